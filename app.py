@@ -6,15 +6,15 @@ Usage:
   streamlit run app.py
 """
 
+import asyncio
 import json
 import os
 import streamlit as st
 from urllib.parse import urlparse
 
-from scraper import MediaScraper
-from research import MediaProfiler
-from storage import StorageManager
-from report_generator import ReportGenerator
+# Light imports only: the scraper and analyzers (langchain, openai, ddgs,
+# whois, BeautifulSoup) load on the first fresh analysis, not on page load
+import resources
 
 # ---------------------------------------------------------------------------
 # Page config
@@ -57,7 +57,8 @@ def load_cached_reports() -> list[dict]:
 def run_analysis(url: str, force_refresh: bool = False):
     """Run the full pipeline with progress updates."""
     domain = extract_domain(url)
-    storage = StorageManager()
+    # Shared by every session in this process (see resources.py)
+    storage = resources.get_storage()
 
     # Check cache
     if not force_refresh and storage.exists(domain):
@@ -67,36 +68,29 @@ def run_analysis(url: str, force_refresh: bool = False):
         return report_text, data.model_dump() if data else {}
 
     progress = st.progress(0, text="Starting analysis...")
+    from scraper import MediaScraper
 
-    # 1. Scrape
-    progress.progress(5, text="Scraping articles from homepage...")
+    # 1-2. Scrape and profile: outlet-level analyzers run while articles download
+    progress.progress(5, text="Scraping articles and researching the outlet...")
     scraper = MediaScraper(url, max_articles=15)
-    articles_obj = scraper.scrape_feed()
+    profiler = resources.get_profiler()
+    scraped = []
 
-    if not articles_obj:
-        st.error("No articles found. The site may be blocking requests.")
-        return None, None
-
-    articles_data = [{"title": a.title, "text": a.text, "url": a.url} for a in articles_obj]
-    progress.progress(20, text=f"Scraped {len(articles_data)} articles")
+    async def on_article(article):
+        # Runs on this thread's event loop, so Streamlit calls are safe here
+        scraped.append(article)
+        progress.progress(min(5 + 2 * len(scraped), 35), text=f"Scraped {len(scraped)} articles, analyzing...")
 
-    # 2. Profile
-    progress.progress(25, text="Resolving outlet name...")
-    profiler = MediaProfiler()
+    report_data = asyncio.run(profiler.aprofile_streaming(url, scraper.aiter_articles(), on_article=on_article))
 
-    # We run profile step by step so we can update progress
-    researcher = profiler.researcher
-    prof_domain = profiler._extract_domain(url)
-    outlet_name = researcher.resolve_outlet_name(url, domain=prof_domain)
-    progress.progress(30, text=f"Analyzing: {outlet_name}")
-
-    progress.progress(35, text="Analyzing editorial bias...")
-    report_data = profiler.profile(url, articles_data, outlet_name=outlet_name)
-    progress.progress(75, text="Analysis complete")
+    if not report_data.articles_analyzed:
+        st.error("No articles found. The site may be blocking requests.")
+        return None, None
+    progress.progress(75, text=f"Analysis complete: {report_data.outlet_name}")
 
     # 3. Generate report
     progress.progress(80, text="Generating narrative report...")
-    generator = ReportGenerator()
+    generator = resources.get_report_generator()
     report_text = generator.generate(report_data)
     progress.progress(90, text="Saving results...")
 
@@ -157,7 +151,7 @@ if analyze_btn and url_input:
 # Handle cached report click
 if "view_domain" in st.session_state:
     domain = st.session_state["view_domain"]
-    storage = StorageManager()
+    storage = resources.get_storage()
     report_text = storage.load_report_text(domain)
     data = storage.load_data(domain)
     if report_text:
@@ -0,0 +1,304 @@
+"""
+article_cache.py
+Persistent store of analysis results keyed by article content.
+
+Re-profiling an outlet mostly sees the same articles as last time. Each
+analyzer stores its intermediate results under a hash of the normalized
+article text (article_key), inside a namespace that names the analyzer, its
+version, the model and a fingerprint of its prompt:
+
+    - OpinionAnalyzer: one ArticleClassification per article
+    - EditorialBiasAnalyzer (map-reduce): one chunk assessment per group of
+      articles; chunks are content-defined, so a new article only disturbs
+      the chunk it lands in and the others are re-aggregated from the cache
+    - LocalPropagandaDetector: propaganda spans per article
+    - Outlet-level prompts (single-prompt editorial bias, sourcing,
+      pseudoscience, fused content analysis): one result per article set
+      (content_key of the prompt), reused while the articles are unchanged
+
+Editing a prompt changes the namespace, so stale results are never served;
+bump an analyzer's CACHE_VERSION when its output changes for another reason.
+Entries not read for ARTICLE_CACHE_MAX_AGE_DAYS are pruned on open.
+
+default_cache() returns None outside live transport mode (record and replay
+runs must reach the LLM cassettes) or when disabled with
+MEDIA_PROFILER_ARTICLE_CACHE=0 / configure(enabled=False).
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Iterable, Optional, TypeVar
+
+from pydantic import BaseModel
+
+import tracing
+import transport
+from config import ARTICLE_CACHE_ENABLED, ARTICLE_CACHE_MAX_AGE_DAYS, ARTICLE_CACHE_PATH
+
+logger = logging.getLogger(__name__)
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_WHITESPACE = re.compile(r"\s+")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    last_access REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+);
+CREATE INDEX IF NOT EXISTS results_last_access ON results (last_access);
+"""
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """Unicode-normalized, lowercased text with whitespace collapsed."""
+    text = unicodedata.normalize("NFKC", text or "")
+    return _WHITESPACE.sub(" ", text).strip().lower()
+
+
+def _digest(*parts: str) -> str:
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()[:32]
+
+
+def content_key(*texts: Optional[str]) -> str:
+    """Hash of normalized texts (e.g. an outlet-level prompt)."""
+    return _digest(*(normalize_text(text) for text in texts))
+
+
+def article_key(title: Optional[str], text: Optional[str]) -> str:
+    """Content hash of an article (title + body), stable across re-scrapes."""
+    return content_key(title, text)
+
+
+def corpus_key(keys: Iterable[str]) -> str:
+    """Hash of a set of article keys, independent of article order."""
+    return _digest(*sorted(keys))
+
+
+def namespace(analyzer: str, version: int, model: str, prompt: str = "") -> str:
+    """
+    Cache namespace for one analyzer configuration.
+
+    Args:
+        analyzer: Analyzer name (e.g. "opinion")
+        version: The analyzer's CACHE_VERSION
+        model: Model the results came from
+        prompt: System prompt (or any other text the results depend on);
+            a fingerprint of it is part of the namespace
+
+    Returns:
+        Namespace string
+    """
+    return f"{analyzer}:v{version}:{model}:{_digest(prompt)[:8]}"
+
+
+# =============================================================================
+# Store
+# =============================================================================
+
+
+class ArticleCache:
+    """
+    SQLite-backed JSON store of analysis results.
+
+    Attributes:
+        path: SQLite file
+        stats: Counters (hits, misses, stored, pruned)
+    """
+
+    def __init__(self, path: str | Path, max_age_days: Optional[float] = None):
+        self.path = Path(path)
+        self.stats = {"hits": 0, "misses": 0, "stored": 0, "pruned": 0}
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        if max_age_days:
+            self.prune(max_age_days)
+
+    def get_many(self, namespace: str, keys: list[str]) -> dict[str, Any]:
+        """Stored values for the `keys` found in `namespace`."""
+        if not keys:
+            return {}
+        unique = list(dict.fromkeys(keys))
+        found: dict[str, Any] = {}
+        with self._lock:
+            # Stay well below SQLite's bound-parameter limit
+            for start in range(0, len(unique), 500):
+                batch = unique[start:start + 500]
+                rows = self._conn.execute(
+                    f"SELECT key, value FROM results WHERE namespace = ? "
+                    f"AND key IN ({','.join('?' * len(batch))})",
+                    (namespace, *batch),
+                ).fetchall()
+                found.update((key, json.loads(value)) for key, value in rows)
+            if found:
+                self._conn.executemany(
+                    "UPDATE results SET last_access = ? WHERE namespace = ? AND key = ?",
+                    [(time.time(), namespace, key) for key in found],
+                )
+                self._conn.commit()
+            self.stats["hits"] += len(found)
+            self.stats["misses"] += len(unique) - len(found)
+        return found
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        """Stored value for `key`, or None."""
+        return self.get_many(namespace, [key]).get(key)
+
+    def put_many(self, namespace: str, items: dict[str, Any]) -> None:
+        """Store JSON-serializable values by key."""
+        if not items:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO results (namespace, key, value, stored_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(namespace, key, json.dumps(value), now, now) for key, value in items.items()],
+            )
+            self._conn.commit()
+            self.stats["stored"] += len(items)
+
+    def put(self, namespace: str, key: str, value: Any) -> None:
+        self.put_many(namespace, {key: value})
+
+    def prune(self, max_age_days: float) -> int:
+        """Delete entries not read in `max_age_days`; returns the number removed."""
+        cutoff = time.time() - max_age_days * 86400
+        with self._lock:
+            removed = self._conn.execute("DELETE FROM results WHERE last_access < ?", (cutoff,)).rowcount
+            self._conn.commit()
+            self.stats["pruned"] += removed
+        return removed
+
+    def count(self, namespace: Optional[str] = None) -> int:
+        """Number of stored entries (in one namespace, or overall)."""
+        with self._lock:
+            if namespace is None:
+                return self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM results WHERE namespace = ?", (namespace,)
+            ).fetchone()[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM results")
+            self._conn.commit()
+
+
+def cached(
+    cache: Optional[ArticleCache],
+    namespace: str,
+    key: str,
+    schema: type[ModelT],
+    compute: Callable[[], ModelT],
+) -> ModelT:
+    """
+    Return the stored `schema` result for `key`, or compute and store it.
+
+    `compute` should raise on failure so that fallback results are never
+    stored.
+
+    Args:
+        cache: Store to use (None computes without caching)
+        namespace: Analyzer namespace (see namespace())
+        key: Article or corpus key
+        schema: Pydantic model the value is validated against
+        compute: Produces the result on a miss
+
+    Returns:
+        The cached or freshly computed result
+    """
+    if cache is None:
+        return compute()
+    stored = cache.get(namespace, key)
+    if stored is not None:
+        tracing.increment("article_cache_hits")
+        return schema.model_validate(stored)
+    tracing.increment("article_cache_misses")
+    result = compute()
+    cache.put(namespace, key, result.model_dump(mode="json"))
+    return result
+
+
+async def acached(
+    cache: Optional[ArticleCache],
+    namespace: str,
+    key: str,
+    schema: type[ModelT],
+    acompute: Callable[[], Awaitable[ModelT]],
+) -> ModelT:
+    """
+    Coroutine counterpart of cached(); `acompute` returns an awaitable.
+
+    Lookups stay synchronous: they are local SQLite reads.
+    """
+    if cache is None:
+        return await acompute()
+    stored = cache.get(namespace, key)
+    if stored is not None:
+        tracing.increment("article_cache_hits")
+        return schema.model_validate(stored)
+    tracing.increment("article_cache_misses")
+    result = await acompute()
+    cache.put(namespace, key, result.model_dump(mode="json"))
+    return result
+
+
+# =============================================================================
+# Process-wide default
+# =============================================================================
+
+_enabled = ARTICLE_CACHE_ENABLED
+_path = ARTICLE_CACHE_PATH
+_caches: dict[str, ArticleCache] = {}
+_caches_lock = threading.Lock()
+
+
+def configure(enabled: Optional[bool] = None, path: Optional[str] = None) -> None:
+    """
+    Change the default cache for this process.
+
+    Args:
+        enabled: Turn the default cache on or off (default: unchanged)
+        path: SQLite file of the default cache (default: unchanged)
+    """
+    global _enabled, _path
+    if enabled is not None:
+        _enabled = enabled
+    if path is not None:
+        _path = path
+
+
+def resolve(cache: Optional[ArticleCache]) -> Optional[ArticleCache]:
+    """`cache` if given, otherwise the process-wide default."""
+    return cache if cache is not None else default_cache()
+
+
+def default_cache() -> Optional[ArticleCache]:
+    """The process-wide ArticleCache, or None when disabled or not in live mode."""
+    if not _enabled or transport.mode() != transport.LIVE:
+        return None
+    key = os.path.abspath(_path)
+    with _caches_lock:
+        if key not in _caches:
+            try:
+                _caches[key] = ArticleCache(_path, ARTICLE_CACHE_MAX_AGE_DAYS)
+            except sqlite3.Error as e:
+                logger.warning(f"Article cache unavailable ({_path}): {e}")
+                return None
+        return _caches[key]
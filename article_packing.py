@@ -0,0 +1,259 @@
+"""
+article_packing.py
+Token-budgeted selection of article excerpts for multi-article LLM prompts.
+
+Analyzers that put many articles into a single prompt (EditorialBiasAnalyzer)
+used to truncate every article to a fixed number of characters, so prompt size
+grew linearly with the number of scraped articles. pack_articles() instead:
+
+1. Drops empty articles and near-duplicates (same title, or heavily
+   overlapping opening text, e.g. the same wire story under two URLs)
+2. Ranks the rest by informativeness: hard-news score of the URL
+   (scraper.hard_news_score) plus a bonus for substantive length
+3. Fills a token budget greedily in rank order, giving each article at most
+   `max_article_tokens` and skipping articles once less than
+   `min_article_tokens` remain
+
+Packed articles keep their original 1-based numbers so "Article N" citations
+in the LLM output still point at the right article, and every dropped article
+is reported with the reason it was dropped.
+
+Tokens are counted with the model's tiktoken encoding when tiktoken is
+installed; otherwise a 4-characters-per-token estimate is used.
+"""
+
+import logging
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+from scraper import hard_news_score
+
+logger = logging.getLogger(__name__)
+
+try:
+    import tiktoken
+except ImportError:  # Optional: fall back to a character-based estimate
+    tiktoken = None
+
+# Rough characters-per-token ratio for English text when tiktoken is unavailable
+CHARS_PER_TOKEN = 4
+
+# Drop reasons
+DROPPED_EMPTY = "empty"
+DROPPED_DUPLICATE = "duplicate"
+DROPPED_BUDGET = "budget"
+
+
+# =============================================================================
+# Token Counting
+# =============================================================================
+
+
+@lru_cache(maxsize=8)
+def _encoding(model: str):
+    """tiktoken encoding for `model` (None if tiktoken is unavailable)."""
+    if tiktoken is None:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        # Encodings are downloaded on first use; offline runs fall back to estimates
+        logger.warning(f"tiktoken encoding unavailable for {model}, estimating tokens: {e}")
+        return None
+
+
+def count_tokens(text: str, model: str = "gpt-4o-mini") -> int:
+    """
+    Count the tokens `text` uses for `model`.
+
+    Args:
+        text: Text to measure
+        model: Model whose tokenizer to use
+
+    Returns:
+        Token count (estimated when tiktoken is not installed)
+    """
+    encoding = _encoding(model)
+    if encoding is None:
+        return -(-len(text) // CHARS_PER_TOKEN)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def truncate_to_tokens(text: str, max_tokens: int, model: str = "gpt-4o-mini") -> str:
+    """
+    Truncate `text` to at most `max_tokens` tokens, cutting at a word boundary.
+
+    Args:
+        text: Text to truncate
+        max_tokens: Token limit
+        model: Model whose tokenizer to use
+
+    Returns:
+        The text unchanged if it fits, otherwise a truncated prefix
+    """
+    encoding = _encoding(model)
+    if encoding is None:
+        limit = max_tokens * CHARS_PER_TOKEN
+        if len(text) <= limit:
+            return text
+        truncated = text[:limit]
+    else:
+        tokens = encoding.encode(text, disallowed_special=())
+        if len(tokens) <= max_tokens:
+            return text
+        truncated = encoding.decode(tokens[:max_tokens])
+
+    # Don't end mid-word
+    cut = truncated.rfind(" ")
+    if cut > len(truncated) * 0.8:
+        truncated = truncated[:cut]
+    return truncated.rstrip()
+
+
+# =============================================================================
+# Packing
+# =============================================================================
+
+
+@dataclass
+class PackedArticle:
+    """An article selected for the prompt, with its (possibly truncated) excerpt."""
+
+    index: int  # Original 1-based article number
+    title: str
+    url: str
+    excerpt: str
+    tokens: int  # Tokens of the formatted block (header + excerpt)
+    score: float
+    truncated: bool = False
+
+
+@dataclass
+class PackingResult:
+    """Outcome of pack_articles()."""
+
+    packed: list[PackedArticle] = field(default_factory=list)
+    dropped: list[dict] = field(default_factory=list)  # index, title, url, reason
+    total_tokens: int = 0
+    token_budget: int = 0
+
+
+def _normalize_title(title: str) -> str:
+    return re.sub(r"[^a-z0-9 ]", "", title.lower()).strip()
+
+
+def _shingles(text: str, size: int = 5, max_words: int = 300) -> set[tuple[str, ...]]:
+    """Word n-grams from the start of an article, used for near-duplicate detection."""
+    words = re.findall(r"\w+", text.lower())[:max_words]
+    return {tuple(words[i:i + size]) for i in range(max(len(words) - size + 1, 0))}
+
+
+def _jaccard(a: set, b: set) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def informativeness(article: dict[str, str]) -> float:
+    """
+    Rank score for an article: hard-news score of its URL plus up to 8 points
+    for length (substantive articles carry more signal than briefs).
+    """
+    words = len(article.get("text", "").split())
+    return hard_news_score(article.get("url", "")) + min(words, 800) / 100
+
+
+def format_article_header(index: int, title: str, url: str) -> str:
+    """Header line(s) that precede each article's text in the prompt."""
+    url_line = f"\nURL: {url}" if url else ""
+    return f"ARTICLE {index}:\nTitle: {title}{url_line}\nText: "
+
+
+def pack_articles(
+    articles: list[dict[str, str]],
+    token_budget: int,
+    model: str = "gpt-4o-mini",
+    max_article_tokens: int = 600,
+    min_article_tokens: int = 120,
+    duplicate_threshold: float = 0.8,
+) -> PackingResult:
+    """
+    Select and truncate articles to fit a prompt token budget.
+
+    Args:
+        articles: List of article dicts with 'title', 'text' and optional 'url'
+        token_budget: Maximum tokens for all packed article blocks together
+        model: Model whose tokenizer to use
+        max_article_tokens: Maximum excerpt tokens per article
+        min_article_tokens: Smallest excerpt worth including
+        duplicate_threshold: Jaccard similarity of opening text above which
+            two articles are treated as duplicates
+
+    Returns:
+        PackingResult with packed articles in original order and dropped ones
+    """
+    result = PackingResult(token_budget=token_budget)
+
+    candidates = []
+    for index, article in enumerate(articles, 1):
+        title = article.get("title", "Untitled") or "Untitled"
+        url = article.get("url", "") or ""
+        text = (article.get("text", "") or "").strip()
+        if not text:
+            result.dropped.append({"index": index, "title": title, "url": url, "reason": DROPPED_EMPTY})
+            continue
+        candidates.append((informativeness(article), index, title, url, text))
+
+    # Best first; ties keep the original order
+    candidates.sort(key=lambda c: (-c[0], c[1]))
+
+    seen_titles: set[str] = set()
+    seen_shingles: list[set] = []
+    remaining = token_budget
+
+    for score, index, title, url, text in candidates:
+        # Placeholder titles say nothing about duplication
+        normalized_title = _normalize_title(title) if title != "Untitled" else ""
+        shingles = _shingles(text)
+        if (normalized_title and normalized_title in seen_titles) or any(
+            _jaccard(shingles, other) >= duplicate_threshold for other in seen_shingles
+        ):
+            result.dropped.append({"index": index, "title": title, "url": url, "reason": DROPPED_DUPLICATE})
+            continue
+
+        header_tokens = count_tokens(format_article_header(index, title, url), model)
+        available = min(max_article_tokens, remaining - header_tokens)
+        if available < min_article_tokens:
+            result.dropped.append({"index": index, "title": title, "url": url, "reason": DROPPED_BUDGET})
+            continue
+
+        excerpt = truncate_to_tokens(text, available, model)
+        tokens = header_tokens + count_tokens(excerpt, model)
+        remaining -= tokens
+
+        seen_titles.add(normalized_title)
+        seen_shingles.append(shingles)
+        result.packed.append(PackedArticle(
+            index=index,
+            title=title,
+            url=url,
+            excerpt=excerpt,
+            tokens=tokens,
+            score=score,
+            truncated=len(excerpt) < len(text),
+        ))
+
+    result.packed.sort(key=lambda p: p.index)
+    result.dropped.sort(key=lambda d: d["index"])
+    result.total_tokens = token_budget - remaining
+
+    if result.dropped:
+        logger.info(
+            f"Packed {len(result.packed)}/{len(articles)} articles into {result.total_tokens} tokens "
+            f"(budget {token_budget}); dropped {len(result.dropped)}"
+        )
+    return result
@@ -0,0 +1,813 @@
+#!/usr/bin/env python3
+"""
+Offline Benchmark Harness
+
+Measures the hot paths of the profiling pipeline (scraping, article parsing,
+Tranco loading, profiler setup, every analyzer, the local propaganda detector
+and storage I/O) against recorded fixtures, so runs are reproducible and need
+no network or API key.
+
+Fixtures live in benchmarks/fixtures/:
+
+    outlets/<domain>/outlet.json   Outlet metadata and URL -> page file index
+    outlets/<domain>/pages/*.html  Recorded homepage, about page and articles
+    outlets/<domain>/search.json   Search results keyed by query substring
+                                   ("default" is used when nothing matches)
+    outlets/<domain>/llm.json      LLM responses keyed by output schema name
+                                   ("text" for plain-text calls)
+    storage/data.json, report.md   A saved report used for storage I/O
+
+Each stage is run `--warmup` times untimed and `--repeat` times timed. Latency
+percentiles (p50/p95/p99), mean and throughput are reported per stage and per
+outlet, then compared against benchmarks/baseline.json. A stage regresses when
+its p50 or p95 exceeds the baseline by more than `--tolerance` (relative) and
+`--noise-floor-ms` (absolute).
+
+Usage:
+    python benchmark.py [--stages scrape_feed,opinion] [--outlets example-news.com]
+                        [--repeat 10] [--warmup 1] [--tolerance 0.25]
+                        [--update-baseline] [--output results.json]
+
+Exits with status 1 if any stage regressed.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import logging
+import os
+import platform
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Optional
+
+import httpx
+import requests
+
+# Analyzers build ChatOpenAI clients at construction time, which requires a
+# key to be set; replayed runs never send a request.
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark-replay")
+
+import article_cache
+import resources
+import schemas
+from refactored_analyzers import TRANCO_DEFAULT_PATH, parse_tranco_list
+from research import MediaProfiler, as_article_dict
+from schemas import ComprehensiveReportData
+from scraper import MediaScraper
+from storage import StorageManager
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+FIXTURES_DIR = Path("benchmarks/fixtures")
+BASELINE_PATH = Path("benchmarks/baseline.json")
+
+DEFAULT_REPEAT = 10
+DEFAULT_WARMUP = 1
+DEFAULT_TOLERANCE = 0.25        # 25% slower than baseline counts as a regression
+DEFAULT_NOISE_FLOOR_MS = 0.5    # Ignore absolute differences below this
+DEFAULT_TRANCO_ROWS = 100_000   # Rows in the synthetic Tranco list
+
+# Outlet key for stages that do not depend on a particular outlet
+GLOBAL_OUTLET = "global"
+
+
+# =============================================================================
+# Replay Transport
+# =============================================================================
+
+
+class ReplayResponse:
+    """Minimal stand-in for requests.Response backed by a fixture page."""
+
+    def __init__(self, url: str, text: Optional[str]):
+        self.url = url
+        self.status_code = 200 if text is not None else 404
+        self.text = text or ""
+        self.content = self.text.encode("utf-8")
+        self.encoding = "utf-8"
+        self.apparent_encoding = "utf-8"
+        self.headers = {"content-type": "text/html; charset=utf-8"}
+        # Streaming consumers (sitemap discovery) read the body from .raw
+        self.raw = io.BytesIO(self.content)
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} for url: {self.url}", response=self)
+
+    def close(self) -> None:
+        pass
+
+
+class ReplaySession:
+    """Serves recorded pages by URL; unknown URLs return 404."""
+
+    def __init__(self, pages: dict[str, str]):
+        self.pages = {self._normalize(url): html for url, html in pages.items()}
+
+    @staticmethod
+    def _normalize(url: str) -> str:
+        return url.rstrip("/")
+
+    def get(self, url: str, *args, **kwargs) -> ReplayResponse:
+        return ReplayResponse(url, self.pages.get(self._normalize(url)))
+
+    def head(self, url: str, *args, **kwargs) -> ReplayResponse:
+        response = self.get(url)
+        response.text, response.content = "", b""
+        return response
+
+    def close(self) -> None:
+        pass
+
+    def async_client(self) -> httpx.AsyncClient:
+        """httpx.AsyncClient serving the same pages (async profiling path)."""
+
+        def handle(request: httpx.Request) -> httpx.Response:
+            html = self.pages.get(self._normalize(str(request.url)))
+            if html is None:
+                return httpx.Response(404, request=request)
+            body = b"" if request.method == "HEAD" else html.encode("utf-8")
+            return httpx.Response(
+                200, headers={"content-type": "text/html; charset=utf-8"}, content=body, request=request
+            )
+
+        return httpx.AsyncClient(transport=httpx.MockTransport(handle))
+
+
+class ReplaySearch:
+    """DDGS stand-in returning recorded results for the first matching query key."""
+
+    def __init__(self, results: dict[str, list[dict]]):
+        self.results = results
+
+    def text(self, query: str, max_results: int = 10, **kwargs) -> list[dict]:
+        for key, hits in self.results.items():
+            if key != "default" and key.lower() in query.lower():
+                return [dict(h) for h in hits[:max_results]]
+        return [dict(h) for h in self.results.get("default", [])[:max_results]]
+
+    async def atext(self, query: str, max_results: int = 10, **kwargs) -> list[dict]:
+        return self.text(query, max_results, **kwargs)
+
+
+class ReplayLLM:
+    """
+    Structured-output LLM stand-in.
+
+    invoke() returns the fixture payload for `schema` validated into the
+    schema class, so the pydantic parsing cost stays in the measurement.
+    Without a schema it behaves like a plain chat model and returns an
+    object with a `.content` string.
+    """
+
+    def __init__(self, responses: dict[str, Any], schema: Optional[type] = None):
+        self.responses = responses
+        self.schema = schema
+
+    def invoke(self, messages: Any, *args, **kwargs) -> Any:
+        if self.schema is None:
+            return SimpleNamespace(content=self.responses.get("text", ""))
+        return self.schema.model_validate(self.responses[self.schema.__name__])
+
+    def batch(self, inputs: list, *args, **kwargs) -> list:
+        return [self.invoke(i) for i in inputs]
+
+    async def ainvoke(self, messages: Any, *args, **kwargs) -> Any:
+        return self.invoke(messages)
+
+    async def abatch(self, inputs: list, *args, **kwargs) -> list:
+        return self.batch(inputs)
+
+    def with_retry(self, **kwargs) -> "ReplayLLM":
+        return self
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@dataclass
+class OutletFixture:
+    """Recorded pages, search results and LLM responses for one outlet."""
+
+    domain: str
+    name: str
+    base_url: str
+    creation_date: date
+    pages: dict[str, str]
+    search: dict[str, list[dict]]
+    llm: dict[str, Any]
+    articles: list[dict[str, str]] = field(default_factory=list)
+
+    @classmethod
+    def load(cls, outlet_dir: Path) -> "OutletFixture":
+        with open(outlet_dir / "outlet.json", encoding="utf-8") as f:
+            meta = json.load(f)
+        pages = {
+            url: (outlet_dir / "pages" / filename).read_text(encoding="utf-8")
+            for url, filename in meta["pages"].items()
+        }
+        with open(outlet_dir / "search.json", encoding="utf-8") as f:
+            search = json.load(f)
+        with open(outlet_dir / "llm.json", encoding="utf-8") as f:
+            llm = json.load(f)
+        return cls(
+            domain=outlet_dir.name,
+            name=meta["name"],
+            base_url=meta["base_url"],
+            creation_date=datetime.strptime(meta["creation_date"], "%Y-%m-%d").date(),
+            pages=pages,
+            search=search,
+            llm=llm,
+        )
+
+    def session(self) -> ReplaySession:
+        return ReplaySession(self.pages)
+
+
+def load_outlets(names: Optional[list[str]] = None) -> list[OutletFixture]:
+    """Load all outlet fixtures (or only `names`) from FIXTURES_DIR/outlets."""
+    outlets_dir = FIXTURES_DIR / "outlets"
+    outlets = []
+    for outlet_dir in sorted(p for p in outlets_dir.iterdir() if p.is_dir()):
+        if names and outlet_dir.name not in names:
+            continue
+        outlets.append(OutletFixture.load(outlet_dir))
+    return outlets
+
+
+# Output schema replayed for each (profiler attribute, LLM attribute)
+_ANALYZER_SCHEMAS = {
+    ("opinion_analyzer", "llm"): "ArticleClassification",
+    ("traffic_analyzer", "llm"): "TrafficEstimate",
+    ("media_type_analyzer", "llm"): "MediaTypeLLMOutput",
+    ("fact_check_searcher", "llm"): "FactCheckLLMOutput",
+    ("sourcing_analyzer", "llm"): "SourcingLLMOutput",
+    ("editorial_bias_analyzer", "llm"): "EditorialBiasLLMOutput",
+    ("editorial_bias_analyzer", "chunk_llm"): "EditorialBiasChunkOutput",
+    ("editorial_bias_analyzer", "reduce_llm"): "EditorialBiasReduceOutput",
+    ("pseudoscience_analyzer", "llm"): "PseudoscienceLLMOutput",
+    ("content_analyzer", "llm"): "FusedContentLLMOutput",
+    ("researcher", "history_llm"): "HistoryLLMOutput",
+    ("researcher", "ownership_llm"): "OwnershipLLMOutput",
+    ("researcher", "analysis_llm"): "ExternalAnalysisLLMOutput",
+    ("researcher", "combined_llm"): "CombinedResearchLLMOutput",
+    ("researcher", "name_llm"): None,
+}
+
+_SCHEMAS_BY_NAME = {
+    name: getattr(schemas, name) for (_, _), name in _ANALYZER_SCHEMAS.items() if name
+}
+
+
+def install_replay(profiler: MediaProfiler, fixture: OutletFixture) -> None:
+    """
+    Point every analyzer of `profiler` at the fixture's recorded pages, LLM
+    responses and search results, and replace WHOIS with the recorded
+    creation date.
+    """
+    for (attr, llm_attr), schema_name in _ANALYZER_SCHEMAS.items():
+        component = getattr(profiler, attr)
+        schema = _SCHEMAS_BY_NAME.get(schema_name) if schema_name else None
+        setattr(component, llm_attr, ReplayLLM(fixture.llm, schema))
+        if hasattr(component, "search"):
+            component.search = ReplaySearch(fixture.search)
+
+    profiler.researcher.session = fixture.session()
+    profiler.researcher.async_session = fixture.session().async_client()
+
+    creation_date = fixture.creation_date
+    profiler.traffic_analyzer._get_whois_data = lambda domain: (creation_date, True, None)
+
+
+# =============================================================================
+# Measurement
+# =============================================================================
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    """Linear-interpolated percentile of `samples` (pct in 0-100)."""
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    k = (len(ordered) - 1) * pct / 100
+    lower = int(k)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (k - lower)
+
+
+def summarize(samples_ms: list[float], ops_per_run: int) -> dict:
+    """Latency percentiles and throughput for one stage."""
+    mean = sum(samples_ms) / len(samples_ms)
+    return {
+        "runs": len(samples_ms),
+        "ops_per_run": ops_per_run,
+        "mean_ms": round(mean, 3),
+        "p50_ms": round(_percentile(samples_ms, 50), 3),
+        "p95_ms": round(_percentile(samples_ms, 95), 3),
+        "p99_ms": round(_percentile(samples_ms, 99), 3),
+        "min_ms": round(min(samples_ms), 3),
+        "max_ms": round(max(samples_ms), 3),
+        "ops_per_s": round(ops_per_run / (mean / 1000), 2) if mean > 0 else 0.0,
+    }
+
+
+def measure(fn: Callable[[], Any], repeat: int, warmup: int, ops_per_run: int = 1) -> dict:
+    """Run `fn` warmup + repeat times and summarize the timed runs."""
+    # Analyzers and the scraper print progress; keep it out of the report
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(warmup):
+            fn()
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            samples.append((time.perf_counter() - start) * 1000)
+    return summarize(samples, ops_per_run)
+
+
+# =============================================================================
+# Stages
+# =============================================================================
+
+
+@dataclass
+class BenchContext:
+    """Shared state for stage functions."""
+
+    outlets: list[OutletFixture]
+    profiler: MediaProfiler
+    workdir: Path
+    tranco_rows: int
+    max_articles: int
+
+
+# Stage registry: name -> (per_outlet, setup). setup(ctx, outlet) returns
+# (callable, ops_per_run), or None to skip the stage.
+STAGES: dict[str, tuple[bool, Callable]] = {}
+
+
+def stage(name: str, per_outlet: bool = True):
+    def register(setup: Callable) -> Callable:
+        STAGES[name] = (per_outlet, setup)
+        return setup
+
+    return register
+
+
+def _new_scraper(ctx: BenchContext, outlet: OutletFixture) -> MediaScraper:
+    scraper = MediaScraper(outlet.base_url, max_articles=ctx.max_articles, request_delay=(0, 0))
+    scraper.session = outlet.session()
+    return scraper
+
+
+@stage("scrape_feed")
+def _scrape_feed(ctx: BenchContext, outlet: OutletFixture):
+    def run():
+        return _new_scraper(ctx, outlet).scrape_feed()
+
+    return run, 1
+
+
+@stage("parse_article")
+def _parse_article(ctx: BenchContext, outlet: OutletFixture):
+    urls = [a["url"] for a in outlet.articles]
+    scraper = _new_scraper(ctx, outlet)
+
+    def run():
+        scraper.reset_dedup()
+        for url in urls:
+            scraper._parse_article(url)
+
+    return run, len(urls)
+
+
+@stage("opinion")
+def _opinion(ctx: BenchContext, outlet: OutletFixture):
+    analyzer = ctx.profiler.opinion_analyzer
+    return (lambda: analyzer.analyze_batch(outlet.articles)), len(outlet.articles)
+
+
+@stage("traffic")
+def _traffic(ctx: BenchContext, outlet: OutletFixture):
+    return (lambda: ctx.profiler.traffic_analyzer.analyze(outlet.base_url)), 1
+
+
+@stage("media_type")
+def _media_type(ctx: BenchContext, outlet: OutletFixture):
+    return (lambda: ctx.profiler.media_type_analyzer.analyze(outlet.base_url)), 1
+
+
+@stage("fact_check")
+def _fact_check(ctx: BenchContext, outlet: OutletFixture):
+    return (lambda: ctx.profiler.fact_check_searcher.analyze(outlet.base_url, outlet.name)), 1
+
+
+@stage("sourcing")
+def _sourcing(ctx: BenchContext, outlet: OutletFixture):
+    return (lambda: ctx.profiler.sourcing_analyzer.analyze(outlet.articles)), 1
+
+
+@stage("editorial_bias")
+def _editorial_bias(ctx: BenchContext, outlet: OutletFixture):
+    analyzer = ctx.profiler.editorial_bias_analyzer
+    return (lambda: analyzer.analyze(outlet.articles, outlet.base_url, outlet.name)), 1
+
+
+@stage("pseudoscience")
+def _pseudoscience(ctx: BenchContext, outlet: OutletFixture):
+    analyzer = ctx.profiler.pseudoscience_analyzer
+    return (lambda: analyzer.analyze(outlet.articles, outlet.base_url, outlet.name)), 1
+
+
+@stage("content_fused")
+def _content_fused(ctx: BenchContext, outlet: OutletFixture):
+    analyzer = ctx.profiler.content_analyzer
+    return (lambda: analyzer.analyze(outlet.articles, outlet.base_url, outlet.name)), 1
+
+
+@stage("research")
+def _research(ctx: BenchContext, outlet: OutletFixture):
+    researcher = ctx.profiler.researcher
+
+    def run():
+        researcher._about_page_cache.clear()
+        researcher.resolve_outlet_name(outlet.base_url, domain=outlet.domain)
+        researcher.research_history(outlet.name, domain=outlet.domain)
+        researcher.research_ownership(outlet.name, domain=outlet.domain)
+        researcher.research_external_analysis(outlet.name, domain=outlet.domain)
+
+    return run, 1
+
+
+@stage("research_combined")
+def _research_combined(ctx: BenchContext, outlet: OutletFixture):
+    researcher = ctx.profiler.researcher
+
+    def run():
+        researcher._about_page_cache.clear()
+        researcher.resolve_outlet_name(outlet.base_url, domain=outlet.domain)
+        researcher.research_all(outlet.name, domain=outlet.domain, mode="combined")
+
+    return run, 1
+
+
+@stage("profile")
+def _profile(ctx: BenchContext, outlet: OutletFixture):
+    def run():
+        ctx.profiler.researcher._about_page_cache.clear()
+        return ctx.profiler.profile(outlet.base_url, outlet.articles)
+
+    return run, 1
+
+
+@stage("aprofile")
+def _aprofile(ctx: BenchContext, outlet: OutletFixture):
+    def run():
+        ctx.profiler.researcher._about_page_cache.clear()
+        return asyncio.run(ctx.profiler.aprofile(outlet.base_url, outlet.articles))
+
+    return run, 1
+
+
+@stage("scrape_then_profile")
+def _scrape_then_profile(ctx: BenchContext, outlet: OutletFixture):
+    def run():
+        ctx.profiler.researcher._about_page_cache.clear()
+        articles = [as_article_dict(a) for a in _new_scraper(ctx, outlet).scrape_feed()]
+        return ctx.profiler.profile(outlet.base_url, articles)
+
+    return run, 1
+
+
+@stage("profile_streaming")
+def _profile_streaming(ctx: BenchContext, outlet: OutletFixture):
+    def run():
+        ctx.profiler.researcher._about_page_cache.clear()
+        return ctx.profiler.profile_streaming(outlet.base_url, _new_scraper(ctx, outlet).iter_articles())
+
+    return run, 1
+
+
+@stage("load_tranco", per_outlet=False)
+def _load_tranco(ctx: BenchContext, outlet: None):
+    path = ctx.workdir / "tranco.csv"
+    with open(path, "w", encoding="utf-8") as f:
+        for rank in range(1, ctx.tranco_rows + 1):
+            f.write(f"{rank},site{rank}.example\n")
+    table = resources.table(str(path), parse_tranco_list)
+    return table.reload, ctx.tranco_rows
+
+
+@stage("new_profiler", per_outlet=False)
+def _new_profiler(ctx: BenchContext, outlet: None):
+    # Per-request setup when every request builds its own MediaProfiler
+    # (lookup tables are already shared)
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            MediaProfiler()
+
+    return run, 1
+
+
+@stage("shared_profiler", per_outlet=False)
+def _shared_profiler(ctx: BenchContext, outlet: None):
+    # Per-request setup with the process-wide profiler (app.py)
+    with contextlib.redirect_stdout(io.StringIO()):
+        resources.get_profiler()
+    return resources.get_profiler, 1
+
+
+@stage("propaganda", per_outlet=False)
+def _propaganda(ctx: BenchContext, outlet: None):
+    try:
+        from local_detector import LocalPropagandaDetector
+    except ImportError as e:
+        logger.warning(f"Skipping propaganda stage: {e}")
+        return None
+    with contextlib.redirect_stdout(io.StringIO()):
+        detector = LocalPropagandaDetector()
+    if not detector.ready:
+        logger.warning("Skipping propaganda stage: local models not available (run train_pipeline.py)")
+        return None
+    texts = [a["text"] for o in ctx.outlets for a in o.articles]
+
+    def run():
+        for text in texts:
+            detector.detect(text)
+
+    return run, len(texts)
+
+
+def _storage_fixture(ctx: BenchContext) -> tuple[StorageManager, ComprehensiveReportData, str]:
+    storage_dir = FIXTURES_DIR / "storage"
+    data = ComprehensiveReportData.model_validate_json(
+        (storage_dir / "data.json").read_text(encoding="utf-8")
+    )
+    text = (storage_dir / "report.md").read_text(encoding="utf-8")
+    return StorageManager(base_dir=ctx.workdir / "reports"), data, text
+
+
+@stage("storage_save", per_outlet=False)
+def _storage_save(ctx: BenchContext, outlet: None):
+    storage, data, text = _storage_fixture(ctx)
+    return (lambda: storage.save(data.target_domain, data, text)), 1
+
+
+@stage("storage_load", per_outlet=False)
+def _storage_load(ctx: BenchContext, outlet: None):
+    storage, data, text = _storage_fixture(ctx)
+    storage.save(data.target_domain, data, text)
+
+    def run():
+        storage.load_data(data.target_domain)
+        storage.load_report_text(data.target_domain)
+
+    return run, 1
+
+
+@stage("storage_exists", per_outlet=False)
+def _storage_exists(ctx: BenchContext, outlet: None):
+    storage, data, text = _storage_fixture(ctx)
+    storage.save(data.target_domain, data, text)
+    return (lambda: storage.exists(data.target_domain)), 1
+
+
+# =============================================================================
+# Baseline Comparison
+# =============================================================================
+
+
+def compare(
+    results: dict,
+    baseline: dict,
+    tolerance: float,
+    noise_floor_ms: float,
+) -> list[dict]:
+    """
+    Compare results against a baseline.
+
+    Returns:
+        One entry per stage/outlet/metric that regressed
+    """
+    regressions = []
+    for stage_name, outlets in results.items():
+        for outlet, stats in outlets.items():
+            base = baseline.get(stage_name, {}).get(outlet)
+            if not base:
+                continue
+            for metric in ("p50_ms", "p95_ms"):
+                current, previous = stats[metric], base[metric]
+                if current > previous * (1 + tolerance) and current - previous > noise_floor_ms:
+                    regressions.append({
+                        "stage": stage_name,
+                        "outlet": outlet,
+                        "metric": metric,
+                        "baseline": previous,
+                        "current": current,
+                        "change": round(current / previous - 1, 3) if previous else None,
+                    })
+    return regressions
+
+
+def print_table(results: dict, baseline: dict) -> None:
+    """Print per-stage, per-outlet results with the change vs baseline."""
+    print(f"\n{'Stage':<16} {'Outlet':<22} {'p50 ms':>10} {'p95 ms':>10} {'p99 ms':>10} {'ops/s':>10} {'vs base':>9}")
+    print("-" * 93)
+    for stage_name, outlets in results.items():
+        for outlet, stats in outlets.items():
+            base = baseline.get(stage_name, {}).get(outlet)
+            delta = ""
+            if base and base.get("p50_ms"):
+                delta = f"{(stats['p50_ms'] / base['p50_ms'] - 1) * 100:+.1f}%"
+            print(
+                f"{stage_name:<16} {outlet:<22} {stats['p50_ms']:>10.2f} {stats['p95_ms']:>10.2f} "
+                f"{stats['p99_ms']:>10.2f} {stats['ops_per_s']:>10.1f} {delta:>9}"
+            )
+
+
+# =============================================================================
+# Main
+# =============================================================================
+
+
+def run_benchmarks(
+    stages: list[str],
+    outlet_names: Optional[list[str]],
+    repeat: int,
+    warmup: int,
+    tranco_rows: int,
+    max_articles: int,
+) -> dict:
+    """
+    Run the selected stages against the fixtures.
+
+    Returns:
+        Dict of stage -> outlet -> summary stats
+    """
+    outlets = load_outlets(outlet_names)
+    if not outlets:
+        raise SystemExit(f"No outlet fixtures found in {FIXTURES_DIR / 'outlets'}")
+    # Every timed run must do the full work, not read the previous run's results
+    article_cache.configure(enabled=False)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        profiler = MediaProfiler()
+
+    results: dict[str, dict] = {}
+    with tempfile.TemporaryDirectory(prefix="media-bench-") as tmp:
+        ctx = BenchContext(
+            outlets=outlets,
+            profiler=profiler,
+            workdir=Path(tmp),
+            tranco_rows=tranco_rows,
+            max_articles=max_articles,
+        )
+
+        # Articles for the content stages come from the recorded pages
+        for outlet in outlets:
+            with contextlib.redirect_stdout(io.StringIO()):
+                scraped = _new_scraper(ctx, outlet).scrape_feed()
+            outlet.articles = [{"title": a.title, "text": a.text, "url": a.url} for a in scraped]
+
+        for stage_name in stages:
+            per_outlet, setup = STAGES[stage_name]
+            targets = outlets if per_outlet else [None]
+            for outlet in targets:
+                key = outlet.domain if outlet else GLOBAL_OUTLET
+                if outlet:
+                    install_replay(profiler, outlet)
+                prepared = setup(ctx, outlet)
+                if prepared is None:
+                    continue
+                fn, ops = prepared
+                print(f"  {stage_name:<16} {key:<22}", end="", flush=True)
+                stats = measure(fn, repeat=repeat, warmup=warmup, ops_per_run=ops)
+                print(f" p50 {stats['p50_ms']:.2f} ms")
+                results.setdefault(stage_name, {})[key] = stats
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the profiling pipeline against recorded fixtures"
+    )
+    parser.add_argument(
+        "--stages",
+        type=str,
+        default=None,
+        help=f"Comma-separated stages to run (default: all). Available: {', '.join(STAGES)}",
+    )
+    parser.add_argument(
+        "--outlets",
+        type=str,
+        default=None,
+        help="Comma-separated outlet fixtures to run (default: all)",
+    )
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Timed runs per stage")
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP, help="Untimed runs per stage")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="Relative slowdown that counts as a regression (default: 0.25)",
+    )
+    parser.add_argument(
+        "--noise-floor-ms",
+        type=float,
+        default=DEFAULT_NOISE_FLOOR_MS,
+        help="Ignore slowdowns smaller than this many milliseconds",
+    )
+    parser.add_argument(
+        "--tranco-rows",
+        type=int,
+        default=DEFAULT_TRANCO_ROWS,
+        help="Rows in the synthetic Tranco list for the load_tranco stage",
+    )
+    parser.add_argument("--max-articles", type=int, default=15, help="max_articles for the scraper")
+    parser.add_argument("--baseline", type=str, default=str(BASELINE_PATH), help="Baseline JSON path")
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Write this run's results as the new baseline",
+    )
+    parser.add_argument("--output", type=str, default=None, help="Also write results to this JSON file")
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s %(name)s: %(message)s")
+
+    stages = args.stages.split(",") if args.stages else list(STAGES)
+    unknown = [s for s in stages if s not in STAGES]
+    if unknown:
+        parser.error(f"Unknown stage(s): {', '.join(unknown)}")
+    outlet_names = args.outlets.split(",") if args.outlets else None
+
+    print(f"Running {len(stages)} stage(s), {args.repeat} runs each (warmup {args.warmup})")
+    results = run_benchmarks(
+        stages, outlet_names, args.repeat, args.warmup, args.tranco_rows, args.max_articles
+    )
+
+    payload = {
+        "meta": {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+            "warmup": args.warmup,
+            "tranco_rows": args.tranco_rows,
+            "tranco_default_path": TRANCO_DEFAULT_PATH,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2)
+
+    baseline_path = Path(args.baseline)
+    if args.update_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(baseline_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2)
+        print_table(results, {})
+        print(f"\nBaseline written to {baseline_path}")
+        return
+
+    baseline = {}
+    if baseline_path.exists():
+        with open(baseline_path, encoding="utf-8") as f:
+            baseline = json.load(f).get("results", {})
+    else:
+        print(f"\nNo baseline at {baseline_path}; run with --update-baseline to create one.")
+
+    print_table(results, baseline)
+
+    regressions = compare(results, baseline, args.tolerance, args.noise_floor_ms)
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s) beyond {args.tolerance:.0%} tolerance:")
+        for r in regressions:
+            print(
+                f"  {r['stage']} [{r['outlet']}] {r['metric']}: "
+                f"{r['baseline']:.2f} -> {r['current']:.2f} ms ({r['change']:+.1%})"
+            )
+        sys.exit(1)
+    if baseline:
+        print("\n✅ No regressions against baseline.")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,176 @@ from dataclasses import dataclass
 # API Keys
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY", "")
 
+# =============================================================================
+# LLM PRICING — USD per 1M tokens (prompt, completion), used for cost tracing
+# =============================================================================
+MODEL_PRICING = {
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4.1-mini": (0.40, 1.60),
+    "gpt-4.1": (2.00, 8.00),
+}
+
+# =============================================================================
+# TRANSPORT — record/replay of HTTP, search and LLM traffic (see transport.py)
+# =============================================================================
+TRANSPORT_MODE = os.environ.get("MEDIA_PROFILER_TRANSPORT", "live")  # live | record | replay
+CASSETTE_DIR = os.environ.get("MEDIA_PROFILER_CASSETTE_DIR", "cassettes")
+# Threads shared by async callers for clients without an async API (DuckDuckGo
+# search, WHOIS); bounds how many such calls are in flight at once
+ASYNC_BLOCKING_WORKERS = 16
+
+# =============================================================================
+# HTTP CACHE — conditional GETs for scraped pages (see http_cache.py)
+# =============================================================================
+HTTP_CACHE_ENABLED = os.environ.get("MEDIA_PROFILER_HTTP_CACHE", "1") != "0"
+HTTP_CACHE_PATH = os.environ.get("MEDIA_PROFILER_HTTP_CACHE_PATH", os.path.join("cache", "http_cache.sqlite"))
+HTTP_CACHE_MAX_MB = 256        # LRU eviction above this many MB of stored bodies
+
+# =============================================================================
+# ARTICLE CACHE — per-article analysis results by content hash (see article_cache.py)
+# =============================================================================
+ARTICLE_CACHE_ENABLED = os.environ.get("MEDIA_PROFILER_ARTICLE_CACHE", "1") != "0"
+ARTICLE_CACHE_PATH = os.environ.get(
+    "MEDIA_PROFILER_ARTICLE_CACHE_PATH", os.path.join("cache", "article_cache.sqlite")
+)
+ARTICLE_CACHE_MAX_AGE_DAYS = 30  # Drop results not reused within this many days
+
+# =============================================================================
+# INCREMENTAL RE-PROFILING — per-stage reuse on --refresh (see stage_cache.py)
+# =============================================================================
+# Days a stage result stays valid while its inputs are unchanged. Article-based
+# stages follow the scraped articles; domain facts change slowly.
+STAGE_TTL_DAYS = {
+    "outlet_name": 180,
+    "traffic": 30,
+    "media_type": 90,
+    "editorial_bias": 7,
+    "sourcing": 7,
+    "pseudoscience": 7,
+    "fact_check": 14,
+    "history": 180,
+    "ownership": 60,
+    "external_analysis": 30,
+    "report_text": 30,
+}
+STAGE_DEFAULT_TTL_DAYS = 7     # Stages missing from STAGE_TTL_DAYS
+
+# =============================================================================
+# LLM CONCURRENCY — batched calls and rate-limit retries
+# =============================================================================
+OPINION_MAX_CONCURRENCY = 8    # Parallel OpinionAnalyzer requests in analyze_batch
+OPINION_PACK_SIZE = 1          # Articles per call in analyze_batch (1 = one call each)
+LLM_MAX_ATTEMPTS = 4           # Attempts per call on rate limits / transient errors
+
+# =============================================================================
+# LLM GATEWAY — shared client pool and rate scheduler (see llm_gateway.py)
+# =============================================================================
+LLM_GATEWAY_ENABLED = os.environ.get("MEDIA_PROFILER_LLM_GATEWAY", "1") != "0"
+# Per-model budgets as (requests per minute, tokens per minute); set these to
+# (or a little below) the account's OpenAI rate limits
+LLM_RATE_LIMITS = {
+    "gpt-4o-mini": (500, 200_000),
+    "gpt-4o": (500, 30_000),
+    "gpt-4.1-mini": (500, 200_000),
+    "gpt-4.1": (500, 30_000),
+}
+LLM_DEFAULT_RATE_LIMIT = (500, 30_000)   # Models missing from LLM_RATE_LIMITS
+LLM_COMPLETION_TOKEN_ESTIMATE = 600      # Reserved per call until the real usage is known
+LLM_POOL_MAX_CONNECTIONS = 32            # Pooled HTTP connections to the API
+# SQLite file shared by processes that should split one budget ("" = per process)
+LLM_GATEWAY_STATE_PATH = os.environ.get("MEDIA_PROFILER_LLM_GATEWAY_STATE", "")
+LLM_DEFAULT_PRIORITY = "interactive"     # "interactive" or "batch"
+
+# =============================================================================
+# RESILIENCE — adaptive deadlines, hedged requests and retries (see resilience.py)
+# =============================================================================
+RESILIENCE_ENABLED = os.environ.get("MEDIA_PROFILER_RESILIENCE", "1") != "0"
+RESILIENCE_WINDOW = 200              # Recent latencies kept per endpoint
+RESILIENCE_MIN_SAMPLES = 20          # Samples before deadlines and hedging adapt
+RESILIENCE_HEDGE_PERCENTILE = 95     # Send a duplicate once the first call is this slow
+RESILIENCE_HEDGE_BUDGET = 0.1        # At most this fraction of calls is hedged
+RESILIENCE_DEADLINE_PERCENTILE = 99
+RESILIENCE_DEADLINE_MULTIPLIER = 3.0  # Deadline = this x the percentile above
+# Deadline bounds per endpoint kind as (min, max) seconds; max applies until
+# an endpoint has RESILIENCE_MIN_SAMPLES latencies
+RESILIENCE_DEADLINES = {
+    "llm": (15.0, 120.0),
+    "search": (3.0, 30.0),
+}
+RESILIENCE_SEARCH_ATTEMPTS = 3       # Attempts per search (LLM calls retry in the client)
+RESILIENCE_BACKOFF_BASE = 0.5        # Seconds; full jitter up to base * 2**attempt
+RESILIENCE_BACKOFF_CAP = 8.0
+RESILIENCE_WORKERS = 32              # Threads running hedged sync calls
+
+# =============================================================================
+# DOMAIN AGE — RDAP/WHOIS creation dates with a persistent cache (see domain_age.py)
+# =============================================================================
+DOMAIN_AGE_CACHE_ENABLED = os.environ.get("MEDIA_PROFILER_DOMAIN_AGE_CACHE", "1") != "0"
+DOMAIN_AGE_CACHE_PATH = os.environ.get(
+    "MEDIA_PROFILER_DOMAIN_AGE_CACHE_PATH", os.path.join("cache", "domain_age.sqlite")
+)
+DOMAIN_AGE_TTL_DAYS = 365            # Creation dates practically never change
+DOMAIN_AGE_NO_DATE_TTL_DAYS = 30     # Registry answered, but without a creation date
+DOMAIN_AGE_NEGATIVE_TTL_DAYS = 1     # Lookup failed (timeout, rate limit, no registry)
+DOMAIN_AGE_RDAP_BOOTSTRAP_URL = "https://data.iana.org/rdap/dns.json"
+DOMAIN_AGE_RDAP_FALLBACK_URL = "https://rdap.org/"  # Redirector, when the bootstrap is unavailable
+# Requests per minute per registry: RDAP server host, or "whois:<tld>"
+DOMAIN_AGE_RATE_LIMITS = {
+    "rdap.verisign.com": 120,
+    "rdap.org": 10,
+}
+DOMAIN_AGE_DEFAULT_RATE_LIMIT = 30
+DOMAIN_AGE_WHOIS_RATE_LIMIT = 10     # WHOIS servers throttle hard; per TLD
+DOMAIN_AGE_WORKERS = 8               # Concurrent lookups in resolve_many()
+DOMAIN_AGE_TIMEOUT = 10.0            # Seconds per RDAP request
+
+# =============================================================================
+# SHARED RESOURCES — process-wide profiler and lookup tables (see resources.py)
+# =============================================================================
+RESOURCE_RELOAD_INTERVAL = float(os.environ.get("MEDIA_PROFILER_RELOAD_INTERVAL", "5"))  # Seconds between file checks (0 = every access)
+
+# =============================================================================
+# PROMPT PACKING — token budgets for multi-article prompts (see article_packing.py)
+# =============================================================================
+EDITORIAL_BIAS_TOKEN_BUDGET = 12_000   # Article tokens per EditorialBiasAnalyzer prompt
+ARTICLE_MAX_TOKENS = 600               # Per-article excerpt cap (~2,400 characters)
+ARTICLE_MIN_TOKENS = 120               # Skip articles once less than this remains
+
+# Map-reduce editorial bias: "single" (one prompt), "map_reduce", or "auto"
+# (map-reduce only when the packed articles exceed EDITORIAL_BIAS_TOKEN_BUDGET)
+EDITORIAL_BIAS_MODE = "auto"
+EDITORIAL_BIAS_MAP_REDUCE_BUDGET = 72_000  # Total article tokens across all chunks
+EDITORIAL_BIAS_CHUNK_TOKENS = 6_000        # Article tokens per map chunk
+EDITORIAL_BIAS_MAX_CONCURRENCY = 4         # Chunks scored in parallel
+EDITORIAL_BIAS_REDUCE_LLM = True           # Write summaries with a final LLM call
+
+# Content analysis in MediaProfiler: "separate" (editorial bias, sourcing and
+# pseudoscience each send the articles in their own prompt) or "fused" (one
+# prompt, one structured response; see FusedContentAnalyzer)
+CONTENT_ANALYSIS_MODE = "separate"
+
+# =============================================================================
+# RESEARCH — history / ownership / external analysis extraction (research.py)
+# =============================================================================
+# "separate": own searches and LLM call per task; "combined": one shared
+# evidence pool and one structured call; "parallel": shared pool, three
+# concurrent calls
+RESEARCH_MODE = "combined"
+RESEARCH_EVIDENCE_CHARS = 6_000  # Shared evidence pool size in the prompt
+
+# research_history() tiers: launch all at once and keep the highest-priority
+# non-empty result (True, costs up to 3 extra searches per outlet), or try
+# them one after another (False)
+RESEARCH_HISTORY_SPECULATIVE = False
+# Seconds each tier may take, counted from launch; a late tier counts as empty
+RESEARCH_TIER_TIMEOUTS = {
+    "about_page": 20.0,
+    "search": 12.0,
+    "wikipedia": 12.0,
+    "domain_search": 12.0,
+}
+
 # =============================================================================
 # FILE PATHS
 # =============================================================================
@@ -0,0 +1,160 @@
+"""
+dedup.py
+URL canonicalization and near-duplicate text detection for scraped articles.
+
+Homepages link the same story under several URLs (AMP variants, tracking
+parameters, section paths) and outlets republish the same wire copy, so
+without deduplication one story can be fetched and analyzed several times.
+MediaScraper uses two layers:
+
+1. canonicalize_url() before fetching: lowercase host without "www.", no
+   fragment, no tracking parameters, no AMP markers, no trailing slash
+2. SimHashIndex after extracting text: 64-bit SimHash over word shingles;
+   two texts within a few bits of each other are the same story
+"""
+
+import hashlib
+import re
+import threading
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+# Query parameters that identify a click, not a page
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "mc_cid", "mc_eid", "igshid",
+    "ocid", "cmpid", "cmp", "ito", "ns_mchannel", "ns_source", "ns_campaign",
+    "ns_linkname", "ns_fee", "ref", "ref_src", "referrer", "smid",
+    "sr_share", "taid",
+    "outputtype", "amp", "_ga", "guccounter",
+}
+TRACKING_PREFIXES = ("utm_", "at_", "pk_", "mtm_")
+
+# AMP renderings of an article: amp.host/..., /amp/..., .../amp, story.amp.html
+_AMP_SEGMENT_RE = re.compile(r"/amp(?=/|$)")
+_AMP_EXTENSION_RE = re.compile(r"\.amp(?=(\.html?)?$)")
+
+SIMHASH_BITS = 64
+SHINGLE_SIZE = 3
+
+# Texts whose SimHashes differ in at most this many bits are near-duplicates
+DEFAULT_MAX_DISTANCE = 3
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Normalize a URL so the same page linked different ways compares equal.
+
+    Args:
+        url: Absolute URL
+
+    Returns:
+        Canonical form of the URL
+    """
+    parsed = urlparse(url.strip())
+    host = parsed.netloc.lower()
+    for prefix in ("www.", "amp."):
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+    if host.endswith(":80") and parsed.scheme == "http":
+        host = host[:-3]
+    elif host.endswith(":443"):
+        host = host[:-4]
+
+    path = _AMP_EXTENSION_RE.sub("", _AMP_SEGMENT_RE.sub("", parsed.path))
+    path = re.sub(r"/{2,}", "/", path).rstrip("/") or "/"
+
+    query = [
+        (key, value)
+        for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    ]
+    query.sort()
+
+    # http and https serve the same article; compare them as https
+    return urlunparse(("https", host, path, "", urlencode(query), ""))
+
+
+def _shingle_hash(shingle: str) -> int:
+    return int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def simhash(text: str, shingle_size: int = SHINGLE_SIZE) -> int:
+    """
+    64-bit SimHash of a text's word shingles (similar texts, similar hashes).
+
+    Args:
+        text: Article text
+        shingle_size: Words per shingle
+
+    Returns:
+        Fingerprint as an int (0 for texts without words)
+    """
+    words = re.findall(r"\w+", text.lower())
+    if not words:
+        return 0
+    if len(words) < shingle_size:
+        shingles = [" ".join(words)]
+    else:
+        shingles = [" ".join(words[i:i + shingle_size]) for i in range(len(words) - shingle_size + 1)]
+
+    weights = [0] * SIMHASH_BITS
+    for shingle in shingles:
+        h = _shingle_hash(shingle)
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if h >> bit & 1 else -1
+
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+class SimHashIndex:
+    """
+    Thread-safe set of SimHash fingerprints with near-duplicate lookup.
+
+    Fingerprints are split into `max_distance + 1` bands; by the pigeonhole
+    principle two fingerprints within `max_distance` bits share at least one
+    band exactly, so only same-band entries need a Hamming comparison.
+    """
+
+    def __init__(self, max_distance: int = DEFAULT_MAX_DISTANCE):
+        self.max_distance = max_distance
+        self._bands = max_distance + 1
+        self._band_bits = -(-SIMHASH_BITS // self._bands)
+        self._buckets: list[dict[int, list[tuple[int, str]]]] = [{} for _ in range(self._bands)]
+        self._lock = threading.Lock()
+
+    def _band_keys(self, fingerprint: int) -> list[int]:
+        mask = (1 << self._band_bits) - 1
+        return [(fingerprint >> (i * self._band_bits)) & mask for i in range(self._bands)]
+
+    def add_if_new(self, fingerprint: int, label: str) -> str | None:
+        """
+        Add `fingerprint` unless a near-duplicate is already indexed.
+
+        Args:
+            fingerprint: SimHash of the new text
+            label: Identifier stored with it (e.g. the article URL)
+
+        Returns:
+            Label of the existing near-duplicate, or None if it was added
+        """
+        keys = self._band_keys(fingerprint)
+        with self._lock:
+            for band, key in enumerate(keys):
+                for other, other_label in self._buckets[band].get(key, ()):
+                    if hamming_distance(fingerprint, other) <= self.max_distance:
+                        return other_label
+            for band, key in enumerate(keys):
+                self._buckets[band].setdefault(key, []).append((fingerprint, label))
+        return None
+
+    def clear(self) -> None:
+        with self._lock:
+            for bucket in self._buckets:
+                bucket.clear()
@@ -0,0 +1,311 @@
+"""
+discovery.py
+Article discovery from robots.txt sitemaps, news sitemaps and RSS/Atom feeds.
+
+Scraping homepage <a> tags finds section pages, tags and promos as well as
+articles, so MediaScraper had to fetch twice as many links as it needed.
+Sitemaps and feeds list canonical article URLs, usually with publication
+dates, so they can be ranked before fetching anything:
+
+1. robots.txt "Sitemap:" lines, falling back to well-known sitemap and feed
+   paths when robots.txt lists none
+2. Sitemap indexes are expanded (news sitemaps and recently modified child
+   sitemaps first); <urlset>, RSS <item> and Atom <entry> elements become
+   DiscoveredArticle entries
+3. Articles outside the recency window, or rejected by the caller's link
+   filter, are skipped; the rest are returned newest first (MediaScraper
+   then ranks each day's articles by hard-news score)
+
+Documents are parsed incrementally with ElementTree.iterparse straight from
+the response stream (gzip-compressed sitemaps included), and each element
+is cleared as soon as it has been read, so a 50,000-URL sitemap never has
+to be held in memory.
+"""
+
+import gzip
+import logging
+import re
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import IO, Callable, Iterator, List, Optional
+from urllib.parse import urljoin
+
+import tracing
+
+logger = logging.getLogger(__name__)
+
+# Probed when robots.txt does not list any sitemap
+FALLBACK_SITEMAP_PATHS = ["/sitemap.xml", "/news-sitemap.xml", "/sitemap_news.xml"]
+FALLBACK_FEED_PATHS = ["/feed", "/rss", "/rss.xml"]
+
+MAX_DOCUMENTS = 8              # Sitemaps/feeds fetched per outlet
+MAX_ENTRIES_PER_DOCUMENT = 5000  # Stop reading a document after this many URLs
+DEFAULT_MAX_AGE_DAYS = 7       # Recency window for dated articles
+
+# Source labels
+NEWS_SITEMAP = "news_sitemap"
+SITEMAP = "sitemap"
+FEED = "feed"
+
+
+@dataclass
+class DiscoveredArticle:
+    """An article URL found in a sitemap or feed."""
+
+    url: str
+    published: Optional[datetime] = None
+    title: Optional[str] = None
+    source: str = SITEMAP
+
+
+# =============================================================================
+# Parsing helpers
+# =============================================================================
+
+
+def _local(tag: str) -> str:
+    """Tag name without its namespace ("{http://...}loc" -> "loc")."""
+    return tag.rsplit("}", 1)[-1].lower()
+
+
+def parse_date(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parse sitemap (W3C/ISO 8601) or RSS (RFC 822) dates as aware datetimes.
+
+    Args:
+        value: Date string
+
+    Returns:
+        UTC-aware datetime, or None if the value cannot be parsed
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        try:
+            parsed = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+class _PrefixedStream:
+    """File-like object replaying already-read bytes before the rest of a stream."""
+
+    def __init__(self, head: bytes, stream: IO[bytes]):
+        self._head = head
+        self._stream = stream
+
+    def read(self, size: int = -1) -> bytes:
+        if self._head:
+            if size is None or size < 0:
+                data, self._head = self._head + self._stream.read(), b""
+                return data
+            data, self._head = self._head[:size], self._head[size:]
+            if len(data) < size:
+                data += self._stream.read(size - len(data))
+            return data
+        return self._stream.read(size)
+
+
+def _open_body(response) -> IO[bytes]:
+    """Decoded response body stream; transparently gunzips .xml.gz documents."""
+    raw = response.raw
+    if hasattr(raw, "decode_content"):
+        raw.decode_content = True  # Undo Content-Encoding: gzip
+    head = raw.read(2)
+    stream = _PrefixedStream(head, raw)
+    if head == b"\x1f\x8b":
+        return gzip.GzipFile(fileobj=stream)
+    return stream
+
+
+def iter_document(stream: IO[bytes], max_entries: int = MAX_ENTRIES_PER_DOCUMENT) -> Iterator[tuple[str, dict]]:
+    """
+    Stream entries from a sitemap, sitemap index, RSS or Atom document.
+
+    Args:
+        stream: Document bytes
+        max_entries: Stop after this many entries
+
+    Yields:
+        ("sitemap", fields) for sitemap index children and ("article", fields)
+        for articles; fields has url, date, title and element ("url" for
+        sitemap entries, "item"/"entry" for feed entries) keys
+    """
+    count = 0
+    fields: dict = {}
+    for event, elem in ET.iterparse(stream, events=("start", "end")):
+        tag = _local(elem.tag)
+
+        if event == "start":
+            if tag in ("url", "sitemap", "item", "entry"):
+                fields = {"url": None, "date": None, "title": None, "element": tag}
+            continue
+
+        text = (elem.text or "").strip()
+        if tag == "loc":
+            fields["url"] = fields.get("url") or text
+        elif tag == "link":
+            # RSS: <link>url</link>; Atom: <link rel="alternate" href="url"/>
+            href = elem.get("href")
+            if href and elem.get("rel", "alternate") == "alternate":
+                fields["url"] = fields.get("url") or href
+            elif text:
+                fields["url"] = fields.get("url") or text
+        elif tag in ("publication_date", "pubdate", "published", "date"):
+            fields["date"] = text or fields.get("date")
+        elif tag in ("lastmod", "updated"):
+            fields["date"] = fields.get("date") or text
+        elif tag == "title":
+            fields["title"] = fields.get("title") or text
+        elif tag in ("url", "sitemap", "item", "entry"):
+            if fields.get("url"):
+                yield ("sitemap" if tag == "sitemap" else "article"), fields
+                count += 1
+            fields = {}
+            elem.clear()
+            if count >= max_entries:
+                logger.info(f"Stopped reading after {max_entries} entries")
+                return
+
+
+# =============================================================================
+# Discovery
+# =============================================================================
+
+
+class ArticleDiscovery:
+    """
+    Finds recent article URLs for an outlet from its sitemaps and feeds.
+
+    Attributes:
+        base_url: Outlet homepage URL
+        session: requests-compatible session used for all fetches
+        headers: Request headers
+        max_age_days: Recency window for dated articles
+        max_documents: Sitemaps/feeds to fetch at most
+        documents_read: URLs of the sitemaps/feeds that were parsed
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        session,
+        headers: Optional[dict] = None,
+        max_age_days: int = DEFAULT_MAX_AGE_DAYS,
+        max_documents: int = MAX_DOCUMENTS,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.session = session
+        self.headers = headers or {}
+        self.max_age_days = max_age_days
+        self.max_documents = max_documents
+        self.documents_read: List[str] = []
+
+    def _get(self, url: str, stream: bool = False):
+        """GET a URL, returning the response or None on any failure."""
+        try:
+            with tracing.span("discovery", tracing.FETCH, url=url):
+                resp = self.session.get(url, headers=self.headers, timeout=15, stream=stream)
+                tracing.annotate(status=resp.status_code)
+            if resp.status_code >= 400:
+                resp.close()
+                return None
+            return resp
+        except Exception as e:
+            logger.debug(f"Discovery fetch failed for {url}: {e}")
+            return None
+
+    def robots_sitemaps(self) -> List[str]:
+        """Sitemap URLs listed in robots.txt."""
+        resp = self._get(f"{self.base_url}/robots.txt")
+        if resp is None:
+            return []
+        sitemaps = []
+        for line in resp.text.splitlines():
+            match = re.match(r"\s*sitemap\s*:\s*(\S+)", line, re.IGNORECASE)
+            if match:
+                sitemaps.append(urljoin(self.base_url, match.group(1)))
+        resp.close()
+        return sitemaps
+
+    def _read(self, url: str) -> Iterator[tuple[str, dict]]:
+        resp = self._get(url, stream=True)
+        if resp is None:
+            return
+        self.documents_read.append(url)
+        try:
+            yield from iter_document(_open_body(resp))
+        except (ET.ParseError, OSError, EOFError) as e:
+            logger.info(f"Could not parse {url} as a sitemap or feed: {e}")
+        finally:
+            resp.close()
+
+    def discover(self, limit: int, accept: Optional[Callable[[str], bool]] = None) -> List[DiscoveredArticle]:
+        """
+        Collect article URLs from sitemaps and feeds.
+
+        Args:
+            limit: Articles wanted; reading stops once this many dated
+                articles have been found
+            accept: Link filter (e.g. same domain, not a tag page)
+
+        Returns:
+            Discovered articles, newest first (undated ones last); empty if
+            the outlet publishes no usable sitemap or feed
+        """
+        queue = self.robots_sitemaps()
+        if not queue:
+            queue = [self.base_url + path for path in FALLBACK_SITEMAP_PATHS + FALLBACK_FEED_PATHS]
+
+        cutoff = datetime.now(timezone.utc) - timedelta(days=self.max_age_days)
+        found: dict[str, DiscoveredArticle] = {}
+        seen_documents = set()
+
+        while queue and len(self.documents_read) < self.max_documents:
+            doc_url = queue.pop(0)
+            if doc_url in seen_documents:
+                continue
+            seen_documents.add(doc_url)
+
+            children = []
+            for kind, fields in self._read(doc_url):
+                if kind == "sitemap":
+                    children.append((parse_date(fields["date"]), urljoin(doc_url, fields["url"])))
+                    continue
+                url = urljoin(doc_url, fields["url"])
+                if url in found or (accept and not accept(url)):
+                    continue
+                published = parse_date(fields["date"])
+                if published is not None and published < cutoff:
+                    continue
+                if fields["element"] != "url":
+                    source = FEED
+                elif "news" in doc_url.lower():
+                    source = NEWS_SITEMAP
+                else:
+                    source = SITEMAP
+                found[url] = DiscoveredArticle(url, published, fields["title"], source)
+
+            # News sitemaps first, then the most recently modified
+            children.sort(key=lambda c: ("news" not in c[1].lower(), -_timestamp(c[0])))
+            queue = [url for _, url in children] + queue
+
+            # Enough fresh, dated articles: no need to read further documents
+            if sum(1 for a in found.values() if a.published) >= limit:
+                break
+
+        logger.info(f"Discovered {len(found)} articles in {len(self.documents_read)} sitemaps/feeds")
+        return sorted(found.values(), key=lambda a: -_timestamp(a.published))
+
+
+def _timestamp(value: Optional[datetime]) -> float:
+    """Sort key for optional datetimes (None sorts as oldest)."""
+    return value.timestamp() if value else float("-inf")
@@ -0,0 +1,563 @@
+"""
+domain_age.py
+Domain creation dates from RDAP and WHOIS, cached persistently.
+
+TrafficLongevityAnalyzer used to run a blocking whois.whois(domain) on every
+profile, uncached, although a domain's creation date practically never
+changes. DomainAgeResolver answers from a SQLite store first and only goes
+to the network on a miss:
+
+    resolver = domain_age.default_resolver()
+    age = resolver.resolve("bbc.com")             # DomainAge(creation_date=...)
+    ages = resolver.resolve_many(domains)         # concurrent, for evaluation runs
+
+A miss asks the domain's registry over RDAP (the server comes from the IANA
+bootstrap file, or the rdap.org redirector when that is unavailable) and
+falls back to WHOIS for TLDs without RDAP or when RDAP fails. Requests are
+spaced per registry (RDAP host, or "whois:<tld>") to DOMAIN_AGE_RATE_LIMITS
+requests per minute. Concurrent lookups of one domain share a single request.
+
+Results are stored with a TTL by outcome: DOMAIN_AGE_TTL_DAYS for a creation
+date, DOMAIN_AGE_NO_DATE_TTL_DAYS when the registry answered without one,
+and DOMAIN_AGE_NEGATIVE_TTL_DAYS for failures, so a broken lookup is not
+retried on every profile but is retried the next day.
+
+default_resolver() only uses the SQLite store in live transport mode (record
+and replay runs must reach the HTTP cassettes) and when it is not disabled
+with MEDIA_PROFILER_DOMAIN_AGE_CACHE=0; results are still remembered for the
+life of the resolver.
+"""
+
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Iterable, Optional
+from urllib.parse import urlparse
+
+import tracing
+import transport
+from config import (
+    DOMAIN_AGE_CACHE_ENABLED,
+    DOMAIN_AGE_CACHE_PATH,
+    DOMAIN_AGE_DEFAULT_RATE_LIMIT,
+    DOMAIN_AGE_NEGATIVE_TTL_DAYS,
+    DOMAIN_AGE_NO_DATE_TTL_DAYS,
+    DOMAIN_AGE_RATE_LIMITS,
+    DOMAIN_AGE_RDAP_BOOTSTRAP_URL,
+    DOMAIN_AGE_RDAP_FALLBACK_URL,
+    DOMAIN_AGE_TIMEOUT,
+    DOMAIN_AGE_TTL_DAYS,
+    DOMAIN_AGE_WHOIS_RATE_LIMIT,
+    DOMAIN_AGE_WORKERS,
+)
+
+logger = logging.getLogger(__name__)
+
+RDAP = "rdap"
+WHOIS = "whois"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS domain_age (
+    domain TEXT PRIMARY KEY,
+    creation_date TEXT,
+    source TEXT,
+    error TEXT,
+    resolved_at REAL NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS domain_age_expires_at ON domain_age (expires_at);
+"""
+
+
+@dataclass(frozen=True)
+class DomainAge:
+    """
+    Outcome of one domain lookup.
+
+    Attributes:
+        domain: Normalized domain
+        creation_date: Registration date, None when unknown
+        source: RDAP or WHOIS when a registry answered, None otherwise
+        error: Why creation_date is missing, if it is
+        cached: Served from the store or the resolver's memory
+    """
+
+    domain: str
+    creation_date: Optional[date]
+    source: Optional[str] = None
+    error: Optional[str] = None
+    cached: bool = False
+
+    @property
+    def failed(self) -> bool:
+        """No registry answered (as opposed to answering without a date)."""
+        return self.source is None
+
+    def ttl_days(self) -> float:
+        """How long this outcome stays valid."""
+        if self.creation_date is not None:
+            return DOMAIN_AGE_TTL_DAYS
+        return DOMAIN_AGE_NEGATIVE_TTL_DAYS if self.failed else DOMAIN_AGE_NO_DATE_TTL_DAYS
+
+
+def normalize_domain(url_or_domain: str) -> str:
+    """Lowercase host of a URL or domain, without "www." and a trailing dot."""
+    value = url_or_domain.strip().lower()
+    host = urlparse(value if "://" in value else f"https://{value}").hostname or value
+    host = host.rstrip(".")
+    return host[4:] if host.startswith("www.") else host
+
+
+def _as_date(value: Any) -> Optional[date]:
+    """Date from a WHOIS/RDAP value (datetime, date, ISO or free-form string, or a list of them)."""
+    if isinstance(value, list):
+        value = value[0] if value else None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str) and value.strip():
+        try:
+            return datetime.fromisoformat(value.strip().replace("Z", "+00:00")).date()
+        except ValueError:
+            pass
+        try:
+            from dateutil import parser
+
+            return parser.parse(value).date()
+        except (ImportError, ValueError, OverflowError):
+            return None
+    return None
+
+
+# =============================================================================
+# Persistent store
+# =============================================================================
+
+
+class DomainAgeStore:
+    """
+    SQLite store of lookup outcomes with per-entry expiry.
+
+    Attributes:
+        path: SQLite file
+        stats: Counters (hits, misses, stored, pruned)
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.stats = {"hits": 0, "misses": 0, "stored": 0, "pruned": 0}
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self.prune()
+
+    def get_many(self, domains: list[str]) -> dict[str, DomainAge]:
+        """Unexpired outcomes for the `domains` found."""
+        unique = list(dict.fromkeys(domains))
+        found: dict[str, DomainAge] = {}
+        now = time.time()
+        with self._lock:
+            # Stay well below SQLite's bound-parameter limit
+            for start in range(0, len(unique), 500):
+                batch = unique[start:start + 500]
+                rows = self._conn.execute(
+                    f"SELECT domain, creation_date, source, error FROM domain_age "
+                    f"WHERE expires_at > ? AND domain IN ({','.join('?' * len(batch))})",
+                    (now, *batch),
+                ).fetchall()
+                for domain, creation_date, source, error in rows:
+                    found[domain] = DomainAge(
+                        domain=domain,
+                        creation_date=date.fromisoformat(creation_date) if creation_date else None,
+                        source=source,
+                        error=error,
+                        cached=True,
+                    )
+            self.stats["hits"] += len(found)
+            self.stats["misses"] += len(unique) - len(found)
+        return found
+
+    def put(self, age: DomainAge) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO domain_age "
+                "(domain, creation_date, source, error, resolved_at, expires_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    age.domain,
+                    age.creation_date.isoformat() if age.creation_date else None,
+                    age.source,
+                    age.error,
+                    now,
+                    now + age.ttl_days() * 86400,
+                ),
+            )
+            self._conn.commit()
+            self.stats["stored"] += 1
+
+    def prune(self) -> int:
+        """Delete expired entries; returns the number removed."""
+        with self._lock:
+            removed = self._conn.execute("DELETE FROM domain_age WHERE expires_at <= ?", (time.time(),)).rowcount
+            self._conn.commit()
+            self.stats["pruned"] += removed
+        return removed
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM domain_age").fetchone()[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM domain_age")
+            self._conn.commit()
+
+
+# =============================================================================
+# Per-registry rate limits
+# =============================================================================
+
+
+class RegistryLimiter:
+    """Spaces requests to each registry evenly at its requests-per-minute limit."""
+
+    def __init__(self, limits: dict[str, int], default_limit: int):
+        self.limits = limits
+        self.default_limit = default_limit
+        self._next_slot: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def limit(self, registry: str) -> int:
+        if registry.startswith("whois:"):
+            return self.limits.get(registry, DOMAIN_AGE_WHOIS_RATE_LIMIT)
+        return self.limits.get(registry, self.default_limit)
+
+    def reserve(self, registry: str) -> float:
+        """Reserve the registry's next slot; returns the seconds to wait for it."""
+        now = time.monotonic()
+        with self._lock:
+            slot = max(now, self._next_slot.get(registry, now))
+            self._next_slot[registry] = slot + 60 / self.limit(registry)
+        return slot - now
+
+    def acquire(self, registry: str) -> None:
+        """Block until a request to `registry` may be sent."""
+        wait = self.reserve(registry)
+        if wait > 0:
+            time.sleep(wait)
+
+
+# =============================================================================
+# Resolver
+# =============================================================================
+
+
+class DomainAgeResolver:
+    """
+    Resolves domain creation dates over RDAP, then WHOIS, behind a cache.
+
+    Attributes:
+        store: Persistent store (None keeps results in memory only)
+        limiter: Per-registry request spacing
+        stats: Counters (lookups, memory_hits, store_hits, rdap, whois, failures)
+    """
+
+    def __init__(
+        self,
+        store: Optional[DomainAgeStore] = None,
+        session=None,
+        limiter: Optional[RegistryLimiter] = None,
+        workers: int = DOMAIN_AGE_WORKERS,
+    ):
+        """
+        Initialize the DomainAgeResolver.
+
+        Args:
+            store: Persistent store of outcomes (default: none)
+            session: requests session for RDAP (default: transport.new_session())
+            limiter: Per-registry rate limits (default: DOMAIN_AGE_RATE_LIMITS)
+            workers: Concurrent lookups in resolve_many()
+        """
+        self.store = store
+        self.session = session if session is not None else transport.new_session()
+        self.limiter = limiter or RegistryLimiter(DOMAIN_AGE_RATE_LIMITS, DOMAIN_AGE_DEFAULT_RATE_LIMIT)
+        self.workers = workers
+        self.stats = {"lookups": 0, "memory_hits": 0, "store_hits": 0, "rdap": 0, "whois": 0, "failures": 0}
+        self._memory: dict[str, tuple[DomainAge, float]] = {}
+        self._in_flight: dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._bootstrap: Optional[dict[str, str]] = None
+        self._bootstrap_lock = threading.Lock()
+
+    # -------------------------------------------------------------------------
+    # Public API
+    # -------------------------------------------------------------------------
+
+    def resolve(self, url_or_domain: str) -> DomainAge:
+        """Creation date of one domain (cached outcome when there is one)."""
+        return self.resolve_many([url_or_domain])[normalize_domain(url_or_domain)]
+
+    def resolve_many(self, domains: Iterable[str]) -> dict[str, DomainAge]:
+        """
+        Creation dates of many domains, looked up concurrently.
+
+        Args:
+            domains: URLs or domains (duplicates are looked up once)
+
+        Returns:
+            Normalized domain -> DomainAge
+        """
+        wanted = list(dict.fromkeys(normalize_domain(d) for d in domains if d))
+        results = self._cached(wanted)
+        missing = [domain for domain in wanted if domain not in results]
+        if len(missing) == 1:
+            results[missing[0]] = self._lookup_once(missing[0])
+        elif missing:
+            with ThreadPoolExecutor(max_workers=min(self.workers, len(missing)), thread_name_prefix="domain-age") as pool:
+                futures = {domain: pool.submit(tracing.bind(self._lookup_once), domain) for domain in missing}
+                for domain, future in futures.items():
+                    results[domain] = future.result()
+        return results
+
+    async def aresolve(self, url_or_domain: str) -> DomainAge:
+        """Coroutine counterpart of resolve(); network lookups run on the shared blocking pool."""
+        domain = normalize_domain(url_or_domain)
+        cached = self._cached([domain])
+        if domain in cached:
+            return cached[domain]
+        return await transport.run_blocking(self._lookup_once, domain)
+
+    async def aresolve_many(self, domains: Iterable[str]) -> dict[str, DomainAge]:
+        """Coroutine counterpart of resolve_many()."""
+        wanted = list(dict.fromkeys(normalize_domain(d) for d in domains if d))
+        ages = await asyncio.gather(*(self.aresolve(domain) for domain in wanted))
+        return dict(zip(wanted, ages))
+
+    # -------------------------------------------------------------------------
+    # Cache layers
+    # -------------------------------------------------------------------------
+
+    def _cached(self, domains: list[str]) -> dict[str, DomainAge]:
+        """Outcomes held in memory or in the store (store hits are kept in memory)."""
+        found: dict[str, DomainAge] = {}
+        now = time.time()
+        with self._lock:
+            for domain in domains:
+                entry = self._memory.get(domain)
+                if entry is not None and entry[1] > now:
+                    found[domain] = replace(entry[0], cached=True)
+            self.stats["memory_hits"] += len(found)
+
+        rest = [domain for domain in domains if domain not in found]
+        if rest and self.store is not None:
+            try:
+                stored = self.store.get_many(rest)
+            except sqlite3.Error as e:
+                logger.warning(f"Domain age store unavailable: {e}")
+                stored = {}
+            with self._lock:
+                for domain, age in stored.items():
+                    self._remember(age)
+                self.stats["store_hits"] += len(stored)
+            found.update(stored)
+
+        if found:
+            tracing.increment("domain_age_cache_hits", len(found))
+        return found
+
+    def _remember(self, age: DomainAge) -> None:
+        """Keep `age` in memory until its TTL runs out (caller holds the lock)."""
+        self._memory[age.domain] = (age, time.time() + age.ttl_days() * 86400)
+
+    def _lookup_once(self, domain: str) -> DomainAge:
+        """Look `domain` up, sharing the request with concurrent callers."""
+        with self._lock:
+            future = self._in_flight.get(domain)
+            owner = future is None
+            if owner:
+                future = self._in_flight[domain] = Future()
+        if not owner:
+            return replace(future.result(), cached=True)
+
+        try:
+            age = self._lookup(domain)
+            with self._lock:
+                self._remember(age)
+            if self.store is not None:
+                try:
+                    self.store.put(age)
+                except sqlite3.Error as e:
+                    logger.warning(f"Could not store domain age for {domain}: {e}")
+            future.set_result(age)
+            return age
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(domain, None)
+
+    # -------------------------------------------------------------------------
+    # Network lookups
+    # -------------------------------------------------------------------------
+
+    def _lookup(self, domain: str) -> DomainAge:
+        """RDAP first, WHOIS when RDAP has no server for the TLD or fails."""
+        with self._lock:
+            self.stats["lookups"] += 1
+
+        errors = []
+        rdap_age = None
+        base_url = self._rdap_base_url(domain)
+        if base_url is not None:
+            try:
+                rdap_age = self._rdap(domain, base_url)
+            except Exception as e:
+                errors.append(f"RDAP error ({type(e).__name__}): {e}")
+                logger.info(f"{errors[-1]} for {domain}, trying WHOIS")
+            else:
+                if rdap_age.creation_date is not None:
+                    return rdap_age
+
+        try:
+            return self._whois(domain)
+        except Exception as e:
+            errors.append(f"WHOIS error ({type(e).__name__}): {e}")
+            logger.warning(f"{errors[-1]} for {domain}")
+        # A registry that answered without a date beats a WHOIS failure
+        if rdap_age is not None:
+            return rdap_age
+        with self._lock:
+            self.stats["failures"] += 1
+        return DomainAge(domain, None, error="; ".join(errors))
+
+    def _rdap_base_url(self, domain: str) -> Optional[str]:
+        """RDAP server for the domain's TLD from the IANA bootstrap (None if the TLD has none)."""
+        with self._bootstrap_lock:
+            if self._bootstrap is None:
+                self._bootstrap = self._load_bootstrap()
+        if not self._bootstrap:
+            return DOMAIN_AGE_RDAP_FALLBACK_URL
+        labels = domain.split(".")
+        # Longest matching suffix ("co.uk" before "uk")
+        for i in range(1, len(labels)):
+            base_url = self._bootstrap.get(".".join(labels[i:]))
+            if base_url is not None:
+                return base_url
+        return None
+
+    def _load_bootstrap(self) -> dict[str, str]:
+        """TLD -> RDAP base URL from the IANA bootstrap file (empty on failure)."""
+        try:
+            with tracing.span("rdap.bootstrap", tracing.FETCH, url=DOMAIN_AGE_RDAP_BOOTSTRAP_URL):
+                response = self.session.get(DOMAIN_AGE_RDAP_BOOTSTRAP_URL, timeout=DOMAIN_AGE_TIMEOUT)
+                response.raise_for_status()
+                services = response.json().get("services", [])
+        except Exception as e:
+            logger.warning(f"RDAP bootstrap unavailable, using {DOMAIN_AGE_RDAP_FALLBACK_URL}: {e}")
+            return {}
+
+        bootstrap: dict[str, str] = {}
+        for tlds, urls in services:
+            # Prefer HTTPS servers
+            urls = sorted(urls, key=lambda url: not url.startswith("https://"))
+            if urls:
+                for tld in tlds:
+                    bootstrap[tld.lower()] = urls[0]
+        return bootstrap
+
+    def _rdap(self, domain: str, base_url: str) -> DomainAge:
+        """Registration event of `domain` from its RDAP server."""
+        url = f"{base_url.rstrip('/')}/domain/{domain}"
+        self.limiter.acquire(urlparse(base_url).hostname or base_url)
+        with tracing.span("rdap", tracing.FETCH, url=url):
+            response = self.session.get(
+                url, timeout=DOMAIN_AGE_TIMEOUT, headers={"Accept": "application/rdap+json"}
+            )
+        if response.status_code == 404:
+            return DomainAge(domain, None, source=RDAP, error="RDAP: domain not found")
+        response.raise_for_status()
+
+        for event in response.json().get("events", []):
+            if event.get("eventAction") == "registration":
+                creation_date = _as_date(event.get("eventDate"))
+                if creation_date is not None:
+                    with self._lock:
+                        self.stats["rdap"] += 1
+                    return DomainAge(domain, creation_date, source=RDAP)
+        return DomainAge(domain, None, source=RDAP, error="RDAP answered without a registration date")
+
+    def _whois(self, domain: str) -> DomainAge:
+        """
+        Creation date of `domain` over WHOIS.
+        Compatible with both 'whois' and 'python-whois' packages.
+        """
+        import whois
+
+        self.limiter.acquire(f"whois:{domain.rsplit('.', 1)[-1]}")
+        with tracing.span("whois", tracing.FETCH, domain=domain):
+            # Try python-whois syntax first, standard whois syntax second
+            if hasattr(whois, "whois"):
+                record = whois.whois(domain)
+            elif hasattr(whois, "query"):
+                record = whois.query(domain)
+            else:
+                raise RuntimeError("Unknown whois library installed")
+
+        creation_date = _as_date(getattr(record, "creation_date", None))
+        if creation_date is None:
+            return DomainAge(domain, None, source=WHOIS, error="No creation date in WHOIS response")
+        with self._lock:
+            self.stats["whois"] += 1
+        return DomainAge(domain, creation_date, source=WHOIS)
+
+    def metrics(self) -> dict:
+        """Resolver counters plus the store's, for logging."""
+        with self._lock:
+            metrics = dict(self.stats)
+        if self.store is not None:
+            metrics["store"] = dict(self.store.stats)
+        return metrics
+
+
+# =============================================================================
+# Process-wide default
+# =============================================================================
+
+_resolver: Optional[DomainAgeResolver] = None
+_resolver_lock = threading.Lock()
+
+
+def default_resolver(reload: bool = False) -> DomainAgeResolver:
+    """
+    The process-wide DomainAgeResolver, built on first use.
+
+    Args:
+        reload: Build a new resolver (e.g. after transport.configure())
+
+    Returns:
+        A resolver backed by DOMAIN_AGE_CACHE_PATH in live mode when the cache
+        is enabled, memory-only otherwise
+    """
+    global _resolver
+    if _resolver is not None and not reload:
+        return _resolver
+    with _resolver_lock:
+        if _resolver is None or reload:
+            store = None
+            if DOMAIN_AGE_CACHE_ENABLED and transport.mode() == transport.LIVE:
+                try:
+                    store = DomainAgeStore(DOMAIN_AGE_CACHE_PATH)
+                except sqlite3.Error as e:
+                    logger.warning(f"Domain age cache unavailable ({DOMAIN_AGE_CACHE_PATH}): {e}")
+            _resolver = DomainAgeResolver(store=store)
+    return _resolver
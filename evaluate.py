@@ -7,6 +7,7 @@ Uses Mean Absolute Error (MAE) with ordinal class mapping for:
 
 Usage:
     python evaluate.py [--n 10] [--mbfc-path mbfc_data.json]
+                       [--transport live|record|replay] [--cassette-dir cassettes]
 """
 
 import argparse
@@ -16,6 +17,12 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
+import domain_age
+import fetching
+import llm_gateway
+import resilience
+import transport
+from fetching import FetchContext
 from research import MediaProfiler
 from scraper import MediaScraper
 
@@ -263,30 +270,20 @@ def evaluate_single_source(
     try:
         logger.info(f"Evaluating: {name} ({source_url})")
 
-        # 1. Scrape articles from the source
-        logger.info(f"  Scraping articles from {source_url}...")
+        # 1-2. Scrape articles and run the profiler; outlet-level stages run while articles download
+        logger.info(f"  Scraping articles from {source_url} and running profiler...")
         scraper = MediaScraper(source_url, max_articles=max_articles)
-        articles = scraper.scrape_feed()
+        report = profiler.profile_streaming(
+            url=source_url,
+            articles=scraper.iter_articles(),
+            outlet_name=name
+        )
 
-        if not articles:
+        if not report.articles_analyzed:
             evaluation.error_message = "No articles scraped"
             return evaluation
 
-        # Convert scraped articles to profiler format
-        article_dicts = [
-            {"title": a.title, "text": a.text}
-            for a in articles
-        ]
-
-        logger.info(f"  Scraped {len(article_dicts)} articles")
-
-        # 2. Run the profiler
-        logger.info(f"  Running profiler...")
-        report = profiler.profile(
-            url=source_url,
-            articles=article_dicts,
-            outlet_name=name
-        )
+        logger.info(f"  Scraped {report.articles_analyzed} articles")
 
         # 3. Extract predictions
         evaluation.pred_bias_label = report.bias_label
@@ -343,6 +340,13 @@ def run_evaluation(
     logger.info(f"Starting evaluation of {len(sources_to_evaluate)} sources")
     logger.info("=" * 70)
 
+    # Domain creation dates for every source in one concurrent batch; the
+    # profiles below then read them from the resolver's cache
+    ages = profiler.traffic_analyzer.domain_ages.resolve_many(
+        entry["source_url"] for entry in sources_to_evaluate if entry.get("source_url")
+    )
+    logger.info(f"Resolved domain ages for {sum(age.creation_date is not None for age in ages.values())}/{len(ages)} sources")
+
     results = []
     bias_errors = []
     factuality_errors = []
@@ -350,7 +354,9 @@ def run_evaluation(
     for i, entry in enumerate(sources_to_evaluate, 1):
         logger.info(f"\n[{i}/{len(sources_to_evaluate)}] Processing {entry.get('name', 'Unknown')}...")
 
-        evaluation = evaluate_single_source(entry, profiler, max_articles)
+        # Scraper and profiler share one fetch context per source
+        with fetching.activate(FetchContext()):
+            evaluation = evaluate_single_source(entry, profiler, max_articles)
         results.append(evaluation)
 
         if evaluation.success:
@@ -507,8 +513,10 @@ def main():
         default="evaluation_results.json",
         help="Output path for JSON results (default: evaluation_results.json)"
     )
+    transport.add_cli_arguments(parser)
 
     args = parser.parse_args()
+    transport.configure_from_args(args)
 
     # Load MBFC data
     mbfc_path = Path(args.mbfc_path)
@@ -523,13 +531,15 @@ def main():
 
     logger.info(f"Loaded {len(mbfc_data)} sources from MBFC data")
 
-    # Run evaluation
-    summary = run_evaluation(
-        mbfc_data=mbfc_data,
-        n_sources=args.num_sources,
-        max_articles=args.max_articles,
-        model=args.model
-    )
+    # Run evaluation (batch priority: yields the LLM quota to interactive
+    # profiles sharing the gateway state)
+    with llm_gateway.priority(llm_gateway.BATCH):
+        summary = run_evaluation(
+            mbfc_data=mbfc_data,
+            n_sources=args.num_sources,
+            max_articles=args.max_articles,
+            model=args.model
+        )
 
     # Print report
     print_evaluation_report(summary)
@@ -537,6 +547,12 @@ def main():
     # Save JSON results
     save_results_json(summary, args.output)
 
+    if transport.mode() != transport.LIVE:
+        logger.info(f"Cassette stats ({transport.mode()}): {transport.get_store().stats}")
+    logger.info(f"LLM gateway: {llm_gateway.metrics()}")
+    logger.info(f"Resilience: {resilience.metrics()}")
+    logger.info(f"Domain ages: {domain_age.default_resolver().metrics()}")
+
 
 if __name__ == "__main__":
     main()
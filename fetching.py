@@ -0,0 +1,249 @@
+"""
+fetching.py
+Per-profile fetch context: one shared session plus an in-memory page store.
+
+Without it the outlet homepage is downloaded by MediaScraper.scrape_feed(),
+again by MediaResearcher for about-link discovery, and about pages once per
+research step, each through a different session. A FetchContext scopes one
+analysis:
+
+    fetch_context = FetchContext()
+    with fetching.activate(fetch_context):
+        articles = MediaScraper(url).scrape_feed()
+        report = MediaProfiler().profile(url, articles)
+
+Inside the block every component resolves its session with
+session_for(self.session) and gets the context instead, so:
+
+    - each URL is fetched at most once (keyed by dedup.canonicalize_url, so
+      www./non-www. and tracking-parameter variants share an entry); callers
+      that ask for a URL already in flight wait for that request
+    - failures are remembered too, and re-raised to later callers
+    - all components reuse the same connection pool
+
+MediaProfiler.profile() activates a fresh context when none is active.
+Streamed GETs (sitemaps read incrementally) bypass the store.
+
+AsyncFetchContext is the same for coroutines (MediaProfiler.aprofile()): it
+wraps an httpx.AsyncClient, shares in-flight requests through asyncio
+futures, and reuses pages a sync FetchContext already holds (the homepage
+the scraper loaded before the async profile started).
+"""
+
+import asyncio
+import contextvars
+import logging
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+import tracing
+import transport
+from dedup import canonicalize_url
+
+logger = logging.getLogger(__name__)
+
+_active_context: contextvars.ContextVar[Optional["FetchContext"]] = contextvars.ContextVar(
+    "fetch_context", default=None
+)
+_active_async_context: contextvars.ContextVar[Optional["AsyncFetchContext"]] = contextvars.ContextVar(
+    "async_fetch_context", default=None
+)
+
+
+class FetchContext:
+    """
+    Session-compatible wrapper that fetches each URL at most once.
+
+    Attributes:
+        session: Underlying requests session (transport-aware)
+        stats: Counters (fetches, reuses, streamed)
+    """
+
+    def __init__(self, session=None):
+        self.session = session if session is not None else transport.new_session()
+        self.stats = {"fetches": 0, "reuses": 0, "streamed": 0}
+        self._pages: dict[str, Future] = {}
+        self._heads: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def _once(self, store: dict[str, Future], url: str, fetch):
+        """Run `fetch` for the first caller of `url`; later callers share its outcome."""
+        key = canonicalize_url(url)
+        with self._lock:
+            future = store.get(key)
+            owner = future is None
+            if owner:
+                future = store[key] = Future()
+                self.stats["fetches"] += 1
+            else:
+                self.stats["reuses"] += 1
+        if not owner:
+            tracing.increment("fetch_reused")
+            return future.result()
+        try:
+            future.set_result(fetch())
+        except Exception as e:
+            future.set_exception(e)
+        return future.result()
+
+    def get(self, url: str, stream: bool = False, **kwargs):
+        """GET `url` once per context (streamed requests are not stored)."""
+        if stream:
+            with self._lock:
+                self.stats["streamed"] += 1
+            return self.session.get(url, stream=True, **kwargs)
+        return self._once(self._pages, url, lambda: self.session.get(url, **kwargs))
+
+    def head(self, url: str, **kwargs):
+        """HEAD `url`; answered from a stored GET when the page was already fetched."""
+        key = canonicalize_url(url)
+        with self._lock:
+            page = self._pages.get(key)
+        if page is not None and page.done() and page.exception() is None:
+            with self._lock:
+                self.stats["reuses"] += 1
+            tracing.increment("fetch_reused")
+            return page.result()
+        return self._once(self._heads, url, lambda: self.session.head(url, **kwargs))
+
+    def fetched(self, url: str):
+        """The stored successful GET response for `url`, or None."""
+        with self._lock:
+            page = self._pages.get(canonicalize_url(url))
+        if page is not None and page.done() and page.exception() is None:
+            return page.result()
+        return None
+
+    def close(self) -> None:
+        with self._lock:
+            self._pages.clear()
+            self._heads.clear()
+        self.session.close()
+
+
+class AsyncFetchContext:
+    """
+    Async counterpart of FetchContext over an httpx.AsyncClient.
+
+    Responses are httpx.Response objects (status_code, headers, content and
+    text behave as in requests). Use from one event loop.
+
+    Attributes:
+        client: Underlying httpx.AsyncClient (transport-aware)
+        parent: Sync FetchContext whose stored pages are reused, if any
+        stats: Counters (fetches, reuses)
+    """
+
+    def __init__(self, client, parent: Optional[FetchContext] = None):
+        self.client = client
+        self.parent = parent
+        self.stats = {"fetches": 0, "reuses": 0}
+        self._pages: dict[str, asyncio.Future] = {}
+        self._heads: dict[str, asyncio.Future] = {}
+
+    async def _once(self, store: dict[str, asyncio.Future], url: str, fetch):
+        """Await `fetch()` for the first caller of `url`; later callers share its outcome."""
+        key = canonicalize_url(url)
+        future = store.get(key)
+        if future is not None:
+            self.stats["reuses"] += 1
+            tracing.increment("fetch_reused")
+            return await asyncio.shield(future)
+        future = store[key] = asyncio.get_running_loop().create_future()
+        self.stats["fetches"] += 1
+        try:
+            future.set_result(await fetch())
+        except asyncio.CancelledError:
+            # Nobody owns the request any more; the next caller starts over
+            del store[key]
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+        return future.result()
+
+    def _reused(self, url: str):
+        """A completed GET from this context or the parent, or None."""
+        page = self._pages.get(canonicalize_url(url))
+        if page is not None and page.done() and page.exception() is None:
+            return page.result()
+        return self.parent.fetched(url) if self.parent is not None else None
+
+    async def get(self, url: str, **kwargs):
+        """GET `url` once per context."""
+        if canonicalize_url(url) not in self._pages:
+            reused = self.parent.fetched(url) if self.parent is not None else None
+            if reused is not None:
+                self.stats["reuses"] += 1
+                tracing.increment("fetch_reused")
+                return reused
+        return await self._once(self._pages, url, lambda: self.client.get(url, **kwargs))
+
+    async def head(self, url: str, **kwargs):
+        """HEAD `url`; answered from a stored GET when the page was already fetched."""
+        page = self._reused(url)
+        if page is not None:
+            self.stats["reuses"] += 1
+            tracing.increment("fetch_reused")
+            return page
+        return await self._once(self._heads, url, lambda: self.client.head(url, **kwargs))
+
+
+def current() -> Optional[FetchContext]:
+    """The FetchContext active in this context, if any."""
+    return _active_context.get()
+
+
+@contextmanager
+def activate(fetch_context: FetchContext) -> Iterator[FetchContext]:
+    """Make `fetch_context` the session used by components in this block."""
+    token = _active_context.set(fetch_context)
+    try:
+        yield fetch_context
+    finally:
+        _active_context.reset(token)
+
+
+def current_async() -> Optional[AsyncFetchContext]:
+    """The AsyncFetchContext active in this context, if any."""
+    return _active_async_context.get()
+
+
+@contextmanager
+def activate_async(fetch_context: AsyncFetchContext) -> Iterator[AsyncFetchContext]:
+    """Make `fetch_context` the client used by coroutines in this block."""
+    token = _active_async_context.set(fetch_context)
+    try:
+        yield fetch_context
+    finally:
+        _active_async_context.reset(token)
+
+
+def client_for(default):
+    """
+    Async client a component should use for a request.
+
+    Args:
+        default: The component's own httpx.AsyncClient
+
+    Returns:
+        The active AsyncFetchContext, or `default` outside of one
+    """
+    fetch_context = _active_async_context.get()
+    return fetch_context if fetch_context is not None else default
+
+
+def session_for(default):
+    """
+    Session a component should use for a request.
+
+    Args:
+        default: The component's own session
+
+    Returns:
+        The active FetchContext, or `default` outside of one
+    """
+    fetch_context = _active_context.get()
+    return fetch_context if fetch_context is not None else default
@@ -15,8 +15,10 @@ import csv
 import logging
 import os
 import re
+import threading
+import unicodedata
 from datetime import date, datetime
-from typing import Optional
+from typing import Iterable, Optional
 from urllib.parse import urlparse, urljoin
 
 import requests
@@ -24,6 +26,7 @@ from bs4 import BeautifulSoup
 from duckduckgo_search import DDGS
 from langchain_openai import ChatOpenAI
 
+from config import COUNTRY_NAME_ALIASES, FREEDOM_INDEX_FILE, FREEDOM_LABELS, ISO_MAPPING
 from schemas import (
     ComprehensiveReportData,
     EditorialBiasResult,
@@ -59,6 +62,150 @@ def get_llm(model: str = "gpt-4o-mini", temperature: float = 0.0) -> ChatOpenAI:
     return ChatOpenAI(model=model, temperature=temperature)
 
 
+# =============================================================================
+# RSF Press Freedom Index
+# =============================================================================
+
+# Parsed once per process on first lookup (see load_freedom_index)
+_freedom_index: Optional[dict[str, dict]] = None
+_freedom_index_lock = threading.Lock()
+
+
+def _normalize_country(name: str) -> str:
+    """Case-, accent- and punctuation-insensitive key for a country name or code."""
+    name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
+    name = re.sub(r"[^a-z0-9]+", " ", name.lower()).strip()
+    return re.sub(r"^the ", "", name)
+
+
+def _freedom_label(score: float) -> str:
+    # Bands have integer bounds (70-89, 90-100); scores like 89.46 belong to
+    # the band whose lower bound they reach
+    for low, high, label in sorted(FREEDOM_LABELS, reverse=True):
+        if low <= score:
+            return label
+    return "Unknown"
+
+
+def _parse_freedom_index(csv_path: str) -> dict[str, dict]:
+    """
+    Parse the RSF CSV (";"-separated, decimal commas, Windows-1252) into
+    entries keyed by normalized English name and ISO 3166 alpha-3 code, plus
+    the names in COUNTRY_NAME_ALIASES in either direction.
+    """
+    index: dict[str, dict] = {}
+    with open(csv_path, "r", encoding="cp1252", errors="replace") as f:
+        for row in csv.DictReader(f, delimiter=";"):
+            country = (row.get("Country_EN") or "").strip()
+            iso = (row.get("ISO") or "").strip().upper()
+            try:
+                score = float((row.get("Score 2025") or "").replace(",", "."))
+                rank = int(row["Rank"]) if row.get("Rank") else None
+            except (ValueError, TypeError):
+                continue
+            entry = {
+                "country": country,
+                "iso": iso,
+                "freedom_score": round(score, 2),
+                "freedom_label": _freedom_label(score),
+                "freedom_rank": rank,
+            }
+            for key in (country, iso):
+                if key:
+                    index[_normalize_country(key)] = entry
+
+    # Aliases may point either way ("UK" -> "United Kingdom", but the CSV
+    # itself says "Russia" where the alias table says "Russian Federation")
+    for alias, name in COUNTRY_NAME_ALIASES.items():
+        alias_key, name_key = _normalize_country(alias), _normalize_country(name)
+        if name_key in index:
+            index.setdefault(alias_key, index[name_key])
+        elif alias_key in index:
+            index.setdefault(name_key, index[alias_key])
+    return index
+
+
+def load_freedom_index(reload: bool = False) -> dict[str, dict]:
+    """
+    The process-wide press freedom index, parsed on first use.
+
+    Args:
+        reload: Re-read the CSV even if it is already loaded
+
+    Returns:
+        Entries (country, iso, freedom_score, freedom_label, freedom_rank)
+        keyed by normalized country name / ISO code; empty if the file is missing
+    """
+    global _freedom_index
+    if _freedom_index is not None and not reload:
+        return _freedom_index
+    with _freedom_index_lock:
+        if _freedom_index is None or reload:
+            csv_path = os.path.join(os.path.dirname(__file__), FREEDOM_INDEX_FILE)
+            try:
+                _freedom_index = _parse_freedom_index(csv_path)
+            except FileNotFoundError:
+                logger.warning(f"Freedom index file not found: {csv_path}")
+                _freedom_index = {}
+            except Exception as e:
+                logger.error(f"Failed to load freedom index: {e}")
+                _freedom_index = {}
+    return _freedom_index
+
+
+def lookup_freedom_rating(headquarters: str | None) -> dict:
+    """
+    Look up the RSF Press Freedom Index entry for a headquarters location.
+
+    Args:
+        headquarters: Headquarters string (e.g., "London, United Kingdom"),
+            a country name, or an ISO code
+
+    Returns:
+        Dict with keys: country, freedom_score, freedom_label, freedom_rank (or all None)
+    """
+    result = {"country": None, "freedom_score": None, "freedom_label": None, "freedom_rank": None}
+
+    if not headquarters:
+        return result
+
+    # Extract country name from headquarters (usually "City, Country")
+    parts = [p.strip() for p in headquarters.split(",")]
+    country_name = parts[-1] if parts else None
+    if not country_name:
+        return result
+
+    # Normalize via aliases
+    country_name = COUNTRY_NAME_ALIASES.get(country_name, country_name)
+    result["country"] = country_name
+
+    index = load_freedom_index()
+    entry = index.get(_normalize_country(country_name))
+    # Two-letter codes only when they are the whole string: "Austin, TX" and
+    # "Los Angeles, CA" end in US state codes, not countries
+    if entry is None and len(parts) == 1 and country_name.upper() in ISO_MAPPING:
+        entry = index.get(_normalize_country(ISO_MAPPING[country_name.upper()]))
+    if entry is None:
+        return result
+
+    result.update({key: entry[key] for key in result})
+    return result
+
+
+def lookup_freedom_ratings(headquarters: Iterable[str | None]) -> list[dict]:
+    """
+    Bulk lookup_freedom_rating() for batch runs (the index is loaded once).
+
+    Args:
+        headquarters: Headquarters strings, one per outlet
+
+    Returns:
+        One result dict per input, in order
+    """
+    load_freedom_index()
+    return [lookup_freedom_rating(hq) for hq in headquarters]
+
+
 # =============================================================================
 # MediaResearcher - Web Research with Structured Output
 # =============================================================================
@@ -611,59 +758,7 @@ class MediaProfiler:
         Returns:
             Dict with keys: country, freedom_score, freedom_label, freedom_rank (or all None)
         """
-        from config import FREEDOM_INDEX_FILE, FREEDOM_LABELS, COUNTRY_NAME_ALIASES
-
-        result = {"country": None, "freedom_score": None, "freedom_label": None, "freedom_rank": None}
-
-        if not headquarters:
-            return result
-
-        # Extract country name from headquarters (usually "City, Country")
-        parts = [p.strip() for p in headquarters.split(",")]
-        country_name = parts[-1] if parts else None
-        if not country_name:
-            return result
-
-        # Normalize via aliases
-        country_name = COUNTRY_NAME_ALIASES.get(country_name, country_name)
-        result["country"] = country_name
-
-        # Load CSV
-        csv_path = os.path.join(os.path.dirname(__file__), FREEDOM_INDEX_FILE)
-        if not os.path.exists(csv_path):
-            logger.warning(f"Freedom index file not found: {csv_path}")
-            return result
-
-        try:
-            with open(csv_path, "r", encoding="utf-8", errors="replace") as f:
-                reader = csv.DictReader(f, delimiter=";")
-                for row in reader:
-                    row_country = row.get("Country_EN", "").strip()
-                    if row_country.lower() == country_name.lower():
-                        # Parse score (uses comma as decimal separator)
-                        score_str = row.get("Score 2025", "").replace(",", ".")
-                        rank_str = row.get("Rank", "")
-                        try:
-                            score = float(score_str)
-                            rank = int(rank_str) if rank_str else None
-                        except (ValueError, TypeError):
-                            break
-
-                        result["freedom_score"] = round(score, 2)
-                        result["freedom_rank"] = rank
-
-                        # Determine label
-                        for low, high, label in FREEDOM_LABELS:
-                            if low <= score <= high:
-                                result["freedom_label"] = label
-                                break
-                        else:
-                            result["freedom_label"] = "Unknown"
-                        break
-        except Exception as e:
-            logger.error(f"Failed to load freedom index: {e}")
-
-        return result
+        return lookup_freedom_rating(headquarters)
 
     @staticmethod
     def _sanitize_null(value: str | None) -> str | None:
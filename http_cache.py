@@ -0,0 +1,388 @@
+"""
+http_cache.py
+Persistent HTTP cache with conditional requests for scraped pages.
+
+Re-profiling an outlet downloads the same homepage, about pages and articles
+again. CachingAdapter sits in front of the requests transport adapter and
+stores GET responses in a SQLite file shared by every session and process:
+
+    - Fresh entries (Cache-Control max-age / Expires, or a heuristic lifetime
+      of 10% of the time since Last-Modified, capped at a day) are served
+      without touching the network
+    - Stale entries with an ETag or Last-Modified are revalidated with
+      If-None-Match / If-Modified-Since; a 304 refreshes the entry and the
+      cached body is returned
+    - no-store responses, Vary: *, non-200 statuses and streamed requests
+      (large sitemaps) are never stored
+
+The store is bounded: once the bodies exceed `max_bytes`, the least recently
+used entries are evicted. SQLite runs in WAL mode so concurrent processes can
+read while one writes.
+
+transport.new_session() mounts the adapter in live mode (see config.py for
+HTTP_CACHE_*), and transport.new_async_client() wraps its httpx transport in
+AsyncCachingTransport, which applies the same rules to the same store;
+record and replay runs bypass both so cassettes stay exact.
+"""
+
+import email.utils
+import io
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+import httpx
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+import tracing
+
+logger = logging.getLogger(__name__)
+
+# Heuristic freshness for responses with Last-Modified but no explicit lifetime
+HEURISTIC_FRACTION = 0.1
+HEURISTIC_MAX_SECONDS = 24 * 3600
+
+# Headers that describe the wire encoding rather than the stored (decoded) body
+_HOP_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    url TEXT PRIMARY KEY,
+    status INTEGER NOT NULL,
+    reason TEXT,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_last_access ON responses (last_access);
+"""
+
+
+def _cache_control(headers) -> dict[str, Optional[str]]:
+    directives = {}
+    for part in headers.get("Cache-Control", "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"') or None
+    return directives
+
+
+def _parse_http_date(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return email.utils.parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def freshness_lifetime(headers, now: float) -> float:
+    """
+    Seconds a response may be served without revalidation.
+
+    Args:
+        headers: Response headers
+        now: Current time (epoch seconds)
+
+    Returns:
+        Lifetime in seconds (0 means revalidate every time)
+    """
+    directives = _cache_control(headers)
+    if "no-cache" in directives:
+        return 0.0
+    if directives.get("max-age") is not None:
+        try:
+            return max(float(directives["max-age"]) - float(headers.get("Age", 0) or 0), 0.0)
+        except ValueError:
+            return 0.0
+    expires = _parse_http_date(headers.get("Expires"))
+    if expires is not None:
+        date = _parse_http_date(headers.get("Date")) or now
+        return max(expires - date, 0.0)
+    last_modified = _parse_http_date(headers.get("Last-Modified"))
+    if last_modified is not None:
+        date = _parse_http_date(headers.get("Date")) or now
+        return min(max(date - last_modified, 0.0) * HEURISTIC_FRACTION, HEURISTIC_MAX_SECONDS)
+    return 0.0
+
+
+def is_storable(response: requests.Response | httpx.Response) -> bool:
+    """Whether a response may be written to the cache."""
+    if response.status_code != 200:
+        return False
+    if "no-store" in _cache_control(response.headers):
+        return False
+    if response.headers.get("Vary", "").strip() == "*":
+        return False
+    return True
+
+
+# =============================================================================
+# Store
+# =============================================================================
+
+
+class HttpCache:
+    """
+    SQLite-backed response store with LRU eviction.
+
+    Attributes:
+        path: SQLite file
+        max_bytes: Upper bound on the total size of stored bodies
+        stats: Counters (hits, revalidated, misses, stored, evicted)
+    """
+
+    def __init__(self, path: str | Path, max_bytes: int):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.stats = {"hits": 0, "revalidated": 0, "misses": 0, "stored": 0, "evicted": 0}
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # One connection per cache object, shared by threads under the lock;
+        # the busy timeout covers other processes holding the write lock
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def _count(self, event: str) -> None:
+        with self._lock:
+            self.stats[event] += 1
+
+    def get(self, url: str) -> Optional[dict]:
+        """Stored entry for `url` (fresh or not), or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, reason, headers, body, expires_at FROM responses WHERE url = ?",
+                (url,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE responses SET last_access = ? WHERE url = ?", (time.time(), url))
+            self._conn.commit()
+        status, reason, headers, body, expires_at = row
+        return {
+            "status": status,
+            "reason": reason,
+            "headers": json.loads(headers),
+            "body": body,
+            "expires_at": expires_at,
+        }
+
+    def put(self, url: str, status: int, reason: Optional[str], headers: dict, body: bytes, lifetime: float) -> None:
+        """Store a response and evict least recently used entries over the size bound."""
+        if len(body) > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(url, status, reason, headers, body, size, stored_at, expires_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, status, reason, json.dumps(headers), body, len(body), now, now + lifetime, now),
+            )
+            self._evict()
+            self._conn.commit()
+        self._count("stored")
+
+    def refresh(self, url: str, headers: dict, lifetime: float) -> None:
+        """Extend a revalidated entry's lifetime and merge the 304's headers."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT headers FROM responses WHERE url = ?", (url,)).fetchone()
+            if row is None:
+                return
+            merged = json.loads(row[0])
+            merged.update(headers)
+            self._conn.execute(
+                "UPDATE responses SET headers = ?, expires_at = ?, last_access = ? WHERE url = ?",
+                (json.dumps(merged), now + lifetime, now, url),
+            )
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        """Delete least recently used rows until the bodies fit (lock held)."""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute("SELECT url, size FROM responses ORDER BY last_access").fetchall()
+        evict = []
+        for url, size in rows:
+            if total <= self.max_bytes:
+                break
+            evict.append((url,))
+            total -= size
+        self._conn.executemany("DELETE FROM responses WHERE url = ?", evict)
+        self.stats["evicted"] += len(evict)
+
+    def size(self) -> int:
+        """Total bytes of stored bodies."""
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+
+# =============================================================================
+# requests adapter
+# =============================================================================
+
+
+class CachingAdapter(BaseAdapter):
+    """requests adapter serving GETs from an HttpCache, revalidating stale entries."""
+
+    def __init__(self, cache: HttpCache, inner: Optional[BaseAdapter] = None):
+        super().__init__()
+        self.cache = cache
+        self.inner = inner or HTTPAdapter()
+
+    def send(self, request: requests.PreparedRequest, stream: bool = False, **kwargs) -> requests.Response:
+        # Streamed bodies (multi-megabyte sitemaps) are not worth buffering
+        if request.method != "GET" or stream:
+            return self.inner.send(request, stream=stream, **kwargs)
+
+        entry = self.cache.get(request.url)
+        now = time.time()
+        if entry is not None and entry["expires_at"] > now:
+            self.cache._count("hits")
+            tracing.increment("http_cache_hits")
+            return self._build_response(request, entry)
+
+        if entry is not None:
+            headers = CaseInsensitiveDict(entry["headers"])
+            if headers.get("ETag"):
+                request.headers["If-None-Match"] = headers["ETag"]
+            if headers.get("Last-Modified"):
+                request.headers["If-Modified-Since"] = headers["Last-Modified"]
+
+        response = self.inner.send(request, stream=False, **kwargs)
+
+        if response.status_code == 304 and entry is not None:
+            update = {k: v for k, v in response.headers.items() if k.lower() not in _HOP_HEADERS}
+            merged = CaseInsensitiveDict(entry["headers"])
+            merged.update(update)
+            self.cache.refresh(request.url, update, freshness_lifetime(merged, now))
+            self.cache._count("revalidated")
+            tracing.increment("http_cache_revalidated")
+            entry["headers"] = dict(merged)
+            return self._build_response(request, entry)
+
+        self.cache._count("misses")
+        if is_storable(response):
+            headers = {k: v for k, v in response.headers.items() if k.lower() not in _HOP_HEADERS}
+            lifetime = freshness_lifetime(response.headers, now)
+            # Entries with neither a lifetime nor a validator can never be reused
+            if lifetime > 0 or "ETag" in response.headers or "Last-Modified" in response.headers:
+                self.cache.put(request.url, response.status_code, response.reason, headers, response.content, lifetime)
+        return response
+
+    def _build_response(self, request: requests.PreparedRequest, entry: dict) -> requests.Response:
+        content = entry["body"]
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response.reason = entry.get("reason")
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response.headers["Content-Length"] = str(len(content))
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response._content = content
+        response._content_consumed = True
+        response.raw = io.BytesIO(content)
+        return response
+
+    def close(self) -> None:
+        self.inner.close()
+
+
+# =============================================================================
+# httpx async transport
+# =============================================================================
+
+
+class AsyncCachingTransport(httpx.AsyncBaseTransport):
+    """httpx async transport serving GETs from an HttpCache (same rules as CachingAdapter)."""
+
+    def __init__(self, cache: HttpCache, inner: httpx.AsyncBaseTransport):
+        self.cache = cache
+        self.inner = inner
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method != "GET":
+            return await self.inner.handle_async_request(request)
+
+        url = str(request.url)
+        entry = self.cache.get(url)
+        now = time.time()
+        if entry is not None and entry["expires_at"] > now:
+            self.cache._count("hits")
+            tracing.increment("http_cache_hits")
+            return self._build_response(request, entry)
+
+        if entry is not None:
+            headers = httpx.Headers(entry["headers"])
+            if headers.get("ETag"):
+                request.headers["If-None-Match"] = headers["ETag"]
+            if headers.get("Last-Modified"):
+                request.headers["If-Modified-Since"] = headers["Last-Modified"]
+
+        response = await self.inner.handle_async_request(request)
+
+        if response.status_code == 304 and entry is not None:
+            await response.aclose()
+            update = {k: v for k, v in response.headers.items() if k.lower() not in _HOP_HEADERS}
+            merged = httpx.Headers(entry["headers"])
+            merged.update(update)
+            self.cache.refresh(url, update, freshness_lifetime(merged, now))
+            self.cache._count("revalidated")
+            tracing.increment("http_cache_revalidated")
+            entry["headers"] = dict(merged)
+            return self._build_response(request, entry)
+
+        self.cache._count("misses")
+        if is_storable(response):
+            lifetime = freshness_lifetime(response.headers, now)
+            if lifetime > 0 or "ETag" in response.headers or "Last-Modified" in response.headers:
+                content = await response.aread()
+                headers = {k: v for k, v in response.headers.items() if k.lower() not in _HOP_HEADERS}
+                self.cache.put(url, response.status_code, response.reason_phrase, headers, content, lifetime)
+        return response
+
+    @staticmethod
+    def _build_response(request: httpx.Request, entry: dict) -> httpx.Response:
+        return httpx.Response(
+            status_code=entry["status"],
+            headers=entry["headers"],
+            content=entry["body"],
+            request=request,
+        )
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+
+_caches: dict[str, HttpCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_cache(path: str, max_bytes: int) -> HttpCache:
+    """Process-wide HttpCache for `path` (one SQLite connection per file)."""
+    key = os.path.abspath(path)
+    with _caches_lock:
+        if key not in _caches:
+            _caches[key] = HttpCache(path, max_bytes)
+        return _caches[key]
@@ -0,0 +1,677 @@
+"""
+llm_gateway.py
+Process-wide LLM client pool and token-per-minute scheduler.
+
+MediaProfiler builds eight analyzers and ReportGenerator one more, each with
+its own ChatOpenAI client; nothing coordinated their request rates, so
+parallel runs hit 429s and every client retried on its own. All chat models
+now come from chat_model(), which hands out one shared ChatOpenAI per
+(model, temperature) on a pooled httpx client whose transport meters every
+request:
+
+    - Requests and tokens per minute are drawn from per-model token buckets
+      (LLM_RATE_LIMITS in config.py). A request reserves its prompt size plus
+      LLM_COMPLETION_TOKEN_ESTIMATE; the reservation is settled against the
+      usage reported in the response
+    - A 429 pauses the model's bucket for the Retry-After period, so waiting
+      requests hold back instead of joining a retry storm
+    - Waiting requests are served interactive first, then batch, in arrival
+      order; evaluation runs wrap their work in priority(BATCH)
+    - With LLM_GATEWAY_STATE_PATH set, the buckets live in a SQLite file and
+      every process using it shares one budget (priority ordering is still
+      per process)
+
+Async calls (ainvoke/abatch) use a second pooled client, http_async_client(),
+metered by the same buckets and queues: coroutines wait their turn with
+aacquire() without blocking the event loop.
+
+Under the scheduler, each request gets an adaptive deadline and, when slow,
+a hedged duplicate (resilience.py); hedges are not metered separately.
+
+metrics() reports queue depth per priority, requests in flight, wait time and
+rate-limit responses. Replay runs are served from cassettes and not metered.
+"""
+
+import asyncio
+import contextvars
+import heapq
+import itertools
+import json
+import logging
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
+
+import httpx
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_openai import ChatOpenAI
+
+import resilience
+import tracing
+import transport
+from config import (
+    LLM_COMPLETION_TOKEN_ESTIMATE,
+    LLM_DEFAULT_PRIORITY,
+    LLM_DEFAULT_RATE_LIMIT,
+    LLM_GATEWAY_ENABLED,
+    LLM_GATEWAY_STATE_PATH,
+    LLM_POOL_MAX_CONNECTIONS,
+    LLM_RATE_LIMITS,
+    RESILIENCE_ENABLED,
+)
+
+logger = logging.getLogger(__name__)
+
+INTERACTIVE = "interactive"
+BATCH = "batch"
+PRIORITIES = (INTERACTIVE, BATCH)
+
+# Rough prompt size of a request body (JSON messages + schema) in tokens
+_BYTES_PER_TOKEN = 4
+# Longest a waiter sleeps before re-checking shared buckets
+_MAX_POLL_SECONDS = 1.0
+# Async waiters are not woken by the condition variable and poll their turn
+_ASYNC_POLL_SECONDS = 0.05
+
+_priority: contextvars.ContextVar[str] = contextvars.ContextVar("llm_priority", default=LLM_DEFAULT_PRIORITY)
+
+
+@contextmanager
+def priority(level: str) -> Iterator[None]:
+    """Send the LLM requests made in this block at `level` (INTERACTIVE or BATCH)."""
+    if level not in PRIORITIES:
+        raise ValueError(f"Unknown LLM priority: {level} (expected one of {', '.join(PRIORITIES)})")
+    token = _priority.set(level)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+# =============================================================================
+# Tracing
+# =============================================================================
+
+
+class TracingCallbackHandler(BaseCallbackHandler):
+    """
+    Records every chat model call as an LLM span on the active tracer.
+
+    Captures latency, prompt/completion token usage and retries. Does nothing
+    when no tracer is active.
+    """
+
+    # Cheap bookkeeping: run in the caller's context on async calls too,
+    # instead of in an executor thread per callback
+    run_inline = True
+
+    def __init__(self):
+        self._runs: dict = {}
+
+    def on_chat_model_start(self, serialized, messages, *, run_id, **kwargs):
+        tracer = tracing.current_tracer()
+        if tracer is None:
+            return
+        params = kwargs.get("invocation_params") or {}
+        model = params.get("model") or params.get("model_name")
+        self._runs[run_id] = (
+            tracer,
+            tracer.start_span("chat_completion", tracing.LLM, parent=tracing.current_span(), model=model),
+        )
+
+    def on_llm_end(self, response, *, run_id, **kwargs):
+        run = self._runs.pop(run_id, None)
+        if run is None:
+            return
+        tracer, span = run
+        usage = (response.llm_output or {}).get("token_usage") or {}
+        span.attributes["prompt_tokens"] = usage.get("prompt_tokens", 0)
+        span.attributes["completion_tokens"] = usage.get("completion_tokens", 0)
+        cached = (usage.get("prompt_tokens_details") or {}).get("cached_tokens")
+        if cached:
+            span.attributes["cached_prompt_tokens"] = cached
+        model_name = (response.llm_output or {}).get("model_name")
+        if model_name:
+            span.attributes["model"] = model_name
+        tracer.end_span(span)
+
+    def on_llm_error(self, error, *, run_id, **kwargs):
+        run = self._runs.pop(run_id, None)
+        if run is not None:
+            tracer, span = run
+            tracer.end_span(span, error=error)
+
+    def on_retry(self, retry_state, *, run_id, **kwargs):
+        run = self._runs.get(run_id)
+        if run is not None:
+            span = run[1]
+            span.attributes["retries"] = span.attributes.get("retries", 0) + 1
+
+
+# =============================================================================
+# Token buckets
+# =============================================================================
+
+
+def _take(state: dict, limit: tuple[int, int], tokens: float, now: float) -> float:
+    """
+    Refill a bucket state and take one request plus `tokens` from it.
+
+    Args:
+        state: {"requests", "tokens", "updated", "paused_until"} (updated in place)
+        limit: (requests per minute, tokens per minute)
+        tokens: Tokens to reserve (capped at the per-minute budget)
+        now: Current time (epoch seconds)
+
+    Returns:
+        0 when taken, otherwise seconds until the bucket can serve the request
+    """
+    rpm, tpm = limit
+    elapsed = max(now - state["updated"], 0.0)
+    state["requests"] = min(rpm, state["requests"] + elapsed * rpm / 60)
+    state["tokens"] = min(tpm, state["tokens"] + elapsed * tpm / 60)
+    state["updated"] = now
+    if state["paused_until"] > now:
+        return state["paused_until"] - now
+
+    tokens = min(tokens, tpm)
+    if state["requests"] >= 1 and state["tokens"] >= tokens:
+        state["requests"] -= 1
+        state["tokens"] -= tokens
+        return 0.0
+    wait_requests = (1 - state["requests"]) * 60 / rpm if state["requests"] < 1 else 0.0
+    wait_tokens = (tokens - state["tokens"]) * 60 / tpm if state["tokens"] < tokens else 0.0
+    return max(wait_requests, wait_tokens, 0.001)
+
+
+class TokenBuckets:
+    """Per-model request and token buckets held in this process."""
+
+    def __init__(self, limits: dict[str, tuple[int, int]], default_limit: tuple[int, int]):
+        self.limits = limits
+        self.default_limit = default_limit
+        self._states: dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def limit(self, model: str) -> tuple[int, int]:
+        return self.limits.get(model, self.default_limit)
+
+    def _state(self, model: str, now: float) -> dict:
+        if model not in self._states:
+            rpm, tpm = self.limit(model)
+            self._states[model] = {"requests": rpm, "tokens": tpm, "updated": now, "paused_until": 0.0}
+        return self._states[model]
+
+    def try_take(self, model: str, tokens: float) -> float:
+        """Take a request slot and `tokens`; returns 0 or the seconds to wait."""
+        now = time.time()
+        with self._lock:
+            return _take(self._state(model, now), self.limit(model), tokens, now)
+
+    def adjust(self, model: str, tokens: float) -> None:
+        """Return (positive) or charge (negative) tokens after the real usage is known."""
+        with self._lock:
+            state = self._state(model, time.time())
+            state["tokens"] = min(self.limit(model)[1], state["tokens"] + tokens)
+
+    def pause(self, model: str, seconds: float) -> None:
+        """Hold every request for `model` for `seconds` (after a 429)."""
+        with self._lock:
+            state = self._state(model, time.time())
+            state["paused_until"] = max(state["paused_until"], time.time() + seconds)
+
+
+class SharedTokenBuckets(TokenBuckets):
+    """Token buckets in a SQLite file, shared by every process that opens it."""
+
+    _SCHEMA = """
+    CREATE TABLE IF NOT EXISTS buckets (
+        model TEXT PRIMARY KEY,
+        requests REAL NOT NULL,
+        tokens REAL NOT NULL,
+        updated REAL NOT NULL,
+        paused_until REAL NOT NULL
+    );
+    """
+
+    def __init__(self, path: str | Path, limits: dict[str, tuple[int, int]], default_limit: tuple[int, int]):
+        super().__init__(limits, default_limit)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Autocommit mode: transactions are opened explicitly with BEGIN IMMEDIATE
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(self._SCHEMA)
+
+    def _update(self, model: str, apply) -> float:
+        """Run `apply(state, now)` on the model's row inside a write transaction."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT requests, tokens, updated, paused_until FROM buckets WHERE model = ?", (model,)
+                ).fetchone()
+                if row is None:
+                    rpm, tpm = self.limit(model)
+                    state = {"requests": rpm, "tokens": tpm, "updated": now, "paused_until": 0.0}
+                else:
+                    state = dict(zip(("requests", "tokens", "updated", "paused_until"), row))
+                result = apply(state, now)
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO buckets (model, requests, tokens, updated, paused_until) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (model, state["requests"], state["tokens"], state["updated"], state["paused_until"]),
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return result
+
+    def try_take(self, model: str, tokens: float) -> float:
+        return self._update(model, lambda state, now: _take(state, self.limit(model), tokens, now))
+
+    def adjust(self, model: str, tokens: float) -> None:
+        def apply(state, now):
+            state["tokens"] = min(self.limit(model)[1], state["tokens"] + tokens)
+        self._update(model, apply)
+
+    def pause(self, model: str, seconds: float) -> None:
+        def apply(state, now):
+            state["paused_until"] = max(state["paused_until"], now + seconds)
+        self._update(model, apply)
+
+
+# =============================================================================
+# Gateway
+# =============================================================================
+
+
+class LLMGateway:
+    """
+    Shared chat models, pooled connections and rate scheduling.
+
+    Attributes:
+        buckets: TokenBuckets (or SharedTokenBuckets) the requests draw from
+        max_connections: Pooled HTTP connections to the API
+        stats: Counters (requests, reserved_tokens, used_tokens, waits,
+            wait_seconds, rate_limited)
+    """
+
+    def __init__(
+        self,
+        limits: Optional[dict[str, tuple[int, int]]] = None,
+        default_limit: tuple[int, int] = LLM_DEFAULT_RATE_LIMIT,
+        state_path: Optional[str] = None,
+        max_connections: int = LLM_POOL_MAX_CONNECTIONS,
+        completion_estimate: int = LLM_COMPLETION_TOKEN_ESTIMATE,
+    ):
+        """
+        Initialize the LLMGateway.
+
+        Args:
+            limits: Per-model (requests/min, tokens/min) (default: LLM_RATE_LIMITS)
+            default_limit: Budget for models missing from `limits`
+            state_path: SQLite file to share the buckets across processes
+                (None keeps them in this process)
+            max_connections: Pooled HTTP connections to the API
+            completion_estimate: Tokens reserved per call for the completion
+        """
+        limits = limits if limits is not None else LLM_RATE_LIMITS
+        self.buckets = (
+            SharedTokenBuckets(state_path, limits, default_limit) if state_path
+            else TokenBuckets(limits, default_limit)
+        )
+        self.max_connections = max_connections
+        self.completion_estimate = completion_estimate
+        self.stats = {
+            "requests": 0, "reserved_tokens": 0, "used_tokens": 0,
+            "waits": 0, "wait_seconds": 0.0, "rate_limited": 0,
+        }
+        self._cond = threading.Condition()
+        self._queues: dict[str, list] = {}
+        self._queued = {level: 0 for level in PRIORITIES}
+        self._in_flight = 0
+        self._sequence = itertools.count()
+        self._models: dict[tuple, ChatOpenAI] = {}
+        self._clients: dict[tuple, Optional[httpx.Client]] = {}
+        self._async_clients: dict[tuple, Optional[httpx.AsyncClient]] = {}
+        self._models_lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Scheduling
+    # ------------------------------------------------------------------
+
+    def acquire(self, model: str, tokens: int, level: Optional[str] = None) -> float:
+        """
+        Block until `model` has budget for one request of `tokens`.
+
+        Waiters are served by priority (interactive before batch), then in
+        arrival order.
+
+        Args:
+            model: Model the request is for
+            tokens: Tokens to reserve
+            level: Priority (default: the one set with priority())
+
+        Returns:
+            Seconds spent waiting
+        """
+        level = level or _priority.get()
+        started = time.monotonic()
+        with self._cond:
+            queue, ticket = self._enqueue(model, level)
+            try:
+                while True:
+                    timeout = None
+                    if queue[0] == ticket:
+                        wait = self.buckets.try_take(model, tokens)
+                        if wait == 0:
+                            heapq.heappop(queue)
+                            break
+                        timeout = min(wait, _MAX_POLL_SECONDS)
+                    self._cond.wait(timeout)
+            except BaseException:
+                self._dequeue(queue, ticket)
+                raise
+            finally:
+                self._queued[level] -= 1
+                self._cond.notify_all()
+            return self._admitted(tokens, started)
+
+    async def aacquire(self, model: str, tokens: int, level: Optional[str] = None) -> float:
+        """
+        Coroutine counterpart of acquire(), sharing its queues and buckets.
+
+        The event loop keeps running while the request waits; its turn is
+        polled every _ASYNC_POLL_SECONDS (or when the bucket refills).
+        """
+        level = level or _priority.get()
+        started = time.monotonic()
+        with self._cond:
+            queue, ticket = self._enqueue(model, level)
+        try:
+            while True:
+                with self._cond:
+                    delay = _ASYNC_POLL_SECONDS
+                    if queue[0] == ticket:
+                        wait = self.buckets.try_take(model, tokens)
+                        if wait == 0:
+                            heapq.heappop(queue)
+                            break
+                        delay = min(wait, _MAX_POLL_SECONDS)
+                await asyncio.sleep(delay)
+        except BaseException:
+            with self._cond:
+                self._dequeue(queue, ticket)
+            raise
+        finally:
+            with self._cond:
+                self._queued[level] -= 1
+                self._cond.notify_all()
+        with self._cond:
+            return self._admitted(tokens, started)
+
+    def _enqueue(self, model: str, level: str) -> tuple[list, tuple]:
+        """Queue a ticket for `model` (lock held)."""
+        ticket = (PRIORITIES.index(level), next(self._sequence))
+        queue = self._queues.setdefault(model, [])
+        heapq.heappush(queue, ticket)
+        self._queued[level] += 1
+        return queue, ticket
+
+    @staticmethod
+    def _dequeue(queue: list, ticket: tuple) -> None:
+        """Withdraw an abandoned ticket (lock held)."""
+        queue.remove(ticket)
+        heapq.heapify(queue)
+
+    def _admitted(self, tokens: int, started: float) -> float:
+        """Count an admitted request and return its wait (lock held)."""
+        self._in_flight += 1
+        waited = time.monotonic() - started
+        self.stats["requests"] += 1
+        self.stats["reserved_tokens"] += tokens
+        if waited > 0.01:
+            self.stats["waits"] += 1
+            self.stats["wait_seconds"] += waited
+        return waited
+
+    def release(self, model: str, reserved: int, used: Optional[int]) -> None:
+        """Finish a request, settling its reservation against the real usage (None = unknown)."""
+        if used is not None and used != reserved:
+            self.buckets.adjust(model, reserved - used)
+        with self._cond:
+            self._in_flight -= 1
+            if used is not None:
+                self.stats["used_tokens"] += used
+            self._cond.notify_all()
+
+    def rate_limited(self, model: str, retry_after: float) -> None:
+        """Pause `model` after a 429 so queued requests back off together."""
+        logger.warning(f"LLM gateway: rate limited on {model}, pausing {retry_after:.1f}s")
+        self.buckets.pause(model, retry_after)
+        with self._cond:
+            self.stats["rate_limited"] += 1
+
+    def metrics(self) -> dict:
+        """Queue depth per priority, requests in flight and cumulative counters."""
+        with self._cond:
+            return {
+                "queued": dict(self._queued),
+                "queue_depth": sum(self._queued.values()),
+                "in_flight": self._in_flight,
+                **self.stats,
+            }
+
+    # ------------------------------------------------------------------
+    # Clients
+    # ------------------------------------------------------------------
+
+    def http_client(self) -> Optional[httpx.Client]:
+        """
+        Pooled, metered httpx client for the current transport mode.
+
+        Replay serves cassettes without network or rate limits, so it uses
+        transport.http_client() directly.
+        """
+        mode = transport.mode()
+        if mode == transport.REPLAY:
+            return transport.http_client()
+        key = (mode, id(transport.get_store()))
+        with self._models_lock:
+            if key not in self._clients:
+                if mode == transport.RECORD:
+                    inner = transport.CassetteTransport(transport.get_store(), record=True)
+                else:
+                    inner = httpx.HTTPTransport(
+                        limits=httpx.Limits(
+                            max_connections=self.max_connections,
+                            max_keepalive_connections=self.max_connections,
+                        )
+                    )
+                if RESILIENCE_ENABLED:
+                    inner = resilience.ResilientTransport(inner)
+                self._clients[key] = httpx.Client(
+                    transport=GatewayTransport(self, inner),
+                    timeout=httpx.Timeout(120.0),
+                )
+            return self._clients[key]
+
+    def http_async_client(self) -> Optional[httpx.AsyncClient]:
+        """Async counterpart of http_client() (per-loop connection pools)."""
+        mode = transport.mode()
+        if mode == transport.REPLAY:
+            return transport.http_async_client()
+        key = (mode, id(transport.get_store()))
+        with self._models_lock:
+            if key not in self._async_clients:
+                if mode == transport.RECORD:
+                    inner = transport.AsyncCassetteTransport(transport.get_store(), record=True)
+                else:
+                    limits = httpx.Limits(
+                        max_connections=self.max_connections,
+                        max_keepalive_connections=self.max_connections,
+                    )
+                    inner = transport.LoopLocalTransport(lambda: httpx.AsyncHTTPTransport(limits=limits))
+                if RESILIENCE_ENABLED:
+                    inner = resilience.AsyncResilientTransport(inner)
+                self._async_clients[key] = httpx.AsyncClient(
+                    transport=AsyncGatewayTransport(self, inner),
+                    timeout=httpx.Timeout(120.0),
+                )
+            return self._async_clients[key]
+
+    def chat_model(self, model: str, temperature: float = 0.0) -> ChatOpenAI:
+        """
+        Shared ChatOpenAI for (model, temperature), traced and metered.
+
+        Callers bind their own structured output (with_structured_output
+        returns a new runnable), so one instance serves every analyzer.
+        """
+        http_client = self.http_client()
+        http_async_client = self.http_async_client()
+        key = (model, temperature, id(http_client), id(http_async_client))
+        with self._models_lock:
+            if key not in self._models:
+                self._models[key] = ChatOpenAI(
+                    model=model,
+                    temperature=temperature,
+                    callbacks=[TracingCallbackHandler()],
+                    http_client=http_client,
+                    http_async_client=http_async_client,
+                )
+            return self._models[key]
+
+
+def _retry_after(headers: httpx.Headers) -> float:
+    """Seconds to back off after a 429 (Retry-After / OpenAI reset headers)."""
+    for name, scale in (("retry-after-ms", 0.001), ("retry-after", 1.0)):
+        try:
+            return float(headers[name]) * scale
+        except (KeyError, ValueError):
+            continue
+    return 1.0
+
+
+def _reservation(gateway: LLMGateway, body: bytes) -> tuple[dict, str, int]:
+    """(payload, model, tokens to reserve) for a chat completion request body."""
+    try:
+        payload = json.loads(body) if body else {}
+    except ValueError:
+        payload = {}
+    model = payload.get("model", "unknown")
+    completion = payload.get("max_completion_tokens") or payload.get("max_tokens") or gateway.completion_estimate
+    return payload, model, len(body) // _BYTES_PER_TOKEN + completion
+
+
+def _usage(content: bytes) -> Optional[int]:
+    """Total tokens reported in a completion response body, if any."""
+    try:
+        return json.loads(content).get("usage", {}).get("total_tokens")
+    except (ValueError, AttributeError):
+        return None
+
+
+class GatewayTransport(httpx.BaseTransport):
+    """httpx transport that schedules chat completion requests through an LLMGateway."""
+
+    def __init__(self, gateway: LLMGateway, inner: httpx.BaseTransport):
+        self.gateway = gateway
+        self.inner = inner
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        payload, model, reserved = _reservation(self.gateway, request.read())
+
+        waited = self.gateway.acquire(model, reserved)
+        if waited > 0.01:
+            tracing.increment("llm_queue_wait_ms", int(waited * 1000))
+
+        used = None
+        try:
+            response = self.inner.handle_request(request)
+            if response.status_code == 429:
+                used = 0
+                self.gateway.rate_limited(model, _retry_after(response.headers))
+            elif response.status_code < 400 and not payload.get("stream"):
+                used = _usage(response.read())
+            return response
+        finally:
+            self.gateway.release(model, reserved, used)
+
+    def close(self) -> None:
+        self.inner.close()
+
+
+class AsyncGatewayTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of GatewayTransport."""
+
+    def __init__(self, gateway: LLMGateway, inner: httpx.AsyncBaseTransport):
+        self.gateway = gateway
+        self.inner = inner
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        payload, model, reserved = _reservation(self.gateway, await request.aread())
+
+        waited = await self.gateway.aacquire(model, reserved)
+        if waited > 0.01:
+            tracing.increment("llm_queue_wait_ms", int(waited * 1000))
+
+        used = None
+        try:
+            response = await self.inner.handle_async_request(request)
+            if response.status_code == 429:
+                used = 0
+                self.gateway.rate_limited(model, _retry_after(response.headers))
+            elif response.status_code < 400 and not payload.get("stream"):
+                used = _usage(await response.aread())
+            return response
+        finally:
+            self.gateway.release(model, reserved, used)
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+
+# =============================================================================
+# Process-wide gateway
+# =============================================================================
+
+_gateway: Optional[LLMGateway] = None
+_gateway_lock = threading.Lock()
+
+
+def get_gateway() -> LLMGateway:
+    """The process-wide LLMGateway (configured from config.py)."""
+    global _gateway
+    with _gateway_lock:
+        if _gateway is None:
+            _gateway = LLMGateway(state_path=LLM_GATEWAY_STATE_PATH or None)
+        return _gateway
+
+
+def chat_model(model: str = "gpt-4o-mini", temperature: float = 0.0) -> ChatOpenAI:
+    """
+    Chat model for analyzers and report generation.
+
+    Routed through the process-wide gateway, or a plain traced client when
+    LLM_GATEWAY_ENABLED is off.
+    """
+    if not LLM_GATEWAY_ENABLED:
+        return ChatOpenAI(
+            model=model,
+            temperature=temperature,
+            callbacks=[TracingCallbackHandler()],
+            http_client=transport.http_client(),
+            http_async_client=transport.http_async_client(),
+        )
+    return get_gateway().chat_model(model, temperature)
+
+
+def metrics() -> dict:
+    """Metrics of the process-wide gateway (see LLMGateway.metrics)."""
+    return get_gateway().metrics()
@@ -11,10 +11,16 @@ from transformers import (
     AutoModelForSequenceClassification,
     pipeline
 )
+from article_cache import article_key, namespace, resolve
 from config import PROPAGANDA_TECHNIQUES
 
 class LocalPropagandaDetector:
-    def __init__(self, si_model_path="propaganda_models/si_model", tc_model_path="propaganda_models/tc_model"):
+    # Bump when detect() output changes for the same models
+    CACHE_VERSION = 1
+
+    def __init__(self, si_model_path="propaganda_models/si_model", tc_model_path="propaganda_models/tc_model", article_cache=None):
+        self.model_paths = f"{si_model_path}|{tc_model_path}"
+        self._article_cache = article_cache
         self.device = 0 if torch.cuda.is_available() else -1
         print(f"Loading Local Propaganda Models on device {self.device}...")
         
@@ -47,9 +53,21 @@ class LocalPropagandaDetector:
             self.ready = False
 
     def detect(self, text):
+        """Propaganda spans in `text`, reused from the article cache when seen before."""
         if not self.ready:
             return []
-            
+        cache = resolve(self._article_cache)
+        if cache is None:
+            return self._detect(text)
+        cache_namespace = namespace("propaganda", self.CACHE_VERSION, self.model_paths)
+        key = article_key(None, text)
+        findings = cache.get(cache_namespace, key)
+        if findings is None:
+            findings = self._detect(text)
+            cache.put(cache_namespace, key, findings)
+        return findings
+
+    def _detect(self, text):
         # Step 1: Identify Spans (Where is the propaganda?)
         # Returns list of dicts: {'entity_group': 'PROP', 'score': 0.9, 'word': 'fake news', 'start': 10, 'end': 19}
         si_results = self.si_pipe(text)
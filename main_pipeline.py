@@ -1,17 +1,25 @@
 """
 main_pipeline.py
 The primary entry point for analyzing a site.
+
+Only what the cached-report path needs (storage, config) is imported at
+module load. The scraper, analyzers, LLM clients and tracing are imported
+when a fresh analysis starts, so printing a cached report does not pay for
+langchain, openai, ddgs, whois and BeautifulSoup
+(verify_import_time.py guards this).
 """
 
 import argparse
 import logging
 import sys
+from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 
-from scraper import MediaScraper
-from research import MediaProfiler
+from config import STAGE_TTL_DAYS
 from storage import StorageManager
-from report_generator import ReportGenerator
+
+if TYPE_CHECKING:
+    from stage_cache import StageCache
 
 # Configure logging
 logging.basicConfig(
@@ -20,13 +28,29 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def analyze_site(url: str, force_refresh: bool = False):
+def analyze_site(
+    url: str,
+    force_refresh: bool = False,
+    trace_path: str | None = None,
+    trace_format: str = "json",
+    full_refresh: bool = False,
+    recompute: list[str] | None = None,
+):
     """
     Main logic flow:
     1. Extract domain.
     2. Check storage for existing fresh report.
     3. If cached, load and print.
     4. If not, scrape -> profile -> generate -> save -> print.
+
+    A refresh is incremental: stages whose inputs are unchanged and whose
+    TTL has not expired are reused from the last run (see stage_cache.py).
+    `full_refresh` recomputes every stage; `recompute` names stages to
+    recompute regardless of their records.
+
+    If trace_path is given, the fresh analysis is traced end to end
+    (scrape, every analyzer, LLM/search/fetch calls, report generation)
+    and the trace is written there in `trace_format` ("json" or "chrome").
     """
     
     # 1. Setup
@@ -34,7 +58,7 @@ def analyze_site(url: str, force_refresh: bool = False):
     storage = StorageManager()
     
     # 2. Check Cache
-    if not force_refresh and storage.exists(domain):
+    if not (force_refresh or full_refresh or recompute) and storage.exists(domain):
         logger.info(f"✅ Found cached report for {domain}")
         
         # Load the pretty report
@@ -49,35 +73,74 @@ def analyze_site(url: str, force_refresh: bool = False):
         print(report_text)
         return
 
-    # 3. If no cache, perform analysis
+    # 3. If no cache, perform analysis (reusing unchanged stages of the last run)
     logger.info(f"🚀 Starting fresh analysis for {domain}...")
-    
-    # A. Scrape
-    scraper = MediaScraper(url, max_articles=15)
-    articles_obj = scraper.scrape_feed() # Returns Article objects
-    
-    if not articles_obj:
-        logger.error("No articles found. Aborting.")
-        return
+    import fetching
+    import tracing
+    from stage_cache import StageCache
+
+    stage_cache = StageCache(
+        records=None if full_refresh else storage.load_stages(domain),
+        recompute=recompute or (),
+    )
+    tracer = tracing.Tracer(f"analyze_site:{domain}")
+    # One fetch context for scraping and profiling: each page is downloaded once
+    with tracing.activate(tracer), fetching.activate(fetching.FetchContext()):
+        with tracer.span("analyze_site", tracing.STAGE, url=url):
+            _run_fresh_analysis(url, domain, storage, stage_cache)
+
+    summary = tracer.summary()
+    logger.info(
+        f"⏱️  Total {summary['total_duration_s']:.1f}s, "
+        f"{summary['totals']['llm_calls']} LLM calls, "
+        f"{summary['totals']['prompt_tokens'] + summary['totals']['completion_tokens']} tokens, "
+        f"~${summary['totals']['cost_usd']:.4f}"
+    )
+    if summary["totals"]["fallbacks"]:
+        logger.warning(
+            f"⚠️  {summary['totals']['fallbacks']} analyzer result(s) fell back to neutral defaults: "
+            + ", ".join(f"{name} ({stats['fallbacks']})" for name, stats in summary["stages"].items() if stats["fallbacks"])
+        )
+    if trace_path:
+        tracer.export(trace_path, fmt=trace_format)
+
 
-    # Convert Article objects to dicts for the profiler
-    articles_data = [
-        {"title": a.title, "text": a.text, "url": a.url}
-        for a in articles_obj
-    ]
+def _run_fresh_analysis(url: str, domain: str, storage: StorageManager, stage_cache: "StageCache"):
+    """Scrape -> profile -> generate -> save -> print (traced by the caller)."""
+    import tracing
+    from report_generator import ReportGenerator
+    from research import MediaProfiler
+    from scraper import MediaScraper
 
-    # B. Profile (Run all analyzers)
+    # A+B. Scrape and profile: outlet-level analyzers run while articles download
+    scraper = MediaScraper(url, max_articles=15)
     profiler = MediaProfiler()
-    # Note: profile() returns a ComprehensiveReportData object
-    report_data = profiler.profile(url, articles_data)
+    # Note: profile_streaming() returns a ComprehensiveReportData object
+    report_data = profiler.profile_streaming(url, scraper.iter_articles(), stage_cache=stage_cache)
+
+    if not report_data.articles_analyzed:
+        logger.error("No articles found. Aborting.")
+        return
 
-    # C. Generate Prose Report
+    # C. Generate Prose Report (unless the analysis it is written from is unchanged)
     logger.info("✍️  Generating narrative report...")
     generator = ReportGenerator()
-    report_text = generator.generate(report_data)
+    with tracing.span("report_text", tracing.STAGE):
+        report_text = stage_cache.run(
+            "report_text",
+            {
+                "data": report_data.model_dump(mode="json", exclude={"analysis_date", "trace_summary"}),
+                "model": generator.model,
+                "version": generator.VERSION,
+            },
+            str,
+            lambda: generator.generate(report_data),
+        )
 
     # D. Save Results
     storage.save(domain, report_data, report_text)
+    storage.save_stages(domain, stage_cache.records)
+    logger.info(f"♻️  Stages {stage_cache.summary()}")
 
     # E. Output
     print("\n" + "="*80)
@@ -88,8 +151,22 @@ def analyze_site(url: str, force_refresh: bool = False):
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Media Bias Analysis Pipeline")
     parser.add_argument("url", help="The URL of the news site to analyze")
-    parser.add_argument("--refresh", action="store_true", help="Ignore cache and force re-analysis")
+    parser.add_argument("--refresh", action="store_true",
+                        help="Re-analyze, recomputing only stages whose inputs changed or whose TTL expired")
+    parser.add_argument("--full-refresh", action="store_true", help="Re-analyze, recomputing every stage")
+    parser.add_argument("--recompute", metavar="STAGES",
+                        help="Comma-separated stages to recompute (implies --refresh), e.g. history,ownership")
+    parser.add_argument("--trace", metavar="PATH", help="Write a latency/token trace of the analysis to PATH")
+    parser.add_argument("--trace-format", choices=["json", "chrome"], default="json",
+                        help="Trace format: native JSON or Chrome trace-event (default: json)")
     
     args = parser.parse_args()
+    if args.recompute:
+        unknown = [s for s in args.recompute.split(",") if s not in STAGE_TTL_DAYS]
+        if unknown:
+            parser.error(f"Unknown stage(s): {', '.join(unknown)} (expected: {', '.join(STAGE_TTL_DAYS)})")
     
-    analyze_site(args.url, force_refresh=args.refresh)
\ No newline at end of file
+    analyze_site(args.url, force_refresh=args.refresh,
+                 trace_path=args.trace, trace_format=args.trace_format,
+                 full_refresh=args.full_refresh,
+                 recompute=args.recompute.split(",") if args.recompute else None)
\ No newline at end of file
@@ -3,30 +3,62 @@ Refactored analyzers using deterministic data retrieval and structured LLM outpu
 
 This module replaces heuristic-based methods with:
 - LangChain's .with_structured_output() for type-safe LLM responses
-- python-whois for deterministic domain age data
+- RDAP/WHOIS (domain_age.py, cached) for deterministic domain age data
 - DuckDuckGo search for external information gathering
 
 Classes:
     OpinionAnalyzer: Classifies articles using LLM content analysis (no URL heuristics)
     TrafficLongevityAnalyzer: Gets domain age from WHOIS + traffic from search/LLM
     MediaTypeAnalyzer: Classifies media type using Wikipedia search + LLM
+
+Every analyzer has an `aanalyze` coroutine next to `analyze`, on the async
+LLM, search and HTTP clients, so many outlets can be analyzed concurrently on
+one event loop (see MediaProfiler.aprofile in research.py).
 """
 
+import asyncio
 import logging
+import math
 import re
-from datetime import date, datetime
+from datetime import date
 from typing import Optional
 from urllib.parse import urlparse
 
-import whois
-from ddgs import DDGS
+from langchain_core.runnables import RunnableLambda
 from langchain_openai import ChatOpenAI
-
+from openai import APIConnectionError, APITimeoutError, InternalServerError, RateLimitError
+
+import domain_age
+import llm_gateway
+import resilience
+import resources
+import tracing
+import transport
+from article_cache import ArticleCache, acached, article_key, cached, content_key, corpus_key, namespace, resolve
+from article_packing import PackedArticle, PackingResult, format_article_header, pack_articles
+from config import (
+    ARTICLE_MAX_TOKENS,
+    ARTICLE_MIN_TOKENS,
+    EDITORIAL_BIAS_CHUNK_TOKENS,
+    EDITORIAL_BIAS_MAP_REDUCE_BUDGET,
+    EDITORIAL_BIAS_MAX_CONCURRENCY,
+    EDITORIAL_BIAS_MODE,
+    EDITORIAL_BIAS_REDUCE_LLM,
+    EDITORIAL_BIAS_TOKEN_BUDGET,
+    LLM_MAX_ATTEMPTS,
+    OPINION_MAX_CONCURRENCY,
+    OPINION_PACK_SIZE,
+)
 from schemas import (
     ArticleClassification,
+    ArticleClassificationBatch,
     ArticleType,
     BiasDirection,
+    FusedContentLLMOutput,
+    DroppedArticle,
+    EditorialBiasChunkOutput,
     EditorialBiasLLMOutput,
+    EditorialBiasReduceOutput,
     EditorialBiasResult,
     FactCheckAnalysisResult,
     FactCheckFinding,
@@ -71,9 +103,89 @@ def get_llm(model: str = "gpt-4o-mini", temperature: float = 0.0) -> ChatOpenAI:
         temperature: Temperature setting (0 for deterministic)
 
     Returns:
-        Configured ChatOpenAI instance
+        Shared ChatOpenAI instance, traced via TracingCallbackHandler and
+        rate-scheduled by the LLM gateway (see llm_gateway.py)
+    """
+    return llm_gateway.chat_model(model, temperature)
+
+
+# Errors worth retrying: rate limits and transient server/network failures
+RETRYABLE_LLM_ERRORS = (RateLimitError, APITimeoutError, APIConnectionError, InternalServerError)
+
+
+def with_llm_retry(runnable, max_attempts: int = LLM_MAX_ATTEMPTS):
+    """
+    Wrap a runnable with jittered exponential-backoff retries on rate limits
+    and transient API errors (other errors fail immediately).
+
+    Args:
+        runnable: LLM or structured-output runnable
+        max_attempts: Total attempts per call
+
+    Returns:
+        Runnable with retries
+    """
+    return runnable.with_retry(
+        retry_if_exception_type=RETRYABLE_LLM_ERRORS,
+        wait_exponential_jitter=True,
+        stop_after_attempt=max_attempts,
+    )
+
+
+def batch_with_retry(runnable, inputs: list, max_concurrency: int) -> list:
+    """
+    Run `inputs` through `runnable` concurrently, retrying each call on its own.
+
+    RunnableRetry.batch() retries the batch as a whole, so a single
+    non-retryable failure is reported for every input; wrapping the
+    per-call retry in a lambda keeps failures isolated to their input.
+
+    Args:
+        runnable: LLM or structured-output runnable
+        inputs: Prompts to send
+        max_concurrency: Maximum calls in flight
+
+    Returns:
+        One result or Exception per input, in input order
     """
-    return ChatOpenAI(model=model, temperature=temperature)
+    retrying = with_llm_retry(runnable)
+    return RunnableLambda(lambda prompt, config: retrying.invoke(prompt, config)).batch(
+        inputs,
+        config={"max_concurrency": max_concurrency},
+        return_exceptions=True,
+    )
+
+
+async def abatch_with_retry(runnable, inputs: list, max_concurrency: int) -> list:
+    """Coroutine counterpart of batch_with_retry() (calls run on the event loop)."""
+    retrying = with_llm_retry(runnable)
+
+    async def ainvoke(prompt, config):
+        return await retrying.ainvoke(prompt, config)
+
+    return await RunnableLambda(ainvoke).abatch(
+        inputs,
+        config={"max_concurrency": max_concurrency},
+        return_exceptions=True,
+    )
+
+
+def combine_snippets(results: list[dict]) -> Optional[str]:
+    """Combine the top five search results into one snippet (None when there are none)."""
+    if not results:
+        return None
+    snippets = []
+    for r in results[:5]:
+        title = r.get("title", "")
+        body = r.get("body", "")
+        snippets.append(f"{title}: {body}")
+    return "\n".join(snippets)
+
+
+async def asearch_text(search, query: str, **kwargs) -> list[dict]:
+    """Traced DuckDuckGo text search from a coroutine (see transport.asearch)."""
+    with tracing.span("ddgs.text", tracing.SEARCH, query=query[:100]):
+        return await transport.asearch(search, query, **kwargs)
 
 
 # =============================================================================
@@ -92,11 +204,18 @@ class OpinionAnalyzer:
     - Presence of subjective language
     - Factual reporting vs commentary patterns
 
+    LLM classifications are kept in the article cache (article_cache.py), so
+    an article seen in an earlier run is not sent again.
+
     Attributes:
         llm: The LangChain LLM with structured output binding
+        batch_llm: LLM bound to ArticleClassificationBatch for packed calls
         max_text_chars: Maximum characters of text to analyze (default 1000)
+        cache_hits: Articles answered from the article cache
     """
 
+    CACHE_VERSION = 1
+
     SYSTEM_PROMPT = """You are an expert media analyst specializing in distinguishing
 between different types of journalistic content. Your task is to classify articles
 based on their actual content, writing style, and journalistic intent.
@@ -140,6 +259,7 @@ Analyze the CONTENT and STYLE, not the URL or publication name."""
         model: str = "gpt-4o-mini",
         temperature: float = 0.0,
         max_text_chars: int = 1000,
+        article_cache: Optional[ArticleCache] = None,
     ):
         """
         Initialize the OpinionAnalyzer.
@@ -148,11 +268,86 @@ Analyze the CONTENT and STYLE, not the URL or publication name."""
             model: OpenAI model to use
             temperature: LLM temperature (0 for deterministic)
             max_text_chars: Maximum characters of article text to analyze
+            article_cache: Store for per-article results (default: the
+                process-wide cache, see article_cache.default_cache())
         """
         self.llm = get_llm(model, temperature).with_structured_output(
             ArticleClassification
         )
+        self.batch_llm = get_llm(model, temperature).with_structured_output(
+            ArticleClassificationBatch
+        )
+        self.model = model
         self.max_text_chars = max_text_chars
+        self._article_cache = article_cache
+        self.cache_hits = 0
+
+    def _build_messages(self, title: str, text: str) -> list[dict[str, str]]:
+        """Build the chat messages for classifying one article."""
+        # Truncate text to max_text_chars
+        text_snippet = text[: self.max_text_chars] if text else ""
+
+        user_prompt = f"""Classify the following article:
+
+TITLE: {title}
+
+TEXT (first {self.max_text_chars} characters):
+{text_snippet}
+
+Based on the writing style, tone, and content, classify this article."""
+
+        return [
+            {"role": "system", "content": self.SYSTEM_PROMPT},
+            {"role": "user", "content": user_prompt},
+        ]
+
+    def _failed(self, error: Exception) -> ArticleClassification:
+        """Safe default (News, zero confidence) for a failed classification."""
+        logger.error(f"OpinionAnalyzer failed: {error}")
+        resilience.record_fallback("opinion", error)
+        return ArticleClassification(
+            article_type=ArticleType.NEWS,
+            confidence=0.0,
+            reasoning=f"Classification failed due to error: {str(error)}",
+        )
+
+    @staticmethod
+    def _is_failure(result: ArticleClassification) -> bool:
+        return result.confidence == 0.0 and result.reasoning.startswith("Classification failed")
+
+    # ------------------------------------------------------------------
+    # Article cache
+    # ------------------------------------------------------------------
+
+    def _cache_namespace(self) -> str:
+        return namespace("opinion", self.CACHE_VERSION, self.model, f"{self.SYSTEM_PROMPT}\n{self.max_text_chars}")
+
+    def _article_key(self, article: dict) -> str:
+        """Key of the part of an article the LLM sees."""
+        text = (article.get("text", "") or "")[: self.max_text_chars]
+        return article_key(article.get("title", ""), text)
+
+    def _cached_classifications(self, articles: list[dict]) -> list[Optional[ArticleClassification]]:
+        """Stored LLM classifications for `articles` (None where not cached)."""
+        cache = resolve(self._article_cache)
+        if cache is None:
+            return [None] * len(articles)
+        keys = [self._article_key(article) for article in articles]
+        stored = cache.get_many(self._cache_namespace(), keys)
+        return [
+            ArticleClassification.model_validate(stored[key]) if key in stored else None
+            for key in keys
+        ]
+
+    def _store_classifications(self, articles: list[dict], results: list[ArticleClassification]) -> None:
+        cache = resolve(self._article_cache)
+        if cache is None:
+            return
+        cache.put_many(self._cache_namespace(), {
+            self._article_key(article): result.model_dump(mode="json")
+            for article, result in zip(articles, results)
+            if not self._is_failure(result)
+        })
 
     def analyze(self, title: str, text: str) -> ArticleClassification:
         """
@@ -165,55 +360,223 @@ Analyze the CONTENT and STYLE, not the URL or publication name."""
         Returns:
             ArticleClassification with type, confidence, and reasoning
         """
-        # Truncate text to max_text_chars
-        text_snippet = text[: self.max_text_chars] if text else ""
-
-        user_prompt = f"""Classify the following article:
+        article = {"title": title, "text": text}
+        stored = self._cached_classification(article)
+        if stored is not None:
+            return stored
 
-TITLE: {title}
+        try:
+            result: ArticleClassification = self.llm.invoke(self._build_messages(title, text))
+            self._store_classifications([article], [result])
+            return result
 
-TEXT (first {self.max_text_chars} characters):
-{text_snippet}
+        except Exception as e:
+            # Return a safe default with low confidence
+            return self._failed(e)
 
-Based on the writing style, tone, and content, classify this article."""
+    async def aanalyze(self, title: str, text: str) -> ArticleClassification:
+        """Coroutine counterpart of analyze()."""
+        article = {"title": title, "text": text}
+        stored = self._cached_classification(article)
+        if stored is not None:
+            return stored
 
         try:
-            result: ArticleClassification = self.llm.invoke(
-                [
-                    {"role": "system", "content": self.SYSTEM_PROMPT},
-                    {"role": "user", "content": user_prompt},
-                ]
-            )
+            result: ArticleClassification = await self.llm.ainvoke(self._build_messages(title, text))
+            self._store_classifications([article], [result])
             return result
 
         except Exception as e:
-            logger.error(f"OpinionAnalyzer failed: {e}")
-            # Return a safe default with low confidence
-            return ArticleClassification(
-                article_type=ArticleType.NEWS,
-                confidence=0.0,
-                reasoning=f"Classification failed due to error: {str(e)}",
-            )
+            return self._failed(e)
+
+    def _cached_classification(self, article: dict) -> Optional[ArticleClassification]:
+        """Cached classification of one article, or None to ask the LLM."""
+        stored = self._cached_classifications([article])[0]
+        if stored is not None:
+            self.cache_hits += 1
+        return stored
 
     def analyze_batch(
-        self, articles: list[dict[str, str]]
+        self,
+        articles: list[dict[str, str]],
+        max_concurrency: int = OPINION_MAX_CONCURRENCY,
+        pack_size: int = OPINION_PACK_SIZE,
     ) -> list[ArticleClassification]:
         """
-        Classify multiple articles.
+        Classify multiple articles concurrently.
+
+        Articles are looked up in the article cache first, and only the
+        misses go to the LLM. LLM requests go through the LLM's batch() with
+        at most `max_concurrency` in flight, and are retried with jittered exponential backoff on rate
+        limits and transient API errors. Results are returned in input order;
+        articles that still fail get the same safe default as analyze().
 
         Args:
             articles: List of dicts with 'title' and 'text' keys
+            max_concurrency: Maximum parallel LLM requests
+            pack_size: Articles classified per LLM call. Values above 1 pack
+                several articles into one ArticleClassificationBatch call;
+                any article missing from a packed answer is retried alone.
 
         Returns:
-            List of ArticleClassification results
+            List of ArticleClassification results, one per article, in order
         """
-        results = []
-        for article in articles:
-            result = self.analyze(
-                title=article.get("title", ""),
-                text=article.get("text", ""),
+        if not articles:
+            return []
+
+        results, missing = self._cached_batch(articles)
+        if missing:
+            llm_results = self._analyze_with_llm(
+                [articles[i] for i in missing], max_concurrency, pack_size
+            )
+            for i, result in zip(missing, llm_results):
+                results[i] = result
+            self._store_classifications([articles[i] for i in missing], llm_results)
+        return results
+
+    async def aanalyze_batch(
+        self,
+        articles: list[dict[str, str]],
+        max_concurrency: int = OPINION_MAX_CONCURRENCY,
+        pack_size: int = OPINION_PACK_SIZE,
+    ) -> list[ArticleClassification]:
+        """Coroutine counterpart of analyze_batch()."""
+        if not articles:
+            return []
+
+        results, missing = self._cached_batch(articles)
+        if missing:
+            llm_results = await self._aanalyze_with_llm(
+                [articles[i] for i in missing], max_concurrency, pack_size
+            )
+            for i, result in zip(missing, llm_results):
+                results[i] = result
+            self._store_classifications([articles[i] for i in missing], llm_results)
+        return results
+
+    def _cached_batch(
+        self, articles: list[dict[str, str]]
+    ) -> tuple[list[Optional[ArticleClassification]], list[int]]:
+        """Cached classifications, plus the indices left for the LLM."""
+        results = self._cached_classifications(articles)
+        missing = [i for i, result in enumerate(results) if result is None]
+        hits = len(articles) - len(missing)
+        self.cache_hits += hits
+        tracing.annotate(opinion_cache_hits=hits)
+        return results, missing
+
+    def _analyze_with_llm(
+        self,
+        articles: list[dict[str, str]],
+        max_concurrency: int,
+        pack_size: int,
+    ) -> list[ArticleClassification]:
+        """Classify articles with concurrent (optionally packed) LLM calls."""
+        if pack_size > 1:
+            return self._analyze_packed(articles, max_concurrency, pack_size)
+
+        outputs = batch_with_retry(
+            self.llm,
+            [self._build_messages(a.get("title", ""), a.get("text", "")) for a in articles],
+            max_concurrency,
+        )
+        return [
+            self._failed(output) if isinstance(output, Exception) else output
+            for output in outputs
+        ]
+
+    async def _aanalyze_with_llm(
+        self,
+        articles: list[dict[str, str]],
+        max_concurrency: int,
+        pack_size: int,
+    ) -> list[ArticleClassification]:
+        """Coroutine counterpart of _analyze_with_llm()."""
+        if pack_size > 1:
+            groups, prompts = self._packed_prompts(articles, pack_size)
+            outputs = await abatch_with_retry(self.batch_llm, prompts, max_concurrency)
+            results = self._unpack(groups, outputs, len(articles))
+            missing = [i for i, result in enumerate(results) if result is None]
+            if missing:
+                retried = await self._aanalyze_with_llm([articles[i] for i in missing], max_concurrency, pack_size=1)
+                for i, result in zip(missing, retried):
+                    results[i] = result
+            return results
+
+        outputs = await abatch_with_retry(
+            self.llm,
+            [self._build_messages(a.get("title", ""), a.get("text", "")) for a in articles],
+            max_concurrency,
+        )
+        return [
+            self._failed(output) if isinstance(output, Exception) else output
+            for output in outputs
+        ]
+
+    def _analyze_packed(
+        self,
+        articles: list[dict[str, str]],
+        max_concurrency: int,
+        pack_size: int,
+    ) -> list[ArticleClassification]:
+        """Classify articles `pack_size` at a time with ArticleClassificationBatch calls."""
+        groups, prompts = self._packed_prompts(articles, pack_size)
+        outputs = batch_with_retry(self.batch_llm, prompts, max_concurrency)
+        results = self._unpack(groups, outputs, len(articles))
+
+        # Anything the packed calls missed is classified on its own
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            retried = self._analyze_with_llm([articles[i] for i in missing], max_concurrency, pack_size=1)
+            for i, result in zip(missing, retried):
+                results[i] = result
+        return results
+
+    def _packed_prompts(
+        self, articles: list[dict[str, str]], pack_size: int
+    ) -> tuple[list[list[int]], list[list[dict[str, str]]]]:
+        """Article index groups and one ArticleClassificationBatch prompt per group."""
+        groups = [
+            list(range(start, min(start + pack_size, len(articles))))
+            for start in range(0, len(articles), pack_size)
+        ]
+
+        prompts = []
+        for group in groups:
+            blocks = []
+            for number, i in enumerate(group, 1):
+                text = articles[i].get("text", "") or ""
+                blocks.append(
+                    f"ARTICLE {number}:\nTITLE: {articles[i].get('title', '')}\n"
+                    f"TEXT (first {self.max_text_chars} characters):\n{text[: self.max_text_chars]}"
+                )
+            user_prompt = (
+                f"Classify each of the following {len(group)} articles independently.\n"
+                f"Return exactly one classification per article, with its article_number.\n\n"
+                + "\n\n---\n\n".join(blocks)
+                + "\n\nBased on the writing style, tone, and content, classify each article."
             )
-            results.append(result)
+            prompts.append([
+                {"role": "system", "content": self.SYSTEM_PROMPT},
+                {"role": "user", "content": user_prompt},
+            ])
+        return groups, prompts
+
+    @staticmethod
+    def _unpack(groups: list[list[int]], outputs: list, count: int) -> list[Optional[ArticleClassification]]:
+        """Per-article results of packed calls (None where an answer is missing)."""
+        results: list[Optional[ArticleClassification]] = [None] * count
+        for group, output in zip(groups, outputs):
+            if isinstance(output, Exception):
+                logger.warning(f"OpinionAnalyzer packed call failed, classifying individually: {output}")
+                continue
+            for item in output.classifications:
+                if 1 <= item.article_number <= len(group):
+                    results[group[item.article_number - 1]] = ArticleClassification(
+                        article_type=item.article_type,
+                        confidence=item.confidence,
+                        reasoning=item.reasoning,
+                    )
         return results
 
 
@@ -233,6 +596,25 @@ DEFAULT_TRANCO_THRESHOLDS = {
 }
 
 
+def parse_tranco_list(path: str) -> dict[str, int]:
+    """
+    Parse a Tranco CSV ("rank,domain" lines) into domain -> rank.
+
+    Used through resources.table(), which shares the result per process.
+    """
+    tranco_data: dict[str, int] = {}
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            rank_str, sep, domain = line.strip().partition(",")
+            if not sep:
+                continue
+            try:
+                tranco_data[domain.lower()] = int(rank_str)
+            except ValueError:
+                continue
+    return tranco_data
+
+
 # =============================================================================
 # TrafficLongevityAnalyzer
 # =============================================================================
@@ -248,11 +630,13 @@ class TrafficLongevityAnalyzer:
     2. **LLM Fallback**: For domains not in Tranco, searches for traffic data
        via DuckDuckGo and uses LLM to parse the results.
 
-    Domain age is always retrieved deterministically via python-whois.
+    Domain age is always retrieved deterministically over RDAP/WHOIS, through
+    the persistently cached domain_age resolver.
 
     Attributes:
         llm: LangChain LLM with structured output for traffic parsing
         search: DuckDuckGo search instance
+        domain_ages: Resolver for domain creation dates (domain_age.py)
         tranco_data: Dict mapping domain -> rank (loaded from Tranco list)
         tranco_loaded: Whether Tranco list is available
         thresholds: Dict mapping tier names to rank cutoffs
@@ -296,6 +680,7 @@ Look for indicators like:
         tranco_path: Optional[str] = None,
         auto_download_tranco: bool = True,
         thresholds: Optional[dict[str, int]] = None,
+        domain_ages: Optional[domain_age.DomainAgeResolver] = None,
     ):
         """
         Initialize the TrafficLongevityAnalyzer.
@@ -306,22 +691,32 @@ Look for indicators like:
             tranco_path: Path to Tranco CSV file (default: tranco_top1m.csv)
             auto_download_tranco: Whether to auto-download Tranco if missing
             thresholds: Custom tier thresholds dict (keys: HIGH, MEDIUM, LOW)
+            domain_ages: Domain age resolver (default: domain_age.default_resolver())
         """
         self.llm = get_llm(model, temperature).with_structured_output(TrafficEstimate)
-        self.search = DDGS()
+        self.search = resilience.get_search()
+        self.domain_ages = domain_ages or domain_age.default_resolver()
         self.thresholds = thresholds or DEFAULT_TRANCO_THRESHOLDS.copy()
 
-        # Initialize Tranco data
-        self.tranco_data: dict[str, int] = {}
-        self.tranco_loaded = False
+        # Tranco data lives in a process-wide table (see resources.py)
         self._tranco_path = tranco_path or TRANCO_DEFAULT_PATH
+        self._tranco: Optional[resources.FileTable] = None
 
         # Try to load Tranco list
         self._load_tranco_list(auto_download=auto_download_tranco)
 
+    @property
+    def tranco_data(self) -> dict[str, int]:
+        """Domain -> rank from the shared Tranco table (reloaded when the file changes)."""
+        return self._tranco.get() if self._tranco is not None else {}
+
+    @property
+    def tranco_loaded(self) -> bool:
+        return bool(self.tranco_data)
+
     def _load_tranco_list(self, auto_download: bool = True) -> bool:
         """
-        Load the Tranco top 1M list into memory.
+        Attach the shared Tranco top 1M table, parsing it if no other analyzer has.
 
         Args:
             auto_download: Whether to download if file doesn't exist
@@ -332,6 +727,8 @@ Look for indicators like:
         import os
 
         tranco_path = self._tranco_path
+        # Attached even when the file is missing: it is picked up once it appears
+        self._tranco = resources.table(tranco_path, parse_tranco_list)
 
         # Check if file exists
         if not os.path.exists(tranco_path):
@@ -344,31 +741,7 @@ Look for indicators like:
                 logger.warning(f"Tranco list not found at {tranco_path}, will use LLM fallback only")
                 return False
 
-        # Load CSV into dict (rank -> domain mapping, we need domain -> rank)
-        try:
-            with open(tranco_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line or "," not in line:
-                        continue
-                    parts = line.split(",", 1)
-                    if len(parts) == 2:
-                        rank_str, domain = parts
-                        try:
-                            rank = int(rank_str)
-                            # Store domain -> rank mapping
-                            self.tranco_data[domain.lower()] = rank
-                        except ValueError:
-                            continue
-
-            self.tranco_loaded = len(self.tranco_data) > 0
-            if self.tranco_loaded:
-                logger.info(f"Loaded Tranco list with {len(self.tranco_data):,} domains")
-            return self.tranco_loaded
-
-        except Exception as e:
-            logger.error(f"Failed to load Tranco list: {e}")
-            return False
+        return self.tranco_loaded
 
     def _download_tranco_list(self, save_path: str) -> bool:
         """
@@ -380,6 +753,7 @@ Look for indicators like:
         Returns:
             True if download successful, False otherwise
         """
+        import os
         import urllib.request
         import zipfile
         import io
@@ -401,9 +775,12 @@ Look for indicators like:
                                 content = csv_file.read()
                             break
 
-            # Save to disk
-            with open(save_path, "wb") as f:
+            # Save to disk; replaced in one step so the shared table never
+            # reloads a half-written file
+            tmp_path = f"{save_path}.part"
+            with open(tmp_path, "wb") as f:
                 f.write(content)
+            os.replace(tmp_path, save_path)
 
             logger.info(f"Successfully downloaded Tranco list to {save_path}")
             return True
@@ -422,21 +799,23 @@ Look for indicators like:
         Returns:
             Rank (1 = most popular) or None if not found
         """
-        if not self.tranco_loaded:
+        # One snapshot, so a concurrent reload cannot switch tables mid-lookup
+        tranco_data = self.tranco_data
+        if not tranco_data:
             return None
 
         # Normalize domain
         domain_lower = domain.lower().strip()
 
         # Direct lookup
-        if domain_lower in self.tranco_data:
-            return self.tranco_data[domain_lower]
+        if domain_lower in tranco_data:
+            return tranco_data[domain_lower]
 
         # Try with www prefix
         if not domain_lower.startswith("www."):
             www_domain = f"www.{domain_lower}"
-            if www_domain in self.tranco_data:
-                return self.tranco_data[www_domain]
+            if www_domain in tranco_data:
+                return tranco_data[www_domain]
 
         return None
 
@@ -471,48 +850,13 @@ Look for indicators like:
 
     def _get_whois_data(self, domain: str) -> tuple[Optional[date], bool, Optional[str]]:
         """
-        Get domain creation date from WHOIS.
-        Compatible with both 'whois' and 'python-whois' packages.
-        """
-        try:
-            # Try python-whois syntax first
-            if hasattr(whois, 'whois'):
-                w = whois.whois(domain)
-            # Try standard whois syntax second
-            elif hasattr(whois, 'query'):
-                w = whois.query(domain)
-            else:
-                return None, False, "Unknown whois library installed"
-
-            # Extract creation date safely
-            creation_date = w.creation_date
-
-            # Handle list of dates (some registrars return multiple)
-            if isinstance(creation_date, list):
-                creation_date = creation_date[0]
-
-            # Convert datetime to date if needed
-            if isinstance(creation_date, datetime):
-                creation_date = creation_date.date()
-            
-            # Handle string dates (common in 'whois' package)
-            if isinstance(creation_date, str):
-                from dateutil import parser
-                try:
-                    creation_date = parser.parse(creation_date).date()
-                except:
-                    pass
-
-            if creation_date:
-                return creation_date, True, None
+        Get domain creation date (RDAP, then WHOIS) through the cached resolver.
 
-            return None, False, "No creation date in WHOIS response"
-
-        except Exception as e:
-            # Catch-all for other errors
-            error_msg = f"WHOIS error ({type(e).__name__}): {str(e)}"
-            logger.warning(f"{error_msg} for {domain}")
-            return None, False, error_msg
+        Returns:
+            (creation_date, whois_success, whois_error)
+        """
+        age = self.domain_ages.resolve(domain)
+        return age.creation_date, age.creation_date is not None, age.error
 
     def _calculate_age_years(self, creation_date: Optional[date]) -> Optional[float]:
         """Calculate domain age in years from creation date."""
@@ -534,23 +878,31 @@ Look for indicators like:
         Returns:
             Search result snippet or None
         """
-        # Improved query per Gemini's suggestion - targets multiple traffic data sources
-        query = f"{domain} traffic stats similarweb hypestat semrush"
+        query = self._traffic_query(domain)
         try:
-            results = list(self.search.text(query, max_results=5))
-            if results:
-                # Combine top results into a snippet
-                snippets = []
-                for r in results[:5]:
-                    title = r.get("title", "")
-                    body = r.get("body", "")
-                    snippets.append(f"{title}: {body}")
-                return "\n".join(snippets)
+            with tracing.span("ddgs.text", tracing.SEARCH, query=query[:100]):
+                results = list(self.search.text(query, max_results=5))
+            return combine_snippets(results)
+        except Exception as e:
+            logger.warning(f"Traffic search failed for {domain}: {e}")
             return None
+
+    async def _asearch_traffic_info(self, domain: str) -> Optional[str]:
+        """Coroutine counterpart of _search_traffic_info()."""
+        query = self._traffic_query(domain)
+        try:
+            results = await asearch_text(self.search, query, max_results=5)
+            return combine_snippets(results)
         except Exception as e:
             logger.warning(f"Traffic search failed for {domain}: {e}")
             return None
 
+    @staticmethod
+    def _traffic_query(domain: str) -> str:
+        # Improved query per Gemini's suggestion - targets multiple traffic data sources
+        return f"{domain} traffic stats similarweb hypestat semrush"
+
+
     def _parse_traffic_with_llm(self, domain: str, snippet: str) -> TrafficEstimate:
         """
         Use LLM to parse traffic tier from search snippet.
@@ -562,6 +914,23 @@ Look for indicators like:
         Returns:
             TrafficEstimate with tier and reasoning
         """
+        try:
+            result: TrafficEstimate = self.llm.invoke(self._traffic_messages(domain, snippet))
+            return result
+
+        except Exception as e:
+            return self._failed_estimate(e)
+
+    async def _aparse_traffic_with_llm(self, domain: str, snippet: str) -> TrafficEstimate:
+        """Coroutine counterpart of _parse_traffic_with_llm()."""
+        try:
+            result: TrafficEstimate = await self.llm.ainvoke(self._traffic_messages(domain, snippet))
+            return result
+
+        except Exception as e:
+            return self._failed_estimate(e)
+
+    def _traffic_messages(self, domain: str, snippet: str) -> list[dict[str, str]]:
         user_prompt = f"""Analyze the following search results for {domain} and estimate the traffic tier:
 
 SEARCH RESULTS:
@@ -569,23 +938,21 @@ SEARCH RESULTS:
 
 Determine the traffic tier based on any traffic data, rankings, or popularity indicators found."""
 
-        try:
-            result: TrafficEstimate = self.llm.invoke(
-                [
-                    {"role": "system", "content": self.TRAFFIC_PARSE_PROMPT},
-                    {"role": "user", "content": user_prompt},
-                ]
-            )
-            return result
+        return [
+            {"role": "system", "content": self.TRAFFIC_PARSE_PROMPT},
+            {"role": "user", "content": user_prompt},
+        ]
 
-        except Exception as e:
-            logger.error(f"Traffic LLM parsing failed: {e}")
-            return TrafficEstimate(
-                traffic_tier=TrafficTier.UNKNOWN,
-                monthly_visits_estimate=None,
-                confidence=0.0,
-                reasoning=f"LLM parsing failed: {str(e)}",
-            )
+    @staticmethod
+    def _failed_estimate(error: Exception) -> TrafficEstimate:
+        logger.error(f"Traffic LLM parsing failed: {error}")
+        resilience.record_fallback("traffic", error)
+        return TrafficEstimate(
+            traffic_tier=TrafficTier.UNKNOWN,
+            monthly_visits_estimate=None,
+            confidence=0.0,
+            reasoning=f"LLM parsing failed: {str(error)}",
+        )
 
     def analyze(self, url_or_domain: str) -> TrafficData:
         """
@@ -605,20 +972,72 @@ Determine the traffic tier based on any traffic data, rankings, or popularity in
         domain = self._extract_domain(url_or_domain)
 
         # 1. Get deterministic WHOIS data
-        creation_date, whois_success, whois_error = self._get_whois_data(domain)
-        age_years = self._calculate_age_years(creation_date)
+        whois_data = self._get_whois_data(domain)
 
         # 2. Try Tranco lookup first (deterministic)
         tranco_rank = self._get_tranco_rank(domain)
+        if tranco_rank is not None:
+            return self._build_traffic_data(domain, whois_data, tranco_rank=tranco_rank)
+
+        # 3. Fall back to LLM-based estimation
+        traffic_snippet = self._search_traffic_info(domain)
+        if traffic_snippet:
+            estimate = self._parse_traffic_with_llm(domain, traffic_snippet)
+            return self._build_traffic_data(domain, whois_data, snippet=traffic_snippet, estimate=estimate)
+
+        # 4. No data available - return fallback
+        return self._build_traffic_data(domain, whois_data)
+
+    async def aanalyze(self, url_or_domain: str) -> TrafficData:
+        """
+        Coroutine counterpart of analyze().
+
+        Domain age lookups (cached, RDAP/WHOIS on a miss) run on the shared
+        blocking pool (transport.run_blocking), concurrently with the traffic search.
+        """
+        domain = self._extract_domain(url_or_domain)
+        whois_task = asyncio.ensure_future(transport.run_blocking(self._get_whois_data, domain))
+        try:
+            tranco_rank = self._get_tranco_rank(domain)
+            if tranco_rank is not None:
+                return self._build_traffic_data(domain, await whois_task, tranco_rank=tranco_rank)
+
+            traffic_snippet = await self._asearch_traffic_info(domain)
+            if traffic_snippet:
+                estimate = await self._aparse_traffic_with_llm(domain, traffic_snippet)
+                return self._build_traffic_data(domain, await whois_task, snippet=traffic_snippet, estimate=estimate)
+            return self._build_traffic_data(domain, await whois_task)
+        finally:
+            whois_task.cancel()
+
+    def _build_traffic_data(
+        self,
+        domain: str,
+        whois_data: tuple[Optional[date], bool, Optional[str]],
+        tranco_rank: Optional[int] = None,
+        snippet: Optional[str] = None,
+        estimate: Optional[TrafficEstimate] = None,
+    ) -> TrafficData:
+        """
+        Assemble TrafficData from the WHOIS lookup and whichever traffic source answered.
+
+        Args:
+            domain: Analyzed domain
+            whois_data: (creation_date, whois_success, whois_error)
+            tranco_rank: Tranco rank, when the domain is listed
+            snippet: Traffic search snippet the LLM estimate is based on
+            estimate: LLM traffic estimate (None: fallback)
+        """
+        creation_date, whois_success, whois_error = whois_data
+        age_years = self._calculate_age_years(creation_date)
 
         if tranco_rank is not None:
             # Found in Tranco - use deterministic ranking
-            traffic_tier = self._rank_to_tier(tranco_rank)
             return TrafficData(
                 domain=domain,
                 creation_date=creation_date,
                 age_years=age_years,
-                traffic_tier=traffic_tier,
+                traffic_tier=self._rank_to_tier(tranco_rank),
                 monthly_visits_estimate=None,  # Tranco doesn't provide this
                 traffic_confidence=1.0,  # Deterministic = 100% confidence
                 traffic_source=TrafficSource.TRANCO,
@@ -628,26 +1047,21 @@ Determine the traffic tier based on any traffic data, rankings, or popularity in
                 traffic_search_snippet=None,
             )
 
-        # 3. Fall back to LLM-based estimation
-        traffic_snippet = self._search_traffic_info(domain)
-
-        if traffic_snippet:
-            traffic_estimate = self._parse_traffic_with_llm(domain, traffic_snippet)
+        if estimate is not None:
             return TrafficData(
                 domain=domain,
                 creation_date=creation_date,
                 age_years=age_years,
-                traffic_tier=traffic_estimate.traffic_tier,
-                monthly_visits_estimate=traffic_estimate.monthly_visits_estimate,
-                traffic_confidence=traffic_estimate.confidence,
+                traffic_tier=estimate.traffic_tier,
+                monthly_visits_estimate=estimate.monthly_visits_estimate,
+                traffic_confidence=estimate.confidence,
                 traffic_source=TrafficSource.LLM,
                 tranco_rank=None,
                 whois_success=whois_success,
                 whois_error=whois_error,
-                traffic_search_snippet=traffic_snippet[:500] if traffic_snippet else None,
+                traffic_search_snippet=snippet[:500] if snippet else None,
             )
 
-        # 4. No data available - return fallback
         return TrafficData(
             domain=domain,
             creation_date=creation_date,
@@ -685,6 +1099,28 @@ Determine the traffic tier based on any traffic data, rankings, or popularity in
 KNOWN_MEDIA_TYPES_PATH = "known_media_types.csv"
 
 
+def parse_known_media_types(path: str) -> dict[str, MediaType]:
+    """
+    Parse known_media_types.csv ("domain,type" rows, "#" comments) into domain -> MediaType.
+
+    Used through resources.table(), which shares the result per process.
+    """
+    import csv
+
+    by_value = {mt.value.lower(): mt for mt in MediaType}
+    known_types: dict[str, MediaType] = {}
+    with open(path, "r", encoding="utf-8") as f:
+        for row in csv.reader(f):
+            # Skip comments and empty lines
+            if not row or row[0].startswith("#") or len(row) < 2:
+                continue
+            # Case-insensitive match of the type name
+            media_type = by_value.get(row[1].strip().lower())
+            if media_type is not None:
+                known_types[row[0].strip().lower()] = media_type
+    return known_types
+
+
 # =============================================================================
 # MediaTypeAnalyzer
 # =============================================================================
@@ -758,62 +1194,41 @@ For example, NYT is a NEWSPAPER even though they have a website and podcasts."""
             lookup_path: Path to known_media_types.csv (default: known_media_types.csv)
         """
         self.llm = get_llm(model, temperature).with_structured_output(MediaTypeLLMOutput)
-        self.search = DDGS()
+        self.search = resilience.get_search()
 
-        # Initialize lookup data
-        self.known_types: dict[str, MediaType] = {}
-        self.lookup_loaded = False
+        # Lookup data lives in a process-wide table (see resources.py)
         self._lookup_path = lookup_path or KNOWN_MEDIA_TYPES_PATH
+        self._known_types: Optional[resources.FileTable] = None
 
         # Load lookup table
         self._load_known_types()
 
+    @property
+    def known_types(self) -> dict[str, MediaType]:
+        """Domain -> MediaType from the shared lookup table (reloaded when the file changes)."""
+        return self._known_types.get() if self._known_types is not None else {}
+
+    @property
+    def lookup_loaded(self) -> bool:
+        return bool(self.known_types)
+
     def _load_known_types(self) -> bool:
         """
-        Load the known media types lookup table.
+        Attach the shared known media types table, parsing it if no other analyzer has.
 
         Returns:
             True if loaded successfully, False otherwise
         """
         import os
-        import csv
 
         lookup_path = self._lookup_path
+        # Attached even when the file is missing: it is picked up once it appears
+        self._known_types = resources.table(lookup_path, parse_known_media_types)
 
         if not os.path.exists(lookup_path):
             logger.warning(f"Known media types file not found at {lookup_path}, will use LLM only")
             return False
-
-        try:
-            with open(lookup_path, "r", encoding="utf-8") as f:
-                reader = csv.reader(f)
-                for row in reader:
-                    # Skip comments and empty lines
-                    if not row or row[0].startswith("#"):
-                        continue
-                    if len(row) >= 2:
-                        domain = row[0].strip().lower()
-                        media_type_str = row[1].strip()
-
-                        # Map string to MediaType enum
-                        try:
-                            media_type = MediaType(media_type_str)
-                            self.known_types[domain] = media_type
-                        except ValueError:
-                            # Try case-insensitive match
-                            for mt in MediaType:
-                                if mt.value.lower() == media_type_str.lower():
-                                    self.known_types[domain] = mt
-                                    break
-
-            self.lookup_loaded = len(self.known_types) > 0
-            if self.lookup_loaded:
-                logger.info(f"Loaded {len(self.known_types)} known media types from {lookup_path}")
-            return self.lookup_loaded
-
-        except Exception as e:
-            logger.error(f"Failed to load known media types: {e}")
-            return False
+        return self.lookup_loaded
 
     def _lookup_media_type(self, domain: str) -> Optional[MediaType]:
         """
@@ -825,28 +1240,30 @@ For example, NYT is a NEWSPAPER even though they have a website and podcasts."""
         Returns:
             MediaType if found, None otherwise
         """
-        if not self.lookup_loaded:
+        # One snapshot, so a concurrent reload cannot switch tables mid-lookup
+        known_types = self.known_types
+        if not known_types:
             return None
 
         # Normalize domain
         domain_lower = domain.lower().strip()
 
         # Direct lookup
-        if domain_lower in self.known_types:
-            return self.known_types[domain_lower]
+        if domain_lower in known_types:
+            return known_types[domain_lower]
 
         # Try with www prefix
         if not domain_lower.startswith("www."):
             www_domain = f"www.{domain_lower}"
-            if www_domain in self.known_types:
-                return self.known_types[www_domain]
+            if www_domain in known_types:
+                return known_types[www_domain]
 
         # Try without subdomain (e.g., news.bbc.com -> bbc.com)
         parts = domain_lower.split(".")
         if len(parts) > 2:
             base_domain = ".".join(parts[-2:])
-            if base_domain in self.known_types:
-                return self.known_types[base_domain]
+            if base_domain in known_types:
+                return known_types[base_domain]
 
         return None
 
@@ -897,23 +1314,30 @@ For example, NYT is a NEWSPAPER even though they have a website and podcasts."""
         query = f'"{domain}" type of media outlet newspaper television website magazine'
 
         try:
-            results = list(self.search.text(query, max_results=5))
+            with tracing.span("ddgs.text", tracing.SEARCH, query=query[:100]):
+                results = list(self.search.text(query, max_results=5))
 
             if not results:
                 # Fallback query - Wikipedia focused
                 query = f"{site_name} wikipedia media company"
-                results = list(self.search.text(query, max_results=3))
+                with tracing.span("ddgs.text", tracing.SEARCH, query=query[:100]):
+                    results = list(self.search.text(query, max_results=3))
 
-            if results:
-                snippets = []
-                for r in results[:5]:
-                    title = r.get("title", "")
-                    body = r.get("body", "")
-                    snippets.append(f"{title}: {body}")
-                return "\n".join(snippets)
+            return combine_snippets(results)
 
+        except Exception as e:
+            logger.warning(f"Media type search failed for {site_name}: {e}")
             return None
 
+    async def _asearch_media_type(self, site_name: str, domain: str) -> Optional[str]:
+        """Coroutine counterpart of _search_media_type()."""
+        query = f'"{domain}" type of media outlet newspaper television website magazine'
+        try:
+            results = await asearch_text(self.search, query, max_results=5)
+            if not results:
+                results = await asearch_text(self.search, f"{site_name} wikipedia media company", max_results=3)
+            return combine_snippets(results)
+
         except Exception as e:
             logger.warning(f"Media type search failed for {site_name}: {e}")
             return None
@@ -930,6 +1354,23 @@ For example, NYT is a NEWSPAPER even though they have a website and podcasts."""
         Returns:
             MediaTypeLLMOutput with type, confidence, and reasoning
         """
+        try:
+            result: MediaTypeLLMOutput = self.llm.invoke(self._messages(site_name, domain, snippet))
+            return result
+
+        except Exception as e:
+            return self._failed_output(e)
+
+    async def _aparse_with_llm(self, site_name: str, domain: str, snippet: str) -> MediaTypeLLMOutput:
+        """Coroutine counterpart of _parse_with_llm()."""
+        try:
+            result: MediaTypeLLMOutput = await self.llm.ainvoke(self._messages(site_name, domain, snippet))
+            return result
+
+        except Exception as e:
+            return self._failed_output(e)
+
+    def _messages(self, site_name: str, domain: str, snippet: str) -> list[dict[str, str]]:
         user_prompt = f"""Classify the media type for: {site_name} ({domain})
 
 SEARCH RESULTS:
@@ -937,22 +1378,20 @@ SEARCH RESULTS:
 
 Based on these search results, what type of media outlet is this?"""
 
-        try:
-            result: MediaTypeLLMOutput = self.llm.invoke(
-                [
-                    {"role": "system", "content": self.SYSTEM_PROMPT},
-                    {"role": "user", "content": user_prompt},
-                ]
-            )
-            return result
+        return [
+            {"role": "system", "content": self.SYSTEM_PROMPT},
+            {"role": "user", "content": user_prompt},
+        ]
 
-        except Exception as e:
-            logger.error(f"MediaTypeAnalyzer LLM call failed: {e}")
-            return MediaTypeLLMOutput(
-                media_type=MediaType.UNKNOWN,
-                confidence=0.0,
-                reasoning=f"LLM classification failed: {str(e)}",
-            )
+    @staticmethod
+    def _failed_output(error: Exception) -> MediaTypeLLMOutput:
+        logger.error(f"MediaTypeAnalyzer LLM call failed: {error}")
+        resilience.record_fallback("media_type", error)
+        return MediaTypeLLMOutput(
+            media_type=MediaType.UNKNOWN,
+            confidence=0.0,
+            reasoning=f"LLM classification failed: {str(error)}",
+        )
 
     def analyze(self, url_or_domain: str) -> MediaTypeClassification:
         """
@@ -975,28 +1414,55 @@ Based on these search results, what type of media outlet is this?"""
         known_type = self._lookup_media_type(domain)
 
         if known_type is not None:
-            return MediaTypeClassification(
-                media_type=known_type,
-                confidence=1.0,  # Deterministic = 100% confidence
-                source=MediaTypeSource.LOOKUP,
-                source_snippet=None,
-                reasoning=f"Found in known media types database as {known_type.value}",
-            )
+            return self._known_result(known_type)
 
         # 2. Fall back to search + LLM
         search_snippet = self._search_media_type(site_name, domain)
 
         if search_snippet:
             llm_result = self._parse_with_llm(site_name, domain, search_snippet)
-            return MediaTypeClassification(
-                media_type=llm_result.media_type,
-                confidence=llm_result.confidence,
-                source=MediaTypeSource.LLM,
-                source_snippet=search_snippet[:500] if search_snippet else None,
-                reasoning=llm_result.reasoning,
-            )
+            return self._llm_result(llm_result, search_snippet)
 
         # 3. No data available - return fallback
+        return self._fallback_result()
+
+    async def aanalyze(self, url_or_domain: str) -> MediaTypeClassification:
+        """Coroutine counterpart of analyze()."""
+        domain = self._extract_domain(url_or_domain)
+        site_name = self._extract_site_name(url_or_domain)
+
+        known_type = self._lookup_media_type(domain)
+        if known_type is not None:
+            return self._known_result(known_type)
+
+        search_snippet = await self._asearch_media_type(site_name, domain)
+        if search_snippet:
+            llm_result = await self._aparse_with_llm(site_name, domain, search_snippet)
+            return self._llm_result(llm_result, search_snippet)
+        return self._fallback_result()
+
+    @staticmethod
+    def _known_result(known_type: MediaType) -> MediaTypeClassification:
+        return MediaTypeClassification(
+            media_type=known_type,
+            confidence=1.0,  # Deterministic = 100% confidence
+            source=MediaTypeSource.LOOKUP,
+            source_snippet=None,
+            reasoning=f"Found in known media types database as {known_type.value}",
+        )
+
+    @staticmethod
+    def _llm_result(llm_result: MediaTypeLLMOutput, search_snippet: str) -> MediaTypeClassification:
+        return MediaTypeClassification(
+            media_type=llm_result.media_type,
+            confidence=llm_result.confidence,
+            source=MediaTypeSource.LLM,
+            source_snippet=search_snippet[:500] if search_snippet else None,
+            reasoning=llm_result.reasoning,
+        )
+
+    @staticmethod
+    def _fallback_result() -> MediaTypeClassification:
         return MediaTypeClassification(
             media_type=MediaType.UNKNOWN,
             confidence=0.0,
@@ -1119,7 +1585,7 @@ If results are about fact checks OF specific claims MADE BY the outlet, those ar
             sites: List of fact-checker sites to search (default: FACTCHECK_SITES)
         """
         self.llm = get_llm(model, temperature).with_structured_output(FactCheckLLMOutput)
-        self.search = DDGS()
+        self.search = resilience.get_search()
         self.sites = sites or FACTCHECK_SITES.copy()
 
     def _extract_domain(self, url: str) -> str:
@@ -1182,16 +1648,9 @@ If results are about fact checks OF specific claims MADE BY the outlet, those ar
             query = f'site:{site} "{domain}" OR "{outlet_name}"'
 
             try:
-                results = list(self.search.text(query, max_results=3))
-
-                for r in results:
-                    title = r.get("title", "")
-                    body = r.get("body", "")
-                    url = r.get("href", "")
-                    snippet = f"[{site}] {title}: {body}"
-                    if url:
-                        snippet += f" (URL: {url})"
-                    all_snippets.append(snippet)
+                with tracing.span("ddgs.text", tracing.SEARCH, query=query[:100]):
+                    results = list(self.search.text(query, max_results=3))
+                all_snippets.extend(self._site_snippets(site, results))
 
             except Exception as e:
                 logger.warning(f"Fact check search failed for {site}: {e}")
@@ -1199,6 +1658,35 @@ If results are about fact checks OF specific claims MADE BY the outlet, those ar
 
         return "\n\n".join(all_snippets) if all_snippets else ""
 
+    async def _asearch_fact_checks(self, domain: str, outlet_name: str) -> str:
+        """Coroutine counterpart of _search_fact_checks(); all sites are searched at once."""
+
+        async def search_site(site: str) -> list[str]:
+            query = f'site:{site} "{domain}" OR "{outlet_name}"'
+            try:
+                return self._site_snippets(site, await asearch_text(self.search, query, max_results=3))
+            except Exception as e:
+                logger.warning(f"Fact check search failed for {site}: {e}")
+                return []
+
+        per_site = await asyncio.gather(*(search_site(site) for site in self.sites))
+        all_snippets = [snippet for snippets in per_site for snippet in snippets]
+        return "\n\n".join(all_snippets) if all_snippets else ""
+
+    @staticmethod
+    def _site_snippets(site: str, results: list[dict]) -> list[str]:
+        """One labelled snippet per search result from a fact-checker site."""
+        snippets = []
+        for r in results:
+            title = r.get("title", "")
+            body = r.get("body", "")
+            url = r.get("href", "")
+            snippet = f"[{site}] {title}: {body}"
+            if url:
+                snippet += f" (URL: {url})"
+            snippets.append(snippet)
+        return snippets
+
     def _parse_with_llm(self, domain: str, outlet_name: str, snippets: str) -> FactCheckLLMOutput:
         """
         Use LLM to parse fact check findings from search snippets.
@@ -1211,32 +1699,47 @@ If results are about fact checks OF specific claims MADE BY the outlet, those ar
         Returns:
             FactCheckLLMOutput with findings and counts
         """
-        user_prompt = f"""Analyze fact check search results for: {outlet_name} ({domain})
-
-SEARCH RESULTS:
-{snippets}
-
-Extract all fact check findings related to this outlet. Count how many have negative verdicts
-(FALSE, MOSTLY_FALSE, PANTS_ON_FIRE, MISLEADING)."""
-
         try:
-            result: FactCheckLLMOutput = self.llm.invoke(
-                [
-                    {"role": "system", "content": self.SYSTEM_PROMPT},
-                    {"role": "user", "content": user_prompt},
-                ]
-            )
+            result: FactCheckLLMOutput = self.llm.invoke(self._messages(domain, outlet_name, snippets))
             return result
 
         except Exception as e:
-            logger.error(f"FactCheckSearcher LLM call failed: {e}")
-            return FactCheckLLMOutput(
-                findings=[],
-                failed_count=0,
-                total_count=0,
-                confidence=0.0,
-                reasoning=f"LLM parsing failed: {str(e)}",
-            )
+            return self._failed_output(e)
+
+    async def _aparse_with_llm(self, domain: str, outlet_name: str, snippets: str) -> FactCheckLLMOutput:
+        """Coroutine counterpart of _parse_with_llm()."""
+        try:
+            result: FactCheckLLMOutput = await self.llm.ainvoke(self._messages(domain, outlet_name, snippets))
+            return result
+
+        except Exception as e:
+            return self._failed_output(e)
+
+    def _messages(self, domain: str, outlet_name: str, snippets: str) -> list[dict[str, str]]:
+        user_prompt = f"""Analyze fact check search results for: {outlet_name} ({domain})
+
+SEARCH RESULTS:
+{snippets}
+
+Extract all fact check findings related to this outlet. Count how many have negative verdicts
+(FALSE, MOSTLY_FALSE, PANTS_ON_FIRE, MISLEADING)."""
+
+        return [
+            {"role": "system", "content": self.SYSTEM_PROMPT},
+            {"role": "user", "content": user_prompt},
+        ]
+
+    @staticmethod
+    def _failed_output(error: Exception) -> FactCheckLLMOutput:
+        logger.error(f"FactCheckSearcher LLM call failed: {error}")
+        resilience.record_fallback("fact_check", error)
+        return FactCheckLLMOutput(
+            findings=[],
+            failed_count=0,
+            total_count=0,
+            confidence=0.0,
+            reasoning=f"LLM parsing failed: {str(error)}",
+        )
 
     def _calculate_score(self, failed_count: int, total_count: int) -> float:
         """
@@ -1278,22 +1781,42 @@ Extract all fact check findings related to this outlet. Count how many have nega
 
         if not snippets:
             # No results found
-            return FactCheckAnalysisResult(
-                domain=domain,
-                outlet_name=outlet_name,
-                failed_checks_count=0,
-                total_checks_count=0,
-                score=5.0,  # Neutral when no data
-                source=FactCheckSource.FALLBACK,
-                findings=[],
-                search_snippets=None,
-                confidence=0.0,
-                reasoning="No fact check results found for this outlet",
-            )
+            return self._empty_result(domain, outlet_name)
 
         # Parse with LLM
         llm_output = self._parse_with_llm(domain, outlet_name, snippets)
+        return self._build_result(domain, outlet_name, snippets, llm_output)
+
+    async def aanalyze(self, url_or_domain: str, outlet_name: str | None = None) -> FactCheckAnalysisResult:
+        """Coroutine counterpart of analyze()."""
+        domain = self._extract_domain(url_or_domain)
+        outlet_name = outlet_name or self._extract_outlet_name(domain)
 
+        snippets = await self._asearch_fact_checks(domain, outlet_name)
+        if not snippets:
+            return self._empty_result(domain, outlet_name)
+
+        llm_output = await self._aparse_with_llm(domain, outlet_name, snippets)
+        return self._build_result(domain, outlet_name, snippets, llm_output)
+
+    @staticmethod
+    def _empty_result(domain: str, outlet_name: str) -> FactCheckAnalysisResult:
+        return FactCheckAnalysisResult(
+            domain=domain,
+            outlet_name=outlet_name,
+            failed_checks_count=0,
+            total_checks_count=0,
+            score=5.0,  # Neutral when no data
+            source=FactCheckSource.FALLBACK,
+            findings=[],
+            search_snippets=None,
+            confidence=0.0,
+            reasoning="No fact check results found for this outlet",
+        )
+
+    def _build_result(
+        self, domain: str, outlet_name: str, snippets: str, llm_output: FactCheckLLMOutput
+    ) -> FactCheckAnalysisResult:
         # Calculate score
         score = self._calculate_score(llm_output.failed_count, llm_output.total_count)
 
@@ -1347,12 +1870,17 @@ You must also detect **Vague Sourcing** or "Anonymous Authority".
 4. Provide a final sourcing score (0=Excellent/High Transparency, 10=Poor/No Sourcing).
 """
 
+    CACHE_VERSION = 1
+
     def __init__(
         self,
         model: str = "gpt-4o-mini",
         temperature: float = 0.0,
+        article_cache: Optional[ArticleCache] = None,
     ):
         self.llm = get_llm(model, temperature).with_structured_output(SourcingLLMOutput)
+        self.model = model
+        self._article_cache = article_cache
 
     def _extract_links(self, text: str) -> list[str]:
         """Extract all URLs from article text."""
@@ -1378,11 +1906,14 @@ You must also detect **Vague Sourcing** or "Anonymous Authority".
                 continue
         return list(domains)
 
-    def analyze(self, articles: list[dict[str, str]]) -> SourcingAnalysisResult:
+    def _gather_evidence(self, articles: list[dict[str, str]]) -> tuple[list[str], list[str], str]:
         """
-        Analyze sourcing quality using links and text analysis.
+        Links and text snippets the sourcing assessment is based on.
+
+        Returns:
+            Tuple of (all links, unique linked domains, text snippets of the
+            first 4 articles)
         """
-        # 1. Gather Link Evidence
         all_links = []
         combined_text_snippets = []
         
@@ -1400,11 +1931,64 @@ You must also detect **Vague Sourcing** or "Anonymous Authority".
             combined_text_snippets.append(f"ARTICLE {i+1}: {snippet}")
 
         unique_domains = self._extract_domains(all_links)
-        
+        text_context = "\n\n".join(combined_text_snippets[:4]) # Limit to first 4 articles to save tokens
+        return all_links, unique_domains, text_context
+
+    @staticmethod
+    def _format_domains(unique_domains: list[str]) -> str:
+        return ", ".join(unique_domains) if unique_domains else "None detected via regex"
+
+    def analyze(self, articles: list[dict[str, str]]) -> SourcingAnalysisResult:
+        """
+        Analyze sourcing quality using links and text analysis.
+        """
+        # 1. Gather Link Evidence
+        all_links, unique_domains, text_context = self._gather_evidence(articles)
+
         # 2. Prepare Prompt for LLM
+        messages = self._messages(unique_domains, text_context)
+
+        try:
+            # 3. Invoke LLM (unless these articles were assessed before)
+            llm_output: SourcingLLMOutput = cached(
+                resolve(self._article_cache),
+                self._cache_namespace(),
+                content_key(messages[1]["content"]),
+                SourcingLLMOutput,
+                lambda: self.llm.invoke(messages),
+            )
+            return self._build_result(llm_output, articles, all_links, unique_domains)
+
+        except Exception as e:
+            logger.error(f"SourcingAnalyzer LLM call failed: {e}")
+            return self._failed_result(e, all_links, unique_domains)
+
+    async def aanalyze(self, articles: list[dict[str, str]]) -> SourcingAnalysisResult:
+        """Coroutine counterpart of analyze()."""
+        all_links, unique_domains, text_context = self._gather_evidence(articles)
+        messages = self._messages(unique_domains, text_context)
+
+        try:
+            llm_output: SourcingLLMOutput = await acached(
+                resolve(self._article_cache),
+                self._cache_namespace(),
+                content_key(messages[1]["content"]),
+                SourcingLLMOutput,
+                lambda: self.llm.ainvoke(messages),
+            )
+            return self._build_result(llm_output, articles, all_links, unique_domains)
+
+        except Exception as e:
+            logger.error(f"SourcingAnalyzer LLM call failed: {e}")
+            return self._failed_result(e, all_links, unique_domains)
+
+    def _cache_namespace(self) -> str:
+        return namespace("sourcing", self.CACHE_VERSION, self.model, self.SYSTEM_PROMPT)
+
+    def _messages(self, unique_domains: list[str], text_context: str) -> list[dict[str, str]]:
+        """Chat messages for the sourcing assessment."""
         # We give the LLM the hard links we found, PLUS the text to find non-linked citations
-        domains_str = ", ".join(unique_domains) if unique_domains else "None detected via regex"
-        text_context = "\n\n".join(combined_text_snippets[:4]) # Limit to first 4 articles to save tokens
+        domains_str = self._format_domains(unique_domains)
 
         user_prompt = f"""Analyze the sourcing in these articles.
 
@@ -1418,63 +2002,70 @@ ARTICLE TEXT SNIPPETS (Look for textual citations and vague sourcing here):
 2. Is there frequent use of vague sourcing? (e.g. "Scientists say", "Critics claim")
 3. Assess the quality of the specific sources found."""
 
-        try:
-            # 3. Invoke LLM
-            llm_output: SourcingLLMOutput = self.llm.invoke(
-                [
-                    {"role": "system", "content": self.SYSTEM_PROMPT},
-                    {"role": "user", "content": user_prompt},
-                ]
-            )
+        return [
+            {"role": "system", "content": self.SYSTEM_PROMPT},
+            {"role": "user", "content": user_prompt},
+        ]
 
-            # 4. Calculate Final Score Logic
-            # Penalize for vague sourcing if quality score is otherwise good
-            final_score = llm_output.overall_quality_score
-            
-            # If vague sourcing is found, ensure score isn't perfect
-            if llm_output.vague_sourcing_detected and final_score < 4.0:
-                final_score += 1.5 
-            
-            # Cap score at 10 (Poor)
-            final_score = min(10.0, final_score)
+    def _build_result(
+        self,
+        llm_output: SourcingLLMOutput,
+        articles: list[dict[str, str]],
+        all_links: list[str],
+        unique_domains: list[str],
+    ) -> SourcingAnalysisResult:
+        """Score an LLM sourcing assessment (shared with FusedContentAnalyzer)."""
+        # 4. Calculate Final Score Logic
+        # Penalize for vague sourcing if quality score is otherwise good
+        final_score = llm_output.overall_quality_score
+        
+        # If vague sourcing is found, ensure score isn't perfect
+        if llm_output.vague_sourcing_detected and final_score < 4.0:
+            final_score += 1.5 
+        
+        # Cap score at 10 (Poor)
+        final_score = min(10.0, final_score)
+
+        # Calculate stats
+        avg_sources = len(all_links) / len(articles) if articles else 0.0
+        
+        # Format reasoning to include vague sourcing info if present
+        reasoning = llm_output.overall_assessment
+        if llm_output.vague_sourcing_detected and llm_output.vague_sourcing_examples:
+            examples = ", ".join(llm_output.vague_sourcing_examples[:2])
+            reasoning += f" (Note: Detected vague sourcing: '{examples}')"
+
+        return SourcingAnalysisResult(
+            score=final_score,
+            avg_sources_per_article=round(avg_sources, 2),
+            total_sources_found=len(all_links),
+            unique_domains=len(unique_domains),
+            has_hyperlinks=len(all_links) > 0,
+            source_assessments=llm_output.sources_assessed,
+            has_primary_sources=llm_output.has_primary_sources,
+            has_wire_services=llm_output.has_wire_services,
+            confidence=llm_output.confidence,
+            reasoning=reasoning
+        )
+
+    @staticmethod
+    def _failed_result(error: Exception, all_links: list[str], unique_domains: list[str]) -> SourcingAnalysisResult:
+        # Fallback ONLY on error
+        resilience.record_fallback("sourcing", error)
+        return SourcingAnalysisResult(
+            score=5.0,
+            avg_sources_per_article=0.0,
+            total_sources_found=len(all_links),
+            unique_domains=len(unique_domains),
+            has_hyperlinks=len(all_links) > 0,
+            source_assessments=[],
+            has_primary_sources=False,
+            has_wire_services=False,
+            confidence=0.0,
+            reasoning=f"Analysis failed: {str(error)}"
+        )
 
-            # Calculate stats
-            avg_sources = len(all_links) / len(articles) if articles else 0.0
-            
-            # Format reasoning to include vague sourcing info if present
-            reasoning = llm_output.overall_assessment
-            if llm_output.vague_sourcing_detected and llm_output.vague_sourcing_examples:
-                examples = ", ".join(llm_output.vague_sourcing_examples[:2])
-                reasoning += f" (Note: Detected vague sourcing: '{examples}')"
-
-            return SourcingAnalysisResult(
-                score=final_score,
-                avg_sources_per_article=round(avg_sources, 2),
-                total_sources_found=len(all_links),
-                unique_domains=len(unique_domains),
-                has_hyperlinks=len(all_links) > 0,
-                source_assessments=llm_output.sources_assessed,
-                has_primary_sources=llm_output.has_primary_sources,
-                has_wire_services=llm_output.has_wire_services,
-                confidence=llm_output.confidence,
-                reasoning=reasoning
-            )
 
-        except Exception as e:
-            logger.error(f"SourcingAnalyzer LLM call failed: {e}")
-            # Fallback ONLY on error
-            return SourcingAnalysisResult(
-                score=5.0,
-                avg_sources_per_article=0.0,
-                total_sources_found=len(all_links),
-                unique_domains=len(unique_domains),
-                has_hyperlinks=len(all_links) > 0,
-                source_assessments=[],
-                has_primary_sources=False,
-                has_wire_services=False,
-                confidence=0.0,
-                reasoning=f"Analysis failed: {str(e)}"
-            )
 # =============================================================================
 # EditorialBiasAnalyzer
 # =============================================================================
@@ -1501,10 +2092,40 @@ class EditorialBiasAnalyzer:
     - +3 to +7: Right-Center
     - +7 to +10: Right / Extreme Right
 
+    Large article sets can be analyzed in map-reduce mode: article chunks are
+    scored concurrently with a compact output, then combined deterministically
+    (confidence x size weighted score, merged policy positions) with an
+    optional reduce LLM call for the narrative summaries.
+
+    Chunk assessments are kept in the article cache: chunks are grouped by
+    article content, so a re-run with a few new articles re-scores only the
+    chunks they land in and re-aggregates the rest from the cache.
+    Single-prompt results are cached per article set.
+
     Attributes:
         llm: LangChain LLM with structured output for bias analysis
+        chunk_llm: LLM with compact per-chunk output (map step)
+        reduce_llm: LLM that writes the narrative summaries (reduce step)
     """
 
+    MODES = ("single", "map_reduce", "auto")
+    CACHE_VERSION = 1
+
+    # "Article 3", "Articles 4, 7 and 9", "Articles 2-5"
+    _ARTICLE_REFERENCE = re.compile(r"\b(Articles?\s+)(\d+(?:\s*(?:,|and|&|-|–)\s*\d+)*)")
+
+    # Position of each direction on the -10..+10 scale, used to average
+    # policy leanings across chunks
+    DIRECTION_SCORES = {
+        BiasDirection.EXTREME_LEFT: -9.0,
+        BiasDirection.LEFT: -6.5,
+        BiasDirection.LEFT_CENTER: -3.5,
+        BiasDirection.CENTER: 0.0,
+        BiasDirection.RIGHT_CENTER: 3.5,
+        BiasDirection.RIGHT: 6.5,
+        BiasDirection.EXTREME_RIGHT: 9.0,
+    }
+
     # Comprehensive system prompt encoding MBFC methodology
     SYSTEM_PROMPT = """You are an expert media analyst specializing in detecting editorial and political bias.
 Your task is to analyze article content and determine the outlet's political leaning.
@@ -1649,6 +2270,15 @@ When the outlet is centrist, still be explicit:
         self,
         model: str = "gpt-4o-mini",
         temperature: float = 0.0,
+        token_budget: int = EDITORIAL_BIAS_TOKEN_BUDGET,
+        max_article_tokens: int = ARTICLE_MAX_TOKENS,
+        min_article_tokens: int = ARTICLE_MIN_TOKENS,
+        mode: str = EDITORIAL_BIAS_MODE,
+        map_reduce_budget: int = EDITORIAL_BIAS_MAP_REDUCE_BUDGET,
+        chunk_tokens: int = EDITORIAL_BIAS_CHUNK_TOKENS,
+        max_concurrency: int = EDITORIAL_BIAS_MAX_CONCURRENCY,
+        reduce_with_llm: bool = EDITORIAL_BIAS_REDUCE_LLM,
+        article_cache: Optional[ArticleCache] = None,
     ):
         """
         Initialize the EditorialBiasAnalyzer.
@@ -1656,8 +2286,34 @@ When the outlet is centrist, still be explicit:
         Args:
             model: OpenAI model to use
             temperature: LLM temperature (0 for deterministic)
-        """
+            token_budget: Maximum article tokens per prompt (see article_packing.py)
+            max_article_tokens: Maximum excerpt tokens per article
+            min_article_tokens: Smallest excerpt worth including
+            mode: "single" (one prompt), "map_reduce", or "auto" (map-reduce
+                only when the articles do not fit in token_budget)
+            map_reduce_budget: Total article tokens across all chunks
+            chunk_tokens: Article tokens per map chunk
+            max_concurrency: Chunks scored in parallel
+            reduce_with_llm: Write the narrative summaries with a reduce LLM
+                call (otherwise they are assembled from chunk reasoning)
+            article_cache: Store for chunk and single-prompt results
+                (default: the process-wide cache)
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown editorial bias mode: {mode} (expected one of {', '.join(self.MODES)})")
         self.llm = get_llm(model, temperature).with_structured_output(EditorialBiasLLMOutput)
+        self.chunk_llm = get_llm(model, temperature).with_structured_output(EditorialBiasChunkOutput)
+        self.reduce_llm = get_llm(model, temperature).with_structured_output(EditorialBiasReduceOutput)
+        self.model = model
+        self.token_budget = token_budget
+        self.max_article_tokens = max_article_tokens
+        self.min_article_tokens = min_article_tokens
+        self.mode = mode
+        self.map_reduce_budget = map_reduce_budget
+        self.chunk_tokens = chunk_tokens
+        self.max_concurrency = max_concurrency
+        self.reduce_with_llm = reduce_with_llm
+        self._article_cache = article_cache
 
     def _extract_domain(self, url: str) -> str:
         """Extract the root domain from a URL."""
@@ -1684,26 +2340,79 @@ When the outlet is centrist, still be explicit:
         else:
             return "Extreme Right"
 
-    def _analyze_with_llm(self, articles: list[dict[str, str]]) -> EditorialBiasLLMOutput:
+    def _score_to_direction(self, score: float) -> BiasDirection:
+        """Convert numeric score to a BiasDirection using the prompt's bias scale."""
+        if score <= -8.0:
+            return BiasDirection.EXTREME_LEFT
+        elif score <= -5.0:
+            return BiasDirection.LEFT
+        elif score <= -2.0:
+            return BiasDirection.LEFT_CENTER
+        elif score < 2.0:
+            return BiasDirection.CENTER
+        elif score < 5.0:
+            return BiasDirection.RIGHT_CENTER
+        elif score < 8.0:
+            return BiasDirection.RIGHT
+        else:
+            return BiasDirection.EXTREME_RIGHT
+
+    def _format_articles(self, packed: list[PackedArticle]) -> str:
+        """Format packed article excerpts for a prompt."""
+        return "\n---\n".join(
+            f"{format_article_header(p.index, p.title, p.url)}{p.excerpt}\n" for p in packed
+        )
+
+    def _analyze_with_llm(self, packed: list[PackedArticle]) -> EditorialBiasLLMOutput:
         """
         Use LLM to analyze editorial bias in articles.
 
         Args:
-            articles: List of article dicts with 'title' and 'text' keys
+            packed: Article excerpts selected by pack_articles(), numbered as
+                in the original article list
 
         Returns:
             EditorialBiasLLMOutput with bias assessment
         """
-        # Format articles for analysis
-        articles_text = []
-        for i, article in enumerate(articles, 1):
-            title = article.get("title", "Untitled")
-            url = article.get("url", "")
-            text = article.get("text", "")[:2000]  # Limit text length
-            url_line = f"\nURL: {url}" if url else ""
-            articles_text.append(f"ARTICLE {i}:\nTitle: {title}{url_line}\nText: {text}\n")
+        messages = self._messages(packed)
+        try:
+            result: EditorialBiasLLMOutput = cached(
+                resolve(self._article_cache),
+                self._cache_namespace(),
+                content_key(messages[1]["content"]),
+                EditorialBiasLLMOutput,
+                lambda: self.llm.invoke(messages),
+            )
+            return result
 
-        combined_text = "\n---\n".join(articles_text)
+        except Exception as e:
+            logger.error(f"EditorialBiasAnalyzer LLM call failed: {e}")
+            return self._failed_output(e)
+
+    async def _aanalyze_with_llm(self, packed: list[PackedArticle]) -> EditorialBiasLLMOutput:
+        """Coroutine counterpart of _analyze_with_llm()."""
+        messages = self._messages(packed)
+        try:
+            result: EditorialBiasLLMOutput = await acached(
+                resolve(self._article_cache),
+                self._cache_namespace(),
+                content_key(messages[1]["content"]),
+                EditorialBiasLLMOutput,
+                lambda: self.llm.ainvoke(messages),
+            )
+            return result
+
+        except Exception as e:
+            logger.error(f"EditorialBiasAnalyzer LLM call failed: {e}")
+            return self._failed_output(e)
+
+    def _cache_namespace(self) -> str:
+        return namespace("editorial_bias", self.CACHE_VERSION, self.model, self.SYSTEM_PROMPT)
+
+    def _messages(self, packed: list[PackedArticle]) -> list[dict[str, str]]:
+        """Chat messages for the single-prompt assessment."""
+        # Format articles for analysis
+        combined_text = self._format_articles(packed)
 
         user_prompt = f"""Analyze the following articles for editorial/political bias.
 IMPORTANT: If the articles are not in English, translate their core meaning to English internally before analyzing.
@@ -1716,27 +2425,449 @@ Assess:
 3. Use of loaded language (with examples and source article references)
 4. Any story selection bias patterns"""
 
-        try:
-            result: EditorialBiasLLMOutput = self.llm.invoke(
-                [
-                    {"role": "system", "content": self.SYSTEM_PROMPT},
-                    {"role": "user", "content": user_prompt},
-                ]
-            )
-            return result
+        return [
+            {"role": "system", "content": self.SYSTEM_PROMPT},
+            {"role": "user", "content": user_prompt},
+        ]
+
+    @staticmethod
+    def _failed_output(error: Exception) -> EditorialBiasLLMOutput:
+        resilience.record_fallback("editorial_bias", error)
+        return EditorialBiasLLMOutput(
+            overall_bias=BiasDirection.CENTER,
+            bias_score=0.0,
+            policy_positions=[],
+            uses_loaded_language=False,
+            loaded_language_examples=[],
+            story_selection_bias=None,
+            confidence=0.0,
+            reasoning=f"LLM analysis failed: {str(error)}",
+        )
 
-        except Exception as e:
-            logger.error(f"EditorialBiasAnalyzer LLM call failed: {e}")
-            return EditorialBiasLLMOutput(
-                overall_bias=BiasDirection.CENTER,
-                bias_score=0.0,
-                policy_positions=[],
-                uses_loaded_language=False,
-                loaded_language_examples=[],
-                story_selection_bias=None,
-                confidence=0.0,
-                reasoning=f"LLM analysis failed: {str(e)}",
-            )
+    # ------------------------------------------------------------------
+    # Map-reduce mode
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _excerpt_key(p: PackedArticle) -> str:
+        """Content key of an excerpt as it appears in a prompt."""
+        return article_key(p.title, p.excerpt)
+
+    def _chunk(self, packed: list[PackedArticle]) -> list[list[PackedArticle]]:
+        """
+        Split packed articles into content-defined chunks of at most chunk_tokens.
+
+        Articles are ordered by content key, and a chunk ends after an
+        article whose key hash hits a boundary (about every
+        0.6 x chunk_tokens / max_article_tokens articles) or when the next
+        article would not fit. Chunk membership therefore depends on the
+        articles themselves rather than their feed positions: adding or
+        removing an article changes the chunk it belongs to, while the
+        others keep their article cache entries.
+        """
+        spacing = max(2, round(0.6 * self.chunk_tokens / self.max_article_tokens))
+        keyed = sorted(((self._excerpt_key(p), p) for p in packed), key=lambda item: item[0])
+
+        chunks: list[list[PackedArticle]] = []
+        current: list[PackedArticle] = []
+        tokens = 0
+        for key, p in keyed:
+            if current and tokens + p.tokens > self.chunk_tokens:
+                chunks.append(current)
+                current, tokens = [], 0
+            current.append(p)
+            tokens += p.tokens
+            if int(key[:8], 16) % spacing == 0:
+                chunks.append(current)
+                current, tokens = [], 0
+        if current:
+            chunks.append(current)
+        return chunks
+
+    @staticmethod
+    def _chunk_label(chunk: list[PackedArticle]) -> str:
+        """Human-readable articles of a chunk (e.g. "Articles 4-9" or "Articles 2, 7, 11")."""
+        indices = sorted(p.index for p in chunk)
+        if len(indices) == 1:
+            return f"Article {indices[0]}"
+        if indices[-1] - indices[0] == len(indices) - 1:
+            return f"Articles {indices[0]}-{indices[-1]}"
+        return f"Articles {', '.join(str(i) for i in indices)}"
+
+    @classmethod
+    def _renumber(cls, output: EditorialBiasChunkOutput, mapping: dict[int, int]) -> EditorialBiasChunkOutput:
+        """Rewrite "Article N" references of a cached chunk output to current article numbers."""
+        if all(old == new for old, new in mapping.items()):
+            return output
+
+        def renumber_reference(match: re.Match) -> str:
+            numbers = re.sub(r"\d+", lambda n: str(mapping.get(int(n.group()), n.group())), match.group(2))
+            return match.group(1) + numbers
+
+        return EditorialBiasChunkOutput.model_validate_json(
+            cls._ARTICLE_REFERENCE.sub(renumber_reference, output.model_dump_json())
+        )
+
+    def _map_chunks(
+        self, chunks: list[list[PackedArticle]]
+    ) -> list[tuple[list[PackedArticle], EditorialBiasChunkOutput]]:
+        """
+        Score each chunk with the compact chunk schema, concurrently.
+
+        Chunks already in the article cache are not sent again; their
+        article references are renumbered to the current article list.
+
+        Args:
+            chunks: Article chunks from _chunk()
+
+        Returns:
+            (chunk, output) pairs for the chunks that succeeded
+        """
+        chunk_keys, results, pending = self._cached_chunks(chunks)
+        prompts = self._chunk_prompts(chunks, pending)
+        outputs = self.chunk_llm.batch(
+            prompts,
+            config={"max_concurrency": self.max_concurrency},
+            return_exceptions=True,
+        ) if prompts else []
+        return self._scored_chunks(chunks, chunk_keys, results, pending, outputs)
+
+    async def _amap_chunks(
+        self, chunks: list[list[PackedArticle]]
+    ) -> list[tuple[list[PackedArticle], EditorialBiasChunkOutput]]:
+        """Coroutine counterpart of _map_chunks()."""
+        chunk_keys, results, pending = self._cached_chunks(chunks)
+        prompts = self._chunk_prompts(chunks, pending)
+        outputs = await self.chunk_llm.abatch(
+            prompts,
+            config={"max_concurrency": self.max_concurrency},
+            return_exceptions=True,
+        ) if prompts else []
+        return self._scored_chunks(chunks, chunk_keys, results, pending, outputs)
+
+    def _chunk_namespace(self) -> str:
+        return namespace("editorial_bias_chunk", self.CACHE_VERSION, self.model, self.SYSTEM_PROMPT)
+
+    def _cached_chunks(
+        self, chunks: list[list[PackedArticle]]
+    ) -> tuple[list[str], list[Optional[EditorialBiasChunkOutput]], list[int]]:
+        """Chunk keys, cached outputs (None where missing) and the indices still to score."""
+        cache = resolve(self._article_cache)
+        chunk_keys = [corpus_key(self._excerpt_key(p) for p in chunk) for chunk in chunks]
+        stored = cache.get_many(self._chunk_namespace(), chunk_keys) if cache is not None else {}
+
+        results: list[Optional[EditorialBiasChunkOutput]] = [None] * len(chunks)
+        for i, (chunk, key) in enumerate(zip(chunks, chunk_keys)):
+            if key in stored:
+                # Stored indices follow the chunk's content-key order, as do the current ones
+                mapping = dict(zip(stored[key]["indices"], (p.index for p in chunk)))
+                results[i] = self._renumber(EditorialBiasChunkOutput.model_validate(stored[key]["output"]), mapping)
+        pending = [i for i, result in enumerate(results) if result is None]
+        tracing.annotate(chunks_cached=len(chunks) - len(pending))
+        return chunk_keys, results, pending
+
+    def _chunk_prompts(self, chunks: list[list[PackedArticle]], pending: list[int]) -> list[list[dict[str, str]]]:
+        """Chunk-schema prompts for the chunks at `pending`."""
+        prompts = []
+        for i in pending:
+            chunk = chunks[i]
+            user_prompt = f"""Analyze the following batch of articles (batch {i + 1} of {len(chunks)}) for editorial/political bias.
+Other batches from the same outlet are analyzed separately: assess ONLY these articles and keep the output compact.
+IMPORTANT: If the articles are not in English, translate their core meaning to English internally before analyzing.
+IMPORTANT: For each policy position, cite the specific article(s) where you found the evidence using the format "Article N: [Title]".
+
+{self._format_articles(chunk)}
+Return:
+1. Political leaning of this batch (score from -10 to +10)
+2. Positions on policy domains covered in this batch — cite source articles for each
+3. Up to 3 examples of loaded language, with article references
+4. One sentence on story selection patterns, if notable
+5. A 1-2 sentence justification"""
+            prompts.append([
+                {"role": "system", "content": self.SYSTEM_PROMPT},
+                {"role": "user", "content": user_prompt},
+            ])
+        return prompts
+
+    def _scored_chunks(
+        self,
+        chunks: list[list[PackedArticle]],
+        chunk_keys: list[str],
+        results: list[Optional[EditorialBiasChunkOutput]],
+        pending: list[int],
+        outputs: list,
+    ) -> list[tuple[list[PackedArticle], EditorialBiasChunkOutput]]:
+        """Merge fresh chunk outputs into `results`, store them, and pair chunks with outputs."""
+        fresh = {}
+        for i, output in zip(pending, outputs):
+            if isinstance(output, Exception):
+                logger.warning(f"EditorialBiasAnalyzer chunk ({self._chunk_label(chunks[i])}) failed: {output}")
+                continue
+            results[i] = output
+            fresh[chunk_keys[i]] = {
+                "indices": [p.index for p in chunks[i]],
+                "output": output.model_dump(mode="json"),
+            }
+        cache = resolve(self._article_cache)
+        if cache is not None:
+            cache.put_many(self._chunk_namespace(), fresh)
+
+        return [(chunk, output) for chunk, output in zip(chunks, results) if output is not None]
+
+    def _merge_policy_positions(
+        self,
+        scored: list[tuple[list[PackedArticle], EditorialBiasChunkOutput]],
+        weights: list[float],
+    ) -> list[PolicyPosition]:
+        """
+        Merge per-chunk policy positions by domain.
+
+        Each domain's leaning is the weighted mean of the chunk leanings on the
+        -10..+10 scale (weight = chunk weight x position confidence), mapped
+        back to a BiasDirection. Indicators and source articles are unioned,
+        strongest chunks first.
+        """
+        grouped: dict[PolicyDomain, list[tuple[PolicyPosition, float]]] = {}
+        for (_, output), weight in zip(scored, weights):
+            for position in output.policy_positions:
+                grouped.setdefault(position.domain, []).append(
+                    (position, weight * max(position.confidence, 0.05))
+                )
+
+        merged = []
+        for domain, items in grouped.items():
+            items.sort(key=lambda item: item[1], reverse=True)
+            total = sum(w for _, w in items)
+            leaning = sum(self.DIRECTION_SCORES[p.leaning] * w for p, w in items) / total
+            confidence = sum(p.confidence * w for p, w in items) / total
+            indicators = list(dict.fromkeys(i for p, _ in items for i in p.indicators))
+            sources = list(dict.fromkeys(a for p, _ in items for a in p.source_articles))
+            merged.append((total, PolicyPosition(
+                domain=domain,
+                leaning=self._score_to_direction(leaning),
+                indicators=indicators[:6],
+                source_articles=sources,
+                confidence=round(confidence, 3),
+            )))
+
+        merged.sort(key=lambda item: item[0], reverse=True)
+        return [position for _, position in merged]
+
+    def _reduce_narrative(
+        self,
+        bias_score: float,
+        positions: list[PolicyPosition],
+        scored: list[tuple[list[PackedArticle], EditorialBiasChunkOutput]],
+        loaded_examples: list[str],
+        story_notes: list[str],
+    ) -> EditorialBiasReduceOutput:
+        """
+        Write the narrative fields for a map-reduce result.
+
+        Uses the reduce LLM when enabled; otherwise (or if that call fails)
+        assembles them from the chunk outputs.
+        """
+        if self.reduce_with_llm:
+            try:
+                return self.reduce_llm.invoke(
+                    self._reduce_messages(bias_score, positions, scored, loaded_examples, story_notes)
+                )
+            except Exception as e:
+                logger.warning(f"EditorialBiasAnalyzer reduce LLM call failed, using chunk reasoning: {e}")
+        return self._assembled_narrative(bias_score, positions, scored, story_notes)
+
+    async def _areduce_narrative(
+        self,
+        bias_score: float,
+        positions: list[PolicyPosition],
+        scored: list[tuple[list[PackedArticle], EditorialBiasChunkOutput]],
+        loaded_examples: list[str],
+        story_notes: list[str],
+    ) -> EditorialBiasReduceOutput:
+        """Coroutine counterpart of _reduce_narrative()."""
+        if self.reduce_with_llm:
+            try:
+                return await self.reduce_llm.ainvoke(
+                    self._reduce_messages(bias_score, positions, scored, loaded_examples, story_notes)
+                )
+            except Exception as e:
+                logger.warning(f"EditorialBiasAnalyzer reduce LLM call failed, using chunk reasoning: {e}")
+        return self._assembled_narrative(bias_score, positions, scored, story_notes)
+
+    def _chunk_notes(self, scored: list[tuple[list[PackedArticle], EditorialBiasChunkOutput]]) -> list[str]:
+        return [
+            f"{self._chunk_label(chunk)}: score {output.bias_score:+.1f}. {output.reasoning}"
+            for chunk, output in scored
+        ]
+
+    def _reduce_messages(
+        self,
+        bias_score: float,
+        positions: list[PolicyPosition],
+        scored: list[tuple[list[PackedArticle], EditorialBiasChunkOutput]],
+        loaded_examples: list[str],
+        story_notes: list[str],
+    ) -> list[dict[str, str]]:
+        """Chat messages for the reduce LLM call."""
+        direction = self._score_to_direction(bias_score)
+        chunk_notes = self._chunk_notes(scored)
+        positions_text = "\n".join(
+            f"- {p.domain.value}: {p.leaning.value} — {'; '.join(p.indicators)} ({', '.join(p.source_articles)})"
+            for p in positions
+        ) or "- None detected"
+        user_prompt = f"""The articles of one outlet were analyzed in {len(scored)} batches.
+The combined bias score is {bias_score:+.1f} ({direction.value}). Do not change the score; summarize the evidence.
+
+Merged policy positions:
+{positions_text}
+
+Per-batch assessments:
+{chr(10).join(f"- {note}" for note in chunk_notes)}
+
+Loaded language examples: {'; '.join(loaded_examples) or 'None'}
+Story selection notes: {'; '.join(story_notes) or 'None'}
+
+Write the ideology summary, economy summary, story selection bias notes and overall reasoning.
+Be explicit and direct, and cite articles as "Article N: [Title]"."""
+        return [
+            {"role": "system", "content": self.SYSTEM_PROMPT},
+            {"role": "user", "content": user_prompt},
+        ]
+
+    def _assembled_narrative(
+        self,
+        bias_score: float,
+        positions: list[PolicyPosition],
+        scored: list[tuple[list[PackedArticle], EditorialBiasChunkOutput]],
+        story_notes: list[str],
+    ) -> EditorialBiasReduceOutput:
+        """Narrative fields assembled from chunk outputs, without an LLM call."""
+        direction = self._score_to_direction(bias_score)
+        chunk_notes = self._chunk_notes(scored)
+        economic = next((p for p in positions if p.domain == PolicyDomain.ECONOMIC), None)
+        leanings = "; ".join(f"{p.domain.value}: {p.leaning.value}" for p in positions)
+        return EditorialBiasReduceOutput(
+            ideology_summary=(
+                f"Across {len(scored)} batches the outlet scores {bias_score:+.1f} ({direction.value})."
+                + (f" Policy leanings — {leanings}." if leanings else "")
+            ),
+            economy_summary=(
+                f"Economically, the outlet leans {economic.leaning.value}: {'; '.join(economic.indicators[:2])}."
+                if economic else ""
+            ),
+            story_selection_bias="; ".join(story_notes) or None,
+            reasoning=" ".join(chunk_notes),
+        )
+
+    def _analyze_map_reduce(
+        self, packed: list[PackedArticle]
+    ) -> tuple[EditorialBiasLLMOutput, int, Optional[float]]:
+        """
+        Analyze editorial bias over article chunks and combine the results.
+
+        The combined bias_score is the mean of chunk scores weighted by
+        chunk confidence x number of articles. The weighted standard
+        deviation of chunk scores is returned as a consistency signal and
+        lowers the combined confidence (a stddev of 5 halves it).
+
+        Args:
+            packed: Article excerpts selected by pack_articles()
+
+        Returns:
+            Tuple of (combined output, chunks analyzed, chunk score stddev)
+        """
+        chunks = self._chunk(packed)
+        if len(chunks) <= 1:
+            return self._analyze_with_llm(packed), 1, None
+
+        scored = self._map_chunks(chunks)
+        tracing.annotate(chunks=len(chunks), chunks_failed=len(chunks) - len(scored))
+        if not scored:
+            return self._all_chunks_failed(len(chunks)), 0, None
+
+        combined = self._combine_chunks(scored)
+        narrative = self._reduce_narrative(
+            combined["bias_score"], combined["positions"], scored,
+            combined["loaded_examples"], combined["story_notes"],
+        )
+        return self._combined_output(combined, narrative), len(scored), round(combined["stddev"], 3)
+
+    async def _aanalyze_map_reduce(
+        self, packed: list[PackedArticle]
+    ) -> tuple[EditorialBiasLLMOutput, int, Optional[float]]:
+        """Coroutine counterpart of _analyze_map_reduce()."""
+        chunks = self._chunk(packed)
+        if len(chunks) <= 1:
+            return await self._aanalyze_with_llm(packed), 1, None
+
+        scored = await self._amap_chunks(chunks)
+        tracing.annotate(chunks=len(chunks), chunks_failed=len(chunks) - len(scored))
+        if not scored:
+            return self._all_chunks_failed(len(chunks)), 0, None
+
+        combined = self._combine_chunks(scored)
+        narrative = await self._areduce_narrative(
+            combined["bias_score"], combined["positions"], scored,
+            combined["loaded_examples"], combined["story_notes"],
+        )
+        return self._combined_output(combined, narrative), len(scored), round(combined["stddev"], 3)
+
+    @staticmethod
+    def _all_chunks_failed(chunk_count: int) -> EditorialBiasLLMOutput:
+        resilience.record_fallback("editorial_bias")
+        return EditorialBiasLLMOutput(
+            overall_bias=BiasDirection.CENTER,
+            bias_score=0.0,
+            policy_positions=[],
+            uses_loaded_language=False,
+            loaded_language_examples=[],
+            story_selection_bias=None,
+            confidence=0.0,
+            reasoning=f"LLM analysis failed for all {chunk_count} article chunks",
+        )
+
+    def _combine_chunks(self, scored: list[tuple[list[PackedArticle], EditorialBiasChunkOutput]]) -> dict:
+        """Weighted score, spread, confidence, positions and examples over scored chunks."""
+        weights = [max(output.confidence, 0.05) * len(chunk) for chunk, output in scored]
+        total_weight = sum(weights)
+        bias_score = sum(w * output.bias_score for (_, output), w in zip(scored, weights)) / total_weight
+        variance = sum(
+            w * (output.bias_score - bias_score) ** 2 for (_, output), w in zip(scored, weights)
+        ) / total_weight
+        stddev = math.sqrt(variance)
+        mean_confidence = sum(w * output.confidence for (_, output), w in zip(scored, weights)) / total_weight
+
+        positions = self._merge_policy_positions(scored, weights)
+        loaded_examples = list(dict.fromkeys(
+            example for _, output in scored for example in output.loaded_language_examples
+        ))[:10]
+        story_notes = [output.story_selection_notes for _, output in scored if output.story_selection_notes]
+        return {
+            "bias_score": bias_score,
+            "stddev": stddev,
+            "mean_confidence": mean_confidence,
+            "positions": positions,
+            "loaded_examples": loaded_examples,
+            "story_notes": story_notes,
+        }
+
+    def _combined_output(self, combined: dict, narrative: EditorialBiasReduceOutput) -> EditorialBiasLLMOutput:
+        """Final map-reduce output from _combine_chunks() and the narrative."""
+        bias_score = max(-10.0, min(10.0, round(combined["bias_score"], 2)))
+        positions = combined["positions"]
+        loaded_examples = combined["loaded_examples"]
+        return EditorialBiasLLMOutput(
+            overall_bias=self._score_to_direction(bias_score),
+            bias_score=bias_score,
+            policy_positions=positions,
+            uses_loaded_language=bool(loaded_examples),
+            loaded_language_examples=loaded_examples,
+            story_selection_bias=narrative.story_selection_bias,
+            ideology_summary=narrative.ideology_summary,
+            economy_summary=narrative.economy_summary,
+            confidence=round(combined["mean_confidence"] / (1 + combined["stddev"] / 5), 3),
+            reasoning=narrative.reasoning,
+        )
 
     def analyze(
         self,
@@ -1758,24 +2889,101 @@ Assess:
         domain = self._extract_domain(url_or_domain) if url_or_domain else "unknown"
 
         if not articles:
-            return EditorialBiasResult(
-                domain=domain,
-                outlet_name=outlet_name,
-                overall_bias=BiasDirection.CENTER,
-                bias_score=0.0,
-                mbfc_label="Center",
-                policy_positions=[],
-                uses_loaded_language=False,
-                loaded_language_examples=[],
-                story_selection_bias=None,
-                articles_analyzed=0,
-                confidence=0.0,
-                reasoning="No articles provided for analysis",
-            )
+            return self._empty_result(domain, outlet_name)
+
+        packing, use_map_reduce = self._plan(articles)
+        if not packing.packed:
+            return self._empty_result(domain, outlet_name)
 
         # Analyze with LLM
-        llm_output = self._analyze_with_llm(articles)
+        if use_map_reduce:
+            llm_output, chunks_analyzed, chunk_stddev = self._analyze_map_reduce(packing.packed)
+        else:
+            llm_output, chunks_analyzed, chunk_stddev = self._analyze_with_llm(packing.packed), 1, None
+
+        return self._build_result(domain, outlet_name, llm_output, packing, chunks_analyzed, chunk_stddev)
+
+    async def aanalyze(
+        self,
+        articles: list[dict[str, str]],
+        url_or_domain: str | None = None,
+        outlet_name: str | None = None,
+    ) -> EditorialBiasResult:
+        """Coroutine counterpart of analyze()."""
+        domain = self._extract_domain(url_or_domain) if url_or_domain else "unknown"
 
+        if not articles:
+            return self._empty_result(domain, outlet_name)
+
+        packing, use_map_reduce = self._plan(articles)
+        if not packing.packed:
+            return self._empty_result(domain, outlet_name)
+
+        if use_map_reduce:
+            llm_output, chunks_analyzed, chunk_stddev = await self._aanalyze_map_reduce(packing.packed)
+        else:
+            llm_output, chunks_analyzed, chunk_stddev = await self._aanalyze_with_llm(packing.packed), 1, None
+
+        return self._build_result(domain, outlet_name, llm_output, packing, chunks_analyzed, chunk_stddev)
+
+    def _plan(self, articles: list[dict[str, str]]) -> tuple[PackingResult, bool]:
+        """Pack `articles` and decide between one prompt and map-reduce."""
+        packing = self.pack(articles)
+        use_map_reduce = self.uses_map_reduce(packing)
+        tracing.annotate(
+            articles_packed=len(packing.packed),
+            articles_dropped=len(packing.dropped),
+            packed_tokens=packing.total_tokens,
+            map_reduce=use_map_reduce,
+        )
+        return packing, use_map_reduce
+
+    def pack(self, articles: list[dict[str, str]]) -> PackingResult:
+        """
+        Fit the best article excerpts into the prompt token budget
+        (map-reduce modes can spread a larger budget over several chunks).
+        """
+        return pack_articles(
+            articles,
+            token_budget=self.token_budget if self.mode == "single" else self.map_reduce_budget,
+            model=self.model,
+            max_article_tokens=self.max_article_tokens,
+            min_article_tokens=self.min_article_tokens,
+        )
+
+    def uses_map_reduce(self, packing: PackingResult) -> bool:
+        """Whether `packing` is analyzed in chunks rather than one prompt."""
+        return self.mode == "map_reduce" or (
+            self.mode == "auto" and packing.total_tokens > self.token_budget
+        )
+
+    @staticmethod
+    def _empty_result(domain: str, outlet_name: str | None) -> EditorialBiasResult:
+        return EditorialBiasResult(
+            domain=domain,
+            outlet_name=outlet_name,
+            overall_bias=BiasDirection.CENTER,
+            bias_score=0.0,
+            mbfc_label="Center",
+            policy_positions=[],
+            uses_loaded_language=False,
+            loaded_language_examples=[],
+            story_selection_bias=None,
+            articles_analyzed=0,
+            confidence=0.0,
+            reasoning="No articles provided for analysis",
+        )
+
+    def _build_result(
+        self,
+        domain: str,
+        outlet_name: str | None,
+        llm_output: EditorialBiasLLMOutput,
+        packing: PackingResult,
+        chunks_analyzed: int = 1,
+        chunk_stddev: float | None = None,
+    ) -> EditorialBiasResult:
+        """Wrap an LLM bias assessment (shared with FusedContentAnalyzer)."""
         # Convert score to MBFC label
         mbfc_label = self._score_to_label(llm_output.bias_score)
 
@@ -1791,7 +2999,11 @@ Assess:
             story_selection_bias=llm_output.story_selection_bias,
             ideology_summary=llm_output.ideology_summary,
             economy_summary=llm_output.economy_summary,
-            articles_analyzed=len(articles),
+            articles_analyzed=len(packing.packed),
+            articles_dropped=[DroppedArticle(**d) for d in packing.dropped],
+            prompt_article_tokens=packing.total_tokens,
+            chunks_analyzed=chunks_analyzed,
+            chunk_score_stddev=chunk_stddev,
             confidence=llm_output.confidence,
             reasoning=llm_output.reasoning,
         )
@@ -1920,10 +3132,13 @@ NONE_DETECTED: No pseudoscience content found
 5. Be precise - distinguish between reporting ON pseudoscience (journalism) vs. PROMOTING it
 6. Quote specific evidence when identifying pseudoscience content"""
 
+    CACHE_VERSION = 1
+
     def __init__(
         self,
         model: str = "gpt-4o-mini",
         temperature: float = 0.0,
+        article_cache: Optional[ArticleCache] = None,
     ):
         """
         Initialize the PseudoscienceAnalyzer.
@@ -1931,8 +3146,12 @@ NONE_DETECTED: No pseudoscience content found
         Args:
             model: OpenAI model to use
             temperature: LLM temperature (0 for deterministic)
+            article_cache: Store for results per article set (default: the
+                process-wide cache)
         """
         self.llm = get_llm(model, temperature).with_structured_output(PseudoscienceLLMOutput)
+        self.model = model
+        self._article_cache = article_cache
 
     def _extract_domain(self, url: str) -> str:
         """Extract the root domain from a URL."""
@@ -1952,6 +3171,43 @@ NONE_DETECTED: No pseudoscience content found
         Returns:
             PseudoscienceLLMOutput with pseudoscience assessment
         """
+        messages = self._messages(articles)
+        try:
+            result: PseudoscienceLLMOutput = cached(
+                resolve(self._article_cache),
+                self._cache_namespace(),
+                content_key(messages[1]["content"]),
+                PseudoscienceLLMOutput,
+                lambda: self.llm.invoke(messages),
+            )
+            return result
+
+        except Exception as e:
+            logger.error(f"PseudoscienceAnalyzer LLM call failed: {e}")
+            return self._failed_output(e)
+
+    async def _aanalyze_with_llm(self, articles: list[dict[str, str]]) -> PseudoscienceLLMOutput:
+        """Coroutine counterpart of _analyze_with_llm()."""
+        messages = self._messages(articles)
+        try:
+            result: PseudoscienceLLMOutput = await acached(
+                resolve(self._article_cache),
+                self._cache_namespace(),
+                content_key(messages[1]["content"]),
+                PseudoscienceLLMOutput,
+                lambda: self.llm.ainvoke(messages),
+            )
+            return result
+
+        except Exception as e:
+            logger.error(f"PseudoscienceAnalyzer LLM call failed: {e}")
+            return self._failed_output(e)
+
+    def _cache_namespace(self) -> str:
+        return namespace("pseudoscience", self.CACHE_VERSION, self.model, self.SYSTEM_PROMPT)
+
+    def _messages(self, articles: list[dict[str, str]]) -> list[dict[str, str]]:
+        """Chat messages for the pseudoscience assessment."""
         # Format articles for analysis
         articles_text = []
         for i, article in enumerate(articles, 1):
@@ -1971,26 +3227,23 @@ Identify:
 3. Whether scientific consensus is respected
 4. Overall quality of science reporting (0=excellent, 10=promotes pseudoscience)"""
 
-        try:
-            result: PseudoscienceLLMOutput = self.llm.invoke(
-                [
-                    {"role": "system", "content": self.SYSTEM_PROMPT},
-                    {"role": "user", "content": user_prompt},
-                ]
-            )
-            return result
-
-        except Exception as e:
-            logger.error(f"PseudoscienceAnalyzer LLM call failed: {e}")
-            return PseudoscienceLLMOutput(
-                indicators=[],
-                promotes_pseudoscience=False,
-                overall_severity=PseudoscienceSeverity.NONE_DETECTED,
-                science_reporting_quality=5.0,
-                respects_scientific_consensus=True,
-                confidence=0.0,
-                reasoning=f"LLM analysis failed: {str(e)}",
-            )
+        return [
+            {"role": "system", "content": self.SYSTEM_PROMPT},
+            {"role": "user", "content": user_prompt},
+        ]
+
+    @staticmethod
+    def _failed_output(error: Exception) -> PseudoscienceLLMOutput:
+        resilience.record_fallback("pseudoscience", error)
+        return PseudoscienceLLMOutput(
+            indicators=[],
+            promotes_pseudoscience=False,
+            overall_severity=PseudoscienceSeverity.NONE_DETECTED,
+            science_reporting_quality=5.0,
+            respects_scientific_consensus=True,
+            confidence=0.0,
+            reasoning=f"LLM analysis failed: {str(error)}",
+        )
 
     def analyze(
         self,
@@ -2012,23 +3265,51 @@ Identify:
         domain = self._extract_domain(url_or_domain) if url_or_domain else "unknown"
 
         if not articles:
-            return PseudoscienceAnalysisResult(
-                domain=domain,
-                outlet_name=outlet_name,
-                score=5.0,  # Neutral when no data
-                promotes_pseudoscience=False,
-                overall_severity=PseudoscienceSeverity.NONE_DETECTED,
-                categories_found=[],
-                indicators=[],
-                respects_scientific_consensus=True,
-                articles_analyzed=0,
-                confidence=0.0,
-                reasoning="No articles provided for analysis",
-            )
+            return self._empty_result(domain, outlet_name)
 
         # Analyze with LLM
         llm_output = self._analyze_with_llm(articles)
+        return self._build_result(domain, outlet_name, llm_output, len(articles))
 
+    async def aanalyze(
+        self,
+        articles: list[dict[str, str]],
+        url_or_domain: str | None = None,
+        outlet_name: str | None = None,
+    ) -> PseudoscienceAnalysisResult:
+        """Coroutine counterpart of analyze()."""
+        domain = self._extract_domain(url_or_domain) if url_or_domain else "unknown"
+
+        if not articles:
+            return self._empty_result(domain, outlet_name)
+
+        llm_output = await self._aanalyze_with_llm(articles)
+        return self._build_result(domain, outlet_name, llm_output, len(articles))
+
+    @staticmethod
+    def _empty_result(domain: str, outlet_name: str | None) -> PseudoscienceAnalysisResult:
+        return PseudoscienceAnalysisResult(
+            domain=domain,
+            outlet_name=outlet_name,
+            score=5.0,  # Neutral when no data
+            promotes_pseudoscience=False,
+            overall_severity=PseudoscienceSeverity.NONE_DETECTED,
+            categories_found=[],
+            indicators=[],
+            respects_scientific_consensus=True,
+            articles_analyzed=0,
+            confidence=0.0,
+            reasoning="No articles provided for analysis",
+        )
+
+    @staticmethod
+    def _build_result(
+        domain: str,
+        outlet_name: str | None,
+        llm_output: PseudoscienceLLMOutput,
+        articles_analyzed: int,
+    ) -> PseudoscienceAnalysisResult:
+        """Wrap an LLM pseudoscience assessment (shared with FusedContentAnalyzer)."""
         # Extract unique categories found
         categories_found = list(set(
             indicator.category for indicator in llm_output.indicators
@@ -2043,12 +3324,263 @@ Identify:
             categories_found=categories_found,
             indicators=llm_output.indicators,
             respects_scientific_consensus=llm_output.respects_scientific_consensus,
-            articles_analyzed=len(articles),
+            articles_analyzed=articles_analyzed,
             confidence=llm_output.confidence,
             reasoning=llm_output.reasoning,
         )
 
 
+# =============================================================================
+# FusedContentAnalyzer
+# =============================================================================
+
+
+class FusedContentAnalyzer:
+    """
+    Editorial bias, sourcing and pseudoscience from one pass over the articles.
+
+    The three content analyzers each serialize the same articles into their
+    own prompt, so the article tokens are paid three times per outlet. This
+    analyzer packs the articles once (EditorialBiasAnalyzer's packing) and
+    asks for all three assessments in a single structured call
+    (FusedContentLLMOutput). The analyzers' own result builders turn the
+    answer into the usual EditorialBiasResult, SourcingAnalysisResult and
+    PseudoscienceAnalysisResult, so callers cannot tell the modes apart.
+
+    When the articles need map-reduce editorial analysis (they do not fit
+    one prompt), the three analyzers run separately instead.
+    """
+
+    CACHE_VERSION = 1
+
+    def __init__(
+        self,
+        model: str = "gpt-4o-mini",
+        temperature: float = 0.0,
+        editorial_bias_analyzer: Optional["EditorialBiasAnalyzer"] = None,
+        sourcing_analyzer: Optional[SourcingAnalyzer] = None,
+        pseudoscience_analyzer: Optional["PseudoscienceAnalyzer"] = None,
+        article_cache: Optional[ArticleCache] = None,
+    ):
+        """
+        Initialize the FusedContentAnalyzer.
+
+        Args:
+            model: OpenAI model to use
+            temperature: LLM temperature (0 for deterministic)
+            editorial_bias_analyzer: Analyzer whose packing, prompt and result
+                builder are reused (created if not given)
+            sourcing_analyzer: Same for sourcing
+            pseudoscience_analyzer: Same for pseudoscience
+            article_cache: Store for results per article set (default: the
+                process-wide cache)
+        """
+        self.llm = get_llm(model, temperature).with_structured_output(FusedContentLLMOutput)
+        self.model = model
+        self._article_cache = article_cache
+        self.editorial_bias_analyzer = editorial_bias_analyzer or EditorialBiasAnalyzer(
+            model=model, temperature=temperature, article_cache=article_cache
+        )
+        self.sourcing_analyzer = sourcing_analyzer or SourcingAnalyzer(
+            model=model, temperature=temperature, article_cache=article_cache
+        )
+        self.pseudoscience_analyzer = pseudoscience_analyzer or PseudoscienceAnalyzer(
+            model=model, temperature=temperature, article_cache=article_cache
+        )
+        self.system_prompt = f"""You assess a news outlet from a sample of its articles in three independent ways. Fill in all three sections of the response; each has its own score, confidence and reasoning.
+
+# SECTION 1: EDITORIAL BIAS
+{self.editorial_bias_analyzer.SYSTEM_PROMPT}
+
+# SECTION 2: SOURCING
+{self.sourcing_analyzer.SYSTEM_PROMPT}
+
+# SECTION 3: PSEUDOSCIENCE
+{self.pseudoscience_analyzer.SYSTEM_PROMPT}"""
+
+    def analyze(
+        self,
+        articles: list[dict[str, str]],
+        url_or_domain: str | None = None,
+        outlet_name: str | None = None,
+    ) -> tuple[EditorialBiasResult, SourcingAnalysisResult, PseudoscienceAnalysisResult]:
+        """
+        Analyze editorial bias, sourcing and pseudoscience together.
+
+        Args:
+            articles: List of article dicts with 'title' and 'text' keys
+            url_or_domain: Optional URL or domain for context
+            outlet_name: Optional human-readable outlet name
+
+        Returns:
+            Tuple of (editorial bias, sourcing, pseudoscience) results
+        """
+        packing = self._plan(articles)
+        if packing is None:
+            return self._analyze_separately(articles, url_or_domain, outlet_name)
+
+        all_links, unique_domains, _ = self.sourcing_analyzer._gather_evidence(articles)
+        messages = self._messages(packing, unique_domains)
+        try:
+            result: FusedContentLLMOutput = cached(
+                resolve(self._article_cache),
+                self._cache_namespace(),
+                content_key(messages[1]["content"]),
+                FusedContentLLMOutput,
+                lambda: self.llm.invoke(messages),
+            )
+        except Exception as e:
+            logger.error(f"FusedContentAnalyzer LLM call failed: {e}")
+            result = e
+        return self._build_results(result, articles, packing, all_links, unique_domains, url_or_domain, outlet_name)
+
+    async def aanalyze(
+        self,
+        articles: list[dict[str, str]],
+        url_or_domain: str | None = None,
+        outlet_name: str | None = None,
+    ) -> tuple[EditorialBiasResult, SourcingAnalysisResult, PseudoscienceAnalysisResult]:
+        """Coroutine counterpart of analyze()."""
+        packing = self._plan(articles)
+        if packing is None:
+            return await self._aanalyze_separately(articles, url_or_domain, outlet_name)
+
+        all_links, unique_domains, _ = self.sourcing_analyzer._gather_evidence(articles)
+        messages = self._messages(packing, unique_domains)
+        try:
+            result: FusedContentLLMOutput = await acached(
+                resolve(self._article_cache),
+                self._cache_namespace(),
+                content_key(messages[1]["content"]),
+                FusedContentLLMOutput,
+                lambda: self.llm.ainvoke(messages),
+            )
+        except Exception as e:
+            logger.error(f"FusedContentAnalyzer LLM call failed: {e}")
+            result = e
+        return self._build_results(result, articles, packing, all_links, unique_domains, url_or_domain, outlet_name)
+
+    def _plan(self, articles: list[dict[str, str]]) -> Optional[PackingResult]:
+        """Packed articles for the fused prompt, or None to run the analyzers separately."""
+        editorial = self.editorial_bias_analyzer
+        if not articles:
+            return None
+
+        packing = editorial.pack(articles)
+        if not packing.packed:
+            tracing.annotate(fused=False)
+            logger.info("  - No article survived packing, running content analyzers separately")
+            return None
+        if editorial.uses_map_reduce(packing):
+            tracing.annotate(fused=False)
+            logger.info("  - Articles need map-reduce bias analysis, running content analyzers separately")
+            return None
+
+        tracing.annotate(
+            fused=True,
+            articles_packed=len(packing.packed),
+            articles_dropped=len(packing.dropped),
+            packed_tokens=packing.total_tokens,
+        )
+        return packing
+
+    def _cache_namespace(self) -> str:
+        return namespace("fused_content", self.CACHE_VERSION, self.model, self.system_prompt)
+
+    def _messages(self, packing: PackingResult, unique_domains: list[str]) -> list[dict[str, str]]:
+        """Chat messages for the fused assessment."""
+        editorial = self.editorial_bias_analyzer
+        user_prompt = f"""Analyze the following articles for (1) editorial/political bias, (2) sourcing quality and (3) pseudoscience and conspiracy content.
+IMPORTANT: If the articles are not in English, translate their core meaning to English internally before analyzing.
+IMPORTANT: For each policy position, cite the specific article(s) where you found the evidence using the format "Article N: [Title]".
+
+DETECTED HYPERLINKS (already extracted):
+{self.sourcing_analyzer._format_domains(unique_domains)}
+
+{editorial._format_articles(packing.packed)}
+Section 1 - Editorial bias:
+1. Overall political leaning (score from -10 to +10)
+2. Positions on specific policy domains if detectable — cite source articles for each
+3. Use of loaded language (with examples and source article references)
+4. Any story selection bias patterns
+
+Section 2 - Sourcing:
+1. Did you find valid named sources in the text that were NOT linked? (e.g. "According to the AP")
+2. Is there frequent use of vague sourcing? (e.g. "Scientists say", "Critics claim")
+3. Assess the quality of the specific sources found.
+
+Section 3 - Pseudoscience:
+1. Any pseudoscientific claims or conspiracy theories
+2. How the outlet treats these claims (promoting vs. debunking)
+3. Whether scientific consensus is respected
+4. Overall quality of science reporting (0=excellent, 10=promotes pseudoscience)"""
+
+        return [
+            {"role": "system", "content": self.system_prompt},
+            {"role": "user", "content": user_prompt},
+        ]
+
+    def _build_results(
+        self,
+        result: FusedContentLLMOutput | Exception,
+        articles: list[dict[str, str]],
+        packing: PackingResult,
+        all_links: list[str],
+        unique_domains: list[str],
+        url_or_domain: str | None,
+        outlet_name: str | None,
+    ) -> tuple[EditorialBiasResult, SourcingAnalysisResult, PseudoscienceAnalysisResult]:
+        """Split a fused answer (or the error it failed with) into the three results."""
+        editorial = self.editorial_bias_analyzer
+        domain = editorial._extract_domain(url_or_domain) if url_or_domain else "unknown"
+        if isinstance(result, Exception):
+            bias_output = editorial._failed_output(result)
+            sourcing = self.sourcing_analyzer._failed_result(result, all_links, unique_domains)
+            pseudoscience_output = self.pseudoscience_analyzer._failed_output(result)
+        else:
+            bias_output = result.editorial_bias
+            sourcing = self.sourcing_analyzer._build_result(result.sourcing, articles, all_links, unique_domains)
+            pseudoscience_output = result.pseudoscience
+
+        return (
+            editorial._build_result(domain, outlet_name, bias_output, packing),
+            sourcing,
+            self.pseudoscience_analyzer._build_result(domain, outlet_name, pseudoscience_output, len(packing.packed)),
+        )
+
+    def _analyze_separately(
+        self,
+        articles: list[dict[str, str]],
+        url_or_domain: str | None,
+        outlet_name: str | None,
+    ) -> tuple[EditorialBiasResult, SourcingAnalysisResult, PseudoscienceAnalysisResult]:
+        with tracing.span("editorial_bias", tracing.ANALYZER):
+            editorial_bias = self.editorial_bias_analyzer.analyze(articles, url_or_domain, outlet_name)
+        with tracing.span("sourcing", tracing.ANALYZER):
+            sourcing = self.sourcing_analyzer.analyze(articles)
+        with tracing.span("pseudoscience", tracing.ANALYZER):
+            pseudoscience = self.pseudoscience_analyzer.analyze(articles, url_or_domain, outlet_name)
+        return editorial_bias, sourcing, pseudoscience
+
+    async def _aanalyze_separately(
+        self,
+        articles: list[dict[str, str]],
+        url_or_domain: str | None,
+        outlet_name: str | None,
+    ) -> tuple[EditorialBiasResult, SourcingAnalysisResult, PseudoscienceAnalysisResult]:
+        """Coroutine counterpart of _analyze_separately(); the three analyzers run concurrently."""
+
+        async def traced(name: str, coroutine):
+            with tracing.span(name, tracing.ANALYZER):
+                return await coroutine
+
+        return tuple(await asyncio.gather(
+            traced("editorial_bias", self.editorial_bias_analyzer.aanalyze(articles, url_or_domain, outlet_name)),
+            traced("sourcing", self.sourcing_analyzer.aanalyze(articles)),
+            traced("pseudoscience", self.pseudoscience_analyzer.aanalyze(articles, url_or_domain, outlet_name)),
+        ))
+
+
 # =============================================================================
 # Convenience Functions
 # =============================================================================
@@ -3,12 +3,17 @@ report_generator.py
 Generates the specific MBFC-style prose report using LLM synthesis.
 """
 
-from langchain_openai import ChatOpenAI
+import llm_gateway
+import tracing
 from schemas import ComprehensiveReportData
 
 class ReportGenerator:
+    # Bump when the prompt changes, so saved report_text stages are regenerated
+    VERSION = 1
+
     def __init__(self, model: str = "gpt-4o", temperature: float = 0.4):
-        self.llm = ChatOpenAI(model=model, temperature=temperature)
+        self.model = model
+        self.llm = llm_gateway.chat_model(model, temperature)
 
     def generate(self, data: ComprehensiveReportData) -> str:
         """
@@ -113,5 +118,6 @@ DO NOT say "information not provided" or "not available" for fields that have ac
             {"role": "user", "content": prompt}
         ]
 
-        response = self.llm.invoke(messages)
+        with tracing.span("report_generation", tracing.STAGE):
+            response = self.llm.invoke(messages)
         return response.content
\ No newline at end of file
@@ -22,16 +22,17 @@ from datetime import datetime
 from typing import Dict, List, Any, Optional
 from dataclasses import asdict
 
-from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage
 
+import llm_gateway
+
 from evidence import (
     ComprehensiveReportData, AnalyzerOutput, ResearchResults,
     ArticleEvidence, FactCheckEvidence
 )
 
 logger = logging.getLogger(__name__)
-llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.3)
+llm = llm_gateway.chat_model("gpt-4o-mini", temperature=0.3)
 
 
 # =============================================================================
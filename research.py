@@ -11,37 +11,64 @@ Components:
 All LLM calls use LangChain's .with_structured_output() for type-safe responses.
 """
 
+import asyncio
 import logging
 import re
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from datetime import date, datetime
-from typing import Optional
+from typing import Any, AsyncIterable, Awaitable, Callable, Iterable, Optional
 from urllib.parse import urlparse, urljoin
 
-import requests
 from bs4 import BeautifulSoup
-from ddgs import DDGS
 from langchain_openai import ChatOpenAI
 
+import fetching
+import llm_gateway
+import resilience
+import tracing
+import transport
+from article_cache import article_key
+from fetching import AsyncFetchContext, FetchContext
+from stage_cache import StageCache
+from tracing import Tracer
+from config import (
+    CONTENT_ANALYSIS_MODE,
+    RESEARCH_EVIDENCE_CHARS,
+    RESEARCH_HISTORY_SPECULATIVE,
+    RESEARCH_MODE,
+    RESEARCH_TIER_TIMEOUTS,
+)
+from dedup import canonicalize_url
 from schemas import (
+    CombinedResearchLLMOutput,
     ComprehensiveReportData,
     EditorialBiasResult,
     ExternalAnalysisItem,
     ExternalAnalysisLLMOutput,
     FactCheckAnalysisResult,
     HistoryLLMOutput,
+    MediaType,
+    MediaTypeClassification,
     OwnershipLLMOutput,
     PseudoscienceAnalysisResult,
     SourcingAnalysisResult,
+    TrafficData,
+    TrafficTier,
 )
 
 from refactored_analyzers import (
     EditorialBiasAnalyzer,
     FactCheckSearcher,
+    FusedContentAnalyzer,
     MediaTypeAnalyzer,
     OpinionAnalyzer,
     PseudoscienceAnalyzer,
     SourcingAnalyzer,
     TrafficLongevityAnalyzer,
+    asearch_text,
 )
 
 logger = logging.getLogger(__name__)
@@ -53,8 +80,8 @@ logger = logging.getLogger(__name__)
 
 
 def get_llm(model: str = "gpt-4o-mini", temperature: float = 0.0) -> ChatOpenAI:
-    """Get a configured LLM instance."""
-    return ChatOpenAI(model=model, temperature=temperature)
+    """Get a configured LLM instance (shared and rate-scheduled, see llm_gateway.py)."""
+    return llm_gateway.chat_model(model, temperature)
 
 
 # =============================================================================
@@ -113,6 +140,21 @@ For each analysis found:
 
 Include up to 3-5 most relevant and credible analyses."""
 
+    COMBINED_RESEARCH_PROMPT = f"""You are extracting three kinds of information about a media outlet from one pool of evidence (its about page and search results). Fill in all three sections; each has its own confidence.
+
+1. HISTORY
+{HISTORY_PROMPT}
+
+2. OWNERSHIP
+{OWNERSHIP_PROMPT}
+
+3. EXTERNAL ANALYSIS
+{EXTERNAL_ANALYSIS_PROMPT}
+
+Use only the evidence relevant to each section."""
+
+    RESEARCH_MODES = ("separate", "combined", "parallel")
+
     # Domains to exclude from search results
     SEARCH_BLACKLIST = {
         "facebook.com",
@@ -139,6 +181,10 @@ Include up to 3-5 most relevant and credible analyses."""
         "/who-we-are",
     ]
 
+    # Concurrent about-page probes and their per-request timeout (seconds)
+    ABOUT_PROBE_WORKERS = 6
+    ABOUT_PROBE_TIMEOUT = 10
+
     # HTTP headers to mimic a browser
     _HEADERS = {
         "User-Agent": (
@@ -154,6 +200,10 @@ Include up to 3-5 most relevant and credible analyses."""
         self,
         model: str = "gpt-4o-mini",
         temperature: float = 0.0,
+        mode: str = RESEARCH_MODE,
+        evidence_chars: int = RESEARCH_EVIDENCE_CHARS,
+        speculative_history: bool = RESEARCH_HISTORY_SPECULATIVE,
+        tier_timeouts: Optional[dict[str, float]] = None,
     ):
         """
         Initialize the MediaResearcher.
@@ -161,7 +211,17 @@ Include up to 3-5 most relevant and credible analyses."""
         Args:
             model: OpenAI model to use
             temperature: LLM temperature (0 for deterministic)
+            mode: research_all() strategy: "separate", "combined" or "parallel"
+            evidence_chars: Shared evidence pool size for combined/parallel modes
+            speculative_history: Run research_history() tiers concurrently
+            tier_timeouts: Seconds per history tier (defaults to RESEARCH_TIER_TIMEOUTS)
         """
+        if mode not in self.RESEARCH_MODES:
+            raise ValueError(f"Unknown research mode: {mode} (expected one of {', '.join(self.RESEARCH_MODES)})")
+        self.mode = mode
+        self.evidence_chars = evidence_chars
+        self.speculative_history = speculative_history
+        self.tier_timeouts = {**RESEARCH_TIER_TIMEOUTS, **(tier_timeouts or {})}
         self.history_llm = get_llm(model, temperature).with_structured_output(
             HistoryLLMOutput
         )
@@ -171,8 +231,15 @@ Include up to 3-5 most relevant and credible analyses."""
         self.analysis_llm = get_llm(model, temperature).with_structured_output(
             ExternalAnalysisLLMOutput
         )
+        self.combined_llm = get_llm(model, temperature).with_structured_output(
+            CombinedResearchLLMOutput
+        )
         self.name_llm = get_llm(model, temperature)
-        self.search = DDGS()
+        self.search = resilience.get_search()
+        # Shared session for about-page and homepage fetches (record/replay aware)
+        self.session = transport.new_session()
+        # Async counterpart used by the a* methods (see MediaProfiler.aprofile)
+        self.async_session = transport.new_async_client()
         # Cache for about page text (domain -> text) to avoid redundant scraping
         self._about_page_cache: dict[str, str] = {}
 
@@ -209,8 +276,13 @@ Include up to 3-5 most relevant and credible analyses."""
 
         Strategy:
         1. Check cache (avoid redundant scraping)
-        2. Try common about page paths (/about, /about-us, etc.)
-        3. If none work, fetch homepage and discover about links from <a> tags
+        2. Probe common about page paths (/about, /about-us, etc.) concurrently;
+           meanwhile load the homepage (from the active FetchContext when the
+           scraper already fetched it) and collect its about links
+        3. If no common path works, probe the discovered about links
+
+        The first candidate that yields about-page text wins; probes that have
+        not started yet are cancelled and running ones skip their GET.
 
         Args:
             domain: The outlet's domain (e.g., "bbc.com")
@@ -220,42 +292,171 @@ Include up to 3-5 most relevant and credible analyses."""
         """
         # Check cache first
         if domain in self._about_page_cache:
+            tracing.increment("cache_hits")
+            return self._about_page_cache[domain]
+
+        base_url = f"https://www.{domain}" if not domain.startswith("www.") else f"https://{domain}"
+        candidates = [urljoin(base_url, path) for path in self.ABOUT_PAGE_PATHS]
+        found = threading.Event()
+
+        executor = ThreadPoolExecutor(max_workers=self.ABOUT_PROBE_WORKERS, thread_name_prefix="about-probe")
+        try:
+            homepage = executor.submit(tracing.bind(self._homepage_about_links), domain, base_url)
+            text = self._first_about_page(executor, candidates, found)
+            if not text:
+                # Strategy 2: about links discovered on the homepage
+                links = [url for url in homepage.result() if url not in candidates]
+                text = self._first_about_page(executor, links[:5], found)
+        finally:
+            # Don't wait for losing probes still blocked on the network
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        self._about_page_cache[domain] = text
+        return text
+
+    async def _ascrape_about_page(self, domain: str) -> str:
+        """
+        Coroutine counterpart of _scrape_about_page().
+
+        Probes run as tasks on the event loop; the losers are cancelled once
+        one yields about-page text.
+        """
+        if domain in self._about_page_cache:
+            tracing.increment("cache_hits")
             return self._about_page_cache[domain]
 
         base_url = f"https://www.{domain}" if not domain.startswith("www.") else f"https://{domain}"
+        candidates = [urljoin(base_url, path) for path in self.ABOUT_PAGE_PATHS]
+
+        homepage = asyncio.ensure_future(self._ahomepage_about_links(domain, base_url))
+        try:
+            text = await self._afirst_about_page(candidates)
+            if not text:
+                links = [url for url in await homepage if url not in candidates]
+                text = await self._afirst_about_page(links[:5])
+        finally:
+            homepage.cancel()
 
-        # Strategy 1: Try common hardcoded paths
-        for path in self.ABOUT_PAGE_PATHS:
-            text = self._fetch_page_text(urljoin(base_url, path))
-            if text:
-                self._about_page_cache[domain] = text
-                return text
+        self._about_page_cache[domain] = text
+        return text
 
-        # Strategy 2: Discover about links from homepage
+    async def _afirst_about_page(self, urls: list[str]) -> str:
+        """Probe `urls` concurrently and return the first about-page text (or "")."""
+        limit = asyncio.Semaphore(self.ABOUT_PROBE_WORKERS)
+
+        async def probe(url: str) -> str:
+            async with limit:
+                return await self._aprobe_about_url(url)
+
+        pending = {asyncio.ensure_future(probe(url)) for url in urls}
         try:
-            resp = requests.get(base_url, headers=self._HEADERS, timeout=10, allow_redirects=True)
-            if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, "html.parser")
-                about_links = set()
-                for a in soup.find_all("a", href=True):
-                    href = a["href"].lower()
-                    # Look for links containing "about" in the path
-                    if "about" in href and not href.startswith("mailto:"):
-                        full_url = urljoin(base_url, a["href"])
-                        # Only follow links on the same domain
-                        if domain in full_url:
-                            about_links.add(full_url)
-
-                for about_url in list(about_links)[:5]:
-                    text = self._fetch_page_text(about_url)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    text = task.result()
                     if text:
-                        self._about_page_cache[domain] = text
                         return text
+            return ""
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _first_about_page(self, executor: ThreadPoolExecutor, urls: list[str], found: threading.Event) -> str:
+        """Probe `urls` concurrently and return the first about-page text (or "")."""
+        pending = {executor.submit(tracing.bind(self._probe_about_url), url, found) for url in urls}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                text = future.result()
+                if text:
+                    found.set()
+                    for other in pending:
+                        other.cancel()
+                    return text
+        return ""
+
+    def _probe_about_url(self, url: str, found: threading.Event) -> str:
+        """
+        HEAD a candidate about page, then GET it only if it looks like HTML.
+
+        Servers that reject HEAD (405/501) or fail it are probed with GET
+        directly. Returns "" without fetching once another probe has won.
+        """
+        if found.is_set():
+            return ""
+        try:
+            with tracing.span("head", tracing.FETCH, url=url):
+                resp = fetching.session_for(self.session).head(url, headers=self._HEADERS, timeout=self.ABOUT_PROBE_TIMEOUT, allow_redirects=True)
+                tracing.annotate(status=resp.status_code)
+            if resp.status_code in (404, 410):
+                return ""
+            content_type = resp.headers.get("content-type", "")
+            if resp.status_code == 200 and content_type and "text/html" not in content_type:
+                return ""
+        except Exception as e:
+            logger.debug(f"  - HEAD failed for {url}, trying GET: {e}")
+        if found.is_set():
+            return ""
+        return self._fetch_page_text(url)
+
+    async def _aprobe_about_url(self, url: str) -> str:
+        """Coroutine counterpart of _probe_about_url() (losing probes are cancelled instead)."""
+        try:
+            with tracing.span("head", tracing.FETCH, url=url):
+                resp = await fetching.client_for(self.async_session).head(
+                    url, headers=self._HEADERS, timeout=self.ABOUT_PROBE_TIMEOUT, follow_redirects=True
+                )
+                tracing.annotate(status=resp.status_code)
+            if resp.status_code in (404, 410):
+                return ""
+            content_type = resp.headers.get("content-type", "")
+            if resp.status_code == 200 and content_type and "text/html" not in content_type:
+                return ""
+        except Exception as e:
+            logger.debug(f"  - HEAD failed for {url}, trying GET: {e}")
+        return await self._afetch_page_text(url)
+
+    def _homepage_about_links(self, domain: str, base_url: str) -> list[str]:
+        """Same-domain links containing "about" on the homepage, in page order."""
+        try:
+            with tracing.span("homepage", tracing.FETCH, url=base_url):
+                resp = fetching.session_for(self.session).get(base_url, headers=self._HEADERS, timeout=10, allow_redirects=True)
+                tracing.annotate(status=resp.status_code, bytes=len(resp.content))
+            if resp.status_code != 200:
+                return []
         except Exception as e:
             logger.debug(f"  - Homepage about link discovery failed: {e}")
+            return []
+        return self._about_links(domain, base_url, resp.text)
 
-        self._about_page_cache[domain] = ""
-        return ""
+    async def _ahomepage_about_links(self, domain: str, base_url: str) -> list[str]:
+        """Coroutine counterpart of _homepage_about_links()."""
+        try:
+            with tracing.span("homepage", tracing.FETCH, url=base_url):
+                resp = await fetching.client_for(self.async_session).get(
+                    base_url, headers=self._HEADERS, timeout=10, follow_redirects=True
+                )
+                tracing.annotate(status=resp.status_code, bytes=len(resp.content))
+            if resp.status_code != 200:
+                return []
+        except Exception as e:
+            logger.debug(f"  - Homepage about link discovery failed: {e}")
+            return []
+        return self._about_links(domain, base_url, resp.text)
+
+    @staticmethod
+    def _about_links(domain: str, base_url: str, html: str) -> list[str]:
+        """Same-domain links containing "about" in `html`, in page order."""
+        about_links: dict[str, None] = {}
+        for a in BeautifulSoup(html, "html.parser").find_all("a", href=True):
+            href = a["href"].lower()
+            # Look for links containing "about" in the path
+            if "about" in href and not href.startswith("mailto:"):
+                full_url = urljoin(base_url, a["href"])
+                # Only follow links on the same domain
+                if domain in full_url:
+                    about_links[full_url] = None
+        return list(about_links)
 
     def _fetch_page_text(self, url: str) -> str:
         """
@@ -268,19 +469,40 @@ Include up to 3-5 most relevant and credible analyses."""
             Cleaned text content, or empty string if failed
         """
         try:
-            resp = requests.get(url, headers=self._HEADERS, timeout=10, allow_redirects=True)
-            if resp.status_code == 200 and "text/html" in resp.headers.get("content-type", ""):
-                soup = BeautifulSoup(resp.text, "html.parser")
-                for tag in soup(["script", "style", "nav", "header", "footer"]):
-                    tag.decompose()
-                text = soup.get_text(separator=" ", strip=True)
-                if len(text) > 200:
-                    logger.info(f"  - Found about page at {url}")
-                    return text[:5000]
+            with tracing.span("page", tracing.FETCH, url=url):
+                resp = fetching.session_for(self.session).get(url, headers=self._HEADERS, timeout=self.ABOUT_PROBE_TIMEOUT, allow_redirects=True)
+                tracing.annotate(status=resp.status_code, bytes=len(resp.content))
+            return self._page_text(url, resp)
         except Exception as e:
             logger.debug(f"  - Page fetch failed for {url}: {e}")
         return ""
 
+    async def _afetch_page_text(self, url: str) -> str:
+        """Coroutine counterpart of _fetch_page_text()."""
+        try:
+            with tracing.span("page", tracing.FETCH, url=url):
+                resp = await fetching.client_for(self.async_session).get(
+                    url, headers=self._HEADERS, timeout=self.ABOUT_PROBE_TIMEOUT, follow_redirects=True
+                )
+                tracing.annotate(status=resp.status_code, bytes=len(resp.content))
+            return self._page_text(url, resp)
+        except Exception as e:
+            logger.debug(f"  - Page fetch failed for {url}: {e}")
+        return ""
+
+    @staticmethod
+    def _page_text(url: str, resp) -> str:
+        """Cleaned text of an HTML response (requests or httpx), or "" if too short."""
+        if resp.status_code == 200 and "text/html" in resp.headers.get("content-type", ""):
+            soup = BeautifulSoup(resp.text, "html.parser")
+            for tag in soup(["script", "style", "nav", "header", "footer"]):
+                tag.decompose()
+            text = soup.get_text(separator=" ", strip=True)
+            if len(text) > 200:
+                logger.info(f"  - Found about page at {url}")
+                return text[:5000]
+        return ""
+
     def resolve_outlet_name(self, url: str, domain: str = "") -> str:
         """
         Resolve the official outlet name using URL heuristics + LLM fallback.
@@ -314,70 +536,136 @@ Include up to 3-5 most relevant and credible analyses."""
         about_text = self._scrape_about_page(domain)
         if about_text:
             try:
-                prompt = (
-                    f'What is the full, official name of the media organization at {domain}? '
-                    f'Based on this about page text, return ONLY the official name '
-                    f'(e.g., "The Associated Press" not "apnews", '
-                    f'"British Broadcasting Corporation" not "bbc", '
-                    f'"Fox News" not "foxnews"). '
-                    f'If you cannot determine it, return "{url_name}".\n\n'
-                    f'About page text:\n{about_text[:3000]}'
-                )
-                response = self.name_llm.invoke([
-                    {"role": "user", "content": prompt}
-                ])
-                official_name = response.content.strip().strip('"').strip("'")
-                # Sanity check: name should be reasonable length
-                if 2 < len(official_name) < 100:
-                    logger.info(f"  - Resolved outlet name: '{url_name}' -> '{official_name}'")
-                    return official_name
+                response = self.name_llm.invoke(self._name_messages(domain, url_name, about_text))
+                return self._official_name(response.content, url_name)
             except Exception as e:
                 logger.warning(f"  - Outlet name resolution failed: {e}")
 
         return url_name
 
-    def _search(self, query: str, max_results: int = 5) -> str:
+    async def aresolve_outlet_name(self, url: str, domain: str = "") -> str:
+        """Coroutine counterpart of resolve_outlet_name()."""
+        domain = domain or self._extract_domain(url)
+        url_name = self._extract_outlet_name(url)
+
+        about_text = await self._ascrape_about_page(domain)
+        if about_text:
+            try:
+                response = await self.name_llm.ainvoke(self._name_messages(domain, url_name, about_text))
+                return self._official_name(response.content, url_name)
+            except Exception as e:
+                logger.warning(f"  - Outlet name resolution failed: {e}")
+
+        return url_name
+
+    @staticmethod
+    def _name_messages(domain: str, url_name: str, about_text: str) -> list[dict[str, str]]:
+        prompt = (
+            f'What is the full, official name of the media organization at {domain}? '
+            f'Based on this about page text, return ONLY the official name '
+            f'(e.g., "The Associated Press" not "apnews", '
+            f'"British Broadcasting Corporation" not "bbc", '
+            f'"Fox News" not "foxnews"). '
+            f'If you cannot determine it, return "{url_name}".\n\n'
+            f'About page text:\n{about_text[:3000]}'
+        )
+        return [{"role": "user", "content": prompt}]
+
+    @staticmethod
+    def _official_name(answer: str, url_name: str) -> str:
+        """The LLM's official name, or `url_name` when the answer is implausible."""
+        official_name = answer.strip().strip('"').strip("'")
+        # Sanity check: name should be reasonable length
+        if 2 < len(official_name) < 100:
+            logger.info(f"  - Resolved outlet name: '{url_name}' -> '{official_name}'")
+            return official_name
+        return url_name
+
+    def _search_results(self, query: str, max_results: int = 5) -> list[dict[str, str]]:
         """
-        Perform a DuckDuckGo search and return combined snippets.
+        Perform a DuckDuckGo search and return filtered results.
 
         Args:
             query: Search query
             max_results: Maximum number of results
 
         Returns:
-            Combined search snippets
+            Up to max_results dicts with title, body and url keys
         """
         try:
             # Request more results to account for blacklist filtering
-            results = list(self.search.text(query, max_results=max_results + 5))
-            logger.debug(f"  - Search for '{query[:60]}...' returned {len(results)} results")
-            if results:
-                snippets = []
-                for r in results:
-                    # Handle both old (href) and new (link) DDGS API keys
-                    url = r.get("href", "") or r.get("link", "")
-                    # Filter out blacklisted domains
-                    if url:
-                        result_domain = self._extract_domain(url)
-                        if result_domain in self.SEARCH_BLACKLIST:
-                            continue
-                    title = r.get("title", "")
-                    body = r.get("body", "") or r.get("snippet", "")
-                    if title or body:
-                        snippets.append(f"{title}: {body} (URL: {url})")
-                    if len(snippets) >= max_results:
-                        break
-                if snippets:
-                    logger.debug(f"  - Kept {len(snippets)} results after filtering")
-                else:
-                    logger.debug(f"  - All {len(results)} results filtered out or empty")
-                return "\n\n".join(snippets)
-            else:
-                logger.debug(f"  - Search returned no results for: {query[:80]}")
-            return ""
+            with tracing.span("ddgs.text", tracing.SEARCH, query=query[:100]):
+                results = list(self.search.text(query, max_results=max_results + 5))
+            return self._filter_results(query, results, max_results)
         except Exception as e:
             logger.warning(f"Search failed for '{query[:60]}...': {e}")
-            return ""
+            return []
+
+    async def _asearch_results(self, query: str, max_results: int = 5) -> list[dict[str, str]]:
+        """Coroutine counterpart of _search_results()."""
+        try:
+            results = await asearch_text(self.search, query, max_results=max_results + 5)
+            return self._filter_results(query, results, max_results)
+        except Exception as e:
+            logger.warning(f"Search failed for '{query[:60]}...': {e}")
+            return []
+
+    def _filter_results(self, query: str, results: list[dict], max_results: int) -> list[dict[str, str]]:
+        """Drop blacklisted and empty results; normalize keys to title, body and url."""
+        logger.debug(f"  - Search for '{query[:60]}...' returned {len(results)} results")
+        if not results:
+            logger.debug(f"  - Search returned no results for: {query[:80]}")
+            return []
+        kept = []
+        for r in results:
+            # Handle both old (href) and new (link) DDGS API keys
+            url = r.get("href", "") or r.get("link", "")
+            # Filter out blacklisted domains
+            if url:
+                result_domain = self._extract_domain(url)
+                if result_domain in self.SEARCH_BLACKLIST:
+                    continue
+            title = r.get("title", "")
+            body = r.get("body", "") or r.get("snippet", "")
+            if title or body:
+                kept.append({"title": title, "body": body, "url": url})
+            if len(kept) >= max_results:
+                break
+        if kept:
+            logger.debug(f"  - Kept {len(kept)} results after filtering")
+        else:
+            logger.debug(f"  - All {len(results)} results filtered out or empty")
+        return kept
+
+    @staticmethod
+    def _format_snippet(result: dict[str, str]) -> str:
+        return f"{result['title']}: {result['body']} (URL: {result['url']})"
+
+    def _search(self, query: str, max_results: int = 5) -> str:
+        """
+        Perform a DuckDuckGo search and return combined snippets.
+
+        Args:
+            query: Search query
+            max_results: Maximum number of results
+
+        Returns:
+            Combined search snippets
+        """
+        return "\n\n".join(self._format_snippet(r) for r in self._search_results(query, max_results))
+
+    async def _asearch(self, query: str, max_results: int = 5) -> str:
+        """Coroutine counterpart of _search()."""
+        return "\n\n".join(self._format_snippet(r) for r in await self._asearch_results(query, max_results))
+
+    def _name_variants(self, outlet_name: str, domain: str) -> str:
+        """Quoted outlet name, OR the domain slug when it differs (for search queries)."""
+        name_variants = f'"{outlet_name}"'
+        if domain:
+            domain_base = domain.split(".")[0]
+            if domain_base.lower() != outlet_name.lower():
+                name_variants = f'"{outlet_name}" OR "{domain_base}"'
+        return name_variants
 
     def research_history(self, outlet_name: str, domain: str = "") -> HistoryLLMOutput:
         """
@@ -389,6 +677,11 @@ Include up to 3-5 most relevant and credible analyses."""
         3. Wikipedia fallback
         4. Broader domain-based search
 
+        With speculative_history the tiers are launched together and the
+        highest-priority non-empty one is used (see _first_tier), so the
+        worst case is the slowest tier rather than the sum of all four, at
+        the cost of searches whose results may be discarded.
+
         Args:
             outlet_name: Human-readable outlet name
             domain: Optional domain for disambiguation (e.g., "bbc.com")
@@ -396,44 +689,122 @@ Include up to 3-5 most relevant and credible analyses."""
         Returns:
             HistoryLLMOutput with extracted history
         """
-        snippets = ""
+        tiers = self._history_tiers(outlet_name, domain, self._scrape_about_page, self._search)
+        if self.speculative_history:
+            snippets = self._first_tier(tiers)
+        else:
+            snippets = ""
+            for name, fn, arg in tiers:
+                snippets = fn(arg)
+                if snippets:
+                    tracing.annotate(history_tier=name)
+                    break
 
-        # Tier 1: Scrape the outlet's own about page directly
-        if domain:
-            about_text = self._scrape_about_page(domain)
-            if about_text:
-                snippets = about_text
+        return self._extract_history(outlet_name, domain, snippets[:3000])
 
-        # Tier 2: DuckDuckGo search for about/history pages
-        if not snippets:
-            name_variants = f'"{outlet_name}"'
-            if domain:
-                domain_base = domain.split(".")[0]
-                if domain_base.lower() != outlet_name.lower():
-                    name_variants = f'"{outlet_name}" OR "{domain_base}"'
+    async def aresearch_history(self, outlet_name: str, domain: str = "") -> HistoryLLMOutput:
+        """Coroutine counterpart of research_history() (speculative tiers run as tasks)."""
+        tiers = self._history_tiers(outlet_name, domain, self._ascrape_about_page, self._asearch)
+        if self.speculative_history:
+            snippets = await self._afirst_tier(tiers)
+        else:
+            snippets = ""
+            for name, fn, arg in tiers:
+                snippets = await fn(arg)
+                if snippets:
+                    tracing.annotate(history_tier=name)
+                    break
 
-            query = f'{name_variants} about us founded history media news organization'
-            snippets = self._search(query)
+        return await self._aextract_history(outlet_name, domain, snippets[:3000])
 
+    def _history_tiers(self, outlet_name: str, domain: str, scrape_about_page, search) -> list:
+        """(name, fn, arg) history tiers in priority order, using the given fetch/search functions."""
+        name_variants = self._name_variants(outlet_name, domain)
+        tiers = []
+        if domain:
+            # Tier 1: Scrape the outlet's own about page directly
+            tiers.append(("about_page", scrape_about_page, domain))
+        # Tier 2: DuckDuckGo search for about/history pages
+        tiers.append(("search", search, f'{name_variants} about us founded history media news organization'))
         # Tier 3: Wikipedia fallback
-        if not snippets:
-            name_variants = f'"{outlet_name}"'
-            if domain:
-                domain_base = domain.split(".")[0]
-                if domain_base.lower() != outlet_name.lower():
-                    name_variants = f'"{outlet_name}" OR "{domain_base}"'
-            query = f'{name_variants} wikipedia founded history media news organization'
-            snippets = self._search(query)
-
+        tiers.append(("wikipedia", search, f'{name_variants} wikipedia founded history media news organization'))
         # Tier 4: Broader domain-based search
-        if not snippets and domain:
-            query = f'{domain} history founded owner media'
-            snippets = self._search(query)
+        if domain:
+            tiers.append(("domain_search", search, f'{domain} history founded owner media'))
+        return tiers
+
+    async def _afirst_tier(self, tiers: list) -> str:
+        """Coroutine counterpart of _first_tier(); unused tiers are cancelled."""
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        tasks = [(name, asyncio.ensure_future(fn(arg))) for name, fn, arg in tiers]
+        try:
+            for name, task in tasks:
+                remaining = started + self.tier_timeouts.get(name, 10.0) - loop.time()
+                try:
+                    result = await asyncio.wait_for(task, timeout=max(remaining, 0.0))
+                except asyncio.TimeoutError:
+                    logger.info(f"  - History tier '{name}' timed out")
+                    continue
+                if result:
+                    tracing.annotate(history_tier=name)
+                    return result
+            return ""
+        finally:
+            for _, task in tasks:
+                task.cancel()
 
+    def _first_tier(self, tiers: list) -> str:
+        """
+        Run (name, fn, arg) tiers concurrently; return the first non-empty
+        result in tier order.
+
+        Each tier may take tier_timeouts[name] seconds from launch; a tier
+        that runs late counts as empty. Once a result is chosen, tiers that
+        have not started are cancelled and running ones are abandoned.
+        """
+        executor = ThreadPoolExecutor(max_workers=len(tiers), thread_name_prefix="history-tier")
+        try:
+            started = time.monotonic()
+            futures = [(name, executor.submit(tracing.bind(fn), arg)) for name, fn, arg in tiers]
+            for name, future in futures:
+                remaining = started + self.tier_timeouts.get(name, 10.0) - time.monotonic()
+                try:
+                    result = future.result(timeout=max(remaining, 0.0))
+                except FutureTimeoutError:
+                    logger.info(f"  - History tier '{name}' timed out")
+                    continue
+                if result:
+                    tracing.annotate(history_tier=name)
+                    return result
+            return ""
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _extract_history(self, outlet_name: str, domain: str, snippets: str) -> HistoryLLMOutput:
+        """History LLM call over `snippets` (LLM knowledge if empty)."""
+        try:
+            result: HistoryLLMOutput = self.history_llm.invoke(self._history_messages(outlet_name, domain, snippets))
+            return result
+        except Exception as e:
+            logger.error(f"History research failed: {e}")
+            return self._failed_history(e)
+
+    async def _aextract_history(self, outlet_name: str, domain: str, snippets: str) -> HistoryLLMOutput:
+        """Coroutine counterpart of _extract_history()."""
+        try:
+            result: HistoryLLMOutput = await self.history_llm.ainvoke(
+                self._history_messages(outlet_name, domain, snippets)
+            )
+            return result
+        except Exception as e:
+            logger.error(f"History research failed: {e}")
+            return self._failed_history(e)
+
+    def _history_messages(self, outlet_name: str, domain: str, snippets: str) -> list[dict[str, str]]:
         if not snippets:
             # Tier 5: LLM general knowledge fallback
             logger.info(f"  - No search results found, using LLM knowledge for {outlet_name}")
-            snippets = ""
             user_prompt = f"""Extract history information for "{outlet_name}" (domain: {domain}).
 
 No search results were available. Use your training knowledge to provide what you know about this media outlet's history.
@@ -442,22 +813,20 @@ Be conservative - only state facts you are confident about. If you are not sure
             user_prompt = f"""Extract history information for "{outlet_name}" from these search results:
 
 SEARCH RESULTS:
-{snippets[:3000]}"""
-
-        try:
-            result: HistoryLLMOutput = self.history_llm.invoke(
-                [
-                    {"role": "system", "content": self.HISTORY_PROMPT},
-                    {"role": "user", "content": user_prompt},
-                ]
-            )
-            return result
-        except Exception as e:
-            logger.error(f"History research failed: {e}")
-            return HistoryLLMOutput(
-                summary=f"History research failed: {str(e)}",
-                confidence=0.0
-            )
+{snippets}"""
+
+        return [
+            {"role": "system", "content": self.HISTORY_PROMPT},
+            {"role": "user", "content": user_prompt},
+        ]
+
+    @staticmethod
+    def _failed_history(error: Exception) -> HistoryLLMOutput:
+        resilience.record_fallback("history", error)
+        return HistoryLLMOutput(
+            summary=f"History research failed: {str(error)}",
+            confidence=0.0
+        )
 
     def research_ownership(self, outlet_name: str, domain: str = "") -> OwnershipLLMOutput:
         """
@@ -478,6 +847,38 @@ SEARCH RESULTS:
             query = f'{domain} ownership owner parent company funded by headquarters'
             snippets = self._search(query)
 
+        return self._extract_ownership(outlet_name, domain, snippets[:3000])
+
+    async def aresearch_ownership(self, outlet_name: str, domain: str = "") -> OwnershipLLMOutput:
+        """Coroutine counterpart of research_ownership()."""
+        snippets = await self._asearch(f'"{outlet_name}" ownership owner parent company funded by headquarters')
+        if not snippets and domain:
+            snippets = await self._asearch(f'{domain} ownership owner parent company funded by headquarters')
+        return await self._aextract_ownership(outlet_name, domain, snippets[:3000])
+
+    def _extract_ownership(self, outlet_name: str, domain: str, snippets: str) -> OwnershipLLMOutput:
+        """Ownership LLM call over `snippets` (LLM knowledge if empty)."""
+        try:
+            result: OwnershipLLMOutput = self.ownership_llm.invoke(
+                self._ownership_messages(outlet_name, domain, snippets)
+            )
+            return result
+        except Exception as e:
+            logger.error(f"Ownership research failed: {e}")
+            return self._failed_ownership(e)
+
+    async def _aextract_ownership(self, outlet_name: str, domain: str, snippets: str) -> OwnershipLLMOutput:
+        """Coroutine counterpart of _extract_ownership()."""
+        try:
+            result: OwnershipLLMOutput = await self.ownership_llm.ainvoke(
+                self._ownership_messages(outlet_name, domain, snippets)
+            )
+            return result
+        except Exception as e:
+            logger.error(f"Ownership research failed: {e}")
+            return self._failed_ownership(e)
+
+    def _ownership_messages(self, outlet_name: str, domain: str, snippets: str) -> list[dict[str, str]]:
         if not snippets:
             # Fallback: LLM general knowledge
             logger.info(f"  - No search results found, using LLM knowledge for {outlet_name}")
@@ -489,22 +890,20 @@ Be conservative - only state facts you are confident about. If you are not sure
             user_prompt = f"""Extract ownership and funding information for "{outlet_name}" from these search results:
 
 SEARCH RESULTS:
-{snippets[:3000]}"""
-
-        try:
-            result: OwnershipLLMOutput = self.ownership_llm.invoke(
-                [
-                    {"role": "system", "content": self.OWNERSHIP_PROMPT},
-                    {"role": "user", "content": user_prompt},
-                ]
-            )
-            return result
-        except Exception as e:
-            logger.error(f"Ownership research failed: {e}")
-            return OwnershipLLMOutput(
-                notes=f"Ownership research failed: {str(e)}",
-                confidence=0.0
-            )
+{snippets}"""
+
+        return [
+            {"role": "system", "content": self.OWNERSHIP_PROMPT},
+            {"role": "user", "content": user_prompt},
+        ]
+
+    @staticmethod
+    def _failed_ownership(error: Exception) -> OwnershipLLMOutput:
+        resilience.record_fallback("ownership", error)
+        return OwnershipLLMOutput(
+            notes=f"Ownership research failed: {str(error)}",
+            confidence=0.0
+        )
 
     def research_external_analysis(self, outlet_name: str, domain: str = "") -> ExternalAnalysisLLMOutput:
         """
@@ -525,6 +924,44 @@ SEARCH RESULTS:
             query = f'{domain} media bias analysis criticism review fact check rating'
             snippets = self._search(query, max_results=8)
 
+        return self._extract_external_analysis(outlet_name, domain, snippets[:4000])
+
+    async def aresearch_external_analysis(self, outlet_name: str, domain: str = "") -> ExternalAnalysisLLMOutput:
+        """Coroutine counterpart of research_external_analysis()."""
+        snippets = await self._asearch(
+            f'"{outlet_name}" media bias analysis criticism review fact check rating', max_results=8
+        )
+        if not snippets and domain:
+            snippets = await self._asearch(
+                f'{domain} media bias analysis criticism review fact check rating', max_results=8
+            )
+        return await self._aextract_external_analysis(outlet_name, domain, snippets[:4000])
+
+    def _extract_external_analysis(self, outlet_name: str, domain: str, snippets: str) -> ExternalAnalysisLLMOutput:
+        """External analysis LLM call over `snippets` (LLM knowledge if empty)."""
+        try:
+            result: ExternalAnalysisLLMOutput = self.analysis_llm.invoke(
+                self._external_analysis_messages(outlet_name, domain, snippets)
+            )
+            return result
+        except Exception as e:
+            logger.error(f"External analysis research failed: {e}")
+            return self._failed_external_analysis(e)
+
+    async def _aextract_external_analysis(
+        self, outlet_name: str, domain: str, snippets: str
+    ) -> ExternalAnalysisLLMOutput:
+        """Coroutine counterpart of _extract_external_analysis()."""
+        try:
+            result: ExternalAnalysisLLMOutput = await self.analysis_llm.ainvoke(
+                self._external_analysis_messages(outlet_name, domain, snippets)
+            )
+            return result
+        except Exception as e:
+            logger.error(f"External analysis research failed: {e}")
+            return self._failed_external_analysis(e)
+
+    def _external_analysis_messages(self, outlet_name: str, domain: str, snippets: str) -> list[dict[str, str]]:
         if not snippets:
             # Fallback: LLM general knowledge
             logger.info(f"  - No search results found, using LLM knowledge for {outlet_name}")
@@ -536,22 +973,239 @@ Be conservative - only state facts you are confident about. If you are not sure
             user_prompt = f"""Extract external analyses and criticism for "{outlet_name}" from these search results:
 
 SEARCH RESULTS:
-{snippets[:4000]}"""
+{snippets}"""
+
+        return [
+            {"role": "system", "content": self.EXTERNAL_ANALYSIS_PROMPT},
+            {"role": "user", "content": user_prompt},
+        ]
+
+    @staticmethod
+    def _failed_external_analysis(error: Exception) -> ExternalAnalysisLLMOutput:
+        resilience.record_fallback("external_analysis", error)
+        return ExternalAnalysisLLMOutput(
+            analyses=[],
+            confidence=0.0
+        )
+
+    # -------------------------------------------------------------------------
+    # Shared evidence pool ("combined" / "parallel" research modes)
+    # -------------------------------------------------------------------------
+
+    def gather_evidence(self, outlet_name: str, domain: str = "") -> "ResearchEvidence":
+        """
+        Collect one evidence pool for history, ownership and external analysis.
+
+        The about page and the three topic searches run concurrently; search
+        results are de-duplicated by canonical URL, so a Wikipedia article
+        returned for both the history and the ownership query is sent to the
+        LLM once. If every search comes back empty, a broader domain query
+        is tried.
+
+        Args:
+            outlet_name: Human-readable outlet name
+            domain: Optional domain for disambiguation
 
+        Returns:
+            ResearchEvidence with the about page text and unique snippets
+        """
+        queries = self._evidence_queries(outlet_name, domain)
+        evidence = ResearchEvidence()
+        with ThreadPoolExecutor(max_workers=len(queries) + 1, thread_name_prefix="research") as executor:
+            about = executor.submit(tracing.bind(self._scrape_about_page), domain) if domain else None
+            searches = [executor.submit(tracing.bind(self._search_results), q, n) for q, n in queries]
+            for future in searches:
+                evidence.add(future.result())
+            if about is not None:
+                evidence.about_text = about.result()
+
+        if not evidence.snippets and domain:
+            evidence.add(self._search_results(f"{domain} history founded owner media bias", 8))
+
+        tracing.annotate(snippets=len(evidence.snippets), duplicate_snippets=evidence.duplicates)
+        return evidence
+
+    async def agather_evidence(self, outlet_name: str, domain: str = "") -> "ResearchEvidence":
+        """Coroutine counterpart of gather_evidence()."""
+        queries = self._evidence_queries(outlet_name, domain)
+        evidence = ResearchEvidence()
+        about = asyncio.ensure_future(self._ascrape_about_page(domain)) if domain else None
         try:
-            result: ExternalAnalysisLLMOutput = self.analysis_llm.invoke(
-                [
-                    {"role": "system", "content": self.EXTERNAL_ANALYSIS_PROMPT},
-                    {"role": "user", "content": user_prompt},
-                ]
+            for results in await asyncio.gather(*(self._asearch_results(q, n) for q, n in queries)):
+                evidence.add(results)
+            if about is not None:
+                evidence.about_text = await about
+        finally:
+            if about is not None:
+                about.cancel()
+
+        if not evidence.snippets and domain:
+            evidence.add(await self._asearch_results(f"{domain} history founded owner media bias", 8))
+
+        tracing.annotate(snippets=len(evidence.snippets), duplicate_snippets=evidence.duplicates)
+        return evidence
+
+    def _evidence_queries(self, outlet_name: str, domain: str) -> list[tuple[str, int]]:
+        """(query, max_results) for the history, ownership and external analysis topics."""
+        return [
+            (f'{self._name_variants(outlet_name, domain)} about us founded history media news organization', 5),
+            (f'"{outlet_name}" ownership owner parent company funded by headquarters', 5),
+            (f'"{outlet_name}" media bias analysis criticism review fact check rating', 8),
+        ]
+
+    def research_all(
+        self,
+        outlet_name: str,
+        domain: str = "",
+        mode: Optional[str] = None,
+    ) -> tuple[HistoryLLMOutput, OwnershipLLMOutput, ExternalAnalysisLLMOutput]:
+        """
+        Run history, ownership and external analysis research together.
+
+        Args:
+            outlet_name: Human-readable outlet name
+            domain: Optional domain for disambiguation
+            mode: "separate", "combined" or "parallel" (default: self.mode)
+
+        Returns:
+            Tuple of (history, ownership, external analyses)
+        """
+        mode = mode or self.mode
+        if mode not in self.RESEARCH_MODES:
+            raise ValueError(f"Unknown research mode: {mode} (expected one of {', '.join(self.RESEARCH_MODES)})")
+
+        if mode == "separate":
+            history = self.research_history(outlet_name, domain=domain)
+            # Later searches use the official name when history found one
+            outlet_name = history.official_name or outlet_name
+            return (
+                history,
+                self.research_ownership(outlet_name, domain=domain),
+                self.research_external_analysis(outlet_name, domain=domain),
             )
-            return result
+
+        evidence = self.gather_evidence(outlet_name, domain)
+        text = evidence.render(self.evidence_chars)
+
+        if mode == "parallel":
+            with ThreadPoolExecutor(max_workers=3, thread_name_prefix="research") as executor:
+                history = executor.submit(tracing.bind(self._extract_history), outlet_name, domain, text)
+                ownership = executor.submit(tracing.bind(self._extract_ownership), outlet_name, domain, text)
+                external = executor.submit(tracing.bind(self._extract_external_analysis), outlet_name, domain, text)
+                return history.result(), ownership.result(), external.result()
+
+        return self._extract_combined(outlet_name, domain, text)
+
+    async def aresearch_all(
+        self,
+        outlet_name: str,
+        domain: str = "",
+        mode: Optional[str] = None,
+    ) -> tuple[HistoryLLMOutput, OwnershipLLMOutput, ExternalAnalysisLLMOutput]:
+        """Coroutine counterpart of research_all()."""
+        mode = mode or self.mode
+        if mode not in self.RESEARCH_MODES:
+            raise ValueError(f"Unknown research mode: {mode} (expected one of {', '.join(self.RESEARCH_MODES)})")
+
+        if mode == "separate":
+            history = await self.aresearch_history(outlet_name, domain=domain)
+            outlet_name = history.official_name or outlet_name
+            ownership, external = await asyncio.gather(
+                self.aresearch_ownership(outlet_name, domain=domain),
+                self.aresearch_external_analysis(outlet_name, domain=domain),
+            )
+            return history, ownership, external
+
+        evidence = await self.agather_evidence(outlet_name, domain)
+        text = evidence.render(self.evidence_chars)
+
+        if mode == "parallel":
+            return tuple(await asyncio.gather(
+                self._aextract_history(outlet_name, domain, text),
+                self._aextract_ownership(outlet_name, domain, text),
+                self._aextract_external_analysis(outlet_name, domain, text),
+            ))
+
+        return await self._aextract_combined(outlet_name, domain, text)
+
+    def _extract_combined(
+        self, outlet_name: str, domain: str, evidence: str
+    ) -> tuple[HistoryLLMOutput, OwnershipLLMOutput, ExternalAnalysisLLMOutput]:
+        """One structured call extracting all three research outputs."""
+        try:
+            result: CombinedResearchLLMOutput = self.combined_llm.invoke(
+                self._combined_messages(outlet_name, domain, evidence)
+            )
+            return result.history, result.ownership, result.external_analysis
         except Exception as e:
-            logger.error(f"External analysis research failed: {e}")
-            return ExternalAnalysisLLMOutput(
-                analyses=[],
-                confidence=0.0
+            logger.error(f"Combined research failed: {e}")
+            return self._failed_history(e), self._failed_ownership(e), self._failed_external_analysis(e)
+
+    async def _aextract_combined(
+        self, outlet_name: str, domain: str, evidence: str
+    ) -> tuple[HistoryLLMOutput, OwnershipLLMOutput, ExternalAnalysisLLMOutput]:
+        """Coroutine counterpart of _extract_combined()."""
+        try:
+            result: CombinedResearchLLMOutput = await self.combined_llm.ainvoke(
+                self._combined_messages(outlet_name, domain, evidence)
             )
+            return result.history, result.ownership, result.external_analysis
+        except Exception as e:
+            logger.error(f"Combined research failed: {e}")
+            return self._failed_history(e), self._failed_ownership(e), self._failed_external_analysis(e)
+
+    def _combined_messages(self, outlet_name: str, domain: str, evidence: str) -> list[dict[str, str]]:
+        if not evidence:
+            logger.info(f"  - No search results found, using LLM knowledge for {outlet_name}")
+            user_prompt = f"""Extract history, ownership and external analyses for "{outlet_name}" (domain: {domain}).
+
+No search results were available. Use your training knowledge to provide what you know about this media outlet.
+Be conservative - only state facts you are confident about. If you are not sure about this outlet, set each confidence to 0.0."""
+        else:
+            user_prompt = f"""Extract history, ownership and external analyses for "{outlet_name}" (domain: {domain}) from this evidence:
+
+{evidence}"""
+
+        return [
+            {"role": "system", "content": self.COMBINED_RESEARCH_PROMPT},
+            {"role": "user", "content": user_prompt},
+        ]
+
+
+class ResearchEvidence:
+    """
+    Evidence shared by the research tasks: about page text plus search
+    snippets de-duplicated by canonical URL.
+    """
+
+    def __init__(self):
+        self.about_text = ""
+        self.snippets: list[dict[str, str]] = []
+        self.duplicates = 0
+        self._seen: set[str] = set()
+
+    def add(self, results: list[dict[str, str]]) -> None:
+        for result in results:
+            key = canonicalize_url(result["url"]) if result["url"] else result["title"] + result["body"]
+            if key in self._seen:
+                self.duplicates += 1
+                continue
+            self._seen.add(key)
+            self.snippets.append(result)
+
+    def render(self, max_chars: int) -> str:
+        """
+        Prompt text: about page first (capped at a third of the budget), then
+        snippets until `max_chars` is reached. Empty if there is no evidence.
+        """
+        parts = []
+        if self.about_text:
+            parts.append(f"ABOUT PAGE:\n{self.about_text[:max_chars // 3]}")
+        if self.snippets:
+            parts.append("SEARCH RESULTS:\n" + "\n\n".join(
+                MediaResearcher._format_snippet(r) for r in self.snippets
+            ))
+        return "\n\n".join(parts)[:max_chars]
 
 
 # =============================================================================
@@ -559,6 +1213,17 @@ SEARCH RESULTS:
 # =============================================================================
 
 
+def as_article_dict(article) -> dict:
+    """Profiler article dict for a scraper Article (dicts are returned as they are)."""
+    if isinstance(article, dict):
+        return article
+    return {"title": article.title, "text": article.text, "url": article.url, "is_opinion": article.is_opinion}
+
+
+async def _resolved(value):
+    return value
+
+
 class MediaProfiler:
     """
     Orchestrates all analyzers to produce comprehensive MBFC-style reports.
@@ -574,12 +1239,41 @@ class MediaProfiler:
     - MediaResearcher: History, ownership, external analysis
 
     Produces a ComprehensiveReportData object with all analysis results.
+
+    Given a StageCache, each stage is reused from an earlier run when its
+    inputs (and STAGE_VERSIONS entry) are unchanged and its TTL has not
+    expired (see stage_cache.py).
+
+    aprofile() is the coroutine counterpart of profile(): the stages run
+    concurrently on the event loop, and many outlets can be profiled at once
+    with asyncio.gather(). profile_streaming() / aprofile_streaming() take
+    the articles as they are scraped (MediaScraper.iter_articles()), so the
+    outlet-level stages overlap with scraping.
     """
 
+    CONTENT_MODES = ("separate", "fused")
+
+    # Bump a stage's version when its code changes what it produces, so
+    # records saved by earlier runs are recomputed
+    STAGE_VERSIONS = {
+        "outlet_name": 1,
+        "traffic": 1,
+        "media_type": 1,
+        "editorial_bias": 1,
+        "sourcing": 1,
+        "pseudoscience": 1,
+        "fact_check": 1,
+        "history": 1,
+        "ownership": 1,
+        "external_analysis": 1,
+    }
+
     def __init__(
         self,
         model: str = "gpt-4o-mini",
         temperature: float = 0.0,
+        research_mode: str = RESEARCH_MODE,
+        content_mode: str = CONTENT_ANALYSIS_MODE,
     ):
         """
         Initialize all analyzers.
@@ -587,7 +1281,15 @@ class MediaProfiler:
         Args:
             model: OpenAI model to use for all analyzers
             temperature: LLM temperature (0 for deterministic)
+            research_mode: How MediaResearcher runs history, ownership and
+                external analysis ("separate", "combined" or "parallel")
+            content_mode: "separate" or "fused" editorial bias, sourcing and
+                pseudoscience analysis (see FusedContentAnalyzer)
         """
+        if content_mode not in self.CONTENT_MODES:
+            raise ValueError(f"Unknown content analysis mode: {content_mode} (expected one of {', '.join(self.CONTENT_MODES)})")
+        self.model = model
+        self.content_mode = content_mode
         self.traffic_analyzer = TrafficLongevityAnalyzer(model=model, temperature=temperature)
         self.media_type_analyzer = MediaTypeAnalyzer(model=model, temperature=temperature)
         self.opinion_analyzer = OpinionAnalyzer(model=model, temperature=temperature)
@@ -595,7 +1297,16 @@ class MediaProfiler:
         self.fact_check_searcher = FactCheckSearcher(model=model, temperature=temperature)
         self.sourcing_analyzer = SourcingAnalyzer(model=model, temperature=temperature)
         self.pseudoscience_analyzer = PseudoscienceAnalyzer(model=model, temperature=temperature)
-        self.researcher = MediaResearcher(model=model, temperature=temperature)
+        self.content_analyzer = FusedContentAnalyzer(
+            model=model,
+            temperature=temperature,
+            editorial_bias_analyzer=self.editorial_bias_analyzer,
+            sourcing_analyzer=self.sourcing_analyzer,
+            pseudoscience_analyzer=self.pseudoscience_analyzer,
+        )
+        self.researcher = MediaResearcher(model=model, temperature=temperature, mode=research_mode)
+        # Tracer from the most recent profile() call (see tracing.py)
+        self.last_trace: Optional[Tracer] = None
 
     def _extract_domain(self, url: str) -> str:
         """Extract the root domain from a URL."""
@@ -660,70 +1371,549 @@ class MediaProfiler:
         url: str,
         articles: list[dict[str, str]],
         outlet_name: Optional[str] = None,
+        stage_cache: Optional[StageCache] = None,
     ) -> ComprehensiveReportData:
         """
         Perform comprehensive profiling of a media outlet.
 
+        The run is traced: if the caller already activated a Tracer (e.g. to
+        include scraping and report generation), spans are added to it;
+        otherwise a new one is created. The aggregated summary is stored on
+        report.trace_summary and the tracer itself on self.last_trace.
+
+        Page fetches share a FetchContext the same way: the caller's (so the
+        homepage the scraper loaded is reused) or a fresh one for this run.
+
+        Args:
+            url: The outlet's URL
+            articles: List of article dicts with 'title' and 'text' keys
+            outlet_name: Optional human-readable name (auto-detected if not provided)
+            stage_cache: Stage records of an earlier run; fresh stages with
+                unchanged inputs are reused and the records updated in place
+
+        Returns:
+            ComprehensiveReportData with all analysis results
+        """
+        tracer = tracing.current_tracer() or Tracer(f"profile:{self._extract_domain(url)}")
+        fetch_context = fetching.current() or FetchContext(self.researcher.session)
+        with tracing.activate(tracer), fetching.activate(fetch_context):
+            with tracer.span("profile", tracing.STAGE, url=url, articles=len(articles)):
+                report = self._profile(url, articles, outlet_name, stage_cache)
+        report.trace_summary = tracer.summary()
+        self.last_trace = tracer
+        return report
+
+    async def aprofile(
+        self,
+        url: str,
+        articles: list[dict[str, str]],
+        outlet_name: Optional[str] = None,
+        stage_cache: Optional[StageCache] = None,
+    ) -> ComprehensiveReportData:
+        """
+        Coroutine counterpart of profile().
+
+        After the outlet name is resolved, traffic, media type, content
+        analysis, fact checks and research run concurrently. Page fetches
+        share an AsyncFetchContext, which reuses pages already held by the
+        caller's sync FetchContext (e.g. the scraped homepage).
+
         Args:
             url: The outlet's URL
             articles: List of article dicts with 'title' and 'text' keys
             outlet_name: Optional human-readable name (auto-detected if not provided)
+            stage_cache: Stage records of an earlier run (see profile())
+
+        Returns:
+            ComprehensiveReportData with all analysis results
+        """
+        tracer = tracing.current_tracer() or Tracer(f"profile:{self._extract_domain(url)}")
+        fetch_context = fetching.current_async() or AsyncFetchContext(
+            self.researcher.async_session, parent=fetching.current()
+        )
+        with tracing.activate(tracer), fetching.activate_async(fetch_context):
+            with tracer.span("profile", tracing.STAGE, url=url, articles=len(articles)):
+                report = await self._aprofile(url, _resolved(articles), outlet_name, stage_cache)
+        report.trace_summary = tracer.summary()
+        self.last_trace = tracer
+        return report
+
+    def profile_streaming(
+        self,
+        url: str,
+        articles: Iterable,
+        outlet_name: Optional[str] = None,
+        stage_cache: Optional[StageCache] = None,
+        on_article: Optional[Callable[[dict], Any]] = None,
+    ) -> ComprehensiveReportData:
+        """
+        Profile an outlet while its articles are still being scraped.
+
+        Runs aprofile_streaming() on a new event loop: `articles` (e.g.
+        MediaScraper.iter_articles()) is consumed on a worker thread, and
+        `on_article`, a plain function, runs on the blocking pool for each
+        article as it arrives. Call from synchronous code only.
+
+        Args:
+            url: The outlet's URL
+            articles: Iterable of scraper Articles or article dicts
+            outlet_name: Optional human-readable name (auto-detected if not provided)
+            stage_cache: Stage records of an earlier run (see profile())
+            on_article: Per-article work (opinion classification, propaganda
+                detection, progress updates, ...), given the article dict
+
+        Returns:
+            ComprehensiveReportData with all analysis results
+        """
+
+        async def aon_article(article: dict):
+            return await transport.run_blocking(on_article, article)
+
+        return asyncio.run(self.aprofile_streaming(
+            url, transport.iterate_blocking(articles), outlet_name, stage_cache,
+            aon_article if on_article is not None else None,
+        ))
+
+    async def aprofile_streaming(
+        self,
+        url: str,
+        articles: AsyncIterable,
+        outlet_name: Optional[str] = None,
+        stage_cache: Optional[StageCache] = None,
+        on_article: Optional[Callable[[dict], Awaitable[Any]]] = None,
+    ) -> ComprehensiveReportData:
+        """
+        Coroutine counterpart of profile_streaming().
+
+        The outlet-level stages (outlet name, traffic, media type, fact
+        checks, research) start when the first article arrives and run while
+        the rest of `articles` is consumed; the content stages start when it
+        is exhausted. A stream that ends empty (e.g. a site blocking the
+        scraper) runs no stages and returns a report with
+        articles_analyzed == 0. on_article is started for each article as it
+        lands, and the report is returned once all of them have finished
+        (their errors are logged).
+
+        Args:
+            url: The outlet's URL
+            articles: Async iterable of scraper Articles or article dicts
+                (e.g. MediaScraper.aiter_articles())
+            outlet_name: Optional human-readable name (auto-detected if not provided)
+            stage_cache: Stage records of an earlier run (see profile())
+            on_article: Coroutine function run per article dict
 
         Returns:
             ComprehensiveReportData with all analysis results
         """
+        tracer = tracing.current_tracer() or Tracer(f"profile:{self._extract_domain(url)}")
+        fetch_context = fetching.current_async() or AsyncFetchContext(
+            self.researcher.async_session, parent=fetching.current()
+        )
+        article_tasks: list[asyncio.Future] = []
+        started = asyncio.get_running_loop().create_future()
+        with tracing.activate(tracer), fetching.activate_async(fetch_context):
+            with tracer.span("profile", tracing.STAGE, url=url, streaming=True):
+                try:
+                    report = await self._aprofile(
+                        url, self._acollect_articles(articles, on_article, article_tasks, started),
+                        outlet_name, stage_cache, started,
+                    )
+                    for result in await asyncio.gather(*article_tasks, return_exceptions=True):
+                        if isinstance(result, Exception):
+                            logger.warning(f"  - Per-article stage failed: {result}")
+                finally:
+                    for task in article_tasks:
+                        task.cancel()
+                tracing.annotate(articles=report.articles_analyzed)
+        report.trace_summary = tracer.summary()
+        self.last_trace = tracer
+        return report
+
+    async def _acollect_articles(
+        self,
+        articles: AsyncIterable,
+        on_article: Optional[Callable[[dict], Awaitable[Any]]],
+        article_tasks: list[asyncio.Future],
+        started: asyncio.Future,
+    ) -> list[dict]:
+        """
+        Article dicts from a stream, starting on_article for each one as it
+        lands. `started` resolves to True at the first article, or to False
+        if the stream ends (or fails) without one.
+        """
+        collected = []
+        with tracing.span("scrape", tracing.STAGE, streaming=True):
+            try:
+                async for article in articles:
+                    article = as_article_dict(article)
+                    collected.append(article)
+                    if not started.done():
+                        started.set_result(True)
+                    if on_article is not None:
+                        article_tasks.append(asyncio.ensure_future(on_article(article)))
+            finally:
+                if not started.done():
+                    started.set_result(False)
+            tracing.annotate(articles=len(collected))
+        logger.info(f"  - Collected {len(collected)} streamed articles")
+        return collected
+
+    def _stage(self, stage_cache: Optional[StageCache], stage: str, inputs: dict, schema, compute):
+        """Run one stage through `stage_cache` (or directly without one)."""
+        if stage_cache is None:
+            return compute()
+        inputs = {**inputs, "model": self.model, "version": self.STAGE_VERSIONS[stage]}
+        return stage_cache.run(stage, inputs, schema, compute)
+
+    def _stage_group(self, stage_cache: Optional[StageCache], stages: tuple, inputs: dict, schemas: tuple, compute):
+        """Run stages produced by one call through `stage_cache`."""
+        if stage_cache is None:
+            return compute()
+        inputs = {**inputs, "model": self.model, "versions": [self.STAGE_VERSIONS[s] for s in stages]}
+        return stage_cache.run_group(stages, inputs, schemas, compute)
+
+    async def _astage(self, stage_cache: Optional[StageCache], stage: str, inputs: dict, schema, acompute):
+        """Coroutine counterpart of _stage(); `acompute` returns an awaitable."""
+        if stage_cache is None:
+            return await acompute()
+        inputs = {**inputs, "model": self.model, "version": self.STAGE_VERSIONS[stage]}
+        return await stage_cache.arun(stage, inputs, schema, acompute)
+
+    async def _astage_group(
+        self, stage_cache: Optional[StageCache], stages: tuple, inputs: dict, schemas: tuple, acompute
+    ):
+        """Coroutine counterpart of _stage_group()."""
+        if stage_cache is None:
+            return await acompute()
+        inputs = {**inputs, "model": self.model, "versions": [self.STAGE_VERSIONS[s] for s in stages]}
+        return await stage_cache.arun_group(stages, inputs, schemas, acompute)
+
+    def _content_inputs(self, domain: str, outlet_name: str, articles: list[dict[str, str]]) -> dict:
+        """Stage inputs of the content analyzers."""
+        # Article order does not matter; any changed, added or removed article does
+        return {
+            "domain": domain,
+            "outlet_name": outlet_name,
+            "content_mode": self.content_mode,
+            "articles": sorted(article_key(a.get("title", ""), a.get("text", "")) for a in articles),
+        }
+
+    def _profile(
+        self,
+        url: str,
+        articles: list[dict[str, str]],
+        outlet_name: Optional[str] = None,
+        stage_cache: Optional[StageCache] = None,
+    ) -> ComprehensiveReportData:
+        """Run all analyzers for profile(); each step is recorded as a span."""
         domain = self._extract_domain(url)
         if not outlet_name:
             logger.info("  - Resolving outlet name...")
-            outlet_name = self.researcher.resolve_outlet_name(url, domain=domain)
+            with tracing.span("outlet_name", tracing.STAGE):
+                outlet_name = self._stage(
+                    stage_cache, "outlet_name", {"url": url}, str,
+                    lambda: self.researcher.resolve_outlet_name(url, domain=domain),
+                )
 
         logger.info(f"Profiling: {outlet_name} ({domain})")
 
         # 1. Traffic and metadata analysis
         logger.info("  - Analyzing traffic and longevity...")
-        traffic_data = self.traffic_analyzer.analyze(url)
+        with tracing.span("traffic", tracing.ANALYZER):
+            traffic_data = self._stage(
+                stage_cache, "traffic", {"domain": domain}, TrafficData,
+                lambda: self.traffic_analyzer.analyze(url),
+            )
 
         logger.info("  - Classifying media type...")
-        media_type_result = self.media_type_analyzer.analyze(url)
+        with tracing.span("media_type", tracing.ANALYZER):
+            media_type_result = self._stage(
+                stage_cache, "media_type", {"domain": domain}, MediaTypeClassification,
+                lambda: self.media_type_analyzer.analyze(url),
+            )
 
         # 2. Content analysis (requires articles)
         editorial_bias_result: Optional[EditorialBiasResult] = None
         sourcing_result: Optional[SourcingAnalysisResult] = None
         pseudoscience_result: Optional[PseudoscienceAnalysisResult] = None
-
-        if articles:
+        content_inputs = self._content_inputs(domain, outlet_name, articles)
+
+        if articles and self.content_mode == "fused":
+            logger.info(f"  - Analyzing {len(articles)} articles for bias, sourcing and pseudoscience (fused)...")
+            with tracing.span("content_analysis", tracing.ANALYZER):
+                editorial_bias_result, sourcing_result, pseudoscience_result = self._stage_group(
+                    stage_cache,
+                    ("editorial_bias", "sourcing", "pseudoscience"),
+                    content_inputs,
+                    (EditorialBiasResult, SourcingAnalysisResult, PseudoscienceAnalysisResult),
+                    lambda: self.content_analyzer.analyze(articles, url, outlet_name),
+                )
+        elif articles:
             logger.info(f"  - Analyzing {len(articles)} articles for bias...")
-            editorial_bias_result = self.editorial_bias_analyzer.analyze(
-                articles, url, outlet_name
-            )
+            with tracing.span("editorial_bias", tracing.ANALYZER):
+                editorial_bias_result = self._stage(
+                    stage_cache, "editorial_bias", content_inputs, EditorialBiasResult,
+                    lambda: self.editorial_bias_analyzer.analyze(articles, url, outlet_name),
+                )
 
             logger.info("  - Analyzing sourcing quality...")
-            sourcing_result = self.sourcing_analyzer.analyze(articles)
+            with tracing.span("sourcing", tracing.ANALYZER):
+                sourcing_result = self._stage(
+                    stage_cache, "sourcing", content_inputs, SourcingAnalysisResult,
+                    lambda: self.sourcing_analyzer.analyze(articles),
+                )
 
             logger.info("  - Checking for pseudoscience...")
-            pseudoscience_result = self.pseudoscience_analyzer.analyze(
-                articles, url, outlet_name
-            )
+            with tracing.span("pseudoscience", tracing.ANALYZER):
+                pseudoscience_result = self._stage(
+                    stage_cache, "pseudoscience", content_inputs, PseudoscienceAnalysisResult,
+                    lambda: self.pseudoscience_analyzer.analyze(articles, url, outlet_name),
+                )
 
         # 3. Fact check search
         logger.info("  - Searching fact-checkers...")
-        fact_check_result = self.fact_check_searcher.analyze(url, outlet_name)
+        with tracing.span("fact_check", tracing.ANALYZER):
+            fact_check_result = self._stage(
+                stage_cache, "fact_check", {"domain": domain, "outlet_name": outlet_name}, FactCheckAnalysisResult,
+                lambda: self.fact_check_searcher.analyze(url, outlet_name),
+            )
 
         # 4. External research
-        logger.info("  - Researching history...")
-        history = self.researcher.research_history(outlet_name, domain=domain)
+        research_inputs = {"domain": domain, "research_mode": self.researcher.mode}
+        if self.researcher.mode == "separate":
+            logger.info("  - Researching history...")
+            with tracing.span("history", tracing.ANALYZER):
+                history = self._stage(
+                    stage_cache, "history", {**research_inputs, "outlet_name": outlet_name}, HistoryLLMOutput,
+                    lambda: self.researcher.research_history(outlet_name, domain=domain),
+                )
+
+            # Update outlet_name if LLM found the official name
+            if history.official_name:
+                logger.info(f"  - Updating outlet name from '{outlet_name}' to '{history.official_name}'")
+                outlet_name = history.official_name
+
+            logger.info("  - Researching ownership...")
+            with tracing.span("ownership", tracing.ANALYZER):
+                ownership = self._stage(
+                    stage_cache, "ownership", {**research_inputs, "outlet_name": outlet_name}, OwnershipLLMOutput,
+                    lambda: self.researcher.research_ownership(outlet_name, domain=domain),
+                )
+
+            logger.info("  - Gathering external analyses...")
+            with tracing.span("external_analysis", tracing.ANALYZER):
+                external_analyses = self._stage(
+                    stage_cache, "external_analysis", {**research_inputs, "outlet_name": outlet_name},
+                    ExternalAnalysisLLMOutput,
+                    lambda: self.researcher.research_external_analysis(outlet_name, domain=domain),
+                )
+        else:
+            logger.info(f"  - Researching history, ownership and external analyses ({self.researcher.mode})...")
+            with tracing.span("research", tracing.ANALYZER, mode=self.researcher.mode):
+                history, ownership, external_analyses = self._stage_group(
+                    stage_cache,
+                    ("history", "ownership", "external_analysis"),
+                    {**research_inputs, "outlet_name": outlet_name},
+                    (HistoryLLMOutput, OwnershipLLMOutput, ExternalAnalysisLLMOutput),
+                    lambda: self.researcher.research_all(outlet_name, domain=domain),
+                )
+
+            if history.official_name:
+                logger.info(f"  - Updating outlet name from '{outlet_name}' to '{history.official_name}'")
+                outlet_name = history.official_name
+
+        report = self._build_report(
+            url, domain, outlet_name, articles, traffic_data, media_type_result,
+            editorial_bias_result, sourcing_result, pseudoscience_result, fact_check_result,
+            history, ownership, external_analyses,
+        )
+        if stage_cache is not None:
+            logger.info(f"  - Stages: {stage_cache.summary()}")
+        logger.info(f"  - Profiling complete for {outlet_name}")
+        return report
+
+    async def _aprofile(
+        self,
+        url: str,
+        articles: Awaitable[list[dict[str, str]]],
+        outlet_name: Optional[str] = None,
+        stage_cache: Optional[StageCache] = None,
+        started: Optional[Awaitable[bool]] = None,
+    ) -> ComprehensiveReportData:
+        """
+        Run all analyzers for aprofile(); independent stages run concurrently.
+
+        Only the content stages wait for `articles`, so a streamed article
+        list is still being collected while the outlet-level stages run.
+        With `started` (whether the stream has yielded an article), no stage
+        starts before the first article, and an empty stream runs none.
+        """
+        articles_ready = asyncio.ensure_future(articles)
+        try:
+            if started is not None and not await started:
+                # Surfaces a scraper error; otherwise the site yielded nothing
+                await articles_ready
+                logger.warning("  - No articles streamed; skipping outlet-level stages")
+                return self._empty_report(url, outlet_name)
+            return await self._aprofile_stages(url, articles_ready, outlet_name, stage_cache)
+        finally:
+            articles_ready.cancel()
+
+    async def _aprofile_stages(
+        self,
+        url: str,
+        articles_ready: "asyncio.Future[list[dict[str, str]]]",
+        outlet_name: Optional[str],
+        stage_cache: Optional[StageCache],
+    ) -> ComprehensiveReportData:
+        domain = self._extract_domain(url)
+        if not outlet_name:
+            logger.info("  - Resolving outlet name...")
+            with tracing.span("outlet_name", tracing.STAGE):
+                outlet_name = await self._astage(
+                    stage_cache, "outlet_name", {"url": url}, str,
+                    lambda: self.researcher.aresolve_outlet_name(url, domain=domain),
+                )
+
+        logger.info(f"Profiling: {outlet_name} ({domain})")
+        research_inputs = {"domain": domain, "research_mode": self.researcher.mode, "outlet_name": outlet_name}
+
+        async def traced(name: str, coroutine, **attributes):
+            with tracing.span(name, tracing.ANALYZER, **attributes):
+                return await coroutine
+
+        async def content():
+            articles = await articles_ready
+            if not articles:
+                return None, None, None
+            content_inputs = self._content_inputs(domain, outlet_name, articles)
+            if self.content_mode == "fused":
+                return await traced("content_analysis", self._astage_group(
+                    stage_cache,
+                    ("editorial_bias", "sourcing", "pseudoscience"),
+                    content_inputs,
+                    (EditorialBiasResult, SourcingAnalysisResult, PseudoscienceAnalysisResult),
+                    lambda: self.content_analyzer.aanalyze(articles, url, outlet_name),
+                ))
+            return await asyncio.gather(
+                traced("editorial_bias", self._astage(
+                    stage_cache, "editorial_bias", content_inputs, EditorialBiasResult,
+                    lambda: self.editorial_bias_analyzer.aanalyze(articles, url, outlet_name),
+                )),
+                traced("sourcing", self._astage(
+                    stage_cache, "sourcing", content_inputs, SourcingAnalysisResult,
+                    lambda: self.sourcing_analyzer.aanalyze(articles),
+                )),
+                traced("pseudoscience", self._astage(
+                    stage_cache, "pseudoscience", content_inputs, PseudoscienceAnalysisResult,
+                    lambda: self.pseudoscience_analyzer.aanalyze(articles, url, outlet_name),
+                )),
+            )
+
+        async def research():
+            if self.researcher.mode != "separate":
+                return await traced("research", self._astage_group(
+                    stage_cache,
+                    ("history", "ownership", "external_analysis"),
+                    research_inputs,
+                    (HistoryLLMOutput, OwnershipLLMOutput, ExternalAnalysisLLMOutput),
+                    lambda: self.researcher.aresearch_all(outlet_name, domain=domain),
+                ), mode=self.researcher.mode)
+
+            history = await traced("history", self._astage(
+                stage_cache, "history", research_inputs, HistoryLLMOutput,
+                lambda: self.researcher.aresearch_history(outlet_name, domain=domain),
+            ))
+            # Ownership and external analysis search for the official name when history found one
+            name = history.official_name or outlet_name
+            inputs = {**research_inputs, "outlet_name": name}
+            ownership, external_analyses = await asyncio.gather(
+                traced("ownership", self._astage(
+                    stage_cache, "ownership", inputs, OwnershipLLMOutput,
+                    lambda: self.researcher.aresearch_ownership(name, domain=domain),
+                )),
+                traced("external_analysis", self._astage(
+                    stage_cache, "external_analysis", inputs, ExternalAnalysisLLMOutput,
+                    lambda: self.researcher.aresearch_external_analysis(name, domain=domain),
+                )),
+            )
+            return history, ownership, external_analyses
+
+        logger.info("  - Running traffic, media type, content, fact-check and research stages concurrently...")
+        (
+            traffic_data,
+            media_type_result,
+            (editorial_bias_result, sourcing_result, pseudoscience_result),
+            fact_check_result,
+            (history, ownership, external_analyses),
+        ) = await asyncio.gather(
+            traced("traffic", self._astage(
+                stage_cache, "traffic", {"domain": domain}, TrafficData,
+                lambda: self.traffic_analyzer.aanalyze(url),
+            )),
+            traced("media_type", self._astage(
+                stage_cache, "media_type", {"domain": domain}, MediaTypeClassification,
+                lambda: self.media_type_analyzer.aanalyze(url),
+            )),
+            content(),
+            traced("fact_check", self._astage(
+                stage_cache, "fact_check", {"domain": domain, "outlet_name": outlet_name}, FactCheckAnalysisResult,
+                lambda: self.fact_check_searcher.aanalyze(url, outlet_name),
+            )),
+            research(),
+        )
 
-        # Update outlet_name if LLM found the official name
         if history.official_name:
             logger.info(f"  - Updating outlet name from '{outlet_name}' to '{history.official_name}'")
             outlet_name = history.official_name
 
-        logger.info("  - Researching ownership...")
-        ownership = self.researcher.research_ownership(outlet_name, domain=domain)
+        report = self._build_report(
+            url, domain, outlet_name, articles_ready.result(), traffic_data, media_type_result,
+            editorial_bias_result, sourcing_result, pseudoscience_result, fact_check_result,
+            history, ownership, external_analyses,
+        )
+        if stage_cache is not None:
+            logger.info(f"  - Stages: {stage_cache.summary()}")
+        logger.info(f"  - Profiling complete for {outlet_name}")
+        return report
 
-        logger.info("  - Gathering external analyses...")
-        external_analyses = self.researcher.research_external_analysis(outlet_name, domain=domain)
+    def _empty_report(self, url: str, outlet_name: Optional[str]) -> ComprehensiveReportData:
+        """Report for an outlet with no articles, built without running any stage."""
+        domain = self._extract_domain(url)
+        credibility_score, credibility_label = self._calculate_credibility_score(5.0, 5.0, 5.0)
+        return ComprehensiveReportData(
+            target_url=url,
+            target_domain=domain,
+            outlet_name=outlet_name or domain,
+            bias_label="Center",
+            bias_score=0.0,
+            factuality_label=self._score_to_factuality_label(5.0),
+            factuality_score=5.0,
+            credibility_label=credibility_label,
+            credibility_score=credibility_score,
+            media_type=MediaType.UNKNOWN.value,
+            traffic_tier=TrafficTier.UNKNOWN.value,
+            analysis_date=datetime.now().strftime("%Y-%m-%d"),
+            articles_analyzed=0,
+        )
 
+    def _build_report(
+        self,
+        url: str,
+        domain: str,
+        outlet_name: str,
+        articles: list[dict[str, str]],
+        traffic_data: TrafficData,
+        media_type_result: MediaTypeClassification,
+        editorial_bias_result: Optional[EditorialBiasResult],
+        sourcing_result: Optional[SourcingAnalysisResult],
+        pseudoscience_result: Optional[PseudoscienceAnalysisResult],
+        fact_check_result: FactCheckAnalysisResult,
+        history: HistoryLLMOutput,
+        ownership: OwnershipLLMOutput,
+        external_analyses: ExternalAnalysisLLMOutput,
+    ) -> ComprehensiveReportData:
+        """Score the stage results and assemble the report (shared by profile() and aprofile())."""
         # 5. Calculate overall scores
         bias_score = editorial_bias_result.bias_score if editorial_bias_result else 0.0
         bias_label = editorial_bias_result.mbfc_label if editorial_bias_result else "Center"
@@ -788,8 +1978,6 @@ class MediaProfiler:
             analysis_date=datetime.now().strftime("%Y-%m-%d"),
             articles_analyzed=len(articles),
         )
-
-        logger.info(f"  - Profiling complete for {outlet_name}")
         return report
 
     def generate_report_text(self, report: ComprehensiveReportData) -> str:
@@ -955,9 +2143,7 @@ def research_outlet(url: str, outlet_name: Optional[str] = None) -> dict:
     domain = researcher._extract_domain(url)
     outlet_name = outlet_name or researcher.resolve_outlet_name(url, domain=domain)
 
-    history = researcher.research_history(outlet_name, domain=domain)
-    ownership = researcher.research_ownership(outlet_name, domain=domain)
-    external = researcher.research_external_analysis(outlet_name, domain=domain)
+    history, ownership, external = researcher.research_all(outlet_name, domain=domain)
 
     return {
         "outlet_name": outlet_name,
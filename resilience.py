@@ -0,0 +1,489 @@
+"""
+resilience.py
+Adaptive deadlines, hedged requests and retries for LLM and search calls.
+
+A slow LLM or DuckDuckGo response used to hold its analyzer until the
+client's fixed timeout (120 s for LLM calls), so the slowest call of a
+profile set its latency. Every call to an endpoint (one model and prompt size
+class, or the search API) now runs under a Policy that keeps the endpoint's
+recent latencies:
+
+    - Deadline: RESILIENCE_DEADLINE_MULTIPLIER x the p99 latency, within the
+      kind's RESILIENCE_DEADLINES bounds (the upper bound until the endpoint
+      has RESILIENCE_MIN_SAMPLES latencies)
+    - Hedging: a call still running at the p95 latency gets an identical
+      second request, and whichever answers first wins. At most
+      RESILIENCE_HEDGE_BUDGET of calls are hedged, so a slow endpoint does
+      not get twice the load
+    - Retries: searches are retried with full-jitter exponential backoff.
+      LLM calls already retry in the OpenAI client and with_llm_retry(),
+      which see a missed deadline as an ordinary APITimeoutError
+
+LLM requests go through ResilientTransport under the gateway's rate
+scheduler (llm_gateway.py); searches through the client from get_search().
+Replay answers from cassettes without latency and is left as it is.
+
+An analyzer that still fails substitutes a neutral, zero-confidence result.
+Its fallback helper calls record_fallback(), counted per stage in the trace
+summary and per component in metrics().
+"""
+
+import asyncio
+import json
+import logging
+import math
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+import httpx
+
+import tracing
+import transport
+from config import (
+    RESILIENCE_BACKOFF_BASE,
+    RESILIENCE_BACKOFF_CAP,
+    RESILIENCE_DEADLINE_MULTIPLIER,
+    RESILIENCE_DEADLINE_PERCENTILE,
+    RESILIENCE_DEADLINES,
+    RESILIENCE_ENABLED,
+    RESILIENCE_HEDGE_BUDGET,
+    RESILIENCE_HEDGE_PERCENTILE,
+    RESILIENCE_MIN_SAMPLES,
+    RESILIENCE_SEARCH_ATTEMPTS,
+    RESILIENCE_WINDOW,
+    RESILIENCE_WORKERS,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+LLM = "llm"
+SEARCH = "search"
+
+# Rough prompt size of a request body in tokens (as in llm_gateway.py)
+_BYTES_PER_TOKEN = 4
+
+
+class DeadlineExceeded(TimeoutError):
+    """No attempt of a call (hedge included) finished within the endpoint's deadline."""
+
+
+# =============================================================================
+# Endpoint policies
+# =============================================================================
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    """Nearest-rank percentile `q` (0-100) of sorted samples."""
+    return ordered[max(0, math.ceil(q / 100 * len(ordered)) - 1)]
+
+
+class Policy:
+    """
+    Recent latencies and call counters of one endpoint.
+
+    Attributes:
+        name: Endpoint name (e.g. "llm:gpt-4o-mini:4k", "search:ddgs")
+        min_deadline: Shortest deadline in seconds
+        max_deadline: Longest deadline, used until enough latencies are known
+        stats: Counters (calls, hedged, hedge_wins, retries, timeouts, failures)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        min_deadline: float,
+        max_deadline: float,
+        window: int = RESILIENCE_WINDOW,
+        min_samples: int = RESILIENCE_MIN_SAMPLES,
+    ):
+        self.name = name
+        self.min_deadline = min_deadline
+        self.max_deadline = max_deadline
+        self.min_samples = min_samples
+        self.stats = {"calls": 0, "hedged": 0, "hedge_wins": 0, "retries": 0, "timeouts": 0, "failures": 0}
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._latencies.append(seconds)
+
+    def count(self, key: str) -> None:
+        with self._lock:
+            self.stats[key] += 1
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Latency percentile in seconds, or None until min_samples are recorded."""
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return None
+            ordered = sorted(self._latencies)
+        return _percentile(ordered, q)
+
+    def deadline(self) -> float:
+        """Seconds a call (all its attempts) may take."""
+        tail = self.percentile(RESILIENCE_DEADLINE_PERCENTILE)
+        if tail is None:
+            return self.max_deadline
+        return min(self.max_deadline, max(self.min_deadline, tail * RESILIENCE_DEADLINE_MULTIPLIER))
+
+    def hedge_delay(self) -> Optional[float]:
+        """Seconds after which a call is hedged, or None while latencies are unknown."""
+        return self.percentile(RESILIENCE_HEDGE_PERCENTILE)
+
+    def try_hedge(self) -> bool:
+        """Take one hedge from the budget; False when the budget is spent."""
+        with self._lock:
+            if self.stats["hedged"] + 1 > RESILIENCE_HEDGE_BUDGET * self.stats["calls"]:
+                return False
+            self.stats["hedged"] += 1
+        tracing.increment("hedges")
+        return True
+
+    def snapshot(self) -> dict:
+        """Counters plus current percentiles, deadline and hedge delay."""
+        with self._lock:
+            stats = dict(self.stats)
+            ordered = sorted(self._latencies)
+        if ordered:
+            stats.update({f"p{q}_s": round(_percentile(ordered, q), 3) for q in (50, 95, 99)})
+        stats["samples"] = len(ordered)
+        stats["deadline_s"] = round(self.deadline(), 3)
+        hedge_delay = self.hedge_delay()
+        stats["hedge_delay_s"] = round(hedge_delay, 3) if hedge_delay is not None else None
+        return stats
+
+
+_policies: dict[str, Policy] = {}
+_fallbacks: dict[str, dict[str, int]] = {}
+_lock = threading.Lock()
+
+
+def policy(name: str, kind: str) -> Policy:
+    """The process-wide Policy for endpoint `name` of `kind` (LLM or SEARCH)."""
+    with _lock:
+        if name not in _policies:
+            _policies[name] = Policy(name, *RESILIENCE_DEADLINES[kind])
+        return _policies[name]
+
+
+def llm_policy(body: bytes) -> Policy:
+    """Policy for a chat completion request: one per model and prompt size class."""
+    try:
+        model = json.loads(body).get("model", "unknown") if body else "unknown"
+    except (ValueError, AttributeError):
+        model = "unknown"
+    # Powers of two of 1k tokens, so long prompts are not hedged at short prompts' p95
+    size = 2 ** max(0, math.ceil(math.log2(max(len(body) / _BYTES_PER_TOKEN, 1) / 1000)))
+    return policy(f"llm:{model}:{size}k", LLM)
+
+
+def record_fallback(component: str, error: Optional[BaseException] = None) -> None:
+    """Count a neutral result substituted for a failed `component` call."""
+    with _lock:
+        by_error = _fallbacks.setdefault(component, {})
+        name = type(error).__name__ if error is not None else "no_result"
+        by_error[name] = by_error.get(name, 0) + 1
+    tracing.increment("fallbacks")
+
+
+def metrics() -> dict:
+    """Per-endpoint latencies and counters, and fallbacks per component and error type."""
+    with _lock:
+        policies = list(_policies.values())
+        fallbacks = {component: dict(by_error) for component, by_error in _fallbacks.items()}
+    return {
+        "endpoints": {p.name: p.snapshot() for p in policies},
+        "fallbacks": fallbacks,
+    }
+
+
+# =============================================================================
+# Calls
+# =============================================================================
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _pool() -> ThreadPoolExecutor:
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=RESILIENCE_WORKERS, thread_name_prefix="hedged")
+        return _executor
+
+
+def _backoff(attempt: int) -> float:
+    """Full-jitter exponential backoff before retry number `attempt + 1`."""
+    return random.uniform(0, min(RESILIENCE_BACKOFF_CAP, RESILIENCE_BACKOFF_BASE * 2 ** attempt))
+
+
+def _timed(fn: Callable[[float], T], timeout: float) -> tuple[T, float]:
+    started = time.monotonic()
+    result = fn(timeout)
+    return result, time.monotonic() - started
+
+
+async def _atimed(afn: Callable[[float], Awaitable[T]], timeout: float) -> tuple[T, float]:
+    started = time.monotonic()
+    result = await afn(timeout)
+    return result, time.monotonic() - started
+
+
+def _discard(result: Any) -> None:
+    """Release a response nobody will read (the losing side of a hedge)."""
+    close = getattr(result, "close", None)
+    if close is not None:
+        close()
+
+
+def _discard_late(future) -> None:
+    if not future.cancelled() and future.exception() is None:
+        _discard(future.result()[0])
+
+
+def _timed_out(p: Policy, deadline: float) -> DeadlineExceeded:
+    # A missed deadline counts as a sample, so deadlines grow when the endpoint slows
+    p.record(deadline)
+    p.count("timeouts")
+    return DeadlineExceeded(f"{p.name} did not answer within {deadline:.1f}s")
+
+
+def _hedged(p: Policy, fn: Callable[[float], T]) -> T:
+    """One call of `fn(timeout)`, hedged after the p95 and bounded by the deadline."""
+    p.count("calls")
+    deadline = p.deadline()
+    hedge_delay = p.hedge_delay()
+    started = time.monotonic()
+
+    def attempt():
+        # Each attempt gets its own copy of the context (a Context runs one thread at a time)
+        return _pool().submit(_timed, tracing.bind(fn), deadline)
+
+    pending = {attempt()}
+    hedge = None
+    if hedge_delay is not None and hedge_delay < deadline:
+        done, _ = wait(pending, timeout=hedge_delay)
+        if not done and p.try_hedge():
+            hedge = attempt()
+            pending.add(hedge)
+
+    error: Optional[BaseException] = None
+    while pending:
+        remaining = deadline - (time.monotonic() - started)
+        done, pending = wait(pending, timeout=max(0.0, remaining), return_when=FIRST_COMPLETED)
+        if not done:
+            for future in pending:
+                future.add_done_callback(_discard_late)
+            raise _timed_out(p, deadline)
+        for future in done:
+            if future.exception() is not None:
+                error = future.exception()
+                continue
+            result, elapsed = future.result()
+            p.record(elapsed)
+            if future is hedge:
+                p.count("hedge_wins")
+            for other in (done | pending) - {future}:
+                other.add_done_callback(_discard_late)
+            return result
+    p.count("failures")
+    raise error
+
+
+async def _ahedged(p: Policy, afn: Callable[[float], Awaitable[T]]) -> T:
+    """Coroutine counterpart of _hedged(); the losing attempt is cancelled."""
+    p.count("calls")
+    deadline = p.deadline()
+    hedge_delay = p.hedge_delay()
+    started = time.monotonic()
+
+    pending = {asyncio.ensure_future(_atimed(afn, deadline))}
+    hedge = None
+    try:
+        if hedge_delay is not None and hedge_delay < deadline:
+            done, _ = await asyncio.wait(pending, timeout=hedge_delay)
+            if not done and p.try_hedge():
+                hedge = asyncio.ensure_future(_atimed(afn, deadline))
+                pending.add(hedge)
+
+        error: Optional[BaseException] = None
+        while pending:
+            remaining = deadline - (time.monotonic() - started)
+            done, pending = await asyncio.wait(pending, timeout=max(0.0, remaining), return_when=FIRST_COMPLETED)
+            if not done:
+                raise _timed_out(p, deadline)
+            winner = next((task for task in done if task.exception() is None), None)
+            if winner is None:
+                error = next(iter(done)).exception()
+                continue
+            result, elapsed = winner.result()
+            p.record(elapsed)
+            if winner is hedge:
+                p.count("hedge_wins")
+            for task in done - {winner}:
+                if task.exception() is None:
+                    await _adiscard(task.result()[0])
+            return result
+        p.count("failures")
+        raise error
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def _adiscard(result: Any) -> None:
+    aclose = getattr(result, "aclose", None)
+    if aclose is not None:
+        await aclose()
+    else:
+        _discard(result)
+
+
+def call(p: Policy, fn: Callable[[float], T], attempts: int = 1) -> T:
+    """
+    Call `fn` under an endpoint policy.
+
+    Args:
+        p: Policy of the endpoint
+        fn: Makes one request; receives the deadline in seconds, for clients
+            that can also enforce it themselves
+        attempts: Total attempts; retries wait with full-jitter backoff
+
+    Returns:
+        The first successful result
+
+    Raises:
+        The last attempt's error (DeadlineExceeded when it ran out of time)
+    """
+    for attempt in range(attempts):
+        try:
+            return _hedged(p, fn)
+        except Exception as e:
+            if attempt + 1 >= attempts:
+                raise
+            p.count("retries")
+            tracing.increment("retries")
+            delay = _backoff(attempt)
+            logger.debug(f"{p.name} failed ({type(e).__name__}), retrying in {delay:.2f}s")
+            time.sleep(delay)
+
+
+async def acall(p: Policy, afn: Callable[[float], Awaitable[T]], attempts: int = 1) -> T:
+    """Coroutine counterpart of call(); `afn` returns an awaitable."""
+    for attempt in range(attempts):
+        try:
+            return await _ahedged(p, afn)
+        except Exception as e:
+            if attempt + 1 >= attempts:
+                raise
+            p.count("retries")
+            tracing.increment("retries")
+            delay = _backoff(attempt)
+            logger.debug(f"{p.name} failed ({type(e).__name__}), retrying in {delay:.2f}s")
+            await asyncio.sleep(delay)
+
+
+# =============================================================================
+# LLM transport
+# =============================================================================
+
+
+def _with_deadline(request: httpx.Request, timeout: float) -> httpx.Request:
+    """Copy of a (read) request whose httpx timeouts are capped at `timeout`."""
+    limits = request.extensions.get("timeout") or {}
+    capped = {
+        key: timeout if limits.get(key) is None else min(limits[key], timeout)
+        for key in ("connect", "read", "write", "pool")
+    }
+    return httpx.Request(
+        request.method,
+        request.url,
+        headers=request.headers,
+        content=request.content,
+        extensions={**request.extensions, "timeout": capped},
+    )
+
+
+def _is_stream(body: bytes) -> bool:
+    try:
+        return bool(json.loads(body).get("stream")) if body else False
+    except (ValueError, AttributeError):
+        return False
+
+
+class ResilientTransport(httpx.BaseTransport):
+    """httpx transport that runs chat completion requests under their endpoint's policy."""
+
+    def __init__(self, inner: httpx.BaseTransport):
+        self.inner = inner
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        body = request.read()
+        if _is_stream(body):
+            return self.inner.handle_request(request)
+        try:
+            return call(llm_policy(body), lambda timeout: self.inner.handle_request(_with_deadline(request, timeout)))
+        except DeadlineExceeded as e:
+            # Surfaces as openai.APITimeoutError, which the client retries
+            raise httpx.ReadTimeout(str(e), request=request) from e
+
+    def close(self) -> None:
+        self.inner.close()
+
+
+class AsyncResilientTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of ResilientTransport."""
+
+    def __init__(self, inner: httpx.AsyncBaseTransport):
+        self.inner = inner
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        body = await request.aread()
+        if _is_stream(body):
+            return await self.inner.handle_async_request(request)
+        try:
+            return await acall(
+                llm_policy(body),
+                lambda timeout: self.inner.handle_async_request(_with_deadline(request, timeout)),
+            )
+        except DeadlineExceeded as e:
+            raise httpx.ReadTimeout(str(e), request=request) from e
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+
+# =============================================================================
+# Search
+# =============================================================================
+
+
+class ResilientSearch:
+    """Search client whose text() calls run under the "search:ddgs" policy, with retries."""
+
+    def __init__(self, inner, attempts: int = RESILIENCE_SEARCH_ATTEMPTS):
+        self.inner = inner
+        self.attempts = attempts
+        self.policy = policy("search:ddgs", SEARCH)
+
+    def text(self, query: str, **kwargs) -> list[dict]:
+        return call(self.policy, lambda timeout: list(self.inner.text(query, **kwargs)), self.attempts)
+
+    async def atext(self, query: str, **kwargs) -> list[dict]:
+        """Coroutine counterpart of text() (see transport.asearch)."""
+        return await acall(self.policy, lambda timeout: transport.asearch(self.inner, query, **kwargs), self.attempts)
+
+
+def get_search():
+    """Search client for the current transport mode, wrapped in ResilientSearch unless replaying."""
+    search = transport.get_search()
+    if not RESILIENCE_ENABLED or transport.is_replay():
+        return search
+    return ResilientSearch(search)
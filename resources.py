@@ -0,0 +1,231 @@
+"""
+resources.py
+Process-wide registry of shared, warm pipeline resources.
+
+Every Streamlit analysis used to construct a new MediaProfiler: eight
+analyzers, the Tranco top-1M CSV re-parsed by TrafficLongevityAnalyzer,
+known_media_types.csv by MediaTypeAnalyzer, plus a fresh StorageManager and
+ReportGenerator. The registry builds each of these once per process and
+hands the same instance to every session and thread:
+
+    profiler = resources.get_profiler()
+    storage = resources.get_storage()
+    generator = resources.get_report_generator()
+
+Lookup tables are FileTables: a file parsed into a dict on first use and
+shared by every analyzer that names the same path and parser. get() checks
+the file's mtime and size at most every RESOURCE_RELOAD_INTERVAL seconds and
+re-parses it when they change (a refreshed Tranco list, an edited
+known_media_types.csv). The new dict replaces the old one in a single
+assignment, so readers never see a half-loaded table. A missing file reads
+as empty until it appears; a file that fails to parse keeps the previous
+table.
+
+Shared instances hold no per-request state, except MediaProfiler.last_trace,
+which reflects whichever call finished last (use report.trace_summary per
+request).
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Hashable, Optional
+
+from config import CONTENT_ANALYSIS_MODE, RESEARCH_MODE, RESOURCE_RELOAD_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# File-backed lookup tables
+# =============================================================================
+
+
+class FileTable:
+    """
+    A file parsed into a dict, shared across threads and reloaded on change.
+
+    Attributes:
+        path: Absolute path of the file
+        loads: Number of times the file was parsed
+        loaded_at: time.time() of the last successful parse (None before)
+    """
+
+    def __init__(self, path: str, parse: Callable[[str], dict]):
+        """
+        Initialize the FileTable (nothing is read until first use).
+
+        Args:
+            path: File to parse
+            parse: Reads the file at a path into a dict
+        """
+        self.path = os.path.abspath(path)
+        self.loads = 0
+        self.loaded_at: Optional[float] = None
+        self._parse = parse
+        self._data: dict = {}
+        self._signature: Optional[tuple[int, int]] = None
+        self._checked_at = float("-inf")
+        self._lock = threading.Lock()
+
+    def _stat(self) -> Optional[tuple[int, int]]:
+        """(mtime_ns, size) of the file, or None if it does not exist."""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def get(self) -> dict:
+        """The current table, re-parsed first if the file changed."""
+        if time.monotonic() - self._checked_at >= RESOURCE_RELOAD_INTERVAL:
+            self._refresh(force=False)
+        return self._data
+
+    def reload(self) -> dict:
+        """Re-parse the file now, changed or not."""
+        self._refresh(force=True)
+        return self._data
+
+    def _refresh(self, force: bool) -> None:
+        with self._lock:
+            # Another thread may have checked while this one waited
+            if not force and time.monotonic() - self._checked_at < RESOURCE_RELOAD_INTERVAL:
+                return
+            signature = self._stat()
+            self._checked_at = time.monotonic()
+            if signature is None or (signature == self._signature and not force):
+                return
+
+            started = time.perf_counter()
+            try:
+                data = self._parse(self.path)
+            except Exception as e:
+                logger.error(f"Failed to load {self.path}, keeping the previous table: {e}")
+            else:
+                reloaded = self.loaded_at is not None
+                self._data = data
+                self.loads += 1
+                self.loaded_at = time.time()
+                logger.info(
+                    f"{'Reloaded' if reloaded else 'Loaded'} {len(data):,} entries from {self.path} "
+                    f"in {time.perf_counter() - started:.2f}s"
+                )
+            # A broken file is not re-parsed until it changes again
+            self._signature = signature
+
+    def stats(self) -> dict:
+        """Path, entry count, load count and last load time."""
+        return {
+            "path": self.path,
+            "entries": len(self._data),
+            "loads": self.loads,
+            "loaded_at": self.loaded_at,
+        }
+
+
+_tables: dict[tuple[str, Callable], FileTable] = {}
+_tables_lock = threading.Lock()
+
+
+def table(path: str, parse: Callable[[str], dict]) -> FileTable:
+    """
+    The process-wide FileTable for `path` read with `parse`.
+
+    Args:
+        path: File to parse (relative paths resolve against the working directory)
+        parse: Reads the file at a path into a dict
+
+    Returns:
+        The FileTable shared by every caller with the same path and parser
+    """
+    key = (os.path.abspath(path), parse)
+    file_table = _tables.get(key)
+    if file_table is None:
+        with _tables_lock:
+            file_table = _tables.get(key)
+            if file_table is None:
+                file_table = _tables[key] = FileTable(path, parse)
+    return file_table
+
+
+# =============================================================================
+# Shared instances
+# =============================================================================
+
+_instances: dict[Hashable, Any] = {}
+# Reentrant: a builder may ask the registry for other resources
+_instances_lock = threading.RLock()
+
+
+def shared(key: Hashable, build: Callable[[], Any]) -> Any:
+    """
+    The process-wide instance for `key`, built by `build()` on first use.
+
+    Args:
+        key: Identifies the resource and its configuration
+        build: Constructs the resource (called at most once per key)
+
+    Returns:
+        The shared instance
+    """
+    instance = _instances.get(key)
+    if instance is not None:
+        return instance
+    with _instances_lock:
+        instance = _instances.get(key)
+        if instance is None:
+            started = time.perf_counter()
+            instance = _instances[key] = build()
+            logger.info(f"Built shared {key[0] if isinstance(key, tuple) else key} in {time.perf_counter() - started:.2f}s")
+    return instance
+
+
+def get_profiler(
+    model: str = "gpt-4o-mini",
+    temperature: float = 0.0,
+    research_mode: str = RESEARCH_MODE,
+    content_mode: str = CONTENT_ANALYSIS_MODE,
+):
+    """The shared MediaProfiler for this configuration (see MediaProfiler.__init__)."""
+    from research import MediaProfiler
+
+    return shared(
+        ("profiler", model, temperature, research_mode, content_mode),
+        lambda: MediaProfiler(
+            model=model, temperature=temperature, research_mode=research_mode, content_mode=content_mode
+        ),
+    )
+
+
+def get_storage(base_dir=None):
+    """The shared StorageManager for `base_dir` (default: storage.REPORTS_DIR)."""
+    from storage import REPORTS_DIR, StorageManager
+
+    base_dir = base_dir if base_dir is not None else REPORTS_DIR
+    return shared(("storage", str(base_dir)), lambda: StorageManager(base_dir))
+
+
+def get_report_generator(model: str = "gpt-4o", temperature: float = 0.4):
+    """The shared ReportGenerator for this configuration."""
+    from report_generator import ReportGenerator
+
+    return shared(("report_generator", model, temperature), lambda: ReportGenerator(model, temperature))
+
+
+def stats() -> dict:
+    """Loaded tables and built instances, for logging and health checks."""
+    with _tables_lock:
+        tables = [file_table.stats() for file_table in _tables.values()]
+    with _instances_lock:
+        instances = [key[0] if isinstance(key, tuple) else key for key in _instances]
+    return {"tables": tables, "instances": instances}
+
+
+def clear() -> None:
+    """Forget every table and instance (the next request rebuilds them)."""
+    with _instances_lock:
+        _instances.clear()
+    with _tables_lock:
+        _tables.clear()
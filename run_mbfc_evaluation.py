@@ -1,3 +1,4 @@
+import argparse
 import json
 import time
 import pandas as pd
@@ -8,6 +9,8 @@ from dataclasses import asdict
 # Import your pipeline components
 # Ensure these match your actual file names (scraper.py and research.py)
 try:
+    import llm_gateway
+    import transport
     from scraper import MediaScraper
     from research import MediaProfiler
 except ImportError:
@@ -163,8 +166,9 @@ class PipelineEvaluator:
                     }
                 })
                 
-                # Respect rate limits
-                time.sleep(2)
+                # Respect rate limits (replayed runs never hit the network)
+                if not transport.is_replay():
+                    time.sleep(2)
 
             except Exception as e:
                 print(f"❌ Error processing {name}: {str(e)}")
@@ -243,5 +247,10 @@ class PipelineEvaluator:
         print(f"Full JSON results saved to {OUTPUT_FILE}")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the full pipeline against MBFC ground truth")
+    transport.add_cli_arguments(parser)
+    transport.configure_from_args(parser.parse_args())
+
     evaluator = PipelineEvaluator()
-    evaluator.run()
\ No newline at end of file
+    with llm_gateway.priority(llm_gateway.BATCH):
+        evaluator.run()
\ No newline at end of file
@@ -47,6 +47,27 @@ class ArticleClassification(BaseModel):
     )
 
 
+class NumberedArticleClassification(ArticleClassification):
+    """Classification of one article within a packed multi-article call."""
+
+    article_number: int = Field(
+        ge=1,
+        description="The article's number as given in the prompt (ARTICLE N)"
+    )
+
+
+class ArticleClassificationBatch(BaseModel):
+    """
+    Structured output for classifying several short articles in one call.
+
+    Used by OpinionAnalyzer.analyze_batch(pack_size > 1).
+    """
+
+    classifications: list[NumberedArticleClassification] = Field(
+        description="One classification per article, in any order"
+    )
+
+
 # =============================================================================
 # Media Type Classification Schemas
 # =============================================================================
@@ -629,6 +650,73 @@ class EditorialBiasLLMOutput(BaseModel):
     )
 
 
+class EditorialBiasChunkOutput(BaseModel):
+    """Compact structured LLM output for one chunk in map-reduce bias analysis."""
+
+    bias_score: float = Field(
+        ge=-10.0,
+        le=10.0,
+        description="Numeric score for this batch of articles: -10 (far left) to +10 (far right), 0 = center"
+    )
+    policy_positions: list[PolicyPosition] = Field(
+        default_factory=list,
+        description="Positions on policy domains covered in this batch, citing 'Article N: Title'"
+    )
+    loaded_language_examples: list[str] = Field(
+        default_factory=list,
+        description="Up to 3 examples of loaded language, with article reference"
+    )
+    story_selection_notes: Optional[str] = Field(
+        default=None,
+        description="One sentence on story selection patterns in this batch, if any"
+    )
+    confidence: float = Field(
+        ge=0.0,
+        le=1.0,
+        description="Confidence in this batch's assessment"
+    )
+    reasoning: str = Field(
+        description="1-2 sentence justification for the batch score"
+    )
+
+
+class EditorialBiasReduceOutput(BaseModel):
+    """Narrative fields written by the optional reduce LLM call in map-reduce bias analysis."""
+
+    ideology_summary: str = Field(
+        description="2-3 sentence direct summary of the outlet's ideological position"
+    )
+    economy_summary: str = Field(
+        description="1-2 sentence direct summary of the outlet's economic stance"
+    )
+    story_selection_bias: Optional[str] = Field(
+        default=None,
+        description="Notes on biased story selection patterns across all batches, if any"
+    )
+    reasoning: str = Field(
+        description="Explanation of the overall bias assessment across batches"
+    )
+
+
+class DroppedArticle(BaseModel):
+    """An article left out of an LLM prompt by token-budgeted packing."""
+
+    index: int = Field(
+        description="Original 1-based article number"
+    )
+    title: str = Field(
+        default="",
+        description="Article title"
+    )
+    url: str = Field(
+        default="",
+        description="Article URL"
+    )
+    reason: str = Field(
+        description="Why it was dropped: 'budget', 'duplicate' or 'empty'"
+    )
+
+
 class EditorialBiasResult(BaseModel):
     """Complete editorial bias analysis result."""
 
@@ -678,6 +766,25 @@ class EditorialBiasResult(BaseModel):
         ge=0,
         description="Number of articles analyzed"
     )
+    articles_dropped: list[DroppedArticle] = Field(
+        default_factory=list,
+        description="Articles left out of the prompt to stay within the token budget"
+    )
+    prompt_article_tokens: int = Field(
+        default=0,
+        ge=0,
+        description="Tokens of article text sent to the LLM"
+    )
+    chunks_analyzed: int = Field(
+        default=1,
+        ge=0,
+        description="Number of article chunks scored (1 unless map-reduce mode was used)"
+    )
+    chunk_score_stddev: Optional[float] = Field(
+        default=None,
+        ge=0.0,
+        description="Weighted standard deviation of per-chunk bias scores (map-reduce only)"
+    )
     confidence: float = Field(
         ge=0.0,
         le=1.0,
@@ -838,6 +945,20 @@ class PseudoscienceAnalysisResult(BaseModel):
     )
 
 
+class FusedContentLLMOutput(BaseModel):
+    """Editorial bias, sourcing and pseudoscience assessed in one structured call."""
+
+    editorial_bias: EditorialBiasLLMOutput = Field(
+        description="Editorial/political bias assessment"
+    )
+    sourcing: SourcingLLMOutput = Field(
+        description="Sourcing quality assessment"
+    )
+    pseudoscience: PseudoscienceLLMOutput = Field(
+        description="Pseudoscience and conspiracy content assessment"
+    )
+
+
 # =============================================================================
 # Research Module Schemas
 # =============================================================================
@@ -938,6 +1059,20 @@ class ExternalAnalysisLLMOutput(BaseModel):
     )
 
 
+class CombinedResearchLLMOutput(BaseModel):
+    """History, ownership and external analyses extracted in one structured call."""
+
+    history: HistoryLLMOutput = Field(
+        description="History and identity of the outlet"
+    )
+    ownership: OwnershipLLMOutput = Field(
+        description="Ownership and funding of the outlet"
+    )
+    external_analysis: ExternalAnalysisLLMOutput = Field(
+        description="External analyses and criticism of the outlet"
+    )
+
+
 class ComprehensiveReportData(BaseModel):
     """Complete data for generating an MBFC-style report."""
 
@@ -1042,4 +1177,8 @@ class ComprehensiveReportData(BaseModel):
     articles_analyzed: int = Field(
         ge=0,
         description="Number of articles analyzed"
-    )
\ No newline at end of file
+    )
+    trace_summary: dict = Field(
+        default_factory=dict,
+        description="Per-stage latency, token usage, cost and call counts for this run (see tracing.py)"
+    )
@@ -1,22 +1,77 @@
 """
 Web Scraper Module - "Brute Force" Edition
-Designed to aggressively crawl homepage links when sitemaps fail.
+Finds articles through sitemaps and RSS/Atom feeds (see discovery.py) and
+aggressively crawls homepage links when those fail.
 """
 
+import math
 import re
+import threading
 import time
 import logging
 import random
-from typing import List, Optional, Set, Dict
+from typing import AsyncIterator, Dict, Generator, Iterator, List, Optional, Set
 from dataclasses import dataclass, field
 from urllib.parse import urljoin, urlparse
-import requests
 import warnings
 from bs4 import BeautifulSoup, XMLParsedAsHTMLWarning
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+import tracing
+import fetching
+import transport
+from dedup import SimHashIndex, canonicalize_url, simhash
+from discovery import SITEMAP, ArticleDiscovery, DiscoveredArticle
+
 logger = logging.getLogger(__name__)
 
+# --- Link Scoring ---
+
+HARD_NEWS_SECTIONS = ['/news', '/politics', '/world', '/business', '/economy',
+                      '/uk-news', '/us-news', '/us-politics', '/global']
+HARD_NEWS_KEYWORDS = ['government', 'election', 'war', 'senate', 'congress',
+                      'parliament', 'law', 'court', 'policy', 'minister',
+                      'president', 'military', 'conflict', 'protest']
+SOFT_NEWS_SECTIONS = ['/sport', '/sports', '/culture', '/arts', '/travel',
+                      '/food', '/style', '/entertainment', '/life', '/lifestyle',
+                      '/celebrity', '/recipe', '/wellness', '/fitness',
+                      '/music', '/movies', '/tv-shows', '/gaming']
+
+# Links that are never articles
+NON_ARTICLE_PATTERNS = ['/tag/', '/search/', '/category/', '/login', '.pdf', '.jpg', '/video/', '/live/']
+
+# Opinion/editorial indicators (see MediaScraper._detect_opinion_article)
+OPINION_URL_PATTERNS = ['/opinion/', '/opinions/', '/editorial/', '/editorials/',
+                        '/op-ed/', '/oped/', '/commentary/', '/perspective/',
+                        '/analysis/', '/column/', '/columns/', '/blog/',
+                        '/views/', '/viewpoint/', '/contributor/']
+OPINION_TITLE_PATTERNS = ['opinion:', 'editorial:', 'commentary:', 'analysis:',
+                          'column:', 'op-ed:', 'perspective:', 'letter to',
+                          'my view', 'i think', 'why we should', 'why i']
+
+
+def hard_news_score(url: str) -> int:
+    """
+    Score a URL by how likely it is to be hard news (higher is better).
+    Used to prioritize homepage links and to rank articles for prompt packing.
+    """
+    score = 0
+    u = url.lower()
+
+    # Boost hard news sections
+    if any(x in u for x in HARD_NEWS_SECTIONS):
+        score += 10
+
+    # Boost hard news keywords in URL slug
+    if any(x in u for x in HARD_NEWS_KEYWORDS):
+        score += 5
+
+    # Demote soft news sections
+    if any(x in u for x in SOFT_NEWS_SECTIONS):
+        score -= 10
+
+    return score
+
 # --- Data Models ---
 
 @dataclass
@@ -47,13 +102,36 @@ class SiteMetadata:
 
 # --- The Scraper Class ---
 
+# Where scrape_feed() looks for article links
+DISCOVERY_MODES = ("auto", "feeds", "homepage")
+
+# Sitemap/feed URLs are real articles, so fetch only a small margin over max_articles
+# ("auto" tops up from the homepage if too few parse; homepage links include section
+# pages and promos, so those fetch 2x)
+FEED_FETCH_MARGIN = 1.2
+
+
 class MediaScraper:
-    def __init__(self, base_url: str, max_articles: int = 30):
+    def __init__(self, base_url: str, max_articles: int = 30, request_delay: tuple = (0.5, 1.5),
+                 discovery_mode: str = "auto"):
+        if discovery_mode not in DISCOVERY_MODES:
+            raise ValueError(f"Unknown discovery mode: {discovery_mode} (expected one of {', '.join(DISCOVERY_MODES)})")
         self.base_url = base_url.rstrip('/')
         self.domain = urlparse(self.base_url).netloc.replace('www.', '')
         self.max_articles = max_articles
-        self.visited_urls: Set[str] = set()
-        self.session = requests.Session()
+        # "feeds": sitemaps/RSS only; "homepage": homepage links only;
+        # "auto": sitemaps/RSS first, topped up from the homepage
+        self.discovery_mode = discovery_mode
+        # (min, max) seconds of random delay before each request; (0, 0) disables it
+        self.request_delay = request_delay
+        self.visited_urls: Set[str] = set()  # Canonical URLs (see dedup.canonicalize_url)
+        self.session = transport.new_session()
+        self._published: Dict[str, str] = {}  # URL -> ISO publication date from the feed
+        # Near-duplicate article text (same wire story under different URLs)
+        self.text_index = SimHashIndex()
+        self._dedup_lock = threading.Lock()
+        self.dedup_stats: Dict[str, int] = {}
+        self.reset_dedup()
         
         # Robust Headers to look like a real browser (Chrome on Windows)
         self.headers = {
@@ -63,11 +141,41 @@ class MediaScraper:
             'Referer': 'https://www.google.com/',
         }
 
+    def reset_dedup(self) -> None:
+        """Forget visited URLs and seen texts, and zero the duplicate counters."""
+        self.visited_urls.clear()
+        self.text_index.clear()
+        self.dedup_stats = {
+            "links": 0,                 # Internal candidate links found
+            "url_duplicates": 0,        # Same page after URL canonicalization
+            "canonical_duplicates": 0,  # <link rel="canonical"> points at a seen page
+            "near_duplicates": 0,       # SimHash match with an already scraped text
+        }
+
+    @property
+    def duplicate_rate(self) -> float:
+        """Share of candidate links that turned out to be duplicates."""
+        links = self.dedup_stats["links"]
+        duplicates = (
+            self.dedup_stats["url_duplicates"]
+            + self.dedup_stats["canonical_duplicates"]
+            + self.dedup_stats["near_duplicates"]
+        )
+        return duplicates / links if links else 0.0
+
+    def _count_duplicate(self, kind: str) -> None:
+        with self._dedup_lock:
+            self.dedup_stats[kind] += 1
+
     def fetch_page(self, url: str) -> Optional[BeautifulSoup]:
         """Downloads and parses a page safely."""
         try:
-            time.sleep(random.uniform(0.5, 1.5)) # Delay to avoid 429 Rate Limits
-            resp = self.session.get(url, headers=self.headers, timeout=15)
+            # Replayed responses cannot be rate limited, so skip the polite delay
+            if self.request_delay[1] > 0 and not transport.is_replay():
+                time.sleep(random.uniform(*self.request_delay)) # Delay to avoid 429 Rate Limits
+            with tracing.span("page", tracing.FETCH, url=url):
+                resp = fetching.session_for(self.session).get(url, headers=self.headers, timeout=15)
+                tracing.annotate(status=resp.status_code, bytes=len(resp.content))
             resp.raise_for_status()
             
             # Fix encoding issues
@@ -87,86 +195,201 @@ class MediaScraper:
     def scrape_feed(self) -> List[Article]:
         """
         The Main Method called by profiler.py.
-        Strategy: Get homepage, find internal links, prioritize hard news, scrape them.
+        Strategy: find article links (sitemaps/feeds first, then the homepage),
+        prioritize hard news, scrape them.
+        """
+        return list(self.iter_articles())
+
+    def iter_articles(self) -> Iterator[Article]:
+        """
+        Yield articles as they are scraped (the streaming form of scrape_feed()).
+
+        Links are discovered first; article pages are then fetched in
+        parallel and each article is yielded as soon as it is parsed, so
+        callers can start per-article work while the rest download
+        (MediaProfiler.profile_streaming). In "auto" mode the homepage is
+        only read when the sitemap/feed links yielded fewer than
+        max_articles. Pages not yet requested are dropped once max_articles
+        are yielded or the generator is closed.
+        """
+        candidates: Dict[str, str] = {}  # Canonical URL -> URL to fetch
+        self._published = {}
+        scraped = 0
+
+        # 1. Sitemaps and feeds list real articles with dates
+        if self.discovery_mode in ("auto", "feeds"):
+            feed_links = self._feed_links(candidates, math.ceil(self.max_articles * FEED_FETCH_MARGIN))
+            scraped += yield from self._scrape_links(feed_links, self.max_articles)
+
+        # 2. Homepage links, when feeds are disabled or too few of their links parsed
+        if self.discovery_mode == "homepage" or (
+            self.discovery_mode == "auto" and scraped < self.max_articles
+        ):
+            homepage_links = self._discover_from_homepage(candidates)
+            wanted = self.max_articles - scraped
+            scraped += yield from self._scrape_links(self._prioritize(homepage_links or [], wanted * 2), wanted)
+
+        tracing.annotate(duplicate_rate=round(self.duplicate_rate, 3), **self.dedup_stats)
+        logger.info(
+            f"Duplicates: {self.dedup_stats['url_duplicates']} by URL, "
+            f"{self.dedup_stats['canonical_duplicates']} by rel=canonical, "
+            f"{self.dedup_stats['near_duplicates']} by text "
+            f"({self.duplicate_rate:.0%} of {self.dedup_stats['links']} links)"
+        )
+
+    def aiter_articles(self) -> AsyncIterator[Article]:
+        """Async iterator over iter_articles(); scraping runs on a worker thread."""
+        return transport.iterate_blocking(self.iter_articles())
+
+    def _scrape_links(self, links: List[str], wanted: int) -> Generator[Article, None, int]:
+        """Fetch `links` in parallel, yielding up to `wanted` valid articles; returns how many."""
+        if not links or wanted <= 0:
+            return 0
+
+        logger.info(f"Scraping up to {wanted} of {len(links)} prioritized links...")
+
+        # Scrape them in parallel
+        scraped = 0
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = [executor.submit(tracing.bind(self._parse_article), url) for url in links]
+            try:
+                for future in as_completed(futures):
+                    if scraped >= wanted: break
+
+                    res = future.result()
+                    if res and len(res.text) > 500: # Ensure valid article text
+                        if res.url in self._published:
+                            res.date = self._published[res.url]
+                        scraped += 1
+                        print(f"✅ Scraped: {res.title[:50]}...")
+                        yield res
+            finally:
+                for future in futures:
+                    future.cancel()
+        return scraped
+
+    def _feed_links(self, candidates: Dict[str, str], limit: int) -> List[str]:
+        """
+        Up to `limit` sitemap/feed links to fetch (publication dates go to self._published).
+
+        Dated articles come newest day first, hard news first within a day.
+        Undated feed entries follow. Undated entries of generic sitemaps
+        (evergreen pages, old archives) are used only in "feeds" mode,
+        after everything else; "auto" mode tops up from the homepage instead.
+        """
+        discovered: Dict[str, DiscoveredArticle] = {}  # Canonical URL -> item
+        for item in self._discover_from_feeds():
+            if self._add_candidate(candidates, item.url):
+                discovered[canonicalize_url(item.url)] = item
+
+        # Key by the URL that will be fetched (the plainest duplicate spelling)
+        items = {candidates[canonical]: item for canonical, item in discovered.items()}
+        for url, item in items.items():
+            if item.published:
+                self._published[url] = item.published.isoformat()
+
+        dated = sorted(
+            (url for url, item in items.items() if item.published),
+            key=lambda url: (
+                -items[url].published.date().toordinal(),
+                -hard_news_score(url),
+                -items[url].published.timestamp(),
+            ),
+        )
+        undated_feeds = [url for url, item in items.items() if not item.published and item.source != SITEMAP]
+        ranked = dated + self._prioritize(undated_feeds, limit)
+        if self.discovery_mode == "feeds":
+            undated_sitemap = [url for url, item in items.items() if not item.published and item.source == SITEMAP]
+            ranked += self._prioritize(undated_sitemap, limit)
+        ranked = ranked[:limit]
+        selected = set(ranked)
+
+        # Links left out may still be found (and ranked) on the homepage
+        for canonical in discovered:
+            if candidates[canonical] not in selected:
+                del candidates[canonical]
+        return ranked
+
+    def _is_article_link(self, url: str) -> bool:
+        """Internal, long enough, and not an obvious non-article page."""
+        if self.domain not in url: return False # Internal only
+        if len(url) < len(self.base_url) + 10: return False # Too short
+        return not any(x in url for x in NON_ARTICLE_PATTERNS)
+
+    def _add_candidate(self, candidates: Dict[str, str], url: str) -> bool:
+        """
+        Add a link under its canonical URL (AMP variants, tracking parameters,
+        fragments and trailing slashes collapse). Returns False for duplicates.
+        """
+        self.dedup_stats["links"] += 1
+        canonical = canonicalize_url(url)
+        if canonical in candidates:
+            self.dedup_stats["url_duplicates"] += 1
+            # Prefer the plainest spelling of the URL (usually the non-AMP one)
+            if len(url) < len(candidates[canonical]):
+                candidates[canonical] = url
+            return False
+        candidates[canonical] = url
+        return True
+
+    @staticmethod
+    def _prioritize(urls: List[str], limit: int) -> List[str]:
+        """Hard news before soft news for better bias analysis (stable for ties)."""
+        return sorted(urls, key=hard_news_score, reverse=True)[:limit]
+
+    def _discover_from_feeds(self) -> List[DiscoveredArticle]:
+        """Recent article URLs from robots.txt sitemaps, news sitemaps and RSS/Atom feeds."""
+        discovery = ArticleDiscovery(self.base_url, fetching.session_for(self.session), headers=self.headers)
+        with tracing.span("discover_feeds", tracing.STAGE):
+            items = discovery.discover(self.max_articles, accept=self._is_article_link)
+            tracing.annotate(documents=len(discovery.documents_read), articles=len(items))
+        return items
+
+    def _discover_from_homepage(self, candidates: Dict[str, str]) -> Optional[List[str]]:
+        """
+        New article links from the homepage (None if it cannot be loaded).
+
+        Links whose canonical URL is already in `candidates` are skipped.
         """
         logger.info(f"Scraping homepage: {self.base_url}")
         soup = self.fetch_page(self.base_url)
         if not soup:
             logger.error("Could not load homepage. Site might be blocking requests.")
-            return []
+            return None
 
-        # 1. Collect all potential links
-        candidates = set()
+        known = set(candidates)
         for a in soup.find_all('a', href=True):
-            href = a['href']
-            full_url = urljoin(self.base_url, href)
-
-            # Filter logic
-            if self.domain not in full_url: continue # Internal only
-            if len(full_url) < len(self.base_url) + 10: continue # Too short
-            # Skip obvious non-article pages
-            if any(x in full_url for x in ['/tag/', '/search/', '/category/', '/login', '.pdf', '.jpg', '/video/', '/live/']): continue
-
-            candidates.add(full_url)
-
-        logger.info(f"Found {len(candidates)} links on homepage.")
-
-        # 2. Prioritize hard news over soft news for better bias analysis
-        scored_candidates = []
-        for url in candidates:
-            score = 0
-            u = url.lower()
-
-            # Boost hard news sections
-            if any(x in u for x in ['/news', '/politics', '/world', '/business', '/economy',
-                                     '/uk-news', '/us-news', '/us-politics', '/global']):
-                score += 10
-
-            # Boost hard news keywords in URL slug
-            if any(x in u for x in ['government', 'election', 'war', 'senate', 'congress',
-                                      'parliament', 'law', 'court', 'policy', 'minister',
-                                      'president', 'military', 'conflict', 'protest']):
-                score += 5
-
-            # Demote soft news sections
-            if any(x in u for x in ['/sport', '/sports', '/culture', '/arts', '/travel',
-                                     '/food', '/style', '/entertainment', '/life', '/lifestyle',
-                                     '/celebrity', '/recipe', '/wellness', '/fitness',
-                                     '/music', '/movies', '/tv-shows', '/gaming']):
-                score -= 10
-
-            scored_candidates.append((score, url))
-
-        # Sort by score descending (hard news first)
-        scored_candidates.sort(key=lambda x: x[0], reverse=True)
-        target_links = [x[1] for x in scored_candidates[:self.max_articles * 2]]
-
-        top_score = scored_candidates[0][0] if scored_candidates else 0
-        logger.info(f"Prioritized {len(target_links)} links (top score: {top_score}). Scraping {self.max_articles}...")
-
-        # 3. Scrape them in parallel
-        articles = []
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            future_to_url = {executor.submit(self._parse_article, url): url for url in target_links}
-
-            for future in as_completed(future_to_url):
-                if len(articles) >= self.max_articles: break
+            full_url = urljoin(self.base_url, a['href'])
+            if self._is_article_link(full_url):
+                self._add_candidate(candidates, full_url)
 
-                res = future.result()
-                if res and len(res.text) > 500: # Ensure valid article text
-                    articles.append(res)
-                    print(f"✅ Scraped: {res.title[:50]}...")
-
-        return articles
+        new_links = [url for canonical, url in candidates.items() if canonical not in known]
+        logger.info(f"Found {len(new_links)} new links on homepage.")
+        return new_links
 
     def _parse_article(self, url: str) -> Optional[Article]:
-        """Parses a single article URL."""
-        if url in self.visited_urls: return None
-        self.visited_urls.add(url)
+        """Parses a single article URL (None for failures and duplicates)."""
+        canonical = canonicalize_url(url)
+        with self._dedup_lock:
+            if canonical in self.visited_urls: return None
+            self.visited_urls.add(canonical)
 
         soup = self.fetch_page(url)
         if not soup: return None
 
+        # The page may declare itself a copy of an article we already have
+        link = soup.find('link', rel='canonical', href=True)
+        if link:
+            declared = canonicalize_url(urljoin(url, link['href']))
+            if declared != canonical:
+                with self._dedup_lock:
+                    seen = declared in self.visited_urls
+                    self.visited_urls.add(declared)
+                if seen:
+                    self._count_duplicate("canonical_duplicates")
+                    logger.info(f"Skipping {url}: canonical URL {declared} already scraped")
+                    return None
+
         # Extract Title
         title = soup.title.get_text(strip=True) if soup.title else ""
         h1 = soup.find('h1')
@@ -193,6 +416,13 @@ class MediaScraper:
 
         if len(text) < 200: return None # Trash result
 
+        # Same story under another URL (syndicated wire copy, section paths)
+        original = self.text_index.add_if_new(simhash(text), url)
+        if original:
+            self._count_duplicate("near_duplicates")
+            logger.info(f"Skipping {url}: near-duplicate of {original}")
+            return None
+
         # Check for Sources (External links)
         sources = []
         for a in soup.find_all('a', href=True):
@@ -226,24 +456,13 @@ class MediaScraper:
         Important for MBFC methodology which separates news reporting from editorial bias.
         """
         # URL indicators
-        opinion_url_patterns = [
-            '/opinion/', '/opinions/', '/editorial/', '/editorials/',
-            '/op-ed/', '/oped/', '/commentary/', '/perspective/',
-            '/analysis/', '/column/', '/columns/', '/blog/',
-            '/views/', '/viewpoint/', '/contributor/'
-        ]
         url_lower = url.lower()
-        if any(pattern in url_lower for pattern in opinion_url_patterns):
+        if any(pattern in url_lower for pattern in OPINION_URL_PATTERNS):
             return True
 
         # Title indicators
         title_lower = title.lower()
-        opinion_title_patterns = [
-            'opinion:', 'editorial:', 'commentary:', 'analysis:',
-            'column:', 'op-ed:', 'perspective:', 'letter to',
-            'my view', 'i think', 'why we should', 'why i'
-        ]
-        if any(pattern in title_lower for pattern in opinion_title_patterns):
+        if any(pattern in title_lower for pattern in OPINION_TITLE_PATTERNS):
             return True
 
         # Meta tag indicators
@@ -0,0 +1,196 @@
+"""
+stage_cache.py
+Stage-level reuse of profile results for incremental re-profiling.
+
+A saved report used to be all or nothing: main_pipeline either printed it or
+re-ran every analyzer. StageCache keeps one record per profile stage
+(traffic, media type, editorial bias, ..., report text):
+
+    {"fingerprint": ..., "computed_at": ..., "value": ...}
+
+The fingerprint hashes the stage's inputs (domain, outlet name, article
+content keys, modes) together with the model and the stage's code version
+(MediaProfiler.STAGE_VERSIONS). On the next run a stage is reused when its
+fingerprint matches and the record is younger than its TTL
+(STAGE_TTL_DAYS in config.py); otherwise it is recomputed and the record
+replaced:
+
+    stage_cache = StageCache(storage.load_stages(domain))
+    report = MediaProfiler().profile(url, articles, stage_cache=stage_cache)
+    storage.save_stages(domain, stage_cache.records)
+
+Stages computed by one call (fused content analysis, combined research) are
+run as a group: reused only when every member is fresh, recomputed together
+otherwise. Results with zero confidence (the analyzers' fallbacks after an
+error) are not recorded, so the next run retries them.
+
+arun()/arun_group() are the same for coroutine stages (MediaProfiler.aprofile).
+"""
+
+import hashlib
+import json
+import logging
+import time
+from typing import Any, Awaitable, Callable, Iterable, Optional
+
+from pydantic import TypeAdapter
+
+import tracing
+from config import STAGE_DEFAULT_TTL_DAYS, STAGE_TTL_DAYS
+
+logger = logging.getLogger(__name__)
+
+
+def fingerprint(stage: str, inputs: dict) -> str:
+    """Hash of a stage name and its (JSON-serializable) inputs."""
+    payload = json.dumps({"stage": stage, "inputs": inputs}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+class StageCache:
+    """
+    Stage records of one outlet, reused when inputs match and TTLs allow.
+
+    Attributes:
+        records: stage -> {"fingerprint", "computed_at", "value"} (JSON-ready)
+        ttl_days: stage -> days a record stays valid
+        recompute: Stages recomputed regardless of their records
+        reused: Stages answered from records in this run
+        recomputed: Stages computed in this run
+    """
+
+    def __init__(
+        self,
+        records: Optional[dict[str, dict]] = None,
+        ttl_days: Optional[dict[str, float]] = None,
+        recompute: Iterable[str] = (),
+    ):
+        """
+        Initialize the StageCache.
+
+        Args:
+            records: Records saved by an earlier run (StorageManager.load_stages)
+            ttl_days: Per-stage TTLs (default: STAGE_TTL_DAYS)
+            recompute: Stage names to recompute even if their records are fresh
+        """
+        self.records: dict[str, dict] = dict(records or {})
+        self.ttl_days = ttl_days if ttl_days is not None else STAGE_TTL_DAYS
+        self.recompute = set(recompute)
+        self.reused: list[str] = []
+        self.recomputed: list[str] = []
+
+    def _ttl_seconds(self, stage: str) -> float:
+        return self.ttl_days.get(stage, STAGE_DEFAULT_TTL_DAYS) * 86400
+
+    def is_fresh(self, stage: str, stage_fingerprint: str, now: Optional[float] = None) -> bool:
+        """Whether the record for `stage` can be reused for these inputs."""
+        record = self.records.get(stage)
+        if record is None or stage in self.recompute:
+            return False
+        if record.get("fingerprint") != stage_fingerprint:
+            return False
+        now = time.time() if now is None else now
+        return now - record.get("computed_at", 0) < self._ttl_seconds(stage)
+
+    def run(self, stage: str, inputs: dict, schema: Any, compute: Callable[[], Any]) -> Any:
+        """
+        Reuse or compute one stage.
+
+        Args:
+            stage: Stage name (key in STAGE_TTL_DAYS)
+            inputs: Everything the result depends on (JSON-serializable)
+            schema: Type of the result (a pydantic model, str, ...)
+            compute: Produces the result when the record cannot be reused
+
+        Returns:
+            The reused or freshly computed result
+        """
+        return self.run_group((stage,), inputs, (schema,), lambda: (compute(),))[0]
+
+    def run_group(
+        self,
+        stages: tuple[str, ...],
+        inputs: dict,
+        schemas: tuple[Any, ...],
+        compute: Callable[[], tuple],
+    ) -> tuple:
+        """
+        Reuse or compute stages produced by one call.
+
+        Args:
+            stages: Stage names, in the order `compute` returns them
+            inputs: Everything the results depend on (JSON-serializable)
+            schemas: Result types, one per stage
+            compute: Produces all results when any record cannot be reused
+
+        Returns:
+            Tuple of results, one per stage
+        """
+        fingerprints, adapters, now, results = self._reuse(stages, inputs, schemas)
+        if results is not None:
+            return results
+        return self._record(stages, fingerprints, adapters, now, compute())
+
+    async def arun(self, stage: str, inputs: dict, schema: Any, acompute: Callable[[], Awaitable[Any]]) -> Any:
+        """Coroutine counterpart of run(); `acompute` returns an awaitable."""
+
+        async def acompute_group():
+            return (await acompute(),)
+
+        return (await self.arun_group((stage,), inputs, (schema,), acompute_group))[0]
+
+    async def arun_group(
+        self,
+        stages: tuple[str, ...],
+        inputs: dict,
+        schemas: tuple[Any, ...],
+        acompute: Callable[[], Awaitable[tuple]],
+    ) -> tuple:
+        """Coroutine counterpart of run_group(); `acompute` returns an awaitable."""
+        fingerprints, adapters, now, results = self._reuse(stages, inputs, schemas)
+        if results is not None:
+            return results
+        return self._record(stages, fingerprints, adapters, now, await acompute())
+
+    def _reuse(self, stages: tuple[str, ...], inputs: dict, schemas: tuple[Any, ...]) -> tuple:
+        """(fingerprints, adapters, now, reused results or None) for a stage group."""
+        fingerprints = [fingerprint(stage, inputs) for stage in stages]
+        adapters = [TypeAdapter(schema) for schema in schemas]
+        now = time.time()
+
+        if all(self.is_fresh(stage, fp, now) for stage, fp in zip(stages, fingerprints)):
+            try:
+                results = tuple(
+                    adapter.validate_python(self.records[stage]["value"])
+                    for stage, adapter in zip(stages, adapters)
+                )
+            except ValueError as e:
+                # A record written by an older schema: recompute it
+                logger.warning(f"Discarding unreadable stage record(s) {', '.join(stages)}: {e}")
+            else:
+                self.reused.extend(stages)
+                tracing.annotate(stage_reused=True)
+                return fingerprints, adapters, now, results
+        return fingerprints, adapters, now, None
+
+    def _record(self, stages, fingerprints, adapters, now: float, results: tuple) -> tuple:
+        """Store freshly computed results (except zero-confidence fallbacks)."""
+        for stage, fp, adapter, result in zip(stages, fingerprints, adapters, results):
+            if getattr(result, "confidence", None) == 0.0:
+                self.records.pop(stage, None)
+                continue
+            self.records[stage] = {
+                "fingerprint": fp,
+                "computed_at": now,
+                "value": adapter.dump_python(result, mode="json"),
+            }
+        self.recomputed.extend(stages)
+        tracing.annotate(stage_reused=False)
+        return results
+
+    def summary(self) -> str:
+        """One-line account of reused and recomputed stages."""
+        return (
+            f"reused {len(self.reused)} stage(s) ({', '.join(self.reused) or 'none'}), "
+            f"recomputed {len(self.recomputed)} ({', '.join(self.recomputed) or 'none'})"
+        )
@@ -6,17 +6,20 @@ Structure:
     example.com/
       data.json   <-- Raw analysis data (ComprehensiveReportData)
       report.md   <-- The human-readable prose report
+      stages.json <-- Per-stage fingerprints and results (stage_cache.py)
 """
 
 import os
 import json
 import logging
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import TYPE_CHECKING, Optional, Dict, Any
 from datetime import datetime, timedelta
 
-# Import schemas to reconstruct objects
-from schemas import ComprehensiveReportData
+# Schemas (pydantic) are imported only when a report object is rebuilt, so
+# exists()/load_report_text() stay cheap for the cached-report path
+if TYPE_CHECKING:
+    from schemas import ComprehensiveReportData
 
 logger = logging.getLogger(__name__)
 
@@ -62,7 +65,7 @@ class StorageManager:
             logger.warning(f"Error checking cache for {domain}: {e}")
             return False
 
-    def save(self, domain: str, report_data: ComprehensiveReportData, report_text: str):
+    def save(self, domain: str, report_data: "ComprehensiveReportData", report_text: str):
         """Saves raw data and text report."""
         outlet_dir = self._get_outlet_dir(domain)
         outlet_dir.mkdir(parents=True, exist_ok=True)
@@ -80,8 +83,10 @@ class StorageManager:
             
         logger.info(f"Saved report and data for {domain} to {outlet_dir}")
 
-    def load_data(self, domain: str) -> Optional[ComprehensiveReportData]:
+    def load_data(self, domain: str) -> Optional["ComprehensiveReportData"]:
         """Loads raw data object from disk."""
+        from schemas import ComprehensiveReportData
+
         outlet_dir = self._get_outlet_dir(domain)
         json_path = outlet_dir / "data.json"
         
@@ -105,4 +110,26 @@ class StorageManager:
             return None
             
         with open(md_path, "r", encoding="utf-8") as f:
-            return f.read()
\ No newline at end of file
+            return f.read()
+
+    def load_stages(self, domain: str) -> Dict[str, Any]:
+        """Loads the stage records of the last run (empty if none)."""
+        stages_path = self._get_outlet_dir(domain) / "stages.json"
+
+        if not stages_path.exists():
+            return {}
+
+        try:
+            with open(stages_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"Failed to load stage records for {domain}: {e}")
+            return {}
+
+    def save_stages(self, domain: str, records: Dict[str, Any]):
+        """Saves stage records for incremental re-profiling."""
+        outlet_dir = self._get_outlet_dir(domain)
+        outlet_dir.mkdir(parents=True, exist_ok=True)
+
+        with open(outlet_dir / "stages.json", "w", encoding="utf-8") as f:
+            json.dump(records, f, indent=2)
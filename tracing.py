@@ -0,0 +1,390 @@
+"""
+tracing.py
+Structured tracing for the profiling pipeline.
+
+Records one span per pipeline stage, analyzer, LLM call and search/fetch call,
+with durations, token usage, cache hits, retries, hedges and fallbacks. A Tracer
+aggregates its spans into a per-stage summary (stored on
+ComprehensiveReportData.trace_summary) and exports either plain JSON or the
+Chrome trace-event format, which can be opened in chrome://tracing or
+https://ui.perfetto.dev.
+
+Usage:
+    tracer = Tracer("profile:bbc.com")
+    with tracing.activate(tracer):
+        with tracing.span("traffic", kind="analyzer"):
+            ...
+    tracer.export("trace.json", fmt="chrome")
+
+When no tracer is active every helper is a cheap no-op, so call sites can be
+instrumented unconditionally.
+"""
+
+import contextvars
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Iterator, Optional
+
+from config import MODEL_PRICING
+
+logger = logging.getLogger(__name__)
+
+# Span kinds
+STAGE = "stage"
+ANALYZER = "analyzer"
+LLM = "llm"
+SEARCH = "search"
+FETCH = "fetch"
+
+# Counters that are summed when spans are aggregated
+_COUNTER_KEYS = ("prompt_tokens", "completion_tokens", "cache_hits", "retries", "hedges")
+# Counters recorded directly on stage/analyzer spans
+_STAGE_COUNTER_KEYS = ("cache_hits", "retries", "hedges", "fallbacks")
+
+_active_tracer: contextvars.ContextVar[Optional["Tracer"]] = contextvars.ContextVar(
+    "active_tracer", default=None
+)
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar(
+    "current_span", default=None
+)
+
+
+@dataclass
+class Span:
+    """A single timed operation inside a trace."""
+
+    span_id: int
+    name: str
+    kind: str
+    start: float  # Seconds since the tracer was created
+    thread_id: int
+    parent_id: Optional[int] = None
+    duration: Optional[float] = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+
+def estimate_cost(model: Optional[str], prompt_tokens: int, completion_tokens: int) -> float:
+    """
+    Estimate the USD cost of an LLM call from MODEL_PRICING.
+
+    Args:
+        model: Model name as reported by the provider (e.g. "gpt-4o-mini-2024-07-18")
+        prompt_tokens: Prompt tokens used
+        completion_tokens: Completion tokens used
+
+    Returns:
+        Estimated cost in USD (0.0 for unknown models)
+    """
+    if not model:
+        return 0.0
+    # Match the longest configured prefix so dated snapshots resolve to their family
+    for name in sorted(MODEL_PRICING, key=len, reverse=True):
+        if model.startswith(name):
+            prompt_price, completion_price = MODEL_PRICING[name]
+            return (prompt_tokens * prompt_price + completion_tokens * completion_price) / 1_000_000
+    return 0.0
+
+
+class Tracer:
+    """
+    Thread-safe collector of spans for one pipeline run.
+
+    Attributes:
+        name: Human-readable trace name (e.g. "profile:bbc.com")
+        started_at: Wall-clock start time (UNIX seconds)
+    """
+
+    def __init__(self, name: str = "profile"):
+        self.name = name
+        self.started_at = time.time()
+        self._origin = time.perf_counter()
+        self._spans: list[Span] = []
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def start_span(
+        self,
+        name: str,
+        kind: str = STAGE,
+        parent: Optional[Span] = None,
+        **attributes: Any,
+    ) -> Span:
+        """
+        Open a span without making it the current span.
+
+        Used by callback-style instrumentation (e.g. LangChain callbacks) where
+        start and end happen in different functions.
+        """
+        span = Span(
+            span_id=next(self._ids),
+            name=name,
+            kind=kind,
+            start=time.perf_counter() - self._origin,
+            thread_id=threading.get_ident(),
+            parent_id=parent.span_id if parent else None,
+            attributes=dict(attributes),
+        )
+        with self._lock:
+            self._spans.append(span)
+        return span
+
+    def end_span(self, span: Span, error: Optional[BaseException] = None) -> None:
+        """Close a span opened with start_span()."""
+        span.duration = time.perf_counter() - self._origin - span.start
+        if error is not None:
+            span.error = f"{type(error).__name__}: {error}"
+
+    @contextmanager
+    def span(self, name: str, kind: str = STAGE, **attributes: Any) -> Iterator[Span]:
+        """Open a span, make it current for nested spans, and close it on exit."""
+        span = self.start_span(name, kind, parent=_current_span.get(), **attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            self.end_span(span, error=e)
+            raise
+        else:
+            self.end_span(span)
+        finally:
+            _current_span.reset(token)
+
+    @property
+    def spans(self) -> list[Span]:
+        """Snapshot of recorded spans."""
+        with self._lock:
+            return list(self._spans)
+
+    # ------------------------------------------------------------------
+    # Aggregation
+    # ------------------------------------------------------------------
+
+    def _owning_stage(self, span: Span, by_id: dict[int, Span]) -> str:
+        """Name of the innermost stage/analyzer span that contains this span."""
+        parent_id = span.parent_id
+        while parent_id is not None and parent_id in by_id:
+            parent = by_id[parent_id]
+            if parent.kind in (STAGE, ANALYZER):
+                return parent.name
+            parent_id = parent.parent_id
+        return "unattributed"
+
+    def summary(self) -> dict:
+        """
+        Aggregate spans into totals, per-kind and per-stage figures.
+
+        Returns:
+            Dict with 'total_duration_s', 'totals', 'by_kind' and 'stages' keys
+        """
+        spans = self.spans
+        by_id = {s.span_id: s for s in spans}
+
+        def empty() -> dict:
+            return {
+                "duration_s": 0.0,
+                "llm_calls": 0,
+                "search_calls": 0,
+                "fetch_calls": 0,
+                "prompt_tokens": 0,
+                "completion_tokens": 0,
+                "cache_hits": 0,
+                "retries": 0,
+                "hedges": 0,
+                "fallbacks": 0,
+                "errors": 0,
+                "cost_usd": 0.0,
+            }
+
+        totals = empty()
+        stages: dict[str, dict] = {}
+        by_kind: dict[str, dict] = {}
+
+        for s in spans:
+            duration = s.duration or 0.0
+            kind_stats = by_kind.setdefault(s.kind, {"count": 0, "duration_s": 0.0, "errors": 0})
+            kind_stats["count"] += 1
+            kind_stats["duration_s"] += duration
+            if s.error:
+                kind_stats["errors"] += 1
+
+            if s.kind in (STAGE, ANALYZER):
+                # Root span is the whole run; it only contributes to totals
+                targets = [totals]
+                if s.parent_id is not None:
+                    stage_stats = stages.setdefault(s.name, empty())
+                    stage_stats["duration_s"] += duration
+                    targets.append(stage_stats)
+                # Cache hits, retries and fallbacks recorded directly on a stage span
+                for stats in targets:
+                    for key in _STAGE_COUNTER_KEYS:
+                        stats[key] += int(s.attributes.get(key, 0) or 0)
+                continue
+
+            stage_stats = stages.setdefault(self._owning_stage(s, by_id), empty())
+            cost = estimate_cost(
+                s.attributes.get("model"),
+                s.attributes.get("prompt_tokens", 0),
+                s.attributes.get("completion_tokens", 0),
+            )
+            for stats in (stage_stats, totals):
+                if s.kind == LLM:
+                    stats["llm_calls"] += 1
+                elif s.kind == SEARCH:
+                    stats["search_calls"] += 1
+                elif s.kind == FETCH:
+                    stats["fetch_calls"] += 1
+                for key in _COUNTER_KEYS:
+                    stats[key] += int(s.attributes.get(key, 0) or 0)
+                stats["errors"] += 1 if s.error else 0
+                stats["cost_usd"] += cost
+
+        roots = [s for s in spans if s.parent_id is None and s.duration is not None]
+        total_duration = max((s.start + s.duration for s in roots), default=0.0) - min(
+            (s.start for s in roots), default=0.0
+        )
+        totals["duration_s"] = total_duration
+
+        def rounded(stats: dict) -> dict:
+            return {
+                k: round(v, 6 if k == "cost_usd" else 3) if isinstance(v, float) else v
+                for k, v in stats.items()
+            }
+
+        return {
+            "trace_name": self.name,
+            "total_duration_s": round(total_duration, 3),
+            "totals": rounded(totals),
+            "by_kind": {k: rounded(v) for k, v in by_kind.items()},
+            "stages": {k: rounded(v) for k, v in stages.items()},
+        }
+
+    # ------------------------------------------------------------------
+    # Export
+    # ------------------------------------------------------------------
+
+    def to_json(self) -> dict:
+        """Full trace as a JSON-serializable dict (spans + summary)."""
+        return {
+            "name": self.name,
+            "started_at": self.started_at,
+            "spans": [asdict(s) for s in self.spans],
+            "summary": self.summary(),
+        }
+
+    def to_chrome_trace(self) -> dict:
+        """Trace in Chrome trace-event format ("X" complete events, microseconds)."""
+        pid = os.getpid()
+        events = []
+        for s in self.spans:
+            args = dict(s.attributes)
+            if s.error:
+                args["error"] = s.error
+            events.append({
+                "name": s.name,
+                "cat": s.kind,
+                "ph": "X",
+                "ts": round(s.start * 1_000_000),
+                "dur": round((s.duration or 0.0) * 1_000_000),
+                "pid": pid,
+                "tid": s.thread_id,
+                "args": args,
+            })
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {"name": self.name, "started_at": self.started_at},
+        }
+
+    def export(self, path: str, fmt: str = "json") -> None:
+        """
+        Write the trace to disk.
+
+        Args:
+            path: Output file path
+            fmt: "json" for the native format or "chrome" for trace-event format
+        """
+        if fmt == "chrome":
+            payload = self.to_chrome_trace()
+        elif fmt == "json":
+            payload = self.to_json()
+        else:
+            raise ValueError(f"Unknown trace format: {fmt}")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2, default=str)
+        logger.info(f"Wrote {fmt} trace with {len(self.spans)} spans to {path}")
+
+
+# =============================================================================
+# Module-level helpers (no-ops when no tracer is active)
+# =============================================================================
+
+
+def current_tracer() -> Optional[Tracer]:
+    """Return the tracer active in this context, if any."""
+    return _active_tracer.get()
+
+
+def current_span() -> Optional[Span]:
+    """Return the innermost open span in this context, if any."""
+    return _current_span.get()
+
+
+@contextmanager
+def activate(tracer: Tracer) -> Iterator[Tracer]:
+    """Make `tracer` the active tracer for the duration of the block."""
+    token = _active_tracer.set(tracer)
+    try:
+        yield tracer
+    finally:
+        _active_tracer.reset(token)
+
+
+@contextmanager
+def span(name: str, kind: str = STAGE, **attributes: Any) -> Iterator[Optional[Span]]:
+    """Open a span on the active tracer, or do nothing if tracing is off."""
+    tracer = _active_tracer.get()
+    if tracer is None:
+        yield None
+        return
+    with tracer.span(name, kind, **attributes) as s:
+        yield s
+
+
+def annotate(**attributes: Any) -> None:
+    """Set attributes on the current span."""
+    s = _current_span.get()
+    if s is not None:
+        s.attributes.update(attributes)
+
+
+def increment(key: str, amount: int = 1) -> None:
+    """Increment a numeric attribute (e.g. 'cache_hits', 'retries') on the current span."""
+    s = _current_span.get()
+    if s is not None:
+        s.attributes[key] = s.attributes.get(key, 0) + amount
+
+
+def bind(fn: Callable) -> Callable:
+    """
+    Bind `fn` to a copy of the current context.
+
+    Thread pools do not inherit contextvars, so work submitted to an executor
+    should be wrapped with bind() to keep its spans attached to the trace.
+    """
+    ctx = contextvars.copy_context()
+
+    def _bound(*args, **kwargs):
+        return ctx.run(fn, *args, **kwargs)
+
+    return _bound
@@ -0,0 +1,641 @@
+"""
+transport.py
+Record/replay transport for HTTP, search and LLM traffic.
+
+Every network dependency of the pipeline goes through this module:
+
+    - requests sessions (MediaScraper, MediaResearcher) via new_session();
+      in live mode these also use the persistent HTTP cache (http_cache.py)
+    - httpx async clients for page fetches via new_async_client() (same
+      cache and cassettes as the sessions)
+    - DuckDuckGo search via get_search(), awaited with asearch()
+    - OpenAI chat completions via http_client() / http_async_client(),
+      passed to ChatOpenAI
+
+Modes:
+    live    Talk to the network (default)
+    record  Talk to the network and write every response to the cassette store
+    replay  Serve responses from the cassette store only; a request without a
+            recorded response raises CassetteMiss
+
+The mode and store location come from the MEDIA_PROFILER_TRANSPORT and
+MEDIA_PROFILER_CASSETTE_DIR environment variables (see config.py) or from
+configure(). Cassettes are plain JSON files stored as
+<cassette_dir>/<kind>/<sha256 of the request>.json, one per request, so replay
+throughput is bounded by disk reads and recordings from several runs merge
+naturally.
+
+Clients without an async API (ddgs, python-whois) are awaited through
+run_blocking(), which runs them on a small shared thread pool
+(ASYNC_BLOCKING_WORKERS) so coroutines never block the event loop.
+
+Usage:
+    MEDIA_PROFILER_TRANSPORT=record python evaluate.py -n 20
+    MEDIA_PROFILER_TRANSPORT=replay python evaluate.py -n 20   # offline, seconds
+"""
+
+import asyncio
+import base64
+import hashlib
+import io
+import json
+import logging
+import os
+import tempfile
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Iterable, Optional, TypeVar
+
+import httpx
+import requests
+from ddgs import DDGS
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+import http_cache
+import tracing
+from config import (
+    ASYNC_BLOCKING_WORKERS,
+    CASSETTE_DIR,
+    HTTP_CACHE_ENABLED,
+    HTTP_CACHE_MAX_MB,
+    HTTP_CACHE_PATH,
+    TRANSPORT_MODE,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+LIVE = "live"
+RECORD = "record"
+REPLAY = "replay"
+MODES = (LIVE, RECORD, REPLAY)
+
+# Cassette kinds (subdirectories of the store)
+HTTP = "http"
+SEARCH = "search"
+LLM = "llm"
+
+# Headers that describe the wire encoding rather than the stored (decoded) body
+_HOP_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+
+class CassetteMiss(RuntimeError):
+    """Raised in replay mode when no recording exists for a request."""
+
+
+# =============================================================================
+# Cassette Store
+# =============================================================================
+
+
+class CassetteStore:
+    """
+    Directory of recorded responses, one JSON file per request.
+
+    Attributes:
+        root: Store directory
+        stats: Per-kind hit/miss/recorded counters
+    """
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+        self.stats: dict[str, dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(*parts: Any) -> str:
+        """Stable hash of the request-identifying parts."""
+        payload = json.dumps(parts, sort_keys=True, default=str, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, kind: str, key: str) -> Path:
+        return self.root / kind / f"{key}.json"
+
+    def _count(self, kind: str, event: str) -> None:
+        with self._lock:
+            kind_stats = self.stats.setdefault(kind, {"hits": 0, "misses": 0, "recorded": 0})
+            kind_stats[event] += 1
+
+    def load(self, kind: str, key: str) -> Optional[dict]:
+        """Return the recording for `key`, or None if there is none."""
+        path = self._path(kind, key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            self._count(kind, "misses")
+            return None
+        self._count(kind, "hits")
+        return entry
+
+    def save(self, kind: str, key: str, entry: dict) -> None:
+        """Write a recording atomically (concurrent writers never see partial files)."""
+        path = self._path(kind, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        self._count(kind, "recorded")
+
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+_mode: str = LIVE
+_store: Optional[CassetteStore] = None
+_http_client: Optional[httpx.Client] = None
+_http_async_client: Optional[httpx.AsyncClient] = None
+_config_lock = threading.Lock()
+
+
+def configure(mode: Optional[str] = None, cassette_dir: Optional[str] = None) -> None:
+    """
+    Set the transport mode and cassette store for this process.
+
+    Clients created afterwards (sessions, search, LLMs) use the new settings;
+    existing ones keep the transport they were built with.
+
+    Args:
+        mode: "live", "record" or "replay" (default: unchanged)
+        cassette_dir: Cassette store directory (default: unchanged)
+    """
+    global _mode, _store, _http_client, _http_async_client
+    with _config_lock:
+        if mode is not None:
+            if mode not in MODES:
+                raise ValueError(f"Unknown transport mode: {mode} (expected one of {', '.join(MODES)})")
+            _mode = mode
+        if cassette_dir is not None or _store is None:
+            _store = CassetteStore(cassette_dir or CASSETTE_DIR)
+        _http_client = None
+        _http_async_client = None
+
+    if _mode == REPLAY:
+        # ChatOpenAI refuses to start without a key even though replay never sends one
+        os.environ.setdefault("OPENAI_API_KEY", "sk-replay")
+    if _mode != LIVE:
+        logger.info(f"Transport mode '{_mode}' using cassettes in {_store.root}")
+
+
+def mode() -> str:
+    """Current transport mode."""
+    return _mode
+
+
+def is_replay() -> bool:
+    """True when responses are served from cassettes (no network, no rate limits)."""
+    return _mode == REPLAY
+
+
+def get_store() -> CassetteStore:
+    """The active cassette store."""
+    return _store
+
+
+def add_cli_arguments(parser) -> None:
+    """Add --transport / --cassette-dir options to an argparse parser."""
+    parser.add_argument(
+        "--transport",
+        type=str,
+        choices=MODES,
+        default=None,
+        help=f"Network transport: live, record or replay (default: {TRANSPORT_MODE})",
+    )
+    parser.add_argument(
+        "--cassette-dir",
+        type=str,
+        default=None,
+        help=f"Cassette store for record/replay (default: {CASSETTE_DIR})",
+    )
+
+
+def configure_from_args(args) -> None:
+    """Apply the options added by add_cli_arguments()."""
+    configure(mode=args.transport, cassette_dir=args.cassette_dir)
+
+
+# =============================================================================
+# HTTP (requests)
+# =============================================================================
+
+
+class CassetteAdapter(BaseAdapter):
+    """
+    requests adapter that records or replays responses.
+
+    Each hop of a redirect chain is a separate send() call, so redirects are
+    recorded and replayed hop by hop.
+    """
+
+    def __init__(self, store: CassetteStore, record: bool):
+        super().__init__()
+        self.store = store
+        self.record = record
+        self._inner = HTTPAdapter() if record else None
+
+    @staticmethod
+    def _request_key(request: requests.PreparedRequest) -> str:
+        body = request.body or b""
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        return CassetteStore.key(request.method, request.url, hashlib.sha256(body).hexdigest())
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        key = self._request_key(request)
+
+        if self.record:
+            live = self._inner.send(request, **kwargs)
+            entry = {
+                "method": request.method,
+                "url": request.url,
+                "status_code": live.status_code,
+                "reason": live.reason,
+                "headers": {k: v for k, v in live.headers.items() if k.lower() not in _HOP_HEADERS},
+                "content": base64.b64encode(live.content).decode("ascii"),
+            }
+            self.store.save(HTTP, key, entry)
+        else:
+            entry = self.store.load(HTTP, key)
+            if entry is None:
+                raise CassetteMiss(f"No recorded response for {request.method} {request.url}")
+
+        return self._build_response(request, entry)
+
+    def _build_response(self, request: requests.PreparedRequest, entry: dict) -> requests.Response:
+        content = base64.b64decode(entry["content"])
+        response = requests.Response()
+        response.status_code = entry["status_code"]
+        response.reason = entry.get("reason")
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response.headers["Content-Length"] = str(len(content))
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response._content = content
+        response._content_consumed = True
+        # Streaming consumers read resp.raw directly
+        response.raw = io.BytesIO(content)
+        return response
+
+    def close(self) -> None:
+        if self._inner is not None:
+            self._inner.close()
+
+
+def new_session() -> requests.Session:
+    """
+    Create a requests session wired to the current transport mode.
+
+    In live mode this is a requests.Session whose GETs go through the shared
+    HTTP cache (unless HTTP_CACHE_ENABLED is off); record and replay bypass
+    the cache so cassettes hold exactly what the network returned.
+    """
+    session = requests.Session()
+    if _mode != LIVE:
+        adapter = CassetteAdapter(_store, record=_mode == RECORD)
+    elif HTTP_CACHE_ENABLED:
+        adapter = http_cache.CachingAdapter(http_cache.get_cache(HTTP_CACHE_PATH, HTTP_CACHE_MAX_MB * 1024 * 1024))
+    else:
+        return session
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def new_async_client(**kwargs: Any) -> httpx.AsyncClient:
+    """
+    Create an httpx async client for page fetches, wired like new_session().
+
+    Live GETs go through the shared HTTP cache (unless HTTP_CACHE_ENABLED is
+    off); record and replay use the HTTP cassettes. The client can be awaited
+    from any event loop (see LoopLocalTransport).
+
+    Args:
+        **kwargs: Passed to httpx.AsyncClient (timeout, headers, ...)
+    """
+    if _mode != LIVE:
+        transport = AsyncCassetteTransport(_store, record=_mode == RECORD, kind=HTTP)
+    else:
+        transport = LoopLocalTransport(httpx.AsyncHTTPTransport)
+        if HTTP_CACHE_ENABLED:
+            transport = http_cache.AsyncCachingTransport(
+                http_cache.get_cache(HTTP_CACHE_PATH, HTTP_CACHE_MAX_MB * 1024 * 1024), transport
+            )
+    return httpx.AsyncClient(transport=transport, **kwargs)
+
+
+# =============================================================================
+# Search (DuckDuckGo)
+# =============================================================================
+
+
+class CassetteSearch:
+    """DDGS wrapper that records or replays text() results."""
+
+    def __init__(self, store: CassetteStore, record: bool):
+        self.store = store
+        self.record = record
+        # Replay never touches DuckDuckGo, so only build a client when recording
+        self._inner = DDGS() if record else None
+
+    def text(self, query: str, **kwargs) -> list[dict]:
+        key = CassetteStore.key("ddgs.text", query, kwargs)
+        if self.record:
+            results = list(self._inner.text(query, **kwargs))
+            self.store.save(SEARCH, key, {"query": query, "params": kwargs, "results": results})
+            return results
+        return self._replay(key, query)
+
+    async def atext(self, query: str, **kwargs) -> list[dict]:
+        """Coroutine counterpart of text(); replay reads the cassette in place."""
+        if self.record:
+            return await run_blocking(self.text, query, **kwargs)
+        return self._replay(CassetteStore.key("ddgs.text", query, kwargs), query)
+
+    def _replay(self, key: str, query: str) -> list[dict]:
+        entry = self.store.load(SEARCH, key)
+        if entry is None:
+            raise CassetteMiss(f"No recorded search results for {query!r}")
+        return entry["results"]
+
+
+def get_search():
+    """Create a DuckDuckGo search client wired to the current transport mode."""
+    if _mode == LIVE:
+        return DDGS()
+    return CassetteSearch(_store, record=_mode == RECORD)
+
+
+async def asearch(search, query: str, **kwargs) -> list[dict]:
+    """
+    Await `search.text(query, **kwargs)`.
+
+    Clients with an atext() coroutine (CassetteSearch) are awaited directly;
+    DDGS has no async API and runs on the shared blocking pool.
+    """
+    atext = getattr(search, "atext", None)
+    if atext is not None:
+        return await atext(query, **kwargs)
+    return await run_blocking(lambda: list(search.text(query, **kwargs)))
+
+
+# =============================================================================
+# Blocking clients in async code
+# =============================================================================
+
+_blocking_executor: Optional[ThreadPoolExecutor] = None
+
+
+async def run_blocking(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run a blocking call without stalling the event loop.
+
+    Calls share one bounded pool (ASYNC_BLOCKING_WORKERS threads), so however
+    many coroutines are waiting, only that many calls are in flight. The
+    caller's context (tracer, fetch context) is carried into the thread.
+    """
+    global _blocking_executor
+    with _config_lock:
+        if _blocking_executor is None:
+            _blocking_executor = ThreadPoolExecutor(
+                max_workers=ASYNC_BLOCKING_WORKERS, thread_name_prefix="blocking"
+            )
+    bound = tracing.bind(fn)
+    return await asyncio.get_running_loop().run_in_executor(_blocking_executor, lambda: bound(*args, **kwargs))
+
+
+async def iterate_blocking(iterable: Iterable[T]) -> AsyncIterator[T]:
+    """
+    Iterate a blocking iterable (e.g. a generator doing I/O) from a coroutine.
+
+    The iterable is consumed on the shared blocking pool and each item is
+    handed to the event loop as soon as it is produced. When the consumer
+    stops early the producer stops after its current item (generators are
+    closed).
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    stopped = threading.Event()
+    end = object()
+
+    def put(entry: tuple) -> None:
+        try:
+            loop.call_soon_threadsafe(queue.put_nowait, entry)
+        except RuntimeError:
+            # The event loop is closed (e.g. asyncio.run() returned): nobody is listening
+            stopped.set()
+
+    def produce() -> None:
+        iterator = iter(iterable)
+        try:
+            for item in iterator:
+                put((item, None))
+                if stopped.is_set():
+                    break
+            else:
+                put((end, None))
+        except Exception as e:
+            put((end, e))
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+
+    producer = asyncio.ensure_future(run_blocking(produce))
+    try:
+        while True:
+            item, error = await queue.get()
+            if item is end:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        stopped.set()
+        if not producer.done():
+            producer.cancel()
+
+
+# =============================================================================
+# httpx (OpenAI client inside ChatOpenAI, async page fetches)
+# =============================================================================
+
+
+def _cassette_key(request: httpx.Request, body: bytes) -> str:
+    return CassetteStore.key(request.method, str(request.url), hashlib.sha256(body).hexdigest())
+
+
+def _cassette_entry(request: httpx.Request, live: httpx.Response, content: bytes) -> dict:
+    return {
+        "method": request.method,
+        "url": str(request.url),
+        "status_code": live.status_code,
+        "reason": live.reason_phrase,
+        "headers": {k: v for k, v in live.headers.items() if k.lower() not in _HOP_HEADERS},
+        "content": base64.b64encode(content).decode("ascii"),
+    }
+
+
+def _cassette_response(request: httpx.Request, entry: dict) -> httpx.Response:
+    return httpx.Response(
+        status_code=entry["status_code"],
+        headers=entry["headers"],
+        content=base64.b64decode(entry["content"]),
+        request=request,
+    )
+
+
+class CassetteTransport(httpx.BaseTransport):
+    """
+    httpx transport that records or replays responses.
+
+    Used for OpenAI API calls (kind LLM); only successful responses are
+    recorded, since errors are retried live.
+    """
+
+    def __init__(self, store: CassetteStore, record: bool, kind: str = LLM):
+        self.store = store
+        self.record = record
+        self.kind = kind
+        self._inner = httpx.HTTPTransport() if record else None
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        body = request.read()
+        key = _cassette_key(request, body)
+
+        if self.record:
+            live = self._inner.handle_request(request)
+            content = live.read()
+            entry = _cassette_entry(request, live, content)
+            live.close()
+            # Only successful completions are worth replaying; errors are retried live
+            if live.status_code < 400:
+                self.store.save(self.kind, key, entry)
+        else:
+            entry = self.store.load(self.kind, key)
+            if entry is None:
+                raise CassetteMiss(f"No recorded {self.kind} response for {request.method} {request.url}")
+
+        return _cassette_response(request, entry)
+
+    def close(self) -> None:
+        if self._inner is not None:
+            self._inner.close()
+
+
+class LoopLocalTransport(httpx.AsyncBaseTransport):
+    """
+    Async transport with one inner transport (connection pool) per event loop.
+
+    httpx connection pools are bound to the loop that opened them; clients
+    built once (analyzers create theirs at construction) may be awaited from
+    several loops, e.g. successive asyncio.run() calls.
+    """
+
+    def __init__(self, factory: Callable[[], httpx.AsyncBaseTransport]):
+        self.factory = factory
+        self._transports: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncBaseTransport]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _transport(self) -> httpx.AsyncBaseTransport:
+        loop = asyncio.get_running_loop()
+        transport = self._transports.get(loop)
+        if transport is None:
+            transport = self._transports[loop] = self.factory()
+        return transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport().handle_async_request(request)
+
+    async def aclose(self) -> None:
+        loop = asyncio.get_running_loop()
+        transport = self._transports.pop(loop, None)
+        if transport is not None:
+            await transport.aclose()
+
+
+class AsyncCassetteTransport(httpx.AsyncBaseTransport):
+    """
+    Async counterpart of CassetteTransport.
+
+    With kind HTTP it reads and writes the same cassettes as CassetteAdapter
+    (requests), so pages recorded by a sync run replay in an async one.
+    """
+
+    def __init__(self, store: CassetteStore, record: bool, kind: str = LLM):
+        self.store = store
+        self.record = record
+        self.kind = kind
+        self._inner = LoopLocalTransport(httpx.AsyncHTTPTransport) if record else None
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        body = await request.aread()
+        key = _cassette_key(request, body)
+
+        if self.record:
+            live = await self._inner.handle_async_request(request)
+            content = await live.aread()
+            entry = _cassette_entry(request, live, content)
+            await live.aclose()
+            # Pages are recorded whatever their status (as CassetteAdapter does);
+            # LLM errors are retried live
+            if self.kind != LLM or live.status_code < 400:
+                self.store.save(self.kind, key, entry)
+        else:
+            entry = self.store.load(self.kind, key)
+            if entry is None:
+                raise CassetteMiss(f"No recorded {self.kind} response for {request.method} {request.url}")
+
+        return _cassette_response(request, entry)
+
+    async def aclose(self) -> None:
+        if self._inner is not None:
+            await self._inner.aclose()
+
+
+def http_client() -> Optional[httpx.Client]:
+    """
+    Shared httpx client for ChatOpenAI(http_client=...).
+
+    Returns None in live mode so the OpenAI SDK uses its default client.
+    """
+    global _http_client
+    if _mode == LIVE:
+        return None
+    with _config_lock:
+        if _http_client is None:
+            _http_client = httpx.Client(
+                transport=CassetteTransport(_store, record=_mode == RECORD),
+                timeout=httpx.Timeout(120.0),
+            )
+        return _http_client
+
+
+def http_async_client() -> Optional[httpx.AsyncClient]:
+    """
+    Shared httpx client for ChatOpenAI(http_async_client=...).
+
+    Returns None in live mode so the OpenAI SDK uses its default client.
+    """
+    global _http_async_client
+    if _mode == LIVE:
+        return None
+    with _config_lock:
+        if _http_async_client is None:
+            _http_async_client = httpx.AsyncClient(
+                transport=AsyncCassetteTransport(_store, record=_mode == RECORD),
+                timeout=httpx.Timeout(120.0),
+            )
+        return _http_async_client
+
+
+configure(mode=TRANSPORT_MODE)
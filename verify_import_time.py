@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Import-Time Budget Verification Script
+
+Guards the cold start of the entry points: importing main_pipeline (and
+the modules the Streamlit app loads on page view) must stay within a time
+budget and must not pull in the heavy dependencies that only a fresh
+analysis needs (langchain, openai, ddgs, whois, BeautifulSoup, pydantic).
+It also times a whole `python main_pipeline.py <url>` run that prints a
+cached report from a temporary reports/ directory.
+
+Each measurement runs in a fresh interpreter (`python -X importtime`) and
+the best of `--repeat` runs is compared with its budget, to keep noise
+from a busy machine out of the result.
+
+Usage:
+    python verify_import_time.py [--repeat N] [--verbose]
+
+Options:
+    --repeat N   Runs per measurement; the fastest counts (default: 5)
+    --verbose    Print the slowest imports of each module
+
+Exits with status 1 if a budget is exceeded or a heavy module is imported.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent
+
+
+# =============================================================================
+# Budgets
+# =============================================================================
+
+# Module -> import budget in ms (cumulative, as reported by -X importtime)
+IMPORT_BUDGETS_MS = {
+    "main_pipeline": 150,
+    "resources": 100,
+    "storage": 100,
+}
+
+# Wall time of `python main_pipeline.py <url>` printing a cached report,
+# interpreter start-up included
+CACHED_REPORT_BUDGET_MS = 500
+
+# Must not be imported by the modules above
+HEAVY_MODULES = (
+    "langchain_core",
+    "langchain_openai",
+    "openai",
+    "ddgs",
+    "duckduckgo_search",
+    "whois",
+    "bs4",
+    "pydantic",
+    "requests",
+    "httpx",
+    "research",
+    "refactored_analyzers",
+    "scraper",
+)
+
+
+# =============================================================================
+# Measurements
+# =============================================================================
+
+
+def _env() -> dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(REPO_DIR), env.get("PYTHONPATH")]))
+    return env
+
+
+def measure_import(module: str) -> tuple[float, list[str], list[tuple[float, str]]]:
+    """
+    Import `module` in a fresh interpreter.
+
+    Returns:
+        (cumulative import ms, heavy modules loaded, [(self ms, name)] slowest first)
+    """
+    code = f"import sys, json; import {module}; print(json.dumps(sorted(sys.modules)))"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, cwd=REPO_DIR, env=_env(), check=True,
+    )
+    loaded = set(json.loads(result.stdout.strip().splitlines()[-1]))
+
+    total_ms = 0.0
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        imports.append((int(self_us) / 1000, name.strip()))
+        if name.strip() == module:
+            total_ms = int(cumulative_us) / 1000
+    imports.sort(reverse=True)
+    heavy = [name for name in HEAVY_MODULES if name in loaded]
+    return total_ms, heavy, imports
+
+
+def measure_cached_report() -> float:
+    """Wall ms of main_pipeline.py printing a cached report (fresh interpreter)."""
+    domain = "example-cached.com"
+    with tempfile.TemporaryDirectory(prefix="import-time-") as tmp:
+        outlet_dir = Path(tmp) / "reports" / domain
+        outlet_dir.mkdir(parents=True)
+        (outlet_dir / "data.json").write_text(
+            json.dumps({"target_domain": domain, "analysis_date": date.today().isoformat()}),
+            encoding="utf-8",
+        )
+        (outlet_dir / "report.md").write_text("Cached report body\n", encoding="utf-8")
+
+        started = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, str(REPO_DIR / "main_pipeline.py"), f"https://{domain}"],
+            capture_output=True, text=True, cwd=tmp, env=_env(),
+        )
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+    if result.returncode != 0 or "CACHED REPORT" not in result.stdout:
+        raise RuntimeError(f"main_pipeline.py did not serve the cached report:\n{result.stderr}")
+    return elapsed_ms
+
+
+# =============================================================================
+# Main
+# =============================================================================
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Verify entry-point import times against budgets")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement; the fastest counts")
+    parser.add_argument("--verbose", action="store_true", help="Print the slowest imports of each module")
+    args = parser.parse_args()
+
+    failures = []
+    print(f"{'Check':<28} {'best ms':>9} {'budget':>8}")
+    print("-" * 47)
+
+    for module, budget_ms in IMPORT_BUDGETS_MS.items():
+        runs = [measure_import(module) for _ in range(args.repeat)]
+        best_ms, heavy, imports = min(runs, key=lambda run: run[0])
+        status = "ok" if best_ms <= budget_ms else "OVER"
+        print(f"import {module:<21} {best_ms:>9.1f} {budget_ms:>8} {status}")
+        if best_ms > budget_ms:
+            failures.append(f"import {module} took {best_ms:.1f} ms (budget {budget_ms} ms)")
+        if heavy:
+            failures.append(f"import {module} loads {', '.join(heavy)}")
+        if args.verbose:
+            for self_ms, name in imports[:5]:
+                print(f"    {self_ms:>8.1f} ms  {name}")
+
+    best_ms = min(measure_cached_report() for _ in range(args.repeat))
+    status = "ok" if best_ms <= CACHED_REPORT_BUDGET_MS else "OVER"
+    print(f"{'cached report (CLI)':<28} {best_ms:>9.1f} {CACHED_REPORT_BUDGET_MS:>8} {status}")
+    if best_ms > CACHED_REPORT_BUDGET_MS:
+        failures.append(f"cached report took {best_ms:.1f} ms (budget {CACHED_REPORT_BUDGET_MS} ms)")
+
+    if failures:
+        print("\nFAILED:")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    print("\nAll import-time budgets met.")
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,10 +8,13 @@ runs the analyzer, and produces a classification report.
 
 Usage:
     python verify_opinion.py [--recreate-csv] [--verbose]
+                             [--max-concurrency N] [--pack-size N]
 
 Options:
-    --recreate-csv  Force recreation of the golden dataset CSV
-    --verbose       Print detailed results for each article
+    --recreate-csv     Force recreation of the golden dataset CSV
+    --verbose          Print detailed results for each article
+    --max-concurrency  Maximum parallel LLM requests
+    --pack-size        Articles classified per LLM call
 """
 
 import argparse
@@ -21,6 +24,7 @@ import sys
 from pathlib import Path
 from typing import Optional
 
+from config import OPINION_MAX_CONCURRENCY, OPINION_PACK_SIZE
 from refactored_analyzers import OpinionAnalyzer
 from schemas import ArticleType, ValidationReport, ValidationResult
 
@@ -303,7 +307,10 @@ def load_golden_csv(filepath: Path) -> list[tuple[str, str, str, ArticleType]]:
 
 
 def run_validation(
-    filepath: Path, verbose: bool = False
+    filepath: Path,
+    verbose: bool = False,
+    max_concurrency: int = OPINION_MAX_CONCURRENCY,
+    pack_size: int = OPINION_PACK_SIZE,
 ) -> ValidationReport:
     """
     Run the OpinionAnalyzer against the golden dataset.
@@ -311,6 +318,8 @@ def run_validation(
     Args:
         filepath: Path to the golden dataset CSV
         verbose: Whether to print detailed results
+        max_concurrency: Maximum parallel LLM requests
+        pack_size: Articles classified per LLM call
 
     Returns:
         ValidationReport with accuracy and detailed results
@@ -328,11 +337,17 @@ def run_validation(
     print("RUNNING VALIDATION")
     print("=" * 70)
 
-    for i, (url, title, text_snippet, expected_label) in enumerate(dataset, 1):
-        print(f"\nProcessing {i}/{len(dataset)}: {title[:50]}...")
+    # Run classification (concurrently; results come back in dataset order)
+    classifications = analyzer.analyze_batch(
+        [{"title": title, "text": text_snippet} for _, title, text_snippet, _ in dataset],
+        max_concurrency=max_concurrency,
+        pack_size=pack_size,
+    )
 
-        # Run classification
-        classification = analyzer.analyze(title, text_snippet)
+    for i, ((url, title, text_snippet, expected_label), classification) in enumerate(
+        zip(dataset, classifications), 1
+    ):
+        print(f"\nProcessing {i}/{len(dataset)}: {title[:50]}...")
 
         # Create result
         is_correct = classification.article_type == expected_label
@@ -460,6 +475,18 @@ def main():
         action="store_true",
         help="Print detailed results for each article",
     )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=OPINION_MAX_CONCURRENCY,
+        help=f"Maximum parallel LLM requests (default: {OPINION_MAX_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--pack-size",
+        type=int,
+        default=OPINION_PACK_SIZE,
+        help=f"Articles classified per LLM call (default: {OPINION_PACK_SIZE})",
+    )
     args = parser.parse_args()
 
     # Determine CSV path
@@ -473,7 +500,12 @@ def main():
         print(f"Using existing golden dataset: {csv_path}")
 
     # Run validation
-    report = run_validation(csv_path, verbose=args.verbose)
+    report = run_validation(
+        csv_path,
+        verbose=args.verbose,
+        max_concurrency=args.max_concurrency,
+        pack_size=args.pack_size,
+    )
 
     # Print report
     print_classification_report(report)